@@ -1,4 +1,4 @@
-import React, { useEffect, useMemo, useState } from 'react';
+import React, { useEffect, useMemo, useRef, useState } from 'react';
 import Header from './components/Header';
 import CompanySection from './components/CompanySection';
 import PeopleSection from './components/PeopleSection';
@@ -7,6 +7,87 @@ import Loader from './components/Loader';
 import './components/Layout.css';
 
 const API_BASE = import.meta.env.VITE_API_BASE || '';
+const STREAM_PAGE_SIZE = 500;
+// 페이지가 빨리 도착해도 중간 렌더는 이 간격보다 자주 하지 않는다 (마지막 페이지는 항상 반영).
+const STREAM_RENDER_INTERVAL_MS = 300;
+
+const emptyData = () => ({
+  organizations: [],
+  companyMemos: {},
+  peopleWithDeals: [],
+  peopleWithoutDeals: [],
+  dealsByPersonId: {},
+  peopleMemosById: {},
+  dealMemosById: {},
+});
+
+const pushBy = (map, key, item) => {
+  if (!key) return;
+  (map[key] ||= []).push(item);
+};
+
+const byOrgName = (a, b) => String(a.name).localeCompare(String(b.name));
+
+// 이미 정렬된 두 배열을 한 번에 합친다 (페이지마다 전체를 다시 정렬하지 않도록).
+function mergeSorted(sorted, page) {
+  const out = new Array(sorted.length + page.length);
+  let i = 0;
+  let j = 0;
+  let k = 0;
+  while (i < sorted.length && j < page.length) {
+    out[k++] = byOrgName(page[j], sorted[i]) < 0 ? page[j++] : sorted[i++];
+  }
+  while (i < sorted.length) out[k++] = sorted[i++];
+  while (j < page.length) out[k++] = page[j++];
+  return out;
+}
+
+function mergeOrgRecord(acc, record, pageOrgs) {
+  pageOrgs.push(record.organization);
+  record.people.forEach((p) => (p.dealCount ? acc.peopleWithDeals : acc.peopleWithoutDeals).push(p));
+  record.deals.forEach((d) => pushBy(acc.dealsByPersonId, d.peopleId, d));
+  record.companyMemos.forEach((m) => pushBy(acc.companyMemos, m.organizationId, m));
+  record.peopleMemos.forEach((m) => pushBy(acc.peopleMemosById, m.peopleId, m));
+  record.dealMemos.forEach((m) => pushBy(acc.dealMemosById, m.dealId, m));
+}
+
+// /api/initial-data/stream을 next_cursor가 없을 때까지 페이지 단위로 읽는다.
+// 회사 목록은 페이지가 끝날 때마다 정렬·병합하고, onPage는 STREAM_RENDER_INTERVAL_MS 간격으로만 부른다.
+async function streamInitialData(onPage) {
+  const acc = emptyData();
+  const decoder = new TextDecoder();
+  let cursor = '';
+  let lastEmit = 0;
+  do {
+    const params = new URLSearchParams({ limit: String(STREAM_PAGE_SIZE) });
+    if (cursor) params.set('after', cursor);
+    const res = await fetch(`${API_BASE}/api/initial-data/stream?${params}`);
+    if (!res.ok || !res.body) throw new Error('Failed to load data from API');
+    const reader = res.body.getReader();
+    const pageOrgs = [];
+    let buffer = '';
+    cursor = '';
+    for (;;) {
+      const { value, done } = await reader.read();
+      buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+      const lines = buffer.split('\n');
+      buffer = lines.pop();
+      for (const line of lines) {
+        if (!line) continue;
+        const record = JSON.parse(line);
+        if (record.type === 'organization') mergeOrgRecord(acc, record, pageOrgs);
+        else if (record.type === 'end') cursor = record.next_cursor || '';
+      }
+      if (done) break;
+    }
+    acc.organizations = mergeSorted(acc.organizations, pageOrgs.sort(byOrgName));
+    const now = Date.now();
+    if (!cursor || now - lastEmit >= STREAM_RENDER_INTERVAL_MS) {
+      lastEmit = now;
+      onPage({ ...acc }, !cursor);
+    }
+  } while (cursor);
+}
 
 function App() {
   const [data, setData] = useState(null);
@@ -15,16 +96,29 @@ function App() {
   const [selectedOrgId, setSelectedOrgId] = useState(null);
   const [withDealsSelection, setWithDealsSelection] = useState({ personId: null, dealId: null });
   const [withoutDealsSelection, setWithoutDealsSelection] = useState({ personId: null, dealId: null });
+  const orgPickedByUser = useRef(false);
+
+  const selectOrg = (orgId) => {
+    orgPickedByUser.current = true;
+    setSelectedOrgId(orgId);
+  };
 
   const fetchData = async () => {
     try {
       setLoading(true);
       setError(null);
-      const res = await fetch(`${API_BASE}/api/initial-data`);
-      if (!res.ok) throw new Error('Failed to load data from API');
-      const payload = await res.json();
-      setData(payload);
-      setSelectedOrgId(payload.organizations?.[0]?.id || null);
+      setData(null);
+      orgPickedByUser.current = false;
+      // NDJSON: 회사 단위 레코드를 페이지마다 병합해 첫 페이지부터 렌더한다.
+      // 기본 선택은 임시로 현재 목록의 첫 회사를 쓰고, 스트림이 끝나면 전체 정렬 기준 첫 회사로 맞춘다
+      // (사용자가 그 사이 직접 고른 회사는 바꾸지 않는다).
+      await streamInitialData((snapshot, complete) => {
+        setData(snapshot);
+        const firstOrgId = snapshot.organizations[0]?.id || null;
+        if (complete && !orgPickedByUser.current) setSelectedOrgId(firstOrgId);
+        else if (firstOrgId) setSelectedOrgId((prev) => prev || firstOrgId);
+        if (snapshot.organizations.length) setLoading(false);
+      });
     } catch (err) {
       setError(err.message || 'Unable to load data');
     } finally {
@@ -81,7 +175,7 @@ function App() {
       <Header
         organizations={organizations}
         selectedOrgId={selectedOrgId}
-        onChangeOrg={setSelectedOrgId}
+        onChangeOrg={selectOrg}
         isLoading={!data}
       />
 
@@ -0,0 +1,242 @@
+"""
+Process-wide LLM transport.
+
+One keep-alive httpx.Client (HTTP/2 when `h2` is installed) is shared by every agent and every
+thread (daily_report_v2 part rollups, LLMDispatcher workers), so TLS handshakes and connections
+are reused instead of being rebuilt per call. `chat_completion` holds the retry/backoff/timeout
+budget logic that used to live in target_attainment; per-model latency and in-flight counters
+are exposed through `transport_stats()`.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+POOL_MAX_CONNECTIONS = int(os.getenv("LLM_POOL_MAX_CONNECTIONS", "16"))
+POOL_KEEPALIVE_SEC = float(os.getenv("LLM_POOL_KEEPALIVE_SEC", "60"))
+BACKOFF_BASE_SEC = 0.5
+BACKOFF_MAX_SEC = 8.0
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+_client: Any = None
+_client_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_model_stats: Dict[str, Dict[str, Any]] = {}
+
+PostFn = Callable[..., Dict[str, Any]]
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except Exception:
+        return False
+    return True
+
+
+def _build_client() -> Any:
+    kwargs: Dict[str, Any] = {"timeout": None}
+    limits_cls = getattr(httpx, "Limits", None)
+    if limits_cls is not None:
+        kwargs["limits"] = limits_cls(
+            max_connections=POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=POOL_MAX_CONNECTIONS,
+            keepalive_expiry=POOL_KEEPALIVE_SEC,
+        )
+    if _http2_available():
+        kwargs["http2"] = True
+    return httpx.Client(**kwargs)
+
+
+def get_client() -> Any:
+    """Shared httpx.Client (created on first use)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _build_client()
+    return _client
+
+
+def set_client(client: Any) -> None:
+    """Replace the shared client (tests inject an httpx.MockTransport-backed client)."""
+    global _client
+    with _client_lock:
+        old, _client = _client, client
+    if old is not None and old is not client:
+        try:
+            old.close()
+        except Exception:
+            logger.debug("llm transport close failed", exc_info=True)
+
+
+def close_client() -> None:
+    set_client(None)
+
+
+def _model_entry(model: str) -> Dict[str, Any]:
+    entry = _model_stats.get(model)
+    if entry is None:
+        entry = {"calls": 0, "errors": 0, "in_flight": 0, "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0}
+        _model_stats[model] = entry
+    return entry
+
+
+def post_json(url: str, headers: Dict[str, str], payload: Dict[str, Any], *, timeout: float) -> Dict[str, Any]:
+    """POST over the shared client, tracking latency and in-flight count per model."""
+    model = str(payload.get("model") or "unknown")
+    with _stats_lock:
+        _model_entry(model)["in_flight"] += 1
+    started = time.monotonic()
+    ok = False
+    try:
+        resp = get_client().post(url, headers=headers, json=payload, timeout=timeout)
+        resp.raise_for_status()
+        data = resp.json()
+        ok = True
+        return data
+    finally:
+        elapsed_ms = (time.monotonic() - started) * 1000.0
+        with _stats_lock:
+            entry = _model_entry(model)
+            entry["in_flight"] -= 1
+            entry["calls"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["last_ms"] = elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            if not ok:
+                entry["errors"] += 1
+
+
+def _is_timeout(exc: BaseException) -> bool:
+    timeout_types = tuple(
+        t for t in (getattr(httpx, name, None) for name in ("ReadTimeout", "ConnectTimeout", "TimeoutException")) if isinstance(t, type)
+    )
+    return bool(timeout_types) and isinstance(exc, timeout_types)
+
+
+def _retryable_status(exc: BaseException) -> int | None:
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    return status if status in RETRYABLE_STATUS else None
+
+
+def _backoff(attempt: int, remaining: float) -> float:
+    delay = min(BACKOFF_MAX_SEC, BACKOFF_BASE_SEC * (2**attempt)) * random.uniform(0.8, 1.2)
+    return max(0.0, min(delay, remaining))
+
+
+def chat_completion(
+    messages: List[dict],
+    *,
+    model: str,
+    base_url: str | None,
+    api_key: str,
+    timeout_total: float,
+    temperature: float,
+    max_tokens: int,
+    retry: int = 0,
+    calls_log: List[Dict[str, Any]] | None = None,
+    kind: str = "main",
+    event_prefix: str = "llm",
+    post: PostFn | None = None,
+) -> str:
+    """
+    OpenAI-compatible /chat/completions with a total timeout budget split over 1 + retry attempts.
+    Timeouts and 429/5xx are retried with jittered exponential backoff; other HTTP errors raise.
+    """
+    url = f"{(base_url or DEFAULT_BASE_URL).rstrip('/')}/chat/completions"
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+    post_fn = post or post_json
+    attempts = max(1, 1 + max(0, retry))
+    budget = max(timeout_total, 0.1)
+    attempt_timeout = budget / attempts
+
+    for attempt in range(attempts):
+        per_timeout = attempt_timeout if attempt < attempts - 1 else budget
+        if calls_log is not None:
+            calls_log.append(
+                {
+                    "kind": kind,
+                    "attempt": attempt + 1,
+                    "attempts": attempts,
+                    "url": url,
+                    "payload": payload,
+                    "timeout_s": per_timeout,
+                }
+            )
+        try:
+            data = post_fn(url, headers, payload, timeout=per_timeout)
+        except Exception as exc:
+            timed_out = _is_timeout(exc)
+            status = None if timed_out else _retryable_status(exc)
+            if not timed_out and status is None:
+                # do not retry on other HTTP errors
+                raise
+            if attempt < attempts - 1:
+                budget -= per_timeout
+                logger.warning(
+                    f"{event_prefix}.retry",
+                    extra={
+                        "event": f"{event_prefix}.retry",
+                        "attempt": attempt + 1,
+                        "attempts": attempts,
+                        "timeout_s": per_timeout,
+                        "reason": exc.__class__.__name__ if status is None else f"http_{status}",
+                    },
+                )
+                time.sleep(_backoff(attempt, budget))
+                continue
+            if timed_out:
+                logger.warning(
+                    f"{event_prefix}.timeout",
+                    extra={"event": f"{event_prefix}.timeout", "attempts": attempts, "timeout_total_s": timeout_total},
+                )
+            raise
+        try:
+            return data["choices"][0]["message"]["content"]
+        except Exception as exc:  # pragma: no cover - defensive
+            raise RuntimeError(f"Invalid OpenAI response: {exc}")
+    raise RuntimeError("unreachable")  # pragma: no cover
+
+
+def transport_stats() -> Dict[str, Any]:
+    with _stats_lock:
+        models = {
+            model: {
+                **{k: v for k, v in entry.items() if k not in {"total_ms", "max_ms", "last_ms"}},
+                "avg_ms": round(entry["total_ms"] / entry["calls"], 1) if entry["calls"] else None,
+                "max_ms": round(entry["max_ms"], 1),
+                "last_ms": round(entry["last_ms"], 1),
+            }
+            for model, entry in _model_stats.items()
+        }
+    return {
+        "client_open": _client is not None,
+        "http2": _http2_available(),
+        "max_connections": POOL_MAX_CONNECTIONS,
+        "models": models,
+    }
+
+
+def reset_stats() -> None:
+    with _stats_lock:
+        _model_stats.clear()
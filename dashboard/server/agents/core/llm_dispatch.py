@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Sequence
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class _RateLimitedType:
+    def __repr__(self) -> str:
+        return "<rate_limited>"
+
+
+_RateLimited = _RateLimitedType()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens/sec refill up to `burst`.
+    rate <= 0 disables limiting.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst if burst is not None else max(1.0, rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, deadline: float | None = None) -> bool:
+        """Block until a token is available; False if `deadline` (monotonic) passes first."""
+        if self.rate <= 0:
+            return True
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return True
+                wait = (1.0 - self._tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+@dataclass
+class DispatchStats:
+    submitted: int = 0
+    completed: int = 0
+    timed_out: int = 0
+    rate_limited: int = 0
+    errors: List[str] = field(default_factory=list)
+    wall_ms: float = 0.0
+
+
+class LLMDispatcher:
+    """
+    Bounded fan-out for LLM calls prepared elsewhere (no SQLite access inside `fn`).
+    - max_workers threads, shared TokenBucket between calls
+    - per-call deadline (token wait + call); on timeout/error `on_fail(item, reason)` supplies the result
+    - results are returned in input order regardless of completion order
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        rate_per_sec: float | None = None,
+        burst: float | None = None,
+        call_deadline_sec: float | None = None,
+        bucket: TokenBucket | None = None,
+    ) -> None:
+        self.max_workers = max(1, int(max_workers if max_workers is not None else _env_float("LLM_MAX_CONCURRENCY", 4)))
+        rate = rate_per_sec if rate_per_sec is not None else _env_float("LLM_RATE_PER_SEC", 2.0)
+        self.bucket = bucket or TokenBucket(rate, burst if burst is not None else _env_float("LLM_RATE_BURST", self.max_workers))
+        self.call_deadline_sec = call_deadline_sec if call_deadline_sec is not None else _env_float("LLM_CALL_DEADLINE_SEC", 90.0)
+        self.stats = DispatchStats()
+
+    @classmethod
+    def serial(cls) -> "LLMDispatcher":
+        """Single worker, no rate limit: the pre-fan-out behaviour."""
+        return cls(max_workers=1, rate_per_sec=0, call_deadline_sec=0)
+
+    def map(
+        self,
+        fn: Callable[[Any], Any],
+        items: Sequence[Any],
+        on_fail: Callable[[Any, str], Any],
+    ) -> List[Any]:
+        started = time.monotonic()
+        self.stats.submitted += len(items)
+        if not items:
+            return []
+        if self.max_workers == 1 and self.bucket.rate <= 0 and not self.call_deadline_sec:
+            results = []
+            for item in items:
+                try:
+                    results.append(fn(item))
+                    self.stats.completed += 1
+                except Exception as exc:
+                    self.stats.errors.append(str(exc))
+                    results.append(on_fail(item, f"error:{exc}"))
+            self.stats.wall_ms += (time.monotonic() - started) * 1000.0
+            return results
+
+        deadline_sec = self.call_deadline_sec or None
+
+        def _guarded(item: Any) -> Any:
+            deadline = time.monotonic() + deadline_sec if deadline_sec else None
+            if not self.bucket.acquire(deadline):
+                return _RateLimited
+            return fn(item)
+
+        results: List[Any] = [None] * len(items)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="llm-dispatch")
+        try:
+            submitted_at = time.monotonic()
+            futures = [executor.submit(_guarded, item) for item in items]
+            for idx, fut in enumerate(futures):
+                item = items[idx]
+                try:
+                    if deadline_sec:
+                        # 큐 대기 시간은 워커 수에 비례하므로 마감은 배치 기준으로 늘려 잡는다.
+                        wave = idx // self.max_workers + 1
+                        remaining = submitted_at + deadline_sec * wave - time.monotonic()
+                        value = fut.result(timeout=max(0.0, remaining))
+                    else:
+                        value = fut.result()
+                except FutureTimeout:
+                    fut.cancel()
+                    self.stats.timed_out += 1
+                    results[idx] = on_fail(item, "deadline_exceeded")
+                    continue
+                except Exception as exc:
+                    self.stats.errors.append(str(exc))
+                    results[idx] = on_fail(item, f"error:{exc}")
+                    continue
+                if value is _RateLimited:
+                    self.stats.rate_limited += 1
+                    results[idx] = on_fail(item, "rate_limited")
+                    continue
+                self.stats.completed += 1
+                results[idx] = value
+        finally:
+            # 마감을 넘긴 호출은 기다리지 않는다(스레드는 LLM timeout으로 스스로 끝난다).
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.stats.wall_ms += (time.monotonic() - started) * 1000.0
+        return results
+
+
+def stats_dict(stats: DispatchStats) -> Dict[str, Any]:
+    return {
+        "submitted": stats.submitted,
+        "completed": stats.completed,
+        "timed_out": stats.timed_out,
+        "rate_limited": stats.rate_limited,
+        "errors": stats.errors[:20],
+        "wall_ms": round(stats.wall_ms, 1),
+    }
@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Sequence
 
 from .artifacts import ArtifactStore
+from .llm_dispatch import LLMDispatcher, stats_dict
 from .types import AgentContext
 
 
@@ -25,12 +26,15 @@ class AgentRunStat:
 class Orchestrator:
     """
     Minimal single-process orchestrator.
-    - No parallelism (SQLite safety)
+    - Agents run in order; SQLite access stays on the calling thread (serial payload gathering)
+    - Agents with `llm_fanout = True` receive a shared LLMDispatcher and fan out only their LLM
+      calls (bounded workers + token bucket + per-call deadline), merged back in input order
     - Soft-fail by default (continues other inputs)
     """
 
-    def __init__(self, soft_fail: bool = True) -> None:
+    def __init__(self, soft_fail: bool = True, dispatcher: LLMDispatcher | None = None) -> None:
         self.soft_fail = soft_fail
+        self.dispatcher = dispatcher or LLMDispatcher()
 
     def _toposort(self, agents: Sequence[Any]) -> List[Any]:
         # For now, execute in given order (agents can later expose depends_on)
@@ -57,11 +61,12 @@ class Orchestrator:
             start = time.time()
             stat.run_count += 1
             try:
+                fanout = {"dispatcher": self.dispatcher} if getattr(agent, "llm_fanout", False) else {}
                 if scope == "counterparty":
                     rows = artifacts.get("base.counterparty_rows", [])
-                    output = agent.run(conn, rows, ctx, cache_dir=ctx.cache_root)
+                    output = agent.run(conn, rows, ctx, cache_dir=ctx.cache_root, **fanout)
                 else:
-                    output = agent.run(conn, ctx, artifacts)
+                    output = agent.run(conn, ctx, artifacts, **fanout)
                 agent_outputs[name] = output
                 # Telemetry aggregation (best-effort)
                 if isinstance(output, dict):
@@ -80,5 +85,6 @@ class Orchestrator:
                 stat.duration_ms_sum += (time.time() - start) * 1000.0
 
         artifacts.set("telemetry.agent_runs", stats)
+        artifacts.set("telemetry.llm_dispatch", stats_dict(self.dispatcher.stats))
         return agent_outputs
 
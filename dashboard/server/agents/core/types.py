@@ -23,6 +23,7 @@ class LLMConfig:
     max_tokens: int
     temperature: float
     api_key: str
+    retry: int = 1
 
     @classmethod
     def from_env(cls) -> "LLMConfig":
@@ -33,6 +34,7 @@ class LLMConfig:
         max_tokens = int(_clamp(os.getenv("LLM_MAX_TOKENS", 512), 128, 2048, 512))
         temperature = _clamp(os.getenv("LLM_TEMPERATURE", 0.2), 0.0, 1.0, 0.2)
         api_key = os.getenv("OPENAI_API_KEY", "")
+        retry = int(_clamp(os.getenv("LLM_RETRY", 1), 0, 3, 1))
         return cls(
             provider=provider,
             model=model,
@@ -41,11 +43,27 @@ class LLMConfig:
             max_tokens=max_tokens,
             temperature=temperature,
             api_key=api_key,
+            retry=retry,
         )
 
     def is_enabled(self) -> bool:
         return self.provider == "openai" and bool(self.api_key)
 
+    def chat(self, messages: list) -> str:
+        """Chat completion over the shared transport; `timeout` applies per attempt."""
+        from . import llm_client
+
+        return llm_client.chat_completion(
+            messages,
+            model=self.model,
+            base_url=self.base_url or None,
+            api_key=self.api_key,
+            timeout_total=self.timeout * (1 + self.retry),
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            retry=self.retry,
+        )
+
 
 @dataclass
 class AgentContext:
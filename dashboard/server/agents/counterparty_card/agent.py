@@ -3,19 +3,16 @@ from __future__ import annotations
 import json
 import os
 import sqlite3
+from dataclasses import dataclass
 from datetime import date, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Sequence, Tuple
 
-try:
-    from openai import OpenAI
-except Exception:  # pragma: no cover - optional dependency
-    OpenAI = None  # type: ignore
-
 from ..core.artifacts import ArtifactStore
 from ..core.cache_store import load as load_cache, save_atomic as save_cache
 from ..core.canonicalize import canonical_json, compute_llm_input_hash, norm_str, slugify
 from ..core.json_guard import parse_json, validate_output
+from ..core.llm_dispatch import LLMDispatcher
 from ..core.prompt_store import PromptStore
 from ..core.types import AgentContext, LLMConfig
 from .fallback import fallback_actions, fallback_blockers, fallback_evidence
@@ -145,6 +142,10 @@ def gather_deals_for_counterparty(
         (org_id, counterparty_name),
     ).fetchall()
 
+    return _deals_from_rows(rows, mode_key)
+
+
+def _deals_from_rows(rows: Sequence[Any], mode_key: str) -> List[Dict[str, Any]]:
     deals: List[Dict[str, Any]] = []
     mode = _normalize_mode(mode_key)
     for r in rows:
@@ -198,14 +199,14 @@ def gather_memos(
     cutoff = (as_of - timedelta(days=MEMO_WINDOW_DAYS)).isoformat()
     memos: List[Dict[str, Any]] = []
     memos += [
-        {"id": row["id"], "date": (row["createdAt"] or "")[:10], "source": "organization", "text": norm_str(row["text"] or "")}
+        _memo_item(row, "organization")
         for row in conn.execute(
             "SELECT id, text, createdAt FROM memo WHERE organizationId = ? AND (createdAt IS NULL OR substr(createdAt,1,10) >= ?) ORDER BY createdAt DESC",
             (org_id, cutoff),
         ).fetchall()
     ]
     memos += [
-        {"id": row["id"], "date": (row["createdAt"] or "")[:10], "source": "deal", "text": norm_str(row["text"] or "")}
+        _memo_item(row, "deal")
         for row in conn.execute(
             """
             SELECT m.id, m.text, m.createdAt
@@ -219,7 +220,7 @@ def gather_memos(
         ).fetchall()
     ]
     memos += [
-        {"id": row["id"], "date": (row["createdAt"] or "")[:10], "source": "people", "text": norm_str(row["text"] or "")}
+        _memo_item(row, "people")
         for row in conn.execute(
             """
             SELECT m.id, m.text, m.createdAt
@@ -234,6 +235,14 @@ def gather_memos(
         ).fetchall()
     ]
 
+    return _finalize_memos(memos)
+
+
+def _memo_item(row: Any, source: str) -> Dict[str, Any]:
+    return {"id": row["id"], "date": (row["createdAt"] or "")[:10], "source": source, "text": norm_str(row["text"] or "")}
+
+
+def _finalize_memos(memos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     seen = set()
     deduped = []
     for m in memos:
@@ -250,9 +259,131 @@ def gather_memos(
     return trimmed
 
 
+PREFETCH_CHUNK = 500  # SQLite 변수 한도(999) 아래로 IN (...) 목록을 나눈다.
+
+
+def _chunks(items: Sequence[Any], size: int = PREFETCH_CHUNK) -> List[Sequence[Any]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def prefetch_deals_for_counterparties(
+    conn: sqlite3.Connection,
+    keys: Sequence[Tuple[str, str]],
+    mode_key: str = "offline",
+) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+    """
+    gather_deals_for_counterparty의 일괄 버전: 후보 org 전체의 딜을 org 청크당 한 번 조회해
+    (org_id, 소속 상위 조직)으로 나눈 뒤 동일한 필터/정렬을 적용한다.
+    """
+    wanted = set(keys)
+    org_ids = sorted({org_id for org_id, _ in wanted})
+    rows_by_key: Dict[Tuple[str, str], List[Any]] = {}
+    for chunk in _chunks(org_ids):
+        placeholders = ",".join("?" * len(chunk))
+        for row in conn.execute(
+            f"""
+            SELECT
+                d.organizationId AS organization_id,
+                COALESCE(p."소속 상위 조직",'') AS upper_org,
+                d.id AS deal_id,
+                d."이름" AS deal_name,
+                d."상태" AS status,
+                d."성사 가능성" AS possibility,
+                d."금액" AS amount_primary,
+                d."예상 체결액" AS amount_fallback,
+                d."과정포맷" AS process_format,
+                d."계약 체결일" AS contract_signed_date,
+                d."수주 예정일" AS expected_close_date,
+                d."수강시작일" AS course_start_date,
+                d."수강종료일" AS course_end_date,
+                d."코스 ID" AS course_id_raw
+            FROM deal d
+            LEFT JOIN people p ON p.id = d.peopleId
+            WHERE d.organizationId IN ({placeholders})
+              AND d."상태" NOT IN ('Convert','Lost')
+            """,
+            tuple(chunk),
+        ).fetchall():
+            key = (row["organization_id"], row["upper_org"])
+            if key in wanted:
+                rows_by_key.setdefault(key, []).append(row)
+    return {key: _deals_from_rows(rows_by_key.get(key, []), mode_key) for key in wanted}
+
+
+def prefetch_memos(
+    conn: sqlite3.Connection,
+    keys: Sequence[Tuple[str, str]],
+    as_of: date,
+) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+    """
+    gather_memos의 일괄 버전: 후보 전체의 조직/딜/people 메모(180일 창)를 org 청크당 3회 조회하고
+    메모리에서 (org_id, 소속 상위 조직)별로 모아 gather_memos와 같은 dedupe/정렬/trim을 적용한다.
+    """
+    cutoff = (as_of - timedelta(days=MEMO_WINDOW_DAYS)).isoformat()
+    wanted = list(dict.fromkeys(keys))
+    org_ids = sorted({org_id for org_id, _ in wanted})
+    org_memos: Dict[str, List[Dict[str, Any]]] = {}
+    deal_memos: Dict[str, List[Dict[str, Any]]] = {}
+    people_memos: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    for chunk in _chunks(org_ids):
+        placeholders = ",".join("?" * len(chunk))
+        params = (*chunk, cutoff)
+        for row in conn.execute(
+            f"""
+            SELECT id, text, createdAt, organizationId AS org_id
+            FROM memo
+            WHERE organizationId IN ({placeholders})
+              AND (createdAt IS NULL OR substr(createdAt,1,10) >= ?)
+            ORDER BY createdAt DESC
+            """,
+            params,
+        ).fetchall():
+            org_memos.setdefault(row["org_id"], []).append(_memo_item(row, "organization"))
+        for row in conn.execute(
+            f"""
+            SELECT m.id, m.text, m.createdAt, d.organizationId AS org_id
+            FROM memo m
+            JOIN deal d ON d.id = m.dealId
+            WHERE d.organizationId IN ({placeholders})
+              AND (m.createdAt IS NULL OR substr(m.createdAt,1,10) >= ?)
+            ORDER BY m.createdAt DESC
+            """,
+            params,
+        ).fetchall():
+            deal_memos.setdefault(row["org_id"], []).append(_memo_item(row, "deal"))
+        for row in conn.execute(
+            f"""
+            SELECT m.id, m.text, m.createdAt, p.organizationId AS org_id, COALESCE(p."소속 상위 조직",'') AS upper_org
+            FROM memo m
+            JOIN people p ON p.id = m.peopleId
+            WHERE p.organizationId IN ({placeholders})
+              AND (m.createdAt IS NULL OR substr(m.createdAt,1,10) >= ?)
+            ORDER BY m.createdAt DESC
+            """,
+            params,
+        ).fetchall():
+            people_memos.setdefault((row["org_id"], row["upper_org"]), []).append(_memo_item(row, "people"))
+
+    return {
+        key: _finalize_memos(org_memos.get(key[0], []) + deal_memos.get(key[0], []) + people_memos.get(key, []))
+        for key in wanted
+    }
+
+
+@dataclass
+class CardJob:
+    key: Tuple[str, str]
+    row: Dict[str, Any]
+    payload: Dict[str, Any]
+    input_hash: str
+    cache_path: Path
+    output: Dict[str, Any] | None = None
+
+
 class CounterpartyCardAgent:
     name = "counterparty_card"
     scope = "counterparty"
+    llm_fanout = True  # run(..., dispatcher=...) 지원: SQLite 준비는 직렬, LLM 호출만 병렬
 
     def __init__(self, version: str = "v1") -> None:
         self.version = version
@@ -296,42 +427,26 @@ class CounterpartyCardAgent:
         return CounterpartyCardPayload.model_validate(payload).model_dump()
 
     def _llm_disabled(self, llm_cfg: LLMConfig) -> bool:
-        return not llm_cfg.is_enabled() or OpenAI is None
+        return not llm_cfg.is_enabled()
 
     def _call_llm(self, payload_json: str, prompts: Dict[str, str], llm_cfg: LLMConfig):
         if self._llm_disabled(llm_cfg):
             return None, "llm_disabled_or_missing_key"
-        client = OpenAI(api_key=llm_cfg.api_key, base_url=llm_cfg.base_url or None)
         messages = [
             {"role": "system", "content": prompts["system"]},
             {"role": "user", "content": prompts["user"].replace("{{PAYLOAD_JSON}}", payload_json)},
         ]
-        completion = client.chat.completions.create(
-            model=llm_cfg.model,
-            messages=messages,
-            timeout=llm_cfg.timeout,
-            max_tokens=llm_cfg.max_tokens,
-            temperature=llm_cfg.temperature,
-        )
-        text = completion.choices[0].message.content or ""
+        text = llm_cfg.chat(messages) or ""
         return text, None
 
     def _repair_json(self, bad_text: str, prompts: Dict[str, str], llm_cfg: LLMConfig):
         if self._llm_disabled(llm_cfg):
             return None, "llm_disabled_or_missing_key"
-        client = OpenAI(api_key=llm_cfg.api_key, base_url=llm_cfg.base_url or None)
         messages = [
             {"role": "system", "content": prompts["system"]},
             {"role": "user", "content": prompts["repair"]},
         ]
-        completion = client.chat.completions.create(
-            model=llm_cfg.model,
-            messages=messages,
-            timeout=llm_cfg.timeout,
-            max_tokens=llm_cfg.max_tokens,
-            temperature=llm_cfg.temperature,
-        )
-        text = completion.choices[0].message.content or ""
+        text = llm_cfg.chat(messages) or ""
         try:
             return json.loads(text), None
         except Exception as exc:
@@ -369,75 +484,126 @@ class CounterpartyCardAgent:
         output["fallback_used"] = False
         return output
 
-    def run(
+    def prepare(
         self,
         conn: sqlite3.Connection,
         risk_rows: Sequence[Dict[str, Any]],
         ctx: AgentContext,
         cache_dir: Path | None = None,
-    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    ) -> List[CardJob]:
+        """Phase 1 (serial, SQLite): build payloads for all candidates and resolve cache hits."""
         mode = _normalize_mode(ctx.mode_key)
-        prompts = self.prompts.load_set(mode, self.version)
         cache_root = cache_dir or ctx.cache_root
-        artifacts = ArtifactStore()
-        artifacts.set("base.counterparty_rows", risk_rows)
-
-        result: Dict[Tuple[str, str], Dict[str, Any]] = {}
         candidates = select_candidates(risk_rows)
         base_dir = Path(cache_root) / ctx.as_of_date.isoformat() / ctx.db_hash / mode
 
+        # 후보 전체의 메모/폴백 딜을 한 번에 적재 (후보 수와 무관하게 고정된 SQL 왕복)
+        candidate_set = set(candidates)
+        candidate_rows: Dict[Tuple[str, str], Dict[str, Any]] = {}
         for r in risk_rows:
             key = (r["organization_id"], r["counterparty_name"])
-            if key not in candidates:
-                continue
-            deals = r.get("top_deals_2026") or gather_deals_for_counterparty(
-                conn, r["organization_id"], r["counterparty_name"], mode_key=mode
-            )
-            memos = gather_memos(conn, r["organization_id"], r["counterparty_name"], ctx.as_of_date)
+            if key in candidate_set:
+                candidate_rows[key] = r  # 같은 키가 반복되면 마지막 행 기준(기존 덮어쓰기와 동일)
+        memos_by_key = prefetch_memos(conn, candidates, ctx.as_of_date)
+        deals_by_key = prefetch_deals_for_counterparties(
+            conn,
+            [key for key, r in candidate_rows.items() if not r.get("top_deals_2026")],
+            mode_key=mode,
+        )
+
+        jobs: List[CardJob] = []
+        for key, r in candidate_rows.items():
+            deals = r.get("top_deals_2026") or deals_by_key.get(key, [])
+            memos = memos_by_key.get(key, [])
             payload = self._build_payload(r, deals, memos, ctx.as_of_date, mode)
             input_hash = compute_llm_input_hash(payload)
             cache_path = base_dir / f"{slugify(r['organization_id'])}__{slugify(r['counterparty_name'])}.json"
+            job = CardJob(key=key, row=r, payload=payload, input_hash=input_hash, cache_path=cache_path)
             cached = load_cache(cache_path)
             if cached:
                 meta = cached.get("meta", {})
                 if meta.get("llm_input_hash") == input_hash and meta.get("prompt_version") == self.version:
                     output = cached.get("output", {})
-                    output = {
+                    job.output = {
                         **output,
                         "risk_level_llm": output.get("risk_level"),
                         "used_cache": True,
                         "llm_meta": meta,
                     }
-                    result[key] = output
-                    continue
-            output = self._run_model(payload, prompts, ctx.llm, mode)
-            meta = {
-                "as_of_date": ctx.as_of_date.isoformat(),
-                "db_hash": ctx.db_hash,
-                "counterparty_key": {"organizationId": r["organization_id"], "counterpartyName": r["counterparty_name"]},
-                "provider": ctx.llm.provider or "fallback",
-                "model": ctx.llm.model,
-                "base_url_configured": bool(ctx.llm.base_url),
-                "timeout": ctx.llm.timeout,
-                "max_tokens": ctx.llm.max_tokens,
-                "temperature": ctx.llm.temperature,
-                "prompt_version": self.version,
-                "llm_input_hash": input_hash,
-                "created_at": date.today().isoformat(),
-                "used_cache": False,
-                "fallback_used": output.get("fallback_used", False),
-                "mode": mode,
-                "agent": self.name,
-                "agent_version": self.version,
-            }
-            save_cache(cache_path, {"meta": meta, "output": output})
-            output = {
-                **output,
-                "risk_level_llm": output.get("risk_level"),
-                "used_cache": False,
-                "llm_meta": meta,
-            }
-            result[key] = output
+            jobs.append(job)
+        return jobs
+
+    def _meta(self, job: CardJob, ctx: AgentContext, mode: str, output: Dict[str, Any]) -> Dict[str, Any]:
+        r = job.row
+        return {
+            "as_of_date": ctx.as_of_date.isoformat(),
+            "db_hash": ctx.db_hash,
+            "counterparty_key": {"organizationId": r["organization_id"], "counterpartyName": r["counterparty_name"]},
+            "provider": ctx.llm.provider or "fallback",
+            "model": ctx.llm.model,
+            "base_url_configured": bool(ctx.llm.base_url),
+            "timeout": ctx.llm.timeout,
+            "max_tokens": ctx.llm.max_tokens,
+            "temperature": ctx.llm.temperature,
+            "prompt_version": self.version,
+            "llm_input_hash": job.input_hash,
+            "created_at": date.today().isoformat(),
+            "used_cache": False,
+            "fallback_used": output.get("fallback_used", False),
+            "mode": mode,
+            "agent": self.name,
+            "agent_version": self.version,
+        }
+
+    def complete(self, job: CardJob, prompts: Dict[str, str], ctx: AgentContext) -> Dict[str, Any]:
+        """Phase 2 (thread-safe, no SQLite): LLM call → validate/fallback → cache write."""
+        mode = _normalize_mode(ctx.mode_key)
+        output = self._run_model(job.payload, prompts, ctx.llm, mode)
+        meta = self._meta(job, ctx, mode, output)
+        save_cache(job.cache_path, {"meta": meta, "output": output})
+        return {
+            **output,
+            "risk_level_llm": output.get("risk_level"),
+            "used_cache": False,
+            "llm_meta": meta,
+        }
+
+    def fail_output(self, job: CardJob, ctx: AgentContext, reason: str) -> Dict[str, Any]:
+        """Rule fallback when the dispatched call missed its deadline/rate budget; not cached so the next run retries."""
+        mode = _normalize_mode(ctx.mode_key)
+        output = self._fallback_output(job.payload, mode)
+        meta = {**self._meta(job, ctx, mode, output), "dispatch_error": reason}
+        return {
+            **output,
+            "risk_level_llm": output.get("risk_level"),
+            "used_cache": False,
+            "llm_meta": meta,
+        }
+
+    def run(
+        self,
+        conn: sqlite3.Connection,
+        risk_rows: Sequence[Dict[str, Any]],
+        ctx: AgentContext,
+        cache_dir: Path | None = None,
+        dispatcher: LLMDispatcher | None = None,
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        mode = _normalize_mode(ctx.mode_key)
+        prompts = self.prompts.load_set(mode, self.version)
+        artifacts = ArtifactStore()
+        artifacts.set("base.counterparty_rows", risk_rows)
+
+        jobs = self.prepare(conn, risk_rows, ctx, cache_dir=cache_dir)
+        pending = [job for job in jobs if job.output is None]
+        outputs = (dispatcher or LLMDispatcher.serial()).map(
+            lambda job: self.complete(job, prompts, ctx),
+            pending,
+            on_fail=lambda job, reason: self.fail_output(job, ctx, reason),
+        )
+        for job, output in zip(pending, outputs):
+            job.output = output
 
+        # 입력(후보) 순서대로 병합
+        result: Dict[Tuple[str, str], Dict[str, Any]] = {job.key: job.output for job in jobs}
         artifacts.set("agent.counterparty_card.outputs", result)
         return result
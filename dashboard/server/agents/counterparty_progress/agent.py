@@ -2,17 +2,14 @@ from __future__ import annotations
 
 import hashlib
 import json
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Sequence, Tuple
-
-try:
-    from openai import OpenAI
-except Exception:  # pragma: no cover - optional dependency
-    OpenAI = None  # type: ignore
+from typing import Any, Dict, List, Sequence, Tuple
 
 from ..core.cache_store import load as load_cache, save_atomic as save_cache
 from ..core.canonicalize import canonical_json, compute_llm_input_hash
 from ..core.json_guard import parse_json
+from ..core.llm_dispatch import LLMDispatcher
 from ..core.prompt_store import PromptStore
 from ..core.types import AgentContext, LLMConfig
 from .fallback import build_fallback_result
@@ -25,9 +22,20 @@ def _upper_slug(text: str) -> str:
     return hashlib.sha1(text.strip().encode("utf-8")).hexdigest()[:10]
 
 
+@dataclass
+class ProgressJob:
+    key: Tuple[str, str]
+    payload: CounterpartyProgressInputV1
+    payload_json: str
+    llm_hash: str
+    cache_path: Path
+    output: Dict[str, Any] | None = None
+
+
 class CounterpartyProgressAgent:
     name = "CounterpartyProgressAgent"
     scope = "report"
+    llm_fanout = True  # run(..., dispatcher=...) 지원
 
     def __init__(self, version: str = "v1") -> None:
         self.version = version
@@ -52,42 +60,26 @@ class CounterpartyProgressAgent:
         return cached
 
     def _llm_disabled(self, llm_cfg: LLMConfig) -> bool:
-        return not llm_cfg.is_enabled() or OpenAI is None
+        return not llm_cfg.is_enabled()
 
     def _llm_call(self, payload_json: str, prompts: Dict[str, str], llm_cfg: LLMConfig):
         if self._llm_disabled(llm_cfg):
             return None, "llm_disabled_or_missing_key"
-        client = OpenAI(api_key=llm_cfg.api_key, base_url=llm_cfg.base_url or None)
         messages = [
             {"role": "system", "content": prompts["system"]},
             {"role": "user", "content": prompts["user"].replace("{{PAYLOAD_JSON}}", payload_json)},
         ]
-        completion = client.chat.completions.create(
-            model=llm_cfg.model,
-            messages=messages,
-            timeout=llm_cfg.timeout,
-            max_tokens=llm_cfg.max_tokens,
-            temperature=llm_cfg.temperature,
-        )
-        text = completion.choices[0].message.content or ""
+        text = llm_cfg.chat(messages) or ""
         return text, None
 
     def _repair_json(self, prompts: Dict[str, str], llm_cfg: LLMConfig):
         if self._llm_disabled(llm_cfg):
             return None, "llm_disabled_or_missing_key"
-        client = OpenAI(api_key=llm_cfg.api_key, base_url=llm_cfg.base_url or None)
         messages = [
             {"role": "system", "content": prompts["system"]},
             {"role": "user", "content": prompts["repair"]},
         ]
-        completion = client.chat.completions.create(
-            model=llm_cfg.model,
-            messages=messages,
-            timeout=llm_cfg.timeout,
-            max_tokens=llm_cfg.max_tokens,
-            temperature=llm_cfg.temperature,
-        )
-        text = completion.choices[0].message.content or ""
+        text = llm_cfg.chat(messages) or ""
         try:
             return json.loads(text), None
         except Exception as exc:
@@ -113,48 +105,68 @@ class CounterpartyProgressAgent:
         )
         return validated.model_dump()
 
-    def run(self, conn, ctx: AgentContext, artifacts) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    def prepare(self, ctx: AgentContext, artifacts) -> List[ProgressJob]:
+        """Phase 1 (serial): validate rows into payloads and resolve cache hits."""
         rows: Sequence[Dict[str, Any]] = artifacts.get("base.counterparty_rows", [])
-        prompts = self.prompt.load_set(ctx.mode_key, self.version)
-        outputs: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        jobs: Dict[Tuple[str, str], ProgressJob] = {}
         for r in rows:
             payload = CounterpartyProgressInputV1.model_validate(r)
             payload_dict = payload.model_dump()
-            payload_json = canonical_json(payload_dict)
             llm_hash = compute_llm_input_hash(payload_dict)
             cache_path = self._cache_path(ctx, payload)
-            cached = self._load_cache(cache_path, llm_hash)
             key = (payload.counterparty_key.org_id, payload.counterparty_key.upper_org)
+            job = ProgressJob(key=key, payload=payload, payload_json=canonical_json(payload_dict), llm_hash=llm_hash, cache_path=cache_path)
+            cached = self._load_cache(cache_path, llm_hash)
             if cached:
-                outputs[key] = {**cached, "used_cache": True}
-                continue
-
-            raw_text, err = self._llm_call(payload_json, prompts, ctx.llm)
-            body: Dict[str, Any] = {}
-            parsed: Dict[str, Any] | None = None
-            if err or raw_text is None:
-                parsed = None
+                job.output = {**cached, "used_cache": True}
+            jobs[key] = job  # 같은 키가 반복되면 마지막 행 기준
+        return list(jobs.values())
+
+    def complete(self, job: ProgressJob, prompts: Dict[str, str], ctx: AgentContext) -> Dict[str, Any]:
+        """Phase 2 (thread-safe): LLM call → validate/fallback → cache write."""
+        payload = job.payload
+        raw_text, err = self._llm_call(job.payload_json, prompts, ctx.llm)
+        body: Dict[str, Any] = {}
+        parsed: Dict[str, Any] | None = None
+        if err or raw_text is None:
+            parsed = None
+        else:
+            parsed_obj, parse_err = parse_json(raw_text)
+            if parse_err:
+                repaired, _ = self._repair_json(prompts, ctx.llm)
+                parsed = repaired if isinstance(repaired, dict) else None
             else:
-                parsed_obj, parse_err = parse_json(raw_text)
-                if parse_err:
-                    repaired, _ = self._repair_json(prompts, ctx.llm)
-                    parsed = repaired if isinstance(repaired, dict) else None
-                else:
-                    parsed = parsed_obj if isinstance(parsed_obj, dict) else None
-            if parsed:
-                body = {k: parsed.get(k) for k in ALLOWED_KEYS}
-
-            try:
-                wrapped = self._wrap_output(payload, body, llm_hash, fallback_used=False, model=ctx.llm.model)
-                # ensure evidence/actions length, else fallback
-                if len(wrapped.get("evidence_bullets", [])) != 3 or not (2 <= len(wrapped.get("recommended_actions", [])) <= 3):
-                    raise ValueError("invalid lengths")
-                save_cache(cache_path, wrapped)
-                outputs[key] = wrapped
-                continue
-            except Exception:
-                fb_body = build_fallback_result(payload)
-                wrapped = self._wrap_output(payload, fb_body, llm_hash, fallback_used=True, model=ctx.llm.model)
-                save_cache(cache_path, wrapped)
-                outputs[key] = wrapped
-        return outputs
+                parsed = parsed_obj if isinstance(parsed_obj, dict) else None
+        if parsed:
+            body = {k: parsed.get(k) for k in ALLOWED_KEYS}
+
+        try:
+            wrapped = self._wrap_output(payload, body, job.llm_hash, fallback_used=False, model=ctx.llm.model)
+            # ensure evidence/actions length, else fallback
+            if len(wrapped.get("evidence_bullets", [])) != 3 or not (2 <= len(wrapped.get("recommended_actions", [])) <= 3):
+                raise ValueError("invalid lengths")
+        except Exception:
+            fb_body = build_fallback_result(payload)
+            wrapped = self._wrap_output(payload, fb_body, job.llm_hash, fallback_used=True, model=ctx.llm.model)
+        save_cache(job.cache_path, wrapped)
+        return wrapped
+
+    def fail_output(self, job: ProgressJob, ctx: AgentContext, reason: str) -> Dict[str, Any]:
+        """Rule fallback for calls that missed the dispatch deadline; not cached so the next run retries."""
+        fb_body = build_fallback_result(job.payload)
+        wrapped = self._wrap_output(job.payload, fb_body, job.llm_hash, fallback_used=True, model=ctx.llm.model)
+        wrapped["llm_meta"]["dispatch_error"] = reason
+        return wrapped
+
+    def run(self, conn, ctx: AgentContext, artifacts, dispatcher: LLMDispatcher | None = None) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        prompts = self.prompt.load_set(ctx.mode_key, self.version)
+        jobs = self.prepare(ctx, artifacts)
+        pending = [job for job in jobs if job.output is None]
+        outputs = (dispatcher or LLMDispatcher.serial()).map(
+            lambda job: self.complete(job, prompts, ctx),
+            pending,
+            on_fail=lambda job, reason: self.fail_output(job, ctx, reason),
+        )
+        for job, output in zip(pending, outputs):
+            job.output = output
+        return {job.key: job.output for job in jobs}
@@ -12,6 +12,7 @@ import httpx
 from fastapi import HTTPException
 
 from dashboard.server.markdown_compact import won_groups_compact_to_markdown
+from ..core import llm_client
 from ..core.cache_store import build_cache_key, load as load_cache, save_atomic as save_cache
 from ..core.json_guard import ensure_json_object_or_error, parse_json_object
 from ..core.prompt_store import PromptStore
@@ -62,10 +63,7 @@ def _get_prompt_version() -> str:
 
 
 def _post_openai_once(url: str, headers: Dict[str, str], payload: Dict[str, Any], *, timeout: float) -> Dict[str, Any]:
-    with httpx.Client(timeout=timeout) as client:
-        resp = client.post(url, headers=headers, json=payload)
-        resp.raise_for_status()
-        return resp.json()
+    return llm_client.post_json(url, headers, payload, timeout=timeout)
 
 
 def _call_openai_chat_completions(
@@ -82,64 +80,21 @@ def _call_openai_chat_completions(
     calls_log: List[Dict[str, Any]] | None = None,
     kind: str = "main",
 ) -> str:
-    url = f"{base_url}/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
-    payload = {
-        "model": model,
-        "messages": messages,
-        "temperature": temperature,
-        "max_tokens": max_tokens,
-    }
     total = timeout_total if timeout_total is not None else (timeout if timeout is not None else 120.0)
-    attempts = max(1, 1 + max(0, retry))
-    budget = max(total, 0.1)
-    attempt_timeout = budget / attempts
-
-    for attempt in range(attempts):
-        per_timeout = attempt_timeout if attempt < attempts - 1 else budget
-        try:
-            if calls_log is not None:
-                calls_log.append(
-                    {
-                        "kind": kind,
-                        "attempt": attempt + 1,
-                        "attempts": attempts,
-                        "url": url,
-                        "payload": payload,
-                        "timeout_s": per_timeout,
-                    }
-                )
-            data = _post_openai_once(url, headers, payload, timeout=per_timeout)
-            try:
-                return data["choices"][0]["message"]["content"]
-            except Exception as exc:  # pragma: no cover - defensive
-                raise RuntimeError(f"Invalid OpenAI response: {exc}")
-        except (httpx.ReadTimeout, httpx.ConnectTimeout, httpx.TimeoutException) as exc:
-            if attempt < attempts - 1:
-                logger.warning(
-                    "target_attainment.retry",
-                    extra={
-                        "event": "target_attainment.retry",
-                        "attempt": attempt + 1,
-                        "attempts": attempts,
-                        "timeout_s": per_timeout,
-                        "reason": exc.__class__.__name__,
-                    },
-                )
-                budget -= per_timeout
-                time.sleep(0.5)
-                continue
-            logger.warning(
-                "target_attainment.timeout",
-                extra={"event": "target_attainment.timeout", "attempts": attempts, "timeout_total_s": timeout_total},
-            )
-            raise
-        except httpx.HTTPStatusError:
-            # do not retry on HTTP errors
-            raise
+    return llm_client.chat_completion(
+        messages,
+        model=model,
+        base_url=base_url,
+        api_key=api_key,
+        timeout_total=total,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        retry=retry,
+        calls_log=calls_log,
+        kind=kind,
+        event_prefix="target_attainment",
+        post=_post_openai_once,
+    )
 
 
 class TargetAttainmentAgent:
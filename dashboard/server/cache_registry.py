@@ -0,0 +1,283 @@
+"""
+Bounded in-process caches for database.py payloads.
+
+Each `BoundedCache` is a small dict-like LRU with an entry cap, a rough byte budget, and hit/miss
+counters. Caches keyed by `(path, mtime, ...)` (db_keyed=True) drop every entry of an older
+signature for the same path as soon as a newer one is stored. The first lookup or store under a
+newer signature also evicts the older one from every *registered* cache (`note_signature` →
+`evict_db`), so caches nobody re-requests after a nightly snapshot refresh do not keep yesterday's
+payloads resident either. `cache_stats()` feeds `/api/debug/caches`.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+# approx_size가 끝까지 내려가지 않도록 하는 상한 (대형 payload 측정 비용 제한)
+_SIZE_MAX_DEPTH = 6
+_SIZE_SAMPLE_ITEMS = 200
+
+_REGISTRY: "OrderedDict[str, BoundedCache]" = OrderedDict()
+_REGISTRY_LOCK = threading.Lock()
+# path -> newest signature (mtime) seen by any registered cache
+_CURRENT_SIGNATURES: Dict[Any, Any] = {}
+_SIGNATURE_LOCK = threading.Lock()
+
+
+def approx_size(obj: Any, _depth: int = 0) -> int:
+    """
+    Rough deep size in bytes. Containers larger than _SIZE_SAMPLE_ITEMS are extrapolated from a
+    sample so measuring a multi-MB payload stays cheap; this is for budgeting, not exact accounting.
+    Buffers exposing `nbytes` (NumPy arrays, including views) count their data; other objects
+    (PortfolioIndex, ColumnFrame, ...) are measured through their __dict__/__slots__.
+    """
+    size = sys.getsizeof(obj)
+    if _depth >= _SIZE_MAX_DEPTH or isinstance(obj, (str, bytes, bytearray, int, float, bool, type(None), type)):
+        return size
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):
+        # getsizeof already includes the buffer of an array that owns its data, but not of a view
+        return max(size, nbytes)
+    if isinstance(obj, dict):
+        items = list(obj.items())
+        sample = items[:_SIZE_SAMPLE_ITEMS]
+        inner = sum(approx_size(k, _depth + 1) + approx_size(v, _depth + 1) for k, v in sample)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        items = list(obj)
+        sample = items[:_SIZE_SAMPLE_ITEMS]
+        inner = sum(approx_size(v, _depth + 1) for v in sample)
+    else:
+        inner = 0
+        attrs = getattr(obj, "__dict__", None)
+        if isinstance(attrs, dict):
+            inner += approx_size(attrs, _depth)
+        for cls in type(obj).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            for slot in (slots,) if isinstance(slots, str) else slots:
+                if slot not in ("__dict__", "__weakref__") and hasattr(obj, slot):
+                    inner += approx_size(getattr(obj, slot), _depth + 1)
+        return size + inner
+    if sample and len(items) > len(sample):
+        inner = int(inner * len(items) / len(sample))
+    return size + inner
+
+
+def _db_signature(key: Hashable) -> Optional[Tuple[Any, Any]]:
+    if isinstance(key, tuple) and len(key) >= 2 and isinstance(key[0], Path):
+        return key[0], key[1]
+    return None
+
+
+class BoundedCache:
+    """Thread-safe LRU mapping with entry/byte limits; supports the dict subset database.py uses."""
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 64,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        db_keyed: bool = True,
+    ) -> None:
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.db_keyed = db_keyed
+        self._data: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._latest: Dict[Any, Any] = {}
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale_evictions = 0
+
+    # --- dict protocol -------------------------------------------------
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        self._note_key(key)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def __getitem__(self, key: Hashable) -> Any:
+        self._note_key(key)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                raise KeyError(key)
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        size = approx_size(value)
+        self._note_key(key)
+        with self._lock:
+            if self.db_keyed:
+                self._evict_older_signatures(key)
+            if key in self._data:
+                self._bytes -= self._data.pop(key)[1]
+            self._data[key] = (value, size)
+            self._bytes += size
+            self._enforce_limits(keep=key)
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            self._bytes -= self._data.pop(key)[1]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._data.keys()))
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is None:
+                return default
+            self._bytes -= entry[1]
+            return entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._latest.clear()
+            self._bytes = 0
+
+    # --- eviction ------------------------------------------------------
+    def _note_key(self, key: Hashable) -> None:
+        # 다른 캐시의 락을 잡으므로 self._lock 밖에서 호출한다 (락 순서 역전 방지).
+        if not self.db_keyed:
+            return
+        sig = _db_signature(key)
+        if sig is not None:
+            note_signature(*sig)
+
+    def _evict_older_signatures(self, key: Hashable) -> None:
+        sig = _db_signature(key)
+        if sig is None:
+            return
+        path, stamp = sig
+        if self._latest.get(path, stamp) == stamp:
+            self._latest[path] = stamp
+            return
+        self._latest[path] = stamp
+        self.evict_path(path, keep_signature=stamp)
+
+    def evict_path(self, path: Path, keep_signature: Any = None) -> int:
+        """Drop entries for `path` whose signature differs from keep_signature (all when None)."""
+        removed = 0
+        with self._lock:
+            for existing in list(self._data.keys()):
+                sig = _db_signature(existing)
+                if sig is None or sig[0] != path:
+                    continue
+                if keep_signature is not None and sig[1] == keep_signature:
+                    continue
+                self._bytes -= self._data.pop(existing)[1]
+                removed += 1
+            self.stale_evictions += removed
+        return removed
+
+    def _enforce_limits(self, keep: Hashable) -> None:
+        while self._data and (
+            len(self._data) > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            oldest = next(iter(self._data))
+            if oldest == keep:
+                # 단일 항목이 예산보다 큰 경우라도 방금 넣은 값은 유지한다.
+                if len(self._data) == 1:
+                    break
+                self._data.move_to_end(oldest)
+                continue
+            self._bytes -= self._data.pop(oldest)[1]
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._data),
+                "max_entries": self.max_entries,
+                "approx_bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "stale_evictions": self.stale_evictions,
+            }
+
+
+def register_cache(
+    name: str,
+    max_entries: int = 64,
+    max_bytes: Optional[int] = 64 * 1024 * 1024,
+    db_keyed: bool = True,
+) -> BoundedCache:
+    """Create (or return the already registered) cache with the given name."""
+    with _REGISTRY_LOCK:
+        cache = _REGISTRY.get(name)
+        if cache is None:
+            cache = BoundedCache(name, max_entries=max_entries, max_bytes=max_bytes, db_keyed=db_keyed)
+            _REGISTRY[name] = cache
+        return cache
+
+
+def registered_caches() -> List[BoundedCache]:
+    with _REGISTRY_LOCK:
+        return list(_REGISTRY.values())
+
+
+def evict_db(path: Path, keep_signature: Any = None) -> int:
+    """Evict entries for `path` (except keep_signature) from every registered cache."""
+    return sum(cache.evict_path(path, keep_signature=keep_signature) for cache in registered_caches())
+
+
+def note_signature(path: Path, signature: Any) -> int:
+    """
+    Record `signature` as current for `path`; when it replaces an older one, evict the older
+    signature's entries from every registered cache. A late request still holding the previous
+    mtime does not roll the current signature back. Returns the number of evicted entries.
+    """
+    with _SIGNATURE_LOCK:
+        previous = _CURRENT_SIGNATURES.get(path)
+        if previous == signature:
+            return 0
+        if isinstance(previous, (int, float)) and isinstance(signature, (int, float)) and signature < previous:
+            return 0
+        _CURRENT_SIGNATURES[path] = signature
+    if previous is None:
+        return 0
+    return evict_db(path, keep_signature=signature)
+
+
+def clear_all() -> None:
+    for cache in registered_caches():
+        cache.clear()
+    with _SIGNATURE_LOCK:
+        _CURRENT_SIGNATURES.clear()
+
+
+def cache_stats() -> Dict[str, Any]:
+    caches = [cache.stats() for cache in registered_caches()]
+    return {
+        "caches": caches,
+        "total_entries": sum(c["entries"] for c in caches),
+        "total_approx_bytes": sum(c["approx_bytes"] for c in caches),
+    }
@@ -0,0 +1,163 @@
+"""
+Background warm-up of the dashboard's default views after a DB refresh.
+
+On startup, and whenever the snapshot signature (db_pool.file_signature) changes, the default-parameter
+variants of the heavy endpoints are computed in a small thread pool so their in-process caches are hot
+before the first user opens each tab. Entries of the previous snapshot are first evicted from every
+registered cache (cache_registry.evict_db), including views nobody re-requests. `warmup_status()` feeds
+`/api/health`; `?ready=true` there returns 503 until the current signature is warmed, so a readiness probe can hold traffic.
+Set ENABLE_CACHE_WARMUP=0 to skip (tests, one-off scripts).
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import cache_registry
+from . import database
+from . import db_pool
+
+logger = logging.getLogger(__name__)
+
+WARMUP_CONCURRENCY = max(1, int(os.getenv("WARMUP_CONCURRENCY", "2")))
+WARMUP_POLL_SEC = float(os.getenv("WARMUP_POLL_SEC", "30"))
+
+# (name, fn(db_path)) — 각 엔드포인트의 기본 파라미터 호출과 같은 캐시 키를 채운다.
+WARMUP_TASKS: List[Tuple[str, Callable[[Path], Any]]] = [
+    ("perf_monthly_amounts", lambda p: database.get_perf_monthly_amounts_summary(db_path=p)),
+    ("perf_monthly_inquiries", lambda p: database.get_perf_monthly_inquiries_summary(db_path=p)),
+    ("perf_monthly_close_rate", lambda p: database.get_perf_monthly_close_rate_summary(db_path=p)),
+    ("counterparty_dri", lambda p: database.get_rank_2025_top100_counterparty_dri(db_path=p)),
+    # QC 탭은 팀별로만 요청한다 (org_tables_v2.html: team=edu1|edu2|public)
+    ("qc_deal_errors_edu1", lambda p: database.get_qc_deal_errors_summary(team="edu1", db_path=p)),
+    ("qc_deal_errors_edu2", lambda p: database.get_qc_deal_errors_summary(team="edu2", db_path=p)),
+    ("qc_deal_errors_public", lambda p: database.get_qc_deal_errors_summary(team="public", db_path=p)),
+    ("statepath_portfolio", lambda p: database.get_statepath_portfolio(db_path=p)),
+]
+
+_state_lock = threading.Lock()
+_warm_lock = threading.Lock()
+_state: Dict[str, Any] = {
+    "status": "idle",
+    "signature": None,
+    "started_at": None,
+    "finished_at": None,
+    "total": len(WARMUP_TASKS),
+    "done": 0,
+    "failed": 0,
+    "tasks": {},
+}
+_watcher: Optional[threading.Thread] = None
+_stop = threading.Event()
+
+
+def _signature(db_path: Path) -> Optional[Tuple[Any, ...]]:
+    try:
+        return db_pool.file_signature(db_path)
+    except OSError:
+        return None
+
+
+def _update(**fields: Any) -> None:
+    with _state_lock:
+        _state.update(fields)
+
+
+def _run_task(name: str, fn: Callable[[Path], Any], db_path: Path) -> None:
+    started = time.perf_counter()
+    error: Optional[str] = None
+    try:
+        fn(db_path)
+    except Exception as exc:  # 한 뷰 실패가 나머지 워밍을 막지 않도록 기록만 한다.
+        error = f"{type(exc).__name__}: {exc}"
+        logger.warning("[warmup] %s failed: %s", name, error)
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    with _state_lock:
+        _state["tasks"][name] = {"status": "error" if error else "ok", "elapsed_ms": elapsed_ms, "error": error}
+        _state["done"] += 1
+        if error:
+            _state["failed"] += 1
+
+
+def warm(db_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Warm every WARMUP_TASKS entry for db_path (default: database.DB_PATH); returns the final status."""
+    path = Path(db_path or database.DB_PATH)
+    with _warm_lock:
+        signature = _signature(path)
+        if signature is None:
+            _update(status="no_db", signature=None, done=0, failed=0, tasks={})
+            return warmup_status()
+        # database.py caches key on (db_path, st_mtime, ...): drop every other snapshot's entries
+        evicted = cache_registry.evict_db(path, keep_signature=path.stat().st_mtime)
+        if evicted:
+            logger.info("[warmup] evicted %d cache entries of previous snapshots", evicted)
+        _update(
+            status="running",
+            signature=signature,
+            started_at=time.time(),
+            finished_at=None,
+            total=len(WARMUP_TASKS),
+            done=0,
+            failed=0,
+            tasks={name: {"status": "pending"} for name, _ in WARMUP_TASKS},
+        )
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=WARMUP_CONCURRENCY, thread_name_prefix="warmup") as pool:
+            for future in [pool.submit(_run_task, name, fn, path) for name, fn in WARMUP_TASKS]:
+                future.result()
+        _update(status="ready", finished_at=time.time())
+        logger.info(
+            "[warmup] %d views warmed in %.1fs (failed=%d)",
+            len(WARMUP_TASKS),
+            time.perf_counter() - started,
+            _state["failed"],
+        )
+    return warmup_status()
+
+
+def warmup_status(db_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Progress snapshot; `ready` is true only when the warmed signature matches the current DB file."""
+    with _state_lock:
+        snapshot = {**_state, "tasks": {k: dict(v) for k, v in _state["tasks"].items()}}
+    if snapshot["status"] == "disabled":
+        snapshot["ready"] = True
+    else:
+        current = _signature(Path(db_path or database.DB_PATH))
+        snapshot["ready"] = snapshot["status"] == "ready" and current is not None and current == snapshot["signature"]
+    snapshot["signature"] = list(snapshot["signature"]) if snapshot["signature"] else None
+    return snapshot
+
+
+def _watch() -> None:
+    while not _stop.is_set():
+        with _state_lock:
+            warmed = _state["signature"]
+        if _signature(Path(database.DB_PATH)) != warmed or warmed is None:
+            try:
+                warm()
+            except Exception as exc:  # pragma: no cover - defensive; tasks already isolate errors
+                logger.warning("[warmup] run failed: %s", exc)
+        _stop.wait(WARMUP_POLL_SEC)
+
+
+def start_cache_warmer() -> Optional[threading.Thread]:
+    """Start the warm-up watcher once per process (warms immediately, then on DB signature changes)."""
+    global _watcher
+    if os.getenv("ENABLE_CACHE_WARMUP", "1") == "0":
+        _update(status="disabled")
+        return None
+    if _watcher is not None and _watcher.is_alive():
+        return _watcher
+    _stop.clear()
+    _watcher = threading.Thread(target=_watch, name="cache-warmer", daemon=True)
+    _watcher.start()
+    return _watcher
+
+
+def stop_cache_warmer() -> None:
+    _stop.set()
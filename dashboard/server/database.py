@@ -5,14 +5,21 @@ import logging
 import os
 import re
 import sqlite3
-from collections import Counter, defaultdict
+from collections import Counter
 from datetime import date, datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 from . import statepath_engine as sp
 from .counterparty_targets_2026 import load_counterparty_targets_2026
 from . import date_kst
+from . import db_pool
+from . import deal_fact
+from . import memo_clean
+from . import perf_columns
+from . import search_index
+from . import statepath_portfolio
+from .cache_registry import register_cache
 
 DB_PATH_ENV = os.getenv("DB_PATH", "salesmap_latest.db")
 print(f"[db] Using DB_PATH={DB_PATH_ENV}")
@@ -139,9 +146,10 @@ class ShadowDiffCollector:
         logger.warning("DATE_KST_SHADOW_DIFF %s", payload)
 
 
-_OWNER_LOOKUP_CACHE: Dict[Path, Dict[str, str]] = {}
-_TABLE_COLUMNS_CACHE: Dict[Tuple[Path, str], Tuple[Optional[float], Set[str]]] = {}
+_OWNER_LOOKUP_CACHE = register_cache("owner_lookup", max_entries=8)
+_TABLE_COLUMNS_CACHE = register_cache("table_columns", max_entries=256, db_keyed=False)
 YEARS_FOR_WON = {"2023", "2024", "2025"}
+SNAPSHOT_INDEX_MIN_VERSION = 1
 ONLINE_COURSE_FORMATS = {"구독제(온라인)", "선택구매(온라인)", "포팅"}
 ONLINE_PNL_FORMATS = {
     "구독제(온라인)",
@@ -156,28 +164,30 @@ PUBLIC_KEYWORDS = ["공단", "공사", "진흥원", "재단", "협회", "청", "
 ACCOUNTING_AUDIT_START_KEY = "2025-01"
 ACCOUNTING_DATA_ENV = "ACCOUNTING_DATA_PATH"
 _KST_TZ = timezone(timedelta(hours=9))
-_COUNTERPARTY_DRI_CACHE: Dict[Tuple[Path, float, str, int, str], Dict[str, Any]] = {}
-_COUNTERPARTY_DRI_SUMMARY_CACHE: Dict[Tuple[Path, float, str, str], Dict[str, Any]] = {}
+_COUNTERPARTY_DRI_CACHE = register_cache("counterparty_dri", max_entries=16)
+_COUNTERPARTY_DRI_SUMMARY_CACHE = register_cache("counterparty_dri_summary", max_entries=64)
 _COUNTERPARTY_TARGET_WARNED: Set[Tuple[float, str]] = set()
-_RANK_2025_SUMMARY_CACHE: Dict[Tuple[Path, float, str, Tuple[int, ...]], Dict[str, Any]] = {}
-_PERF_MONTHLY_DATA_CACHE: Dict[Tuple[Path, float], Dict[str, Any]] = {}
-_PERF_MONTHLY_SUMMARY_CACHE: Dict[Tuple[Path, float, str, str], Dict[str, Any]] = {}
-_PERF_MONTHLY_INQUIRIES_CACHE: Dict[Tuple[Path, float], Dict[str, Any]] = {}
-_PERF_MONTHLY_INQUIRIES_SUMMARY_CACHE: Dict[Tuple[Path, float, str, str, str], Dict[str, Any]] = {}
+_RANK_2025_SUMMARY_CACHE = register_cache("rank_2025_summary", max_entries=64)
+_PERF_MONTHLY_DATA_CACHE = register_cache("perf_monthly_data", max_entries=4)
+_PERF_MONTHLY_INQUIRIES_CACHE = register_cache("perf_monthly_inquiries", max_entries=4)
 # 2026 체결률(근황) 전용 캐시
 CLOSE_RATE_ONLINE_COURSE_FORMATS = ["구독제(온라인)", "선택구매(온라인)", "포팅"]
 CLOSE_RATE_OFFLINE_FORMATS = {"출강", "복합(출강+온라인)", "교육체계 수립", "비대면 실시간"}
 CLOSE_RATE_COURSE_GROUPS = ["구독제(온라인)", "선택구매(온라인)", "포팅", "오프라인"]
 CLOSE_RATE_METRICS = ["total", "confirmed", "high", "low", "lost", "close_rate"]
-_PERF_MONTHLY_CLOSE_RATE_CACHE: Dict[Tuple[Path, float, Path, Optional[float]], Dict[str, Any]] = {}
-_PERF_MONTHLY_CLOSE_RATE_SUMMARY_CACHE: Dict[Tuple[Path, float, Path, Optional[float], str, str, str, str], Dict[str, Any]] = {}
-_PL_PROGRESS_PAYLOAD_CACHE: Dict[Tuple[Path, float, int], Dict[str, Any]] = {}
-_PL_PROGRESS_SUMMARY_CACHE: Dict[Tuple[Path, float, int], Dict[str, Any]] = {}
-_PL_PROGRESS_ACTUAL_FILE_CACHE: Dict[Tuple[Path, float], Dict[str, Any]] = {}
-_QC_MONTHLY_REVENUE_CACHE: Dict[Tuple[Path, float, str, int, int, Optional[str], Optional[float]], Dict[str, Any]] = {}
-_ACCOUNTING_COURSE_ID_CACHE: Dict[Tuple[Path, Optional[float]], Set[str]] = {}
-_EXISTING_2024_FOR_2025_NAME_CACHE: Dict[Tuple[Path, Optional[float]], Set[str]] = {}
-_EXISTING_2024_FOR_2025_ID_CACHE: Dict[Tuple[Path, Optional[float], Path, Optional[float]], Set[str]] = {}
+_PERF_MONTHLY_CLOSE_RATE_CACHE = register_cache("perf_monthly_close_rate", max_entries=4)
+_PL_PROGRESS_PAYLOAD_CACHE = register_cache("pl_progress_payload", max_entries=8)
+_PL_PROGRESS_SUMMARY_CACHE = register_cache("pl_progress_summary", max_entries=16)
+_PL_PROGRESS_ACTUAL_FILE_CACHE = register_cache("pl_progress_actual_file", max_entries=4)
+_QC_MONTHLY_REVENUE_CACHE = register_cache("qc_monthly_revenue", max_entries=64)
+_ACCOUNTING_COURSE_ID_CACHE = register_cache("accounting_course_ids", max_entries=4)
+_EXISTING_2024_FOR_2025_NAME_CACHE = register_cache("existing_2024_for_2025_names", max_entries=4)
+_EXISTING_2024_FOR_2025_ID_CACHE = register_cache("existing_2024_for_2025_ids", max_entries=4)
+_WON_GROUPS_CACHE = register_cache("won_groups", max_entries=64)
+_QC_COMPUTE_CACHE = register_cache("qc_compute", max_entries=16)
+_STATEPATH_ROWS_CACHE = register_cache("statepath_rows", max_entries=4)
+_STATEPATH_INDEX_CACHE = register_cache("statepath_portfolio_index", max_entries=4)
+_DERIVED_TABLE_STATE_CACHE = register_cache("derived_table_state", max_entries=16)
 
 INQUIRY_SIZE_GROUPS = ["대기업", "중견기업", "중소기업", "공공기관", "대학교", "기타", "미기재"]
 INQUIRY_COURSE_FORMATS = [
@@ -501,16 +511,11 @@ def _date_only(val: Any) -> str:
 
 
 def _connect(db_path: Path) -> sqlite3.Connection:
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    try:
-        conn.create_function("kst_date", 1, date_kst.kst_date_only)
-        conn.create_function("kst_year", 1, date_kst.kst_year)
-        conn.create_function("kst_ym", 1, date_kst.kst_ym)
-        conn.create_function("kst_yymm", 1, date_kst.kst_yymm)
-    except Exception:
-        logging.exception("Failed to register KST date UDFs")
-    return conn
+    """
+    Thread-local pooled read-only connection (mode=ro + query_only, kst_* UDFs registered).
+    Reopened automatically when the file behind db_path changes; see db_pool.
+    """
+    return db_pool.get_connection(db_path, query_only=True)
 
 
 def _has_column(conn: sqlite3.Connection, table_name: str, column_name: str) -> bool:
@@ -552,6 +557,37 @@ def _has_column(conn: sqlite3.Connection, table_name: str, column_name: str) ->
     return column_name in cols
 
 
+def check_snapshot_indexes(db_path: Path = DB_PATH) -> Dict[str, Any]:
+    """
+    Compare the indexes recorded in run_info (by the snapshot finalize stage) with sqlite_master.
+    Returns {"ok", "index_version", "required_version", "expected", "missing"}.
+    """
+    if not db_path.exists():
+        raise FileNotFoundError(f"Database not found at {db_path}")
+    result: Dict[str, Any] = {
+        "ok": False,
+        "index_version": None,
+        "required_version": SNAPSHOT_INDEX_MIN_VERSION,
+        "expected": [],
+        "missing": [],
+    }
+    with _connect(db_path) as conn:
+        if _has_column(conn, "run_info", "index_version"):
+            row = conn.execute('SELECT index_version, indexes FROM run_info LIMIT 1').fetchone()
+            if row:
+                try:
+                    result["index_version"] = int(row["index_version"]) if row["index_version"] is not None else None
+                except (TypeError, ValueError):
+                    result["index_version"] = None
+                expected = _safe_json_load(row["indexes"])
+                result["expected"] = [str(name) for name in expected] if isinstance(expected, list) else []
+        present = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    result["missing"] = [name for name in result["expected"] if name not in present]
+    version = result["index_version"]
+    result["ok"] = bool(version is not None and version >= SNAPSHOT_INDEX_MIN_VERSION and result["expected"] and not result["missing"])
+    return result
+
+
 def _normalize_course_id(val: Any) -> str:
     text = (val or "").strip()
     if not text or text == "-":
@@ -1218,7 +1254,7 @@ TEAM_CONFIG = {
     },
 }
 
-_DEALCHECK_MEMBER_CACHE: Dict[str, Set[str]] = {}
+_DEALCHECK_MEMBER_CACHE = register_cache("dealcheck_members", max_entries=32, db_keyed=False)
 QC_RULES: List[Tuple[str, str]] = [
     ("R1", "상태=won & 계약 체결일 없음"),
     ("R2", "상태=won & 금액 결측"),
@@ -1405,10 +1441,6 @@ def list_organizations(
         'o."팀" AS team_json, o."담당자" AS owner_json, '
         "COALESCE(w.won2025, 0) AS won2025 "
         "FROM organization o "
-        "LEFT JOIN (SELECT organizationId, COUNT(*) AS people_count FROM people WHERE organizationId IS NOT NULL GROUP BY organizationId) pc "
-        "  ON pc.organizationId = o.id "
-        "LEFT JOIN (SELECT organizationId, COUNT(*) AS deal_count FROM deal WHERE organizationId IS NOT NULL GROUP BY organizationId) dc "
-        "  ON dc.organizationId = o.id "
         "LEFT JOIN ("
         '  SELECT organizationId, SUM(CAST("금액" AS REAL)) AS won2025 '
         f"  FROM deal WHERE \"상태\" = 'Won' AND {won_clause} AND organizationId IS NOT NULL "
@@ -1422,16 +1454,28 @@ def list_organizations(
     if size and size != "전체":
         query += 'AND "기업 규모" = ? '
         params.append(size)
-    if search:
-        query += 'AND ("이름" LIKE ? OR id LIKE ?) '
-        like = f"%{search}%"
-        params.extend([like, like])
-
-    query += "AND (COALESCE(pc.people_count, 0) > 0 OR COALESCE(dc.deal_count, 0) > 0) "
-    query += "ORDER BY won2025 DESC, name LIMIT ? OFFSET ?"
-    params.extend([limit, offset])
 
     with _connect(db_path) as conn:
+        if search:
+            match = search_index.match_expression([search])
+            if match and _search_index_ready(conn, db_path):
+                query += (
+                    f"AND o.id IN (SELECT ref_id FROM {search_index.SEARCH_TABLE} "
+                    f"WHERE {search_index.SEARCH_TABLE} MATCH ? AND kind = 'org') "
+                )
+                params.append(match)
+            else:
+                query += 'AND ("이름" LIKE ? OR id LIKE ?) '
+                like = f"%{search}%"
+                params.extend([like, like])
+
+        # 사람 또는 딜이 하나라도 있는 조직만 (organizationId 인덱스로 EXISTS 판정)
+        query += (
+            "AND (EXISTS (SELECT 1 FROM people p WHERE p.organizationId = o.id) "
+            "OR EXISTS (SELECT 1 FROM deal d WHERE d.organizationId = o.id)) "
+        )
+        query += "ORDER BY won2025 DESC, name LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
         rows = _fetch_all(conn, query, params)
 
     orgs: List[Dict[str, Any]] = []
@@ -1448,8 +1492,141 @@ def list_organizations(
     return orgs
 
 
+SEARCH_MAX_LIMIT = 100
+
+
+def _derived_table_ready(conn: sqlite3.Connection, db_path: Path, name: str, is_fresh: Any) -> bool:
+    """Snapshot-built derived table `name` matches the current rows (is_fresh(conn) checked once per DB mtime)."""
+    cache_key = (db_path, db_path.stat().st_mtime, name)
+    ready = _DERIVED_TABLE_STATE_CACHE.get(cache_key)
+    if ready is None:
+        ready = bool(is_fresh(conn))
+        _DERIVED_TABLE_STATE_CACHE[cache_key] = ready
+    return ready
+
+
+def _search_index_ready(conn: sqlite3.Connection, db_path: Path) -> bool:
+    return _derived_table_ready(conn, db_path, search_index.SEARCH_TABLE, search_index.search_index_is_fresh)
+
+
+def _memo_clean_ready(conn: sqlite3.Connection, db_path: Path) -> bool:
+    return _derived_table_ready(conn, db_path, memo_clean.MEMO_CLEAN_TABLE, memo_clean.memo_clean_is_fresh)
+
+
+def _search_raw_source(conn: sqlite3.Connection) -> str:
+    """Same (kind, ref_id, org_id, title, body) shape as search_fts, straight from the raw tables."""
+    title_col = _pick_column(conn, "people", search_index.PERSON_TITLE_COLUMNS)
+    return (
+        'SELECT \'org\' AS kind, id AS ref_id, id AS org_id, COALESCE("이름", id) AS title, id AS body '
+        "FROM organization "
+        'UNION ALL SELECT \'person\', id, organizationId, COALESCE("이름", \'\'), '
+        f"COALESCE({_q_or_null(title_col)}, '') FROM people "
+        "UNION ALL SELECT 'memo', m.id, COALESCE(NULLIF(m.organizationId, ''), p.organizationId), '', m.text "
+        "FROM memo m LEFT JOIN people p ON p.id = m.peopleId"
+    )
+
+
+def search_entities(
+    query: str,
+    kind: str = "all",
+    limit: int = 20,
+    offset: int = 0,
+    db_path: Path = DB_PATH,
+) -> Dict[str, Any]:
+    """
+    Ranked search over organizations, people and memos.
+    - search_fts(FTS5 trigram)가 최신이면 MATCH + bm25(title 가중 10, body 1) 순.
+    - 3글자 미만 term은 MATCH 결과에 LIKE 조건으로 추가; 전부 짧으면 같은 테이블에 LIKE
+      (title 일치 > title 포함 > body 포함 순).
+    - 인덱스가 없거나 stale이면 원본 테이블 LIKE로 fallback (mode=raw).
+    """
+    if not db_path.exists():
+        raise FileNotFoundError(f"Database not found at {db_path}")
+    terms = search_index.query_terms(query or "")
+    if not terms:
+        raise ValueError("query must not be empty")
+    if kind != "all" and kind not in search_index.SEARCH_KINDS:
+        raise ValueError(f"kind must be one of: all, {', '.join(search_index.SEARCH_KINDS)}")
+    limit = max(1, min(limit, SEARCH_MAX_LIMIT))
+    offset = max(0, offset)
+
+    with _connect(db_path) as conn:
+        indexed = _search_index_ready(conn, db_path)
+        match = search_index.match_expression(terms) if indexed else None
+        like_terms = search_index.short_terms(terms) if match else terms
+        like_sql = " AND ".join("(title LIKE ? ESCAPE '\\' OR body LIKE ? ESCAPE '\\')" for _ in like_terms)
+        params: List[Any] = []
+        if match:
+            mode = "fts"
+            source = search_index.SEARCH_TABLE
+            where = f"{search_index.SEARCH_TABLE} MATCH ?" + (f" AND {like_sql}" if like_sql else "")
+            params.append(match)
+            score_sql = f"bm25({search_index.SEARCH_TABLE}, 0, 0, 0, 10.0, 1.0)"
+            score_params: List[Any] = []
+        else:
+            mode = "like" if indexed else "raw"
+            source = search_index.SEARCH_TABLE if indexed else f"({_search_raw_source(conn)})"
+            where = like_sql
+            first = terms[0]
+            score_sql = "CASE WHEN title = ? THEN 0 WHEN title LIKE ? ESCAPE '\\' THEN 1 ELSE 2 END"
+            score_params = [first, search_index.like_pattern(first)]
+        for term in like_terms:
+            pattern = search_index.like_pattern(term)
+            params.extend([pattern, pattern])
+
+        count_rows = _fetch_all(
+            conn, f"SELECT kind, COUNT(*) AS n FROM {source} WHERE {where} GROUP BY kind", params
+        )
+        counts = {k: 0 for k in search_index.SEARCH_KINDS}
+        for row in count_rows:
+            if row["kind"] in counts:
+                counts[row["kind"]] = int(row["n"])
+
+        kind_sql, kind_params = ("", []) if kind == "all" else (" AND kind = ?", [kind])
+        rows = _fetch_all(
+            conn,
+            f"SELECT kind, ref_id, org_id, title, body, {score_sql} AS score "
+            f"FROM {source} WHERE {where}{kind_sql} "
+            "ORDER BY score, kind, length(title), ref_id LIMIT ? OFFSET ?",
+            score_params + params + kind_params + [limit, offset],
+        )
+        org_ids = sorted({row["org_id"] for row in rows if row["org_id"]})
+        org_names: Dict[str, str] = {}
+        if org_ids:
+            placeholders = ",".join("?" for _ in org_ids)
+            for row in _fetch_all(
+                conn,
+                f'SELECT id, COALESCE("이름", id) AS name FROM organization WHERE id IN ({placeholders})',
+                org_ids,
+            ):
+                org_names[row["id"]] = row["name"]
+
+    items = [
+        {
+            "kind": row["kind"],
+            "id": row["ref_id"],
+            "orgId": row["org_id"],
+            "orgName": org_names.get(row["org_id"]),
+            "title": row["title"],
+            "snippet": search_index.snippet(row["body"], terms),
+            "score": round(float(row["score"]), 4),
+        }
+        for row in rows
+    ]
+    return {
+        "items": items,
+        "total": counts[kind] if kind != "all" else sum(counts.values()),
+        "counts": counts,
+        "meta": {"query": query, "kind": kind, "limit": limit, "offset": offset, "mode": mode},
+    }
+
+
 # ----------------------- StatePath Portfolio Helpers -----------------------
 def _statepath_rows(db_path: Path) -> List[sqlite3.Row]:
+    cache_key = (db_path, db_path.stat().st_mtime)
+    cached = _STATEPATH_ROWS_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
     with _connect(db_path) as conn:
         rows = _fetch_all(
             conn,
@@ -1468,6 +1645,7 @@ def _statepath_rows(db_path: Path) -> List[sqlite3.Row]:
             "LEFT JOIN people p ON p.id = d.peopleId "
             'WHERE d."상태" = \'Won\' AND d.organizationId IS NOT NULL',
         )
+    _STATEPATH_ROWS_CACHE[cache_key] = rows
     return rows
 
 
@@ -1505,6 +1683,125 @@ def _bucket_dir(prev: str, curr: str) -> str:
     return "down"
 
 
+def _statepath_portfolio_item(org_id: str, org_cells: Dict[str, Dict[str, float]], row_meta: sqlite3.Row) -> Dict[str, Any]:
+    state24, state25 = _build_state_from_cells(org_cells)
+    path = _build_path_from_states(state24, state25)
+    org_name = row_meta["orgName"]
+    bucket_dir = _bucket_dir(state24["bucket"], state25["bucket"])
+    rail_dir_online = _bucket_dir(state24["bucket_online"], state25["bucket_online"])
+    rail_dir_offline = _bucket_dir(state24["bucket_offline"], state25["bucket_offline"])
+    events = path["events"]
+    has_open = any(ev["type"] in ("OPEN", "OPEN_CELL") for ev in events)
+    has_scale_up = any(ev["type"] in ("SCALE_UP", "SCALE_UP_CELL") for ev in events)
+    risk = any(ev["type"] in ("CLOSE", "CLOSE_CELL", "SCALE_DOWN", "SCALE_DOWN_CELL") for ev in events)
+    return {
+        "orgId": org_id,
+        "orgName": org_name,
+        "sizeRaw": row_meta["sizeRaw"],
+        "sizeGroup": infer_size_group(org_name, row_meta["sizeRaw"]),
+        "companyTotalEok2024": state24["total_eok"],
+        "companyBucket2024": state24["bucket"],
+        "companyTotalEok2025": state25["total_eok"],
+        "companyBucket2025": state25["bucket"],
+        "deltaEok": state25["total_eok"] - state24["total_eok"],
+        "companyBucketTransition": f"{state24['bucket']}→{state25['bucket']}",
+        "seed": path["seed"],
+        "risk": risk,
+        "eventCounts": {
+            "openCell": sum(1 for ev in events if ev["type"] in ("OPEN", "OPEN_CELL")),
+            "closeCell": sum(1 for ev in events if ev["type"] in ("CLOSE", "CLOSE_CELL")),
+            "scaleUpCell": sum(1 for ev in events if ev["type"] in ("SCALE_UP", "SCALE_UP_CELL")),
+            "scaleDownCell": sum(1 for ev in events if ev["type"] in ("SCALE_DOWN", "SCALE_DOWN_CELL")),
+            "companyChange": 1 if state24["bucket"] != state25["bucket"] else 0,
+            "railChange": sum(1 for ev in events if ev["type"] == "RAIL_SCALE_CHANGE"),
+        },
+        "openedCells": [ev.get("cell") for ev in events if ev["type"] in ("OPEN", "OPEN_CELL")],
+        "closedCells": [ev.get("cell") for ev in events if ev["type"] in ("CLOSE", "CLOSE_CELL")],
+        "scaledUpCells": [ev.get("cell") for ev in events if ev["type"] in ("SCALE_UP", "SCALE_UP_CELL")],
+        "scaledDownCells": [ev.get("cell") for ev in events if ev["type"] in ("SCALE_DOWN", "SCALE_DOWN_CELL")],
+        "railChange": {
+            "ONLINE": rail_dir_online,
+            "OFFLINE": rail_dir_offline,
+        },
+        "qaFlagCount": len(path.get("qa_flags", [])),
+        "states": {"2024": state24, "2025": state25},
+        "path": path,
+        "_events": events,
+        "_bucket_dir": bucket_dir,
+        "_has_open": has_open,
+        "_has_scale_up": has_scale_up,
+    }
+
+
+def _project_statepath_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    # Minimal contract fields (underscore) + backward-compatible camelCase keys for FE
+    s24 = item.get("states", {}).get("2024", {})
+    s25 = item.get("states", {}).get("2025", {})
+    cells24 = s24.get("cells", {}) if isinstance(s24.get("cells"), dict) else {}
+    cells25 = s25.get("cells", {}) if isinstance(s25.get("cells"), dict) else {}
+    projected = {
+        "org_id": item["orgId"],
+        "org_name": item["orgName"],
+        "size_raw": item["sizeRaw"],
+        "segment": item["sizeGroup"],
+        "company_total_eok_2024": item["companyTotalEok2024"],
+        "company_bucket_2024": item["companyBucket2024"],
+        "company_total_eok_2025": item["companyTotalEok2025"],
+        "company_bucket_2025": item["companyBucket2025"],
+        "delta_eok": item["deltaEok"],
+        "company_online_bucket_2024": s24.get("bucket_online"),
+        "company_offline_bucket_2024": s24.get("bucket_offline"),
+        "company_online_bucket_2025": s25.get("bucket_online"),
+        "company_offline_bucket_2025": s25.get("bucket_offline"),
+        "cells_2024": cells24,
+        "cells_2025": cells25,
+        "seed": item.get("seed"),
+    }
+    projected.update(
+        {
+            "orgId": item["orgId"],
+            "orgName": item["orgName"],
+            "sizeRaw": item["sizeRaw"],
+            "sizeGroup": item["sizeGroup"],
+            "companyTotalEok2024": item["companyTotalEok2024"],
+            "companyBucket2024": item["companyBucket2024"],
+            "companyTotalEok2025": item["companyTotalEok2025"],
+            "companyBucket2025": item["companyBucket2025"],
+            "deltaEok": item["deltaEok"],
+            "companyOnlineBucket2024": s24.get("bucket_online"),
+            "companyOfflineBucket2024": s24.get("bucket_offline"),
+            "companyOnlineBucket2025": s25.get("bucket_online"),
+            "companyOfflineBucket2025": s25.get("bucket_offline"),
+            "cells2024": cells24,
+            "cells2025": cells25,
+            "seed": item.get("seed"),
+        }
+    )
+    return projected
+
+
+def _statepath_portfolio_index(db_path: Path) -> statepath_portfolio.PortfolioIndex:
+    """Every org's portfolio item + facet indexes, built once per DB mtime."""
+    cache_key = (db_path, db_path.stat().st_mtime)
+    cached = _STATEPATH_INDEX_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    rows = _statepath_rows(db_path)
+    cells_by_org = _build_statepath_cells(rows)
+    meta_map: Dict[str, sqlite3.Row] = {}
+    for row in rows:
+        if row["orgId"] not in meta_map:
+            meta_map[row["orgId"]] = row
+    items = [
+        _statepath_portfolio_item(org_id, org_cells, meta_map[org_id])
+        for org_id, org_cells in cells_by_org.items()
+        if org_id in meta_map
+    ]
+    index = statepath_portfolio.PortfolioIndex(items, _project_statepath_item)
+    _STATEPATH_INDEX_CACHE[cache_key] = index
+    return index
+
+
 def get_statepath_portfolio(
     size_group: str = "전체",
     search: str | None = None,
@@ -1518,184 +1815,9 @@ def get_statepath_portfolio(
         raise FileNotFoundError(f"Database not found at {db_path}")
     limit = max(1, min(limit, 2000))
     offset = max(0, offset)
-    rows = _statepath_rows(db_path)
-    cells_by_org = _build_statepath_cells(rows)
-    meta_map: Dict[str, sqlite3.Row] = {}
-    for row in rows:
-        if row["orgId"] not in meta_map:
-            meta_map[row["orgId"]] = row
-
-    items_raw: List[Dict[str, Any]] = []
-    for org_id, org_cells in cells_by_org.items():
-        row_meta = meta_map.get(org_id)
-        if not row_meta:
-            continue
-        state24, state25 = _build_state_from_cells(org_cells)
-        path = _build_path_from_states(state24, state25)
-        seed = path["seed"]
-        org_name = row_meta["orgName"]
-        sg = infer_size_group(org_name, row_meta["sizeRaw"])
-        if size_group != "전체" and sg != size_group:
-            continue
-        if search and search not in org_name:
-            continue
-        bucket_dir = _bucket_dir(state24["bucket"], state25["bucket"])
-        rail_dir_online = _bucket_dir(state24["bucket_online"], state25["bucket_online"])
-        rail_dir_offline = _bucket_dir(state24["bucket_offline"], state25["bucket_offline"])
-        events = path["events"]
-        has_open = any(ev["type"] in ("OPEN", "OPEN_CELL") for ev in events)
-        has_scale_up = any(ev["type"] in ("SCALE_UP", "SCALE_UP_CELL") for ev in events)
-        risk = any(ev["type"] in ("CLOSE", "CLOSE_CELL", "SCALE_DOWN", "SCALE_DOWN_CELL") for ev in events)
-        item = {
-            "orgId": org_id,
-            "orgName": org_name,
-            "sizeRaw": row_meta["sizeRaw"],
-            "sizeGroup": sg,
-            "companyTotalEok2024": state24["total_eok"],
-            "companyBucket2024": state24["bucket"],
-            "companyTotalEok2025": state25["total_eok"],
-            "companyBucket2025": state25["bucket"],
-            "deltaEok": state25["total_eok"] - state24["total_eok"],
-            "companyBucketTransition": f"{state24['bucket']}→{state25['bucket']}",
-            "seed": seed,
-            "risk": risk,
-            "eventCounts": {
-                "openCell": sum(1 for ev in events if ev["type"] in ("OPEN", "OPEN_CELL")),
-                "closeCell": sum(1 for ev in events if ev["type"] in ("CLOSE", "CLOSE_CELL")),
-                "scaleUpCell": sum(1 for ev in events if ev["type"] in ("SCALE_UP", "SCALE_UP_CELL")),
-                "scaleDownCell": sum(1 for ev in events if ev["type"] in ("SCALE_DOWN", "SCALE_DOWN_CELL")),
-                "companyChange": 1 if state24["bucket"] != state25["bucket"] else 0,
-                "railChange": sum(1 for ev in events if ev["type"] == "RAIL_SCALE_CHANGE"),
-            },
-            "openedCells": [ev.get("cell") for ev in events if ev["type"] in ("OPEN", "OPEN_CELL")],
-            "closedCells": [ev.get("cell") for ev in events if ev["type"] in ("CLOSE", "CLOSE_CELL")],
-            "scaledUpCells": [ev.get("cell") for ev in events if ev["type"] in ("SCALE_UP", "SCALE_UP_CELL")],
-            "scaledDownCells": [ev.get("cell") for ev in events if ev["type"] in ("SCALE_DOWN", "SCALE_DOWN_CELL")],
-            "railChange": {
-                "ONLINE": rail_dir_online,
-                "OFFLINE": rail_dir_offline,
-            },
-            "qaFlagCount": len(path.get("qa_flags", [])),
-            "states": {"2024": state24, "2025": state25},
-            "path": path,
-            "_events": events,
-            "_bucket_dir": bucket_dir,
-            "_has_open": has_open,
-            "_has_scale_up": has_scale_up,
-        }
-        items_raw.append(item)
-
+    index = _statepath_portfolio_index(db_path)
     filters = filters or {}
-    filtered = []
-    for item in items_raw:
-        if filters.get("riskOnly") and not item["risk"]:
-            continue
-        if filters.get("hasOpen") and not item["_has_open"]:
-            continue
-        if filters.get("hasScaleUp") and not item["_has_scale_up"]:
-            continue
-        company_dir = filters.get("companyDir", "all")
-        if company_dir != "all" and item["_bucket_dir"] != company_dir:
-            continue
-        seed = filters.get("seed", "all")
-        if seed != "all" and item["seed"] != seed:
-            continue
-        rail = filters.get("rail", "all")
-        rail_dir = filters.get("railDir", "all")
-        if rail != "all":
-            if rail_dir != "all" and item["railChange"].get(rail) != rail_dir:
-                continue
-        company_from = filters.get("companyFrom", "all")
-        company_to = filters.get("companyTo", "all")
-        if company_from != "all" and item["companyBucket2024"] != company_from:
-            continue
-        if company_to != "all" and item["companyBucket2025"] != company_to:
-            continue
-        cell = filters.get("cell", "all")
-        cell_event = filters.get("cellEvent", "all")
-        if cell != "all" or cell_event != "all":
-            matched = False
-            for ev in item["_events"]:
-                if cell != "all" and ev.get("cell") != cell:
-                    continue
-                if cell_event != "all":
-                    if cell_event == "OPEN" and ev["type"] not in ("OPEN", "OPEN_CELL"):
-                        continue
-                    if cell_event == "CLOSE" and ev["type"] not in ("CLOSE", "CLOSE_CELL"):
-                        continue
-                    if cell_event == "UP" and ev["type"] not in ("SCALE_UP", "SCALE_UP_CELL"):
-                        continue
-                    if cell_event == "DOWN" and ev["type"] not in ("SCALE_DOWN", "SCALE_DOWN_CELL"):
-                        continue
-                matched = True
-                break
-            if not matched:
-                continue
-        filtered.append(item)
-
-    def sort_key(it: Dict[str, Any]):
-        if sort == "delta_desc":
-            return -(it["deltaEok"])
-        if sort == "bucket_up_desc":
-            return -sp.BUCKET_ORDER.index(it["companyBucket2025"]) + sp.BUCKET_ORDER.index(it["companyBucket2024"])
-        if sort == "risk_first":
-            return (0 if it["risk"] else 1, -it["companyTotalEok2025"])
-        if sort == "name_asc":
-            return (it["orgName"] or "")
-        return -it["companyTotalEok2025"]
-
-    filtered.sort(key=sort_key)
-    total_count = len(filtered)
-    sliced = filtered[offset : offset + limit]
-
-    summary = _build_portfolio_summary(filtered, size_group, search, filters)
-    def _project(item: Dict[str, Any]) -> Dict[str, Any]:
-        # Minimal contract fields (underscore) + backward-compatible camelCase keys for FE
-        s24 = item.get("states", {}).get("2024", {})
-        s25 = item.get("states", {}).get("2025", {})
-        cells24 = s24.get("cells", {}) if isinstance(s24.get("cells"), dict) else {}
-        cells25 = s25.get("cells", {}) if isinstance(s25.get("cells"), dict) else {}
-        projected = {
-            "org_id": item["orgId"],
-            "org_name": item["orgName"],
-            "size_raw": item["sizeRaw"],
-            "segment": item["sizeGroup"],
-            "company_total_eok_2024": item["companyTotalEok2024"],
-            "company_bucket_2024": item["companyBucket2024"],
-            "company_total_eok_2025": item["companyTotalEok2025"],
-            "company_bucket_2025": item["companyBucket2025"],
-            "delta_eok": item["deltaEok"],
-            "company_online_bucket_2024": s24.get("bucket_online"),
-            "company_offline_bucket_2024": s24.get("bucket_offline"),
-            "company_online_bucket_2025": s25.get("bucket_online"),
-            "company_offline_bucket_2025": s25.get("bucket_offline"),
-            "cells_2024": cells24,
-            "cells_2025": cells25,
-            "seed": item.get("seed"),
-        }
-        projected.update(
-            {
-                "orgId": item["orgId"],
-                "orgName": item["orgName"],
-                "sizeRaw": item["sizeRaw"],
-                "sizeGroup": item["sizeGroup"],
-                "companyTotalEok2024": item["companyTotalEok2024"],
-                "companyBucket2024": item["companyBucket2024"],
-                "companyTotalEok2025": item["companyTotalEok2025"],
-                "companyBucket2025": item["companyBucket2025"],
-                "deltaEok": item["deltaEok"],
-                "companyOnlineBucket2024": s24.get("bucket_online"),
-                "companyOfflineBucket2024": s24.get("bucket_offline"),
-                "companyOnlineBucket2025": s25.get("bucket_online"),
-                "companyOfflineBucket2025": s25.get("bucket_offline"),
-                "cells2024": cells24,
-                "cells2025": cells25,
-                "seed": item.get("seed"),
-            }
-        )
-        return projected
-
-    items = [_project(item) for item in sliced]
+    total_count, items, summary = index.query(size_group, search, filters, sort, limit, offset)
     return {
         "summary": summary,
         "items": items,
@@ -1711,176 +1833,22 @@ def get_statepath_portfolio(
     }
 
 
-def _build_portfolio_summary(items: List[Dict[str, Any]], size_group: str, search: str | None, filters: Dict[str, Any]) -> Dict[str, Any]:
-    if not items:
-        buckets = sp.BUCKET_ORDER
-        return {
-            "accountCount": 0,
-            "sum2024Eok": 0.0,
-            "sum2025Eok": 0.0,
-            "companyBucketChangeCounts": {"up": 0, "flat": 0, "down": 0},
-            "openAccountCount": 0,
-            "closeAccountCount": 0,
-            "riskAccountCount": 0,
-            "seedCounts": {s: 0 for s in ["H→B", "B→H", "SIMUL", "NONE"]},
-            "companyTransitionMatrix": {"buckets": buckets, "counts": [[0 for _ in buckets] for _ in buckets]},
-            "cellEventMatrix": {cell: {"OPEN": 0, "CLOSE": 0, "UP": 0, "DOWN": 0} for cell in ["HRD_ONLINE", "HRD_OFFLINE", "BU_ONLINE", "BU_OFFLINE"]},
-            "railChangeSummary": {"ONLINE": {"up": 0, "flat": 0, "down": 0}, "OFFLINE": {"up": 0, "flat": 0, "down": 0}},
-            "topPatterns": {},
-            "segmentComparison": [],
-        }
-    buckets = sp.BUCKET_ORDER
-    matrix = [[0 for _ in buckets] for _ in buckets]
-    cell_matrix = {cell: {"OPEN": 0, "CLOSE": 0, "UP": 0, "DOWN": 0} for cell in ["HRD_ONLINE", "HRD_OFFLINE", "BU_ONLINE", "BU_OFFLINE"]}
-    rail_change = {"ONLINE": {"up": 0, "flat": 0, "down": 0}, "OFFLINE": {"up": 0, "flat": 0, "down": 0}}
-    seed_counts = {s: 0 for s in ["H→B", "B→H", "SIMUL", "NONE"]}
-    open_count = 0
-    close_count = 0
-    risk_count = 0
-    sum2024 = 0.0
-    sum2025 = 0.0
-    for it in items:
-        sum2024 += it["companyTotalEok2024"]
-        sum2025 += it["companyTotalEok2025"]
-        dir_company = _bucket_dir(it["companyBucket2024"], it["companyBucket2025"])
-        i = buckets.index(it["companyBucket2024"])
-        j = buckets.index(it["companyBucket2025"])
-        matrix[i][j] += 1
-        if dir_company == "up":
-            open_count += 1
-        if dir_company == "down":
-            close_count += 1
-        if it["risk"]:
-            risk_count += 1
-        seed_counts[it["seed"]] = seed_counts.get(it["seed"], 0) + 1
-        for ev in it["_events"]:
-            c = ev.get("cell")
-            if c in cell_matrix:
-                if ev["type"] in ("OPEN", "OPEN_CELL"):
-                    cell_matrix[c]["OPEN"] += 1
-                elif ev["type"] in ("CLOSE", "CLOSE_CELL"):
-                    cell_matrix[c]["CLOSE"] += 1
-                elif ev["type"] in ("SCALE_UP", "SCALE_UP_CELL"):
-                    cell_matrix[c]["UP"] += 1
-                elif ev["type"] in ("SCALE_DOWN", "SCALE_DOWN_CELL"):
-                    cell_matrix[c]["DOWN"] += 1
-        for rail in ("ONLINE", "OFFLINE"):
-            rail_change[rail][it["railChange"][rail]] += 1
-
-    top_patterns = {
-        "topOpenCell": _top_cell_event(cell_matrix, "OPEN"),
-        "topCloseCell": _top_cell_event(cell_matrix, "CLOSE"),
-        "topUpCell": _top_cell_event(cell_matrix, "UP"),
-        "topDownCell": _top_cell_event(cell_matrix, "DOWN"),
-        "topSeed": _top_seed(seed_counts),
-    }
-    segment_comparison: List[Dict[str, Any]] = []
-    if (
-        size_group == "전체"
-        and not search
-        and all(v in (False, "all", None) for v in filters.values())
-    ):
-        group_map: Dict[str, Dict[str, Any]] = {}
-        for it in items:
-            sg = it["sizeGroup"]
-            entry = group_map.setdefault(
-                sg,
-                {
-                    "sizeGroup": sg,
-                    "accountCount": 0,
-                    "sum2025Eok": 0.0,
-                    "companyUp": 0,
-                    "open": 0,
-                    "risk": 0,
-                    "seedH2B": 0,
-                },
-            )
-            entry["accountCount"] += 1
-            entry["sum2025Eok"] += it["companyTotalEok2025"]
-            if _bucket_dir(it["companyBucket2024"], it["companyBucket2025"]) == "up":
-                entry["companyUp"] += 1
-            if it["openedCells"]:
-                entry["open"] += 1
-            if it["risk"]:
-                entry["risk"] += 1
-            if it["seed"] == "H→B":
-                entry["seedH2B"] += 1
-        for sg, entry in group_map.items():
-            total = entry["accountCount"]
-            segment_comparison.append(
-                {
-                    "sizeGroup": sg,
-                    "accountCount": total,
-                    "sum2025Eok": entry["sum2025Eok"],
-                    "companyUpRate": entry["companyUp"] / total if total else 0,
-                    "openRate": entry["open"] / total if total else 0,
-                    "riskRate": entry["risk"] / total if total else 0,
-                    "seedH2BRate": entry["seedH2B"] / total if total else 0,
-                }
-            )
-
-    return {
-        "accountCount": len(items),
-        "sum2024Eok": sum2024,
-        "sum2025Eok": sum2025,
-        "companyBucketChangeCounts": {
-            "up": sum(1 for it in items if _bucket_dir(it["companyBucket2024"], it["companyBucket2025"]) == "up"),
-            "flat": sum(1 for it in items if _bucket_dir(it["companyBucket2024"], it["companyBucket2025"]) == "flat"),
-            "down": sum(1 for it in items if _bucket_dir(it["companyBucket2024"], it["companyBucket2025"]) == "down"),
-        },
-        "openAccountCount": open_count,
-        "closeAccountCount": close_count,
-        "riskAccountCount": risk_count,
-        "seedCounts": seed_counts,
-        "companyTransitionMatrix": {"buckets": buckets, "counts": matrix},
-        "cellEventMatrix": cell_matrix,
-        "railChangeSummary": rail_change,
-        "topPatterns": top_patterns,
-        "segmentComparison": segment_comparison,
-    }
-
-
-def _top_cell_event(cell_matrix: Dict[str, Dict[str, int]], key: str) -> Dict[str, Any]:
-    best_cell = None
-    best_val = -1
-    for cell, counts in cell_matrix.items():
-        if counts[key] > best_val:
-            best_cell = cell
-            best_val = counts[key]
-    return {"cell": best_cell, "count": best_val}
-
-
-def _top_seed(seed_counts: Dict[str, int]) -> Dict[str, Any]:
-    best_seed = None
-    best_val = -1
-    for seed, cnt in seed_counts.items():
-        if cnt > best_val:
-            best_seed = seed
-            best_val = cnt
-    return {"seed": best_seed, "count": best_val}
-
-
 def get_statepath_detail(org_id: str, db_path: Path = DB_PATH) -> Dict[str, Any] | None:
     if not db_path.exists():
         raise FileNotFoundError(f"Database not found at {db_path}")
-    rows = [r for r in _statepath_rows(db_path) if r["orgId"] == org_id]
-    if not rows:
-        return None
-    cells_by_org = _build_statepath_cells(rows)
-    cells = cells_by_org.get(org_id)
-    if not cells:
+    index = _statepath_portfolio_index(db_path)
+    pos = index.by_org.get(org_id)
+    if pos is None:
         return None
-    state24, state25 = _build_state_from_cells(cells)
-    path = _build_path_from_states(state24, state25)
-    org_name = rows[0]["orgName"]
-    size_raw = rows[0]["sizeRaw"]
-    size_group_val = infer_size_group(org_name, size_raw)
+    item = index.items[pos]
     return {
-        "org": {"id": org_id, "name": org_name, "sizeRaw": size_raw, "sizeGroup": size_group_val},
-        "year_states": {"2024": state24, "2025": state25},
-        "path_2024_to_2025": path,
+        "org": {"id": org_id, "name": item["orgName"], "sizeRaw": item["sizeRaw"], "sizeGroup": item["sizeGroup"]},
+        "year_states": dict(item["states"]),
+        "path_2024_to_2025": item["path"],
         "qa": {"flags": [], "checks": {"y2024_ok": True, "y2025_ok": True}},
     }
+
+
 def get_org_by_id(org_id: str, db_path: Path = DB_PATH) -> Dict[str, Any] | None:
     if not db_path.exists():
         raise FileNotFoundError(f"Database not found at {db_path}")
@@ -2969,10 +2937,49 @@ def get_won_groups_json(
     Build grouped JSON by upper_org -> team for organizations that have Won deals in 2023/2024/2025.
     Each group includes all deals (any status) for people in that upper_org/team, attached people info,
     deal memos, people memos, and submitted webform names. Organization meta and memos are included.
+
+    The unfiltered org build is memoized per (db_path, mtime, org_id); a target_uppers filter is
+    applied to the memoized groups, so every won-groups view of one org shares one SQL pass.
+    Returned objects are shared with the cache and must not be mutated.
     """
     if not db_path.exists():
         raise FileNotFoundError(f"Database not found at {db_path}")
 
+    cache_key = (db_path, db_path.stat().st_mtime, str(org_id))
+    base = _WON_GROUPS_CACHE.get(cache_key)
+    if base is None:
+        base = _build_won_groups_json(org_id, db_path)
+        _WON_GROUPS_CACHE[cache_key] = base
+    if target_uppers is None:
+        return base
+    requested = {(u or "").strip() or "미입력" for u in (target_uppers or []) if u}
+    return {
+        "organization": base["organization"],
+        "groups": [g for g in base["groups"] if g["upper_org"] in requested],
+    }
+
+
+def get_memo_markdown_by_html(org_id: str, db_path: Path = DB_PATH) -> Dict[str, str]:
+    """
+    htmlBody → precomputed markdown for the org's memos (the won-groups memo set) from memo_clean.
+    Empty when memo_clean is missing/stale or the memo table has no htmlBody; callers then convert per memo.
+    """
+    if not db_path.exists():
+        raise FileNotFoundError(f"Database not found at {db_path}")
+    with _connect(db_path) as conn:
+        if not _has_column(conn, "memo", "htmlBody") or not _memo_clean_ready(conn, db_path):
+            return {}
+        rows = _fetch_all(
+            conn,
+            f"SELECT m.htmlBody AS html, mc.markdown FROM memo m JOIN {memo_clean.MEMO_CLEAN_TABLE} mc ON mc.memo_id = m.id "
+            "WHERE m.organizationId = ? AND mc.markdown IS NOT NULL",
+            (org_id,),
+        )
+    return {row["html"]: row["markdown"] for row in rows}
+
+
+def _build_won_groups_json(org_id: str, db_path: Path) -> Dict[str, Any]:
+
     def _normalize_upper(val: Any) -> str:
         cleaned = (val or "").strip()
         return cleaned if cleaned else "미입력"
@@ -3104,11 +3111,15 @@ def get_won_groups_json(
             (org_id,),
         )
 
-        # Memo preloading (single pass)
+        # Memo preloading (single pass); form-memo cleaning comes from memo_clean when it is fresh
+        use_memo_clean = _memo_clean_ready(conn, db_path)
         memo_select = (
-            "SELECT id, dealId, peopleId, organizationId, text, createdAt"
-            + (", htmlBody" if has_memo_html else "")
-            + " FROM memo WHERE organizationId = ?"
+            "SELECT m.id, m.dealId, m.peopleId, m.organizationId, m.text, m.createdAt"
+            + (", m.htmlBody" if has_memo_html else "")
+            + (", mc.kind AS clean_kind, mc.clean_json" if use_memo_clean else "")
+            + " FROM memo m"
+            + (f" LEFT JOIN {memo_clean.MEMO_CLEAN_TABLE} mc ON mc.memo_id = m.id" if use_memo_clean else "")
+            + " WHERE m.organizationId = ?"
         )
         memo_rows = _fetch_all(conn, memo_select, (org_id,))
 
@@ -3119,7 +3130,15 @@ def get_won_groups_json(
     for memo in memo_rows:
         created_at_raw = _row_get(memo, "createdAt")
         date_only = _date_only(created_at_raw)
-        cleaned = _clean_form_memo(memo["text"])
+        clean_kind = _row_get(memo, "clean_kind")
+        if clean_kind == "skip":
+            cleaned = ""
+        elif clean_kind == "form":
+            cleaned = json.loads(memo["clean_json"])
+        elif clean_kind == "text":
+            cleaned = None
+        else:
+            cleaned = _clean_form_memo(memo["text"])
         html_body = _row_get(memo, "htmlBody")
         if cleaned == "":
             # Skip low-value form memos
@@ -3163,11 +3182,6 @@ def get_won_groups_json(
         upper = person["upper_org"] if person else "미입력"
         target_uppers_set.add(upper)
 
-    # Apply caller-specified filter if provided
-    if target_uppers is not None:
-        requested = {_normalize_upper(u) for u in (target_uppers or []) if u}
-        target_uppers_set = target_uppers_set & requested
-
     if not target_uppers_set:
         return {"organization": {**org_meta, "memos": org_memos}, "groups": []}
 
@@ -3557,11 +3571,26 @@ def _qc_team_for_owner(owner: str) -> Optional[str]:
 
 
 def _qc_compute(team: str, db_path: Path = DB_PATH, include_hidden: bool = False) -> Dict[str, Any]:
+    """
+    Cached per (DB mtime, server-local day, team, include_hidden); the day matches the date.today()
+    cutoffs the QC rules use. Returns a shallow copy because callers pop
+    `details_by_owner` from the top-level dict.
+    """
     if not db_path.exists():
         raise FileNotFoundError(f"Database not found at {db_path}")
     if team not in {"all", "edu1", "edu2", "public"}:
         raise ValueError(f"Unsupported team: {team}")
+    cache_key = (db_path, db_path.stat().st_mtime, date.today().isoformat(), team, include_hidden)
+    cached = _QC_COMPUTE_CACHE.get(cache_key)
+    if cached is None:
+        cached = _qc_compute_uncached(team, db_path, include_hidden)
+        _QC_COMPUTE_CACHE[cache_key] = cached
+    return dict(cached)
 
+
+def _qc_compute_uncached(team: str, db_path: Path, include_hidden: bool) -> Dict[str, Any]:
+    # deal_fact를 쓰지 않고 원본 deal을 읽는다: QC 규칙은 deal_fact에 없는 컬럼(강사/제안서/온라인 차수 등,
+    # _qc_pick_columns의 대체 컬럼명 포함)과 people 기준 조직 조인을 쓰고, 결과는 _qc_compute가 스냅샷·일자별로 캐시한다.
     with _connect(db_path) as conn:
         cols, schema_missing = _qc_pick_columns(conn)
         select_fields = [
@@ -4313,6 +4342,193 @@ def get_initial_dashboard_data(db_path: Path = DB_PATH) -> Dict[str, Any]:
     }
 
 
+# Streaming variant of get_initial_dashboard_data: one NDJSON-friendly record per organization.
+INITIAL_STREAM_BATCH = int(os.getenv("INITIAL_STREAM_BATCH", "200"))
+INITIAL_STREAM_MAX_LIMIT = 5000
+# (alias, SQL expression). 키 컬럼(id/organizationId/peopleId/dealId)은 그룹핑에 필요하므로 omit 대상이 아니다.
+_INITIAL_STREAM_COLUMNS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "organization": (
+        ("name", 'COALESCE("이름", id)'),
+        ("industry", '"업종"'),
+        ("team", '"팀"'),
+        ("owner", '"담당자"'),
+        ("phone", '"전화"'),
+        ("size", '"기업 규모"'),
+    ),
+    "people": (
+        ("name", 'COALESCE("이름", id)'),
+        ("title", '"직급/직책"'),
+        ("email", '"이메일"'),
+        ("phone", '"전화"'),
+        ("status", '"고객 상태"'),
+    ),
+    "deal": (
+        ("name", 'COALESCE("이름", id)'),
+        ("status", '"상태"'),
+        ("amount", '"금액"'),
+        ("expected_amount", '"예상 체결액"'),
+        ("deadline", '"마감일"'),
+        ("expected_date", '"수주 예정일"'),
+    ),
+    "memo": (
+        ("text", "text"),
+        ("createdAt", "createdAt"),
+        ("updatedAt", "updatedAt"),
+        ("ownerId", "ownerId"),
+        ("htmlBody", "htmlBody"),
+    ),
+}
+_INITIAL_STREAM_KEYS = {
+    "organization": ("id",),
+    "people": ("id", "organizationId"),
+    "deal": ("id", "peopleId", "organizationId"),
+    "memo": ("id", "dealId", "peopleId", "organizationId"),
+}
+
+
+def _initial_stream_select(conn: sqlite3.Connection, table: str, omit: Set[str]) -> str:
+    parts = list(_INITIAL_STREAM_KEYS[table])
+    for alias, expr in _INITIAL_STREAM_COLUMNS[table]:
+        if alias in omit:
+            continue
+        if table == "memo" and alias == "htmlBody" and not _has_column(conn, "memo", "htmlBody"):
+            parts.append("NULL AS htmlBody")
+            continue
+        parts.append(f"{expr} AS {alias}" if expr != alias else alias)
+    return ", ".join(parts)
+
+
+def _initial_stream_batch(
+    db_path: Path, after: Optional[str], batch: int, omit: Set[str]
+) -> List[Dict[str, Any]]:
+    """One keyset page of organizations (id > after) that have people, with everything attached."""
+    with _connect(db_path) as conn:
+        org_rows = _fetch_all(
+            conn,
+            f"SELECT {_initial_stream_select(conn, 'organization', omit)} FROM organization o "
+            "WHERE o.id > ? AND EXISTS (SELECT 1 FROM people p WHERE p.organizationId = o.id) "
+            "ORDER BY o.id LIMIT ?",
+            (after or "", batch),
+        )
+        if not org_rows:
+            return []
+        org_ids = [row["id"] for row in org_rows]
+        ph = ",".join("?" for _ in org_ids)
+        people_in = f"SELECT id FROM people WHERE organizationId IN ({ph})"
+        people_rows = _fetch_all(
+            conn,
+            f"SELECT {_initial_stream_select(conn, 'people', omit)} FROM people "
+            f'WHERE organizationId IN ({ph}) ORDER BY organizationId, COALESCE("이름", id)',
+            org_ids,
+        )
+        deal_rows = _fetch_all(
+            conn,
+            f"SELECT {_initial_stream_select(conn, 'deal', omit)} FROM deal "
+            f"WHERE peopleId IN ({people_in}) ORDER BY peopleId",
+            org_ids,
+        )
+        memo_cols = _initial_stream_select(conn, "memo", omit)
+        # get_initial_dashboard_data와 같은 분류 우선순위: dealId > peopleId > organizationId
+        memo_rows = _fetch_all(
+            conn,
+            f"SELECT {memo_cols} FROM memo WHERE dealId IN (SELECT id FROM deal WHERE peopleId IN ({people_in})) "
+            f"UNION ALL SELECT {memo_cols} FROM memo WHERE COALESCE(dealId, '') = '' AND peopleId IN ({people_in}) "
+            f"UNION ALL SELECT {memo_cols} FROM memo WHERE COALESCE(dealId, '') = '' AND COALESCE(peopleId, '') = '' "
+            f"AND organizationId IN ({ph})",
+            org_ids * 3,
+        )
+
+    deals_by_person: Dict[str, List[Dict[str, Any]]] = {}
+    for row in deal_rows:
+        deals_by_person.setdefault(row["peopleId"], []).append(dict(row))
+    person_org: Dict[str, str] = {}
+    people_by_org: Dict[str, List[Dict[str, Any]]] = {}
+    for row in people_rows:
+        person = dict(row)
+        person["dealCount"] = len(deals_by_person.get(person["id"], []))
+        person_org[person["id"]] = person["organizationId"]
+        people_by_org.setdefault(person["organizationId"], []).append(person)
+    deal_org: Dict[str, str] = {}
+    for pid, deals in deals_by_person.items():
+        for deal in deals:
+            deal_org[deal["id"]] = person_org.get(pid, "")
+
+    memos_by_org: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+    for row in memo_rows:
+        memo = dict(row)
+        if memo.get("dealId"):
+            org_id, kind = deal_org.get(memo["dealId"]), "dealMemos"
+        elif memo.get("peopleId"):
+            org_id, kind = person_org.get(memo["peopleId"]), "peopleMemos"
+        else:
+            org_id, kind = memo.get("organizationId"), "companyMemos"
+        if org_id:
+            memos_by_org.setdefault(org_id, {}).setdefault(kind, []).append(memo)
+
+    records: List[Dict[str, Any]] = []
+    for row in org_rows:
+        org_id = row["id"]
+        people = people_by_org.get(org_id, [])
+        memos = memos_by_org.get(org_id, {})
+        records.append(
+            {
+                "type": "organization",
+                "organization": dict(row),
+                "people": people,
+                "deals": [deal for person in people for deal in deals_by_person.get(person["id"], [])],
+                "companyMemos": memos.get("companyMemos", []),
+                "peopleMemos": memos.get("peopleMemos", []),
+                "dealMemos": memos.get("dealMemos", []),
+            }
+        )
+    return records
+
+
+def iter_initial_dashboard_data(
+    after: Optional[str] = None,
+    limit: Optional[int] = None,
+    omit: Sequence[str] = (),
+    db_path: Path = DB_PATH,
+    batch_size: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the data behind get_initial_dashboard_data org-by-org with bounded memory.
+
+    Organizations (only those with people, as in the bulk endpoint) are walked in id order with
+    keyset pagination (`id > after`); each record carries the org's people (with dealCount), their
+    deals and the company/people/deal memos. `omit` drops non-key columns (e.g. htmlBody) at the SQL
+    level. The last record is `{"type": "end", "count", "next_cursor"}`; next_cursor is None when
+    the walk reached the end. Argument and DB checks run eagerly so callers can map errors before
+    the first byte is sent.
+    """
+    if not db_path.exists():
+        raise FileNotFoundError(f"Database not found at {db_path}")
+    if limit is not None and not 1 <= limit <= INITIAL_STREAM_MAX_LIMIT:
+        raise ValueError(f"limit must be between 1 and {INITIAL_STREAM_MAX_LIMIT}")
+    omit_set = {name.strip() for name in omit if name and name.strip()}
+    allowed = {alias for cols in _INITIAL_STREAM_COLUMNS.values() for alias, _ in cols}
+    unknown = omit_set - allowed
+    if unknown:
+        raise ValueError(f"unknown or non-omittable fields: {', '.join(sorted(unknown))}")
+    batch = max(1, batch_size or INITIAL_STREAM_BATCH)
+
+    def _walk() -> Iterator[Dict[str, Any]]:
+        cursor, count = after, 0
+        while limit is None or count < limit:
+            size = batch if limit is None else min(batch, limit - count)
+            records = _initial_stream_batch(db_path, cursor, size, omit_set)
+            for record in records:
+                yield record
+            count += len(records)
+            if len(records) < size:
+                yield {"type": "end", "count": count, "next_cursor": None}
+                return
+            cursor = records[-1]["organization"]["id"]
+        yield {"type": "end", "count": count, "next_cursor": cursor}
+
+    return _walk()
+
+
 def get_won_totals_by_size(db_path: Path = DB_PATH) -> List[Dict[str, Any]]:
     """
     Aggregate Won deals by organization size and contract year (2023/2024/2025).
@@ -4513,6 +4729,103 @@ def _compute_existing_org_ids_for_2025(db_path: Path) -> Set[str]:
         existing.add(org_id)
     return existing
 
+def _perf_amount_bucket(
+    status: Any,
+    probability: Any,
+    start_date: Any,
+    end_date: Any,
+    course_id: Any,
+    course_id_available: bool,
+    amount_num: Optional[float],
+    expected_amount_num: Optional[float],
+) -> Tuple[Optional[str], float]:
+    """
+    Monthly-amounts bucket rule (CONTRACT > CONFIRMED > HIGH) and the amount it counts.
+    Shared by _load_perf_monthly_data and the deal_fact builder.
+    """
+
+    def has_value(val: Any) -> bool:
+        return val is not None and str(val).strip() != ""
+
+    course_id_ok = True if not course_id_available else has_value(course_id)
+    if (
+        (status or "").strip() == "Won"
+        and has_value(start_date)
+        and has_value(end_date)
+        and course_id_ok
+        and amount_num is not None
+    ):
+        return "CONTRACT", amount_num
+    if _prob_equals(probability, "확정"):
+        return "CONFIRMED", _amount_fallback(amount_num, expected_amount_num)
+    if _prob_equals(probability, "높음"):
+        return "HIGH", _amount_fallback(amount_num, expected_amount_num)
+    return None, 0.0
+
+
+def _load_perf_monthly_data_from_fact(conn: sqlite3.Connection) -> Tuple[List[Dict[str, Any]], bool]:
+    """Fast path for _load_perf_monthly_data: typed rows straight from deal_fact (no per-row parsing)."""
+    rows = _fetch_all(
+        conn,
+        f'''
+        SELECT *
+        FROM {deal_fact.DEAL_FACT_TABLE}
+        WHERE
+          perf_month IS NOT NULL AND perf_bucket IS NOT NULL AND
+          (
+            contract_signed_date_raw LIKE '2025%' OR contract_signed_date_raw LIKE '2026%' OR
+            expected_close_date_raw LIKE '2025%' OR expected_close_date_raw LIKE '2026%'
+          )
+        ''',
+    )
+    course_row = conn.execute(
+        f"SELECT value FROM {deal_fact.DEAL_FACT_META_TABLE} WHERE key = 'course_id_column'"
+    ).fetchone()
+    course_id_available = bool(course_row and course_row[0])
+    major_sizes = {"대기업", "중견기업", "중소기업"}
+    data_rows: List[Dict[str, Any]] = []
+    for row in rows:
+        org_name = row["org_name"]
+        data_rows.append(
+            {
+                "month": row["perf_month"],
+                "bucket": row["perf_bucket"],
+                "amount_used": float(row["perf_amount_used"] or 0.0),
+                "amount": row["amount_num"],
+                "expected_amount": row["expected_amount_num"],
+                "org_name": org_name,
+                "upper_org": row["upper_org"] or "미입력",
+                "customer_person_name": row["person_name"] or "미입력",
+                "deal_id": row["deal_id"],
+                "deal_name": row["deal_name"] or row["deal_id"],
+                "course_format": row["process_format_raw"],
+                "category": row["category"],
+                "day1_owner_names": json.loads(row["owner_names"] or "[]"),
+                "status": row["status"],
+                "probability": row["probability_label_raw"],
+                "expected_close_date": row["expected_close_date_raw"],
+                "start_date": row["course_start_date_raw"],
+                "end_date": row["course_end_date_raw"],
+                "course_id": row["perf_course_id"] if course_id_available else None,
+                "contract_date": row["contract_signed_date_raw"],
+                "is_online": (row["process_format_raw"] or "").strip() in ONLINE_COURSE_FORMATS,
+                "is_major_size": row["size_group"] in major_sizes,
+                "org_is_samsung": org_name == "삼성전자",
+                "course_id_available": course_id_available,
+            }
+        )
+    return data_rows, course_id_available
+
+
+def _perf_amount_columns(rows: List[Dict[str, Any]]) -> perf_columns.ColumnFrame:
+    """Columns for get_perf_monthly_amounts_summary: bucket code, segment bitmask, amount_used."""
+    frame = perf_columns.ColumnFrame(rows, owners_field="day1_owner_names")
+    frame.add_codes("bucket", (r["bucket"] for r in rows), _PERF_ROW_ORDER[1:])
+    frame.add_bitmask("segments", rows, [seg["predicate"] for seg in _perf_segments()])
+    frame.add_values("amount_used", (r["amount_used"] for r in rows))
+    return frame
+
+
 def _load_perf_monthly_data(db_path: Path) -> Dict[str, Any]:
     """
     Load deals with fields required for monthly performance aggregation.
@@ -4527,11 +4840,21 @@ def _load_perf_monthly_data(db_path: Path) -> Dict[str, Any]:
     if cached is not None:
         return cached
 
-    def has_value(val: Any) -> bool:
-        return val is not None and str(val).strip() != ""
-
     try_query_error = None
+    collector = ShadowDiffCollector(enabled=_is_shadow_mode())
     with _connect(db_path) as conn:
+        if not collector.enabled and deal_fact.deal_fact_is_fresh(conn):
+            fact_rows, course_id_available = _load_perf_monthly_data_from_fact(conn)
+            payload = {
+                "rows": fact_rows,
+                "snapshot_version": f"db_mtime:{int(stat.st_mtime)}",
+                "course_id_available": course_id_available or any(r.get("course_id") is not None for r in fact_rows),
+                "try_query_error": None,
+                "source": deal_fact.DEAL_FACT_TABLE,
+                "columns": _perf_amount_columns(fact_rows),
+            }
+            _PERF_MONTHLY_DATA_CACHE[cache_key] = payload
+            return payload
         course_id_col = _detect_course_id_column(conn)
         course_id_select = f'd."{course_id_col}" AS course_id' if course_id_col else "NULL AS course_id"
         category_col = _pick_column(conn, "deal", ["카테고리", "category", "Category"])
@@ -4575,7 +4898,6 @@ def _load_perf_monthly_data(db_path: Path) -> Dict[str, Any]:
             rows = _fetch_all(conn, fallback_query)
 
     major_sizes = {"대기업", "중견기업", "중소기업"}
-    collector = ShadowDiffCollector(enabled=_is_shadow_mode())
     data_rows: List[Dict[str, Any]] = []
     for row in rows:
         month_key = _month_key_from_dates(row["contract_date"], row["expected_close_date"])
@@ -4596,28 +4918,16 @@ def _load_perf_monthly_data(db_path: Path) -> Dict[str, Any]:
         is_online = (row["course_format"] or "").strip() in ONLINE_COURSE_FORMATS
         amount_num = _to_number(row["amount"])
         expected_amount_num = _to_number(row["expected_amount"])
-        start_ok = has_value(row["start_date"])
-        end_ok = has_value(row["end_date"])
-        course_id_ok = True if course_id_col is None else has_value(row["course_id"])
-
-        bucket: Optional[str] = None
-        amount_used: float = 0.0
-
-        if (
-            (row["status"] or "").strip() == "Won"
-            and start_ok
-            and end_ok
-            and course_id_ok
-            and amount_num is not None
-        ):
-            bucket = "CONTRACT"
-            amount_used = amount_num
-        elif _prob_equals(row["probability"], "확정"):
-            bucket = "CONFIRMED"
-            amount_used = _amount_fallback(amount_num, expected_amount_num)
-        elif _prob_equals(row["probability"], "높음"):
-            bucket = "HIGH"
-            amount_used = _amount_fallback(amount_num, expected_amount_num)
+        bucket, amount_used = _perf_amount_bucket(
+            status=row["status"],
+            probability=row["probability"],
+            start_date=row["start_date"],
+            end_date=row["end_date"],
+            course_id=row["course_id"],
+            course_id_available=course_id_col is not None,
+            amount_num=amount_num,
+            expected_amount_num=expected_amount_num,
+        )
 
         if not bucket:
             continue
@@ -4656,6 +4966,7 @@ def _load_perf_monthly_data(db_path: Path) -> Dict[str, Any]:
         "snapshot_version": f"db_mtime:{int(stat.st_mtime)}",
         "course_id_available": any(r.get("course_id") is not None for r in data_rows) or course_id_col is not None,
         "try_query_error": str(try_query_error) if try_query_error else None,
+        "columns": _perf_amount_columns(data_rows),
     }
     collector.emit(
         logging.getLogger(__name__),
@@ -4666,11 +4977,27 @@ def _load_perf_monthly_data(db_path: Path) -> Dict[str, Any]:
 
 
 
+def _perf_inquiry_columns(rows: List[Dict[str, Any]]) -> perf_columns.ColumnFrame:
+    """Columns for get_perf_monthly_inquiries_summary: one (size, course, category) cell code per row."""
+    frame = perf_columns.ColumnFrame(rows)
+    frame.add_codes("size", (r["size_group"] for r in rows), INQUIRY_SIZE_GROUPS)
+    frame.add_codes("course", (r["course_format"] for r in rows), INQUIRY_COURSE_FORMATS)
+    frame.add_codes("category", (r["category_group"] for r in rows), INQUIRY_CATEGORY_GROUPS)
+    frame.add_cell(
+        "cell",
+        ("size", "course", "category"),
+        (len(INQUIRY_SIZE_GROUPS), len(INQUIRY_COURSE_FORMATS), len(INQUIRY_CATEGORY_GROUPS)),
+    )
+    return frame
+
+
 def _load_perf_monthly_inquiries_data(db_path: Path, debug: bool = False) -> Dict[str, Any]:
     """
     Load deals for monthly inquiry (deal creation) counts.
     Uses deal."생성 날짜" as month key and filters out Convert / onlineFirst==FALSE.
     """
+    # deal_fact를 쓰지 않고 원본 deal을 읽는다: 조직은 deal→people 순으로 TRIM한 id로 조인하고(deal_fact는 deal.organizationId만),
+    # (온라인)최초 입과 여부·생성일 원문(KST 월 키/shadow 비교)·조인 진단 컬럼이 deal_fact에 없다. 결과는 스냅샷별로 캐시(+warmup).
     if not db_path.exists():
         raise FileNotFoundError(f"Database not found at {db_path}")
 
@@ -4889,6 +5216,7 @@ def _load_perf_monthly_inquiries_data(db_path: Path, debug: bool = False) -> Dic
 
     payload = {
         "rows": data_rows,
+        "columns": _perf_inquiry_columns(data_rows),
         "snapshot_version": f"db_mtime:{int(stat.st_mtime)}",
         "meta_debug": {
             "impl_tag": "inq_v1_people_nullif_trim",
@@ -4920,10 +5248,35 @@ def _load_perf_monthly_inquiries_data(db_path: Path, debug: bool = False) -> Dic
 
  
  
+_CLOSE_RATE_BUCKETS = ["confirmed", "high", "low", "lost"]
+
+
+def _perf_close_rate_columns(
+    rows: List[Dict[str, Any]], existing_by_year: Dict[str, Set[str]]
+) -> perf_columns.ColumnFrame:
+    """Columns for get_perf_monthly_close_rate_summary: (size, course_group) cell, prob bucket, is_existing."""
+    frame = perf_columns.ColumnFrame(rows)
+    frame.add_codes("size", (r.get("size_group") for r in rows), INQUIRY_SIZE_GROUPS)
+    frame.add_codes("course", (r.get("course_group") for r in rows), CLOSE_RATE_COURSE_GROUPS)
+    frame.add_cell("cell", ("size", "course"), (len(INQUIRY_SIZE_GROUPS), len(CLOSE_RATE_COURSE_GROUPS)))
+    frame.add_codes("bucket", (r.get("prob_bucket") for r in rows), _CLOSE_RATE_BUCKETS)
+    frame.add_values(
+        "is_existing",
+        (
+            _close_rate_is_existing_for_month((r.get("org_id") or "").strip(), r.get("month"), existing_by_year)
+            for r in rows
+        ),
+        dtype=bool,
+    )
+    return frame
+
+
 def _load_perf_monthly_close_rate_data(db_path: Path = DB_PATH) -> Dict[str, Any]:
     """
     Load deals for close-rate aggregation (확정/높음/낮음/LOST) per month/size/course group.
     """
+    # 원본 deal을 읽는다: 문의 수 로더와 같은 deal→people 조직 조인·(온라인)최초 입과 여부를 쓰고, 카테고리 컬럼 후보
+    # (과정 대분류/category1 포함)와 people 팀 서명도 deal_fact에 없다. 결과는 스냅샷·기존고객 목록 mtime별로 캐시(+warmup).
     if not db_path.exists():
         raise FileNotFoundError(f"Database not found at {db_path}")
 
@@ -5097,13 +5450,15 @@ def _load_perf_monthly_close_rate_data(db_path: Path = DB_PATH) -> Dict[str, Any
             }
         )
 
+    existing_by_year = {
+        "2025": existing_ids_2025_columns,
+        "2026": existing_ids_2026_columns,
+    }
     payload = {
         "rows": data_rows,
+        "columns": _perf_close_rate_columns(data_rows, existing_by_year),
         "existing_org_ids": existing_ids_2026_columns,
-        "existing_org_ids_by_year": {
-            "2025": existing_ids_2025_columns,
-            "2026": existing_ids_2026_columns,
-        },
+        "existing_org_ids_by_year": existing_by_year,
         "snapshot_version": f"db_mtime:{int(stat.st_mtime)}",
         "meta_debug": {
             "total_loaded": len(rows),
@@ -5145,82 +5500,56 @@ def get_perf_monthly_close_rate_summary(
     months = _month_range_keys(from_month, to_month)
     if not months:
         raise ValueError("from/to month range is empty")
-    month_set = set(months)
-    zero_map = lambda: {m: 0 for m in months}  # noqa: E731
 
-    list_path = Path(os.getenv(EXISTING_2024_FOR_2025_ENV, EXISTING_2024_FOR_2025_DEFAULT_PATH))
-    list_mtime = list_path.stat().st_mtime if list_path.exists() else None
     payload = _load_perf_monthly_close_rate_data(db_path)
-    stat = db_path.stat()
-    cache_key = (db_path, stat.st_mtime, list_path, list_mtime, from_month, to_month, cust, scope)
-    cached = _PERF_MONTHLY_CLOSE_RATE_SUMMARY_CACHE.get(cache_key)
-    if cached is not None:
-        return cached
-
-    existing_by_year = payload.get("existing_org_ids_by_year") or {}
-    if not existing_by_year:
-        legacy_set = payload.get("existing_org_ids") or set()
-        existing_by_year = {"2026": legacy_set}
-
-    total_counts: Dict[Tuple[str, str], Dict[str, int]] = defaultdict(zero_map)
-    metric_counts: Dict[Tuple[str, str, str], Dict[str, float]] = defaultdict(zero_map)
-    for size in INQUIRY_SIZE_GROUPS:
-        for course in CLOSE_RATE_COURSE_GROUPS:
-            _ = total_counts[(size, course)]
-            for metric in CLOSE_RATE_METRICS:
-                _ = metric_counts[(size, course, metric)]
-
+    frame: Optional[perf_columns.ColumnFrame] = payload.get("columns")
+    if frame is None:
+        existing_by_year = payload.get("existing_org_ids_by_year") or {"2026": payload.get("existing_org_ids") or set()}
+        frame = _perf_close_rate_columns(payload["rows"], existing_by_year)
+    positions = frame.month_positions(months)
+    in_range = positions >= 0
+    valid = in_range & (frame.columns["cell"] >= 0)
+    scope_ok = frame.owner_mask(allowed_members, _owners_match_team)
+    is_existing = frame.columns["is_existing"]
+    if cust == "existing":
+        cust_ok = is_existing
+    elif cust == "new":
+        cust_ok = ~is_existing
+    else:
+        cust_ok = frame.ones()
+    included_mask = valid & scope_ok & cust_ok
     summary_debug = {
-        "excluded_out_of_range": 0,
-        "excluded_scope_mismatch": 0,
-        "excluded_customer_type_mismatch": 0,
+        "excluded_out_of_range": int((~in_range).sum()),
+        "excluded_scope_mismatch": int((valid & ~scope_ok).sum()),
+        "excluded_customer_type_mismatch": int((valid & scope_ok & ~cust_ok).sum()),
+    }
+    included = int(included_mask.sum())
+
+    n_size, n_course, n_months = len(INQUIRY_SIZE_GROUPS), len(CLOSE_RATE_COURSE_GROUPS), len(months)
+    cell = frame.columns["cell"]
+    totals = perf_columns.grid(cell, positions, included_mask, n_size * n_course, n_months)
+    bucket = frame.columns["bucket"]
+    per_bucket = {
+        name: perf_columns.grid(cell, positions, included_mask & (bucket == code), n_size * n_course, n_months)
+        for code, name in enumerate(_CLOSE_RATE_BUCKETS)
     }
-    included = 0
-
-    for row in payload["rows"]:
-        month_key = row.get("month")
-        if month_key not in month_set:
-            summary_debug["excluded_out_of_range"] += 1
-            continue
-        size = row.get("size_group")
-        course_group = row.get("course_group")
-        if size not in INQUIRY_SIZE_GROUPS or course_group not in CLOSE_RATE_COURSE_GROUPS:
-            continue
-        if allowed_members is not None and not _owners_match_team(row.get("owner_names"), allowed_members):
-            summary_debug["excluded_scope_mismatch"] += 1
-            continue
-
-        org_id = (row.get("org_id") or "").strip()
-        is_existing = _close_rate_is_existing_for_month(org_id, month_key, existing_by_year)
-        if cust == "existing" and not is_existing:
-            summary_debug["excluded_customer_type_mismatch"] += 1
-            continue
-        if cust == "new" and is_existing:
-            summary_debug["excluded_customer_type_mismatch"] += 1
-            continue
-
-        included += 1
-        total_counts[(size, course_group)][month_key] += 1
-        bucket = row.get("prob_bucket")
-        if bucket in {"confirmed", "high", "low", "lost"}:
-            metric_counts[(size, course_group, bucket)][month_key] += 1
 
-    # mirror total into metric_counts for row generation
-    for size in INQUIRY_SIZE_GROUPS:
-        for course in CLOSE_RATE_COURSE_GROUPS:
+    total_counts: Dict[Tuple[str, str], Dict[str, int]] = {}
+    metric_counts: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+    for si, size in enumerate(INQUIRY_SIZE_GROUPS):
+        for ci, course in enumerate(CLOSE_RATE_COURSE_GROUPS):
+            idx = si * n_course + ci
+            total_counts[(size, course)] = perf_columns.month_map(totals[idx], months)
+            # mirror total into metric_counts for row generation
             metric_counts[(size, course, "total")] = total_counts[(size, course)]
-
-    # close_rate per month
-    for size in INQUIRY_SIZE_GROUPS:
-        for course in CLOSE_RATE_COURSE_GROUPS:
-            totals = total_counts[(size, course)]
-            conf = metric_counts[(size, course, "confirmed")]
-            high = metric_counts[(size, course, "high")]
-            rate_map = metric_counts[(size, course, "close_rate")]
-            for m in months:
-                denom = totals[m]
-                numer = conf[m] + high[m]
-                rate_map[m] = round((numer / denom) * 100, 1) if denom > 0 else 0.0
+            for name in _CLOSE_RATE_BUCKETS:
+                metric_counts[(size, course, name)] = perf_columns.month_map(per_bucket[name][idx], months)
+            # close_rate per month
+            conf, high = metric_counts[(size, course, "confirmed")], metric_counts[(size, course, "high")]
+            metric_counts[(size, course, "close_rate")] = {
+                m: round(((conf[m] + high[m]) / denom) * 100, 1) if denom > 0 else 0.0
+                for m, denom in total_counts[(size, course)].items()
+            }
 
     label_map = {
         "total": "전체",
@@ -5273,7 +5602,6 @@ def get_perf_monthly_close_rate_summary(
             "meta_debug": meta_debug,
         },
     }
-    _PERF_MONTHLY_CLOSE_RATE_SUMMARY_CACHE[cache_key] = result
     return result
 
 
@@ -5465,63 +5793,50 @@ def get_perf_monthly_amounts_summary(
 ) -> Dict[str, Any]:
     """
     Summary table for monthly amounts by segment and row (계약/확정/높음).
-    Amounts are raw 원 단위; months are YYMM keys.
+    Amounts are raw 원 단위; months are YYMM keys. Aggregated from the payload's column frame.
     """
     months = _month_range_keys(from_month, to_month)
-    month_set = set(months)
     if not months:
         raise ValueError("from/to month range is empty")
 
     payload = _load_perf_monthly_data(db_path)
     allowed_members = _perf_monthly_scope_members(scope) if scope else _dealcheck_team_members(team)
-    stat = db_path.stat()
-    cache_key = (db_path, stat.st_mtime, from_month, to_month, team or "all", scope or "none")
-    cached = _PERF_MONTHLY_SUMMARY_CACHE.get(cache_key)
-    if cached is not None:
-        return cached
+    frame: perf_columns.ColumnFrame = payload.get("columns") or _perf_amount_columns(payload["rows"])
+    positions = frame.month_positions(months)
+    bucket = frame.columns["bucket"]
+    keep = frame.owner_mask(allowed_members, _owners_match_team) & (positions >= 0) & (bucket >= 0)
+    positions, bucket, amount, seg_bits = perf_columns.take(
+        keep, positions, bucket, frame.columns["amount_used"], frame.columns["segments"]
+    )
+    # TOTAL은 버킷 구분 없이 같은 행 순서로 누적한다(루프 구현과 동일한 합산 순서).
+    any_bucket = perf_columns.collapse(bucket)
+    n_buckets, n_months = len(_PERF_ROW_ORDER) - 1, len(months)
 
-    rows_data = [row for row in payload["rows"] if row["month"] in month_set]
-    if allowed_members is not None:
-        rows_data = [row for row in rows_data if _owners_match_team(row.get("day1_owner_names"), allowed_members)]
     segments_result: List[Dict[str, Any]] = []
-    for seg in _perf_segments():
-        bucket_data: Dict[str, Dict[str, Any]] = {}
-        for bucket_key in _PERF_ROW_ORDER:
-            bucket_data[bucket_key] = {
-                "byMonth": {m: 0.0 for m in months},
-                "dealCountByMonth": {m: 0 for m in months},
-            }
-        for deal in rows_data:
-            bucket = deal["bucket"]
-            if bucket not in bucket_data:
-                continue
-            if not seg["predicate"](deal):
-                continue
-            month = deal["month"]
-            bucket_data[bucket]["byMonth"][month] += deal["amount_used"]
-            bucket_data[bucket]["dealCountByMonth"][month] += 1
-            bucket_data["TOTAL"]["byMonth"][month] += deal["amount_used"]
-            bucket_data["TOTAL"]["dealCountByMonth"][month] += 1
-
+    for i, seg in enumerate(_perf_segments()):
+        mask = perf_columns.bit(seg_bits, i)
+        sums = perf_columns.grid(bucket, positions, mask, n_buckets, n_months, amount)
+        counts = perf_columns.grid(bucket, positions, mask, n_buckets, n_months)
+        total_sums = perf_columns.grid(any_bucket, positions, mask, 1, n_months, amount)[0]
+        total_counts = perf_columns.grid(any_bucket, positions, mask, 1, n_months)[0]
         seg_rows: List[Dict[str, Any]] = []
-        for row_key in _PERF_ROW_ORDER:
+        for r, row_key in enumerate(_PERF_ROW_ORDER):
+            by_month, count_by_month = (total_sums, total_counts) if r == 0 else (sums[r - 1], counts[r - 1])
             seg_rows.append(
                 {
                     "key": row_key,
                     "label": _PERF_ROW_LABEL.get(row_key, row_key),
-                    "byMonth": bucket_data[row_key]["byMonth"],
-                    "dealCountByMonth": bucket_data[row_key]["dealCountByMonth"],
+                    "byMonth": perf_columns.month_map(by_month, months, float),
+                    "dealCountByMonth": perf_columns.month_map(count_by_month, months),
                 }
             )
         segments_result.append({"key": seg["key"], "label": seg["label"], "rows": seg_rows})
 
-    result = {
+    return {
         "months": months,
         "segments": segments_result,
         "meta": {"snapshot_version": payload.get("snapshot_version"), "team": team, "scope": scope},
     }
-    _PERF_MONTHLY_SUMMARY_CACHE[cache_key] = result
-    return result
 
 
 def get_perf_monthly_amounts_deals(
@@ -5612,53 +5927,25 @@ def get_perf_monthly_inquiries_summary(
     Summary counts of deal creations by (size_group, course_format, category_group) × month.
     """
     months = _month_range_keys(from_month, to_month)
-    month_set = set(months)
     if not months:
         raise ValueError("from/to month range is empty")
 
     payload = _load_perf_monthly_inquiries_data(db_path, debug=debug)
-    stat = db_path.stat()
-    cache_key = (db_path, stat.st_mtime, from_month, to_month, team or "all")
-    if not debug:
-        cached = _PERF_MONTHLY_INQUIRIES_SUMMARY_CACHE.get(cache_key)
-        if cached is not None:
-            return cached
-
     team_members = _dealcheck_team_members(team)
+    frame: perf_columns.ColumnFrame = payload.get("columns") or _perf_inquiry_columns(payload["rows"])
+    positions = frame.month_positions(months)
+    team_mask = frame.owner_mask(team_members, _owners_match_team)
+    n_size, n_course, n_category = len(INQUIRY_SIZE_GROUPS), len(INQUIRY_COURSE_FORMATS), len(INQUIRY_CATEGORY_GROUPS)
+    cells = perf_columns.grid(frame.columns["cell"], positions, team_mask, n_size * n_course * n_category, len(months))
+    cells = cells.reshape(n_size, n_course, n_category, len(months))
+    rollup = cells.sum(axis=2)
     detail_counts: Dict[Tuple[str, str, str], Dict[str, int]] = {}
     fmt_rollup: Dict[Tuple[str, str], Dict[str, int]] = {}
-
-    def _init_counts_for_detail(size: str, course: str, category: str) -> Dict[str, int]:
-        return detail_counts.setdefault((size, course, category), {m: 0 for m in months})
-
-    for size in INQUIRY_SIZE_GROUPS:
-        for course in INQUIRY_COURSE_FORMATS:
-            fmt_rollup[(size, course)] = {m: 0 for m in months}
-            for category in INQUIRY_CATEGORY_GROUPS:
-                _init_counts_for_detail(size, course, category)
-
-    rows_total_in_range = 0
-    excluded_by_team = 0
-    excluded_by_team_by_size: Dict[str, int] = {}
-    excluded_owner_counter: Counter[str] = Counter()
-
-    for row in payload["rows"]:
-        if row["month"] not in month_set:
-            continue
-        rows_total_in_range += 1
-        if team_members is not None and not _owners_match_team(row.get("owner_names"), team_members):
-            excluded_by_team += 1
-            size = row["size_group"]
-            excluded_by_team_by_size[size] = excluded_by_team_by_size.get(size, 0) + 1
-            for name in row.get("owner_names") or []:
-                excluded_owner_counter[name] += 1
-            continue
-        size = row["size_group"]
-        course = row["course_format"]
-        category = row["category_group"]
-        month = row["month"]
-        detail_counts[(size, course, category)][month] += 1
-        fmt_rollup[(size, course)][month] += 1
+    for si, size in enumerate(INQUIRY_SIZE_GROUPS):
+        for ci, course in enumerate(INQUIRY_COURSE_FORMATS):
+            fmt_rollup[(size, course)] = perf_columns.month_map(rollup[si, ci], months)
+            for ki, category in enumerate(INQUIRY_CATEGORY_GROUPS):
+                detail_counts[(size, course, category)] = perf_columns.month_map(cells[si, ci, ki], months)
 
     rows_list: List[Dict[str, Any]] = []
     for size in INQUIRY_SIZE_GROUPS:
@@ -5695,6 +5982,17 @@ def get_perf_monthly_inquiries_summary(
 
     team_filter_debug = None
     if debug and team is not None:
+        in_range = positions >= 0
+        rows_total_in_range = int(in_range.sum())
+        excluded_by_team_by_size: Dict[str, int] = {}
+        excluded_owner_counter: Counter[str] = Counter()
+        for idx in (in_range & ~team_mask).nonzero()[0].tolist():
+            row = payload["rows"][idx]
+            size = row["size_group"]
+            excluded_by_team_by_size[size] = excluded_by_team_by_size.get(size, 0) + 1
+            for name in row.get("owner_names") or []:
+                excluded_owner_counter[name] += 1
+        excluded_by_team = sum(excluded_by_team_by_size.values())
         team_filter_debug = {
             "team_param": team,
             "allowed_member_count": len(team_members or []),
@@ -5717,8 +6015,6 @@ def get_perf_monthly_inquiries_summary(
     if team_filter_debug is not None:
         result["meta"]["debug"] = result["meta"].get("debug") or {}
         result["meta"]["debug"]["team_filter"] = team_filter_debug
-    if not debug:
-        _PERF_MONTHLY_INQUIRIES_SUMMARY_CACHE[cache_key] = result
     return result
 
 
@@ -6336,6 +6632,8 @@ def _compute_counterparty_dri_rows(
     targets_meta: Dict[Tuple[str, str], Dict[str, Any]],
     debug: bool,
 ) -> Tuple[List[Dict[str, Any]], Dict[str, Any], int]:
+    # 원본 deal을 읽는다: 여기 연도는 계약 체결일→수주 예정일 기준이고 과정포맷은 strip 없이 비교하는데, deal_fact의
+    # deal_year(수강시작일 우선)/is_online(strip)과 정의가 달라 그대로 옮기면 숫자가 바뀐다. 결과는 counterparty_dri 캐시(+warmup)로 스냅샷당 한 번 계산.
     online_set = sp.ONLINE_COURSE_FORMATS
     db_stat = db_path.stat()
     snapshot_version = f"db_mtime:{int(db_stat.st_mtime)}"
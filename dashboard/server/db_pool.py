@@ -0,0 +1,168 @@
+"""
+Thread-local pool of read-only SQLite connections.
+
+FastAPI runs sync endpoints on a worker threadpool; opening a fresh connection per call means a
+file open, schema parse and UDF registration on every request. Connections here are opened once
+per (thread, path, profile) in `mode=ro` with read-tuned PRAGMAs and the kst_* UDFs registered,
+and are reused until the file behind the path changes (symlink swap by start.sh, os.replace by the
+snapshot job, or an in-place write), at which point the next checkout reopens transparently.
+
+Two profiles:
+- query_only=True (database.py): PRAGMA query_only, nothing can be written.
+- query_only=False (deal_normalizer): still mode=ro for the main DB, but TEMP tables are allowed
+  (deal_norm, org_tier, ... are built per request in temp_store=MEMORY and dropped by the builder
+  when it is done, since the connection outlives the request).
+"""
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import quote
+
+from . import date_kst
+
+POOL_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+POOL_CACHE_SIZE_KIB = int(os.getenv("SQLITE_CACHE_SIZE_KIB", "65536"))
+# 스레드당 유지할 최대 (경로, 프로필) 수: 스케줄러 스냅샷 경로가 계속 바뀌어도 fd가 쌓이지 않게 한다.
+POOL_MAX_PER_THREAD = 4
+
+_local = threading.local()
+_all_conns: "weakref.WeakSet[PooledConnection]" = weakref.WeakSet()
+_all_lock = threading.Lock()
+_stats = {"opened": 0, "reused": 0, "recycled": 0}
+
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3.Connection whose close() is a no-op so `conn.close()` in callers keeps the pool intact."""
+
+    pool_key: Tuple[str, bool] = ("", True)
+    signature: Tuple[Any, ...] = ()
+    owner: Optional[int] = None
+    released = False
+    # release() from another thread: recycled at the owner's next get_connection instead of closed mid-query
+    stale = False
+
+    def close(self) -> None:
+        return None
+
+    def force_close(self) -> None:
+        self.released = True
+        super().close()
+
+
+def file_signature(db_path: Path) -> Tuple[Any, ...]:
+    """Identity of the file currently behind db_path (follows symlinks)."""
+    real = os.path.realpath(db_path)
+    st = os.stat(real)
+    return (real, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def register_kst_udfs(conn: sqlite3.Connection) -> None:
+    try:
+        conn.create_function("kst_date", 1, date_kst.kst_date_only)
+        conn.create_function("kst_year", 1, date_kst.kst_year)
+        conn.create_function("kst_ym", 1, date_kst.kst_ym)
+        conn.create_function("kst_yymm", 1, date_kst.kst_yymm)
+    except Exception:
+        logging.exception("Failed to register KST date UDFs")
+
+
+def _open(path: str, query_only: bool) -> PooledConnection:
+    uri = f"file:{quote(path)}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False, factory=PooledConnection)
+    conn.row_factory = sqlite3.Row
+    for pragma in (
+        f"PRAGMA mmap_size={POOL_MMAP_SIZE}",
+        f"PRAGMA cache_size=-{POOL_CACHE_SIZE_KIB}",
+        "PRAGMA temp_store=MEMORY",
+    ):
+        try:
+            conn.execute(pragma)
+        except sqlite3.Error:
+            logging.debug("pragma skipped: %s", pragma)
+    if query_only:
+        conn.execute("PRAGMA query_only=ON")
+    register_kst_udfs(conn)
+    with _all_lock:
+        _all_conns.add(conn)
+        _stats["opened"] += 1
+    return conn
+
+
+def _thread_pool() -> "OrderedDict[Tuple[str, bool], PooledConnection]":
+    pool = getattr(_local, "conns", None)
+    if pool is None:
+        pool = OrderedDict()
+        _local.conns = pool
+    return pool
+
+
+def get_connection(db_path: Path, query_only: bool = True) -> PooledConnection:
+    """Check out this thread's pooled connection for db_path, reopening it if the file changed."""
+    path = os.path.abspath(db_path)
+    signature = file_signature(Path(path))
+    key = (path, query_only)
+    pool = _thread_pool()
+    conn = pool.get(key)
+    if conn is not None:
+        if conn.signature == signature and not conn.released and not conn.stale:
+            pool.move_to_end(key)
+            conn.row_factory = sqlite3.Row
+            with _all_lock:
+                _stats["reused"] += 1
+            return conn
+        pool.pop(key)
+        if not conn.released:
+            conn.force_close()
+            with _all_lock:
+                _stats["recycled"] += 1
+    conn = _open(path, query_only)
+    conn.pool_key = key
+    conn.signature = signature
+    conn.owner = threading.get_ident()
+    pool[key] = conn
+    while len(pool) > POOL_MAX_PER_THREAD:
+        _, oldest = pool.popitem(last=False)
+        oldest.force_close()
+    return conn
+
+
+def release(db_path: Path) -> int:
+    """
+    Retire pooled connections for db_path in every thread (call before deleting the file). Connections of
+    this thread or of threads that have exited are idle and closed here; ones owned by other live threads may
+    be mid-query, so they are only marked stale and recycled at their owner's next get_connection.
+    Returns the number closed directly.
+    """
+    path = os.path.abspath(db_path)
+    closed = 0
+    me = threading.get_ident()
+    live = {t.ident for t in threading.enumerate()}
+    with _all_lock:
+        targets = [c for c in list(_all_conns) if c.pool_key[0] == path]
+    for conn in targets:
+        if conn.released:
+            continue
+        if conn.owner != me and conn.owner in live:
+            conn.stale = True
+            continue
+        try:
+            conn.force_close()
+            closed += 1
+        except sqlite3.Error:
+            continue
+    pool = _thread_pool()
+    for key in [k for k in pool if k[0] == path]:
+        pool.pop(key)
+    return closed
+
+
+def pool_stats() -> Dict[str, Any]:
+    with _all_lock:
+        return {**_stats, "open": sum(1 for c in _all_conns if not c.released)}
@@ -0,0 +1,172 @@
+"""
+Typed, pre-normalized deal table materialized once per snapshot.
+
+`deal_fact` holds every deal row (Convert 포함) with amounts/dates/flags already parsed by the
+same helpers the API uses (deal_normalizer._normalize_deal_row + database perf rules), so hot
+paths can read typed columns instead of re-parsing TEXT on every request.
+
+Freshness: writing the table changes the file mtime/size, so the stamp is a content signature of
+the source `deal` table (run_tag, row count, max rowid) plus the DATE_KST_MODE the parse used.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+DEAL_FACT_TABLE = "deal_fact"
+DEAL_FACT_META_TABLE = "deal_fact_meta"
+DEAL_FACT_VERSION = 1
+
+# DEAL_NORM_COLUMNS(deal_normalizer) 뒤에 붙는 추가 컬럼
+DEAL_FACT_EXTRA_COLUMNS: Sequence[Tuple[str, str]] = (
+    ("org_name", "TEXT"),
+    ("size_raw", "TEXT"),
+    ("size_group", "TEXT"),
+    ("upper_org", "TEXT"),
+    ("person_name", "TEXT"),
+    ("category", "TEXT"),
+    ("perf_course_id", "TEXT"),
+    ("owner_json", "TEXT"),
+    ("owner_names", "TEXT"),
+    ("created_date", "TEXT"),
+    ("amount_num", "REAL"),
+    ("expected_amount_num", "REAL"),
+    ("perf_month", "TEXT"),
+    ("perf_bucket", "TEXT"),
+    ("perf_amount_used", "REAL"),
+)
+
+
+def _date_mode() -> str:
+    mode = os.getenv("DATE_KST_MODE", "legacy").lower()
+    return mode if mode in {"legacy", "shadow", "strict"} else "legacy"
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+    return row is not None
+
+
+def deal_source_signature(conn: sqlite3.Connection) -> str:
+    run_tag = ""
+    if _table_exists(conn, "run_info"):
+        try:
+            row = conn.execute("SELECT run_tag FROM run_info LIMIT 1").fetchone()
+            run_tag = str(row[0] or "") if row else ""
+        except sqlite3.OperationalError:
+            run_tag = ""
+    count, max_rowid = conn.execute("SELECT COUNT(*), MAX(rowid) FROM deal").fetchone()
+    return f"v{DEAL_FACT_VERSION}|{_date_mode()}|{run_tag}|{int(count or 0)}|{int(max_rowid or 0)}"
+
+
+def deal_fact_is_fresh(conn: sqlite3.Connection) -> bool:
+    """True when deal_fact exists and was built from the current deal rows with the current date mode."""
+    try:
+        if not _table_exists(conn, DEAL_FACT_META_TABLE) or not _table_exists(conn, DEAL_FACT_TABLE):
+            return False
+        row = conn.execute(f"SELECT value FROM {DEAL_FACT_META_TABLE} WHERE key = 'signature'").fetchone()
+        return bool(row) and row[0] == deal_source_signature(conn)
+    except sqlite3.Error:
+        return False
+
+
+def build_deal_fact(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """(Re)create deal_fact + deal_fact_meta in the given (writable) snapshot connection."""
+    from . import database as db
+    from . import deal_normalizer as dn
+
+    started = time.time()
+    prev_factory = conn.row_factory
+    conn.row_factory = sqlite3.Row
+    try:
+        size_col = db._pick_column(conn, "organization", ["기업 규모"])
+        person_col = db._pick_column(conn, "people", ["이름"])
+        owner_col = db._pick_column(conn, "deal", ["담당자"])
+        category_col = db._pick_column(conn, "deal", ["카테고리", "category", "Category"])
+        created_col = db._pick_column(conn, "deal", ["생성 날짜", "createdAt"])
+        course_id_col = db._detect_course_id_column(conn)
+        extra_select = ",\n".join(
+            [
+                'COALESCE(o."이름", d.organizationId) AS perf_org_name',
+                f"{'o.' + db._q(size_col) if size_col else 'NULL'} AS size_raw",
+                f"{'p.' + db._q(person_col) if person_col else 'NULL'} AS person_name",
+                f"{db._dq(owner_col)} AS owner_json",
+                f"{db._dq(category_col)} AS category",
+                f"{db._dq(created_col)} AS created_raw",
+                f"{db._dq(course_id_col)} AS perf_course_id",
+            ]
+        )
+        rows = conn.execute(
+            f"""
+            SELECT {dn._deal_source_columns_sql(conn)},
+            {extra_select}
+            FROM deal d
+            LEFT JOIN organization o ON o.id = d.organizationId
+            LEFT JOIN people p ON p.id = d.peopleId
+            """
+        ).fetchall()
+
+        columns: List[Tuple[str, str]] = list(dn.DEAL_NORM_COLUMNS) + list(DEAL_FACT_EXTRA_COLUMNS)
+        fact_rows: List[Tuple[Any, ...]] = []
+        for row in rows:
+            norm = dn._normalize_deal_row(row)
+            org_name = row["perf_org_name"] or (row["organization_id"] or "-")
+            amount_num = db._to_number(row["amount_raw_primary"])
+            expected_amount_num = db._to_number(row["amount_raw_fallback"])
+            perf_bucket, perf_amount_used = db._perf_amount_bucket(
+                status=row["status"],
+                probability=row["probability_label_raw"],
+                start_date=row["course_start_date_raw"],
+                end_date=row["course_end_date_raw"],
+                course_id=row["perf_course_id"],
+                course_id_available=course_id_col is not None,
+                amount_num=amount_num,
+                expected_amount_num=expected_amount_num,
+            )
+            created_date = dn._parse_date(row["created_raw"])
+            fact_rows.append(
+                norm
+                + (
+                    org_name,
+                    row["size_raw"],
+                    db.infer_size_group(org_name, row["size_raw"]),
+                    row["counterparty_raw"],
+                    row["person_name"],
+                    row["category"],
+                    row["perf_course_id"],
+                    row["owner_json"],
+                    json.dumps(db._parse_owner_names(row["owner_json"]), ensure_ascii=False),
+                    created_date,
+                    amount_num,
+                    expected_amount_num,
+                    db._month_key_from_dates(row["contract_signed_date_raw"], row["expected_close_date_raw"]),
+                    perf_bucket,
+                    perf_amount_used,
+                )
+            )
+
+        col_defs = ", ".join(f'"{name}" {ctype}' for name, ctype in columns)
+        placeholders = ", ".join("?" for _ in columns)
+        conn.execute(f"DROP TABLE IF EXISTS {DEAL_FACT_TABLE}")
+        conn.execute(f"CREATE TABLE {DEAL_FACT_TABLE} ({col_defs})")
+        conn.executemany(f"INSERT INTO {DEAL_FACT_TABLE} VALUES ({placeholders})", fact_rows)
+        signature = deal_source_signature(conn)
+        conn.execute(f"DROP TABLE IF EXISTS {DEAL_FACT_META_TABLE}")
+        conn.execute(f"CREATE TABLE {DEAL_FACT_META_TABLE} (key TEXT PRIMARY KEY, value TEXT)")
+        conn.executemany(
+            f"INSERT INTO {DEAL_FACT_META_TABLE} (key, value) VALUES (?, ?)",
+            [
+                ("signature", signature),
+                ("version", str(DEAL_FACT_VERSION)),
+                ("date_mode", _date_mode()),
+                ("row_count", str(len(fact_rows))),
+                ("course_id_column", course_id_col or ""),
+            ],
+        )
+        conn.commit()
+    finally:
+        conn.row_factory = prev_factory
+    return {"rows": len(fact_rows), "signature": signature, "elapsed_sec": round(time.time() - started, 3)}
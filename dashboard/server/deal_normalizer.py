@@ -10,6 +10,8 @@ from typing import Any, Dict, List, Sequence, Tuple
 
 from . import counterparty_llm as cllm
 from . import date_kst
+from . import db_pool
+from . import deal_fact
 from .agents.core.artifacts import ArtifactStore
 from .agents.core.types import AgentContext, LLMConfig
 from .agents.core.orchestrator import Orchestrator
@@ -108,8 +110,8 @@ def _connect(db_path: str | Path | None = None) -> sqlite3.Connection:
     path = Path(db_path) if db_path else DB_PATH
     if not path.exists():
         raise FileNotFoundError(f"Database not found at {path}")
-    conn = sqlite3.connect(str(path), check_same_thread=False)
-    conn.row_factory = sqlite3.Row
+    # 스레드별 풀링된 읽기 전용(mode=ro) 커넥션. TEMP 테이블 생성이 필요하므로 query_only는 끈다.
+    conn = db_pool.get_connection(path, query_only=False)
     # 읽기 전용이지만 안전을 위해 FK 활성화
     try:
         conn.execute("PRAGMA foreign_keys=ON;")
@@ -117,6 +119,16 @@ def _connect(db_path: str | Path | None = None) -> sqlite3.Connection:
         pass
     return conn
 
+def drop_temp_tables(conn: sqlite3.Connection) -> int:
+    """
+    풀링된 커넥션은 요청이 끝나도 닫히지 않으므로(temp_store=MEMORY) 빌더가 만든 TEMP 테이블을 모두 지운다.
+    """
+    names = [row[0] for row in conn.execute("SELECT name FROM temp.sqlite_master WHERE type = 'table'").fetchall()]
+    for name in names:
+        conn.execute(f'DROP TABLE IF EXISTS temp."{name}"')
+    return len(names)
+
+
 # deal_norm TEMP TABLE 정의 (순서가 insert 시에도 사용됨)
 DEAL_NORM_COLUMNS: Sequence[Tuple[str, str]] = (
     ("deal_id", "TEXT"),
@@ -354,29 +366,11 @@ def _classify_bucket(
     return None
 
 
-def build_deal_norm(conn: sqlite3.Connection, table_name: str = "deal_norm") -> Dict[str, Any]:
-    """
-    deal/people/organization을 조인하고 금액/날짜/비온라인/카운터파티 플래그를 포함한
-    TEMP TABLE deal_norm을 생성한다. Convert 상태는 제외되며 dq_metrics를 반환한다.
-    """
-    conn.row_factory = sqlite3.Row
-
+def _deal_source_columns_sql(conn: sqlite3.Connection) -> str:
+    """SELECT list shared by build_deal_norm and deal_fact (aliases feed _normalize_deal_row)."""
     has_course_id = _has_column(conn, "deal", "코스 ID")
-
-    dq_metrics: Dict[str, int] = {
-        "total_deals_loaded": 0,
-        "excluded_convert_count": 0,
-        "amount_missing_count": 0,
-        "amount_parse_fail_count": 0,
-        "year_missing_count": 0,
-        "counterparty_unclassified_count": 0,
-        "process_format_missing_count": 0,
-    }
-
-    select_course_id = 'd."코스 ID" AS course_id_raw,' if has_course_id else "NULL AS course_id_raw,"
-    deal_rows = conn.execute(
-        f"""
-        SELECT
+    select_course_id = 'd."코스 ID" AS course_id_raw' if has_course_id else "NULL AS course_id_raw"
+    return f"""
             d.id AS deal_id,
             d."이름" AS deal_name,
             d."상태" AS status,
@@ -390,138 +384,213 @@ def build_deal_norm(conn: sqlite3.Connection, table_name: str = "deal_norm") ->
             d."수강시작일" AS course_start_date_raw,
             d."수강종료일" AS course_end_date_raw,
             d."성사 가능성" AS probability_label_raw,
-            {select_course_id}
+            {select_course_id},
             COALESCE(o."이름", o.id) AS organization_name,
             p."소속 상위 조직" AS counterparty_raw
-        FROM deal d
-        LEFT JOIN organization o ON o.id = d.organizationId
-        LEFT JOIN people p ON p.id = d.peopleId
+    """
+
+
+def _new_dq_metrics() -> Dict[str, int]:
+    return {
+        "total_deals_loaded": 0,
+        "excluded_convert_count": 0,
+        "amount_missing_count": 0,
+        "amount_parse_fail_count": 0,
+        "year_missing_count": 0,
+        "counterparty_unclassified_count": 0,
+        "process_format_missing_count": 0,
+    }
+
+
+def _normalize_deal_row(row: Any, dq_metrics: Dict[str, int] | None = None) -> Tuple[Any, ...]:
+    """
+    원본 deal 행(_deal_source_columns_sql alias)을 DEAL_NORM_COLUMNS 순서의 튜플로 정규화한다.
+    dq_metrics가 주어지면 결측/파싱 실패 카운트를 누적한다.
+    """
+    metrics = dq_metrics if dq_metrics is not None else _new_dq_metrics()
+    status = row["status"]
+
+    process_format_raw = row["process_format_raw"]
+    process_format_missing = _normalize_str(process_format_raw) is None
+    metrics["process_format_missing_count"] += 1 if process_format_missing else 0
+
+    is_nononline = process_format_missing or str(process_format_raw).strip() not in ONLINE_DEAL_FORMATS
+    is_online = not is_nononline
+
+    amount_raw_primary = row["amount_raw_primary"]
+    amount_raw_fallback = row["amount_raw_fallback"]
+    primary_has_value = _normalize_str(amount_raw_primary) is not None
+    fallback_has_value = _normalize_str(amount_raw_fallback) is not None
+
+    amount_source = "NONE"
+    amount_value = 0
+    amount_parse_ok = False
+
+    if primary_has_value:
+        amount_source = "AMOUNT"
+        amount_value, amount_parse_ok = _parse_amount(amount_raw_primary)
+    elif fallback_has_value:
+        amount_source = "EXPECTED"
+        amount_value, amount_parse_ok = _parse_amount(amount_raw_fallback)
+
+    amount_missing_flag = not primary_has_value and not fallback_has_value
+    if amount_missing_flag:
+        metrics["amount_missing_count"] += 1
+    if amount_source != "NONE" and not amount_parse_ok:
+        metrics["amount_parse_fail_count"] += 1
+
+    contract_signed_date = _parse_date(row["contract_signed_date_raw"])
+    expected_close_date = _parse_date(row["expected_close_date_raw"])
+    course_start_date = _parse_date(row["course_start_date_raw"])
+    course_end_date = _parse_date(row["course_end_date_raw"])
+
+    base_date = contract_signed_date or expected_close_date
+    deal_year = None
+    if course_start_date:
+        deal_year = int(course_start_date.split("-")[0])
+    elif base_date:
+        deal_year = int(base_date.split("-")[0])
+
+    year_missing_flag = deal_year is None
+    if year_missing_flag:
+        metrics["year_missing_count"] += 1
+
+    organization_name = row["organization_name"] or None
+    org_missing_flag = row["organization_id"] is None or organization_name is None
+    if org_missing_flag:
+        organization_name = organization_name or ORG_UNKNOWN
+
+    counterparty_raw = _normalize_str(row["counterparty_raw"])
+    counterparty_missing_flag = row["people_id"] is None or counterparty_raw is None
+    if counterparty_missing_flag:
+        counterparty_name = COUNTERPARTY_UNKNOWN
+        metrics["counterparty_unclassified_count"] += 1
+    else:
+        counterparty_name = counterparty_raw
+
+    counterparty_key = f"{row['organization_id'] or ''}||{counterparty_name}"
+
+    required_fields_ok = (
+        bool(contract_signed_date)
+        and bool(course_start_date)
+        and bool(course_end_date)
+        and _normalize_str(row["course_id_raw"]) is not None
+        and amount_value > 0
+    )
+    bucket = _classify_bucket(status, row["probability_label_raw"], required_fields_ok, amount_value)
+    metrics["total_deals_loaded"] += 1
+
+    return (
+        row["deal_id"],
+        row["deal_name"],
+        status,
+        row["organization_id"],
+        organization_name,
+        row["people_id"],
+        counterparty_name,
+        counterparty_key,
+        process_format_raw,
+        _bool_to_int(process_format_missing),
+        _bool_to_int(is_nononline),
+        _bool_to_int(is_online),
+        amount_raw_primary,
+        amount_raw_fallback,
+        amount_source,
+        int(amount_value),
+        int(amount_value),
+        _bool_to_int(amount_parse_ok),
+        _bool_to_int(amount_source != "NONE" and not amount_parse_ok),
+        _bool_to_int(amount_missing_flag),
+        row["contract_signed_date_raw"],
+        row["expected_close_date_raw"],
+        row["course_start_date_raw"],
+        row["course_end_date_raw"],
+        row["course_id_raw"],
+        contract_signed_date,
+        expected_close_date,
+        course_start_date,
+        course_end_date,
+        base_date,
+        deal_year,
+        _bool_to_int(year_missing_flag),
+        _bool_to_int(counterparty_missing_flag),
+        _bool_to_int(org_missing_flag),
+        row["probability_label_raw"],
+        bucket,
+    )
+
+
+def _build_deal_norm_from_fact(conn: sqlite3.Connection, table_name: str) -> Dict[str, Any]:
+    """deal_fact가 최신이면 파싱 없이 SQL 한 번으로 deal_norm을 채운다."""
+    names = ", ".join(f'"{name}"' for name, _ in DEAL_NORM_COLUMNS)
+    conn.execute(
+        f'INSERT INTO "{table_name}" ({names}) SELECT {names} FROM {deal_fact.DEAL_FACT_TABLE} '
+        "WHERE status IS NULL OR status <> 'Convert'"
+    )
+    row = conn.execute(
+        f"""
+        SELECT
+          SUM(CASE WHEN status IS NULL OR status <> 'Convert' THEN 1 ELSE 0 END) AS total_deals_loaded,
+          SUM(CASE WHEN status = 'Convert' THEN 1 ELSE 0 END) AS excluded_convert_count,
+          SUM(CASE WHEN status IS NULL OR status <> 'Convert' THEN amount_missing_flag ELSE 0 END) AS amount_missing_count,
+          SUM(CASE WHEN status IS NULL OR status <> 'Convert' THEN amount_parse_failed ELSE 0 END) AS amount_parse_fail_count,
+          SUM(CASE WHEN status IS NULL OR status <> 'Convert' THEN year_missing_flag ELSE 0 END) AS year_missing_count,
+          SUM(CASE WHEN status IS NULL OR status <> 'Convert' THEN counterparty_missing_flag ELSE 0 END) AS counterparty_unclassified_count,
+          SUM(CASE WHEN status IS NULL OR status <> 'Convert' THEN process_format_missing_flag ELSE 0 END) AS process_format_missing_count
+        FROM {deal_fact.DEAL_FACT_TABLE}
         """
-    ).fetchall()
+    ).fetchone()
+    return {key: int(row[key] or 0) for key in _new_dq_metrics()}
+
+
+def _create_temp_index(conn: sqlite3.Connection, table: str, columns: Sequence[str]) -> None:
+    # TEMP 테이블에 만든 인덱스는 temp 스키마에 생기고 DROP TABLE 시 함께 제거된다.
+    name = f"idx_{table}_{'_'.join(columns)}"
+    cols = ", ".join(f'"{c}"' for c in columns)
+    conn.execute(f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" ({cols})')
+
+
+def build_deal_norm(conn: sqlite3.Connection, table_name: str = "deal_norm") -> Dict[str, Any]:
+    """
+    deal/people/organization을 조인하고 금액/날짜/비온라인/카운터파티 플래그를 포함한
+    TEMP TABLE deal_norm을 생성한다. Convert 상태는 제외되며 dq_metrics를 반환한다.
+    스냅샷에 최신 deal_fact가 있으면 행별 파싱 대신 그 테이블을 복사한다.
+    """
+    conn.row_factory = sqlite3.Row
 
     conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
     col_defs = ", ".join([f'"{name}" {ctype}' for name, ctype in DEAL_NORM_COLUMNS])
     conn.execute(f'CREATE TEMP TABLE "{table_name}" ({col_defs})')
 
+    if deal_fact.deal_fact_is_fresh(conn):
+        dq_metrics = _build_deal_norm_from_fact(conn, table_name)
+    else:
+        dq_metrics = _build_deal_norm_from_rows(conn, table_name)
+    # 하위 빌더(org_tier/target/risk)와 top-deal 윈도 쿼리가 모두 (org, counterparty, year)로 조인/필터한다.
+    _create_temp_index(conn, table_name, ("organization_id", "counterparty_name", "deal_year"))
+    _create_temp_index(conn, table_name, ("deal_year",))
+    return dq_metrics
+
+
+def _build_deal_norm_from_rows(conn: sqlite3.Connection, table_name: str) -> Dict[str, Any]:
+    dq_metrics = _new_dq_metrics()
+    deal_rows = conn.execute(
+        f"""
+        SELECT {_deal_source_columns_sql(conn)}
+        FROM deal d
+        LEFT JOIN organization o ON o.id = d.organizationId
+        LEFT JOIN people p ON p.id = d.peopleId
+        """
+    ).fetchall()
+
     insert_sql = f'INSERT INTO "{table_name}" ({", ".join([name for name, _ in DEAL_NORM_COLUMNS])}) VALUES ({", ".join(["?"] * len(DEAL_NORM_COLUMNS))})'
     norm_rows: List[Tuple[Any, ...]] = []
 
     for row in deal_rows:
-        status = row["status"]
-        if status == "Convert":
+        if row["status"] == "Convert":
             dq_metrics["excluded_convert_count"] += 1
             continue
-
-        process_format_raw = row["process_format_raw"]
-        process_format_missing = _normalize_str(process_format_raw) is None
-        dq_metrics["process_format_missing_count"] += 1 if process_format_missing else 0
-
-        is_nononline = process_format_missing or str(process_format_raw).strip() not in ONLINE_DEAL_FORMATS
-        is_online = not is_nononline
-
-        amount_raw_primary = row["amount_raw_primary"]
-        amount_raw_fallback = row["amount_raw_fallback"]
-        primary_has_value = _normalize_str(amount_raw_primary) is not None
-        fallback_has_value = _normalize_str(amount_raw_fallback) is not None
-
-        amount_source = "NONE"
-        amount_value = 0
-        amount_parse_ok = False
-
-        if primary_has_value:
-            amount_source = "AMOUNT"
-            amount_value, amount_parse_ok = _parse_amount(amount_raw_primary)
-        elif fallback_has_value:
-            amount_source = "EXPECTED"
-            amount_value, amount_parse_ok = _parse_amount(amount_raw_fallback)
-
-        amount_missing_flag = not primary_has_value and not fallback_has_value
-        if amount_missing_flag:
-            dq_metrics["amount_missing_count"] += 1
-        if amount_source != "NONE" and not amount_parse_ok:
-            dq_metrics["amount_parse_fail_count"] += 1
-
-        contract_signed_date = _parse_date(row["contract_signed_date_raw"])
-        expected_close_date = _parse_date(row["expected_close_date_raw"])
-        course_start_date = _parse_date(row["course_start_date_raw"])
-        course_end_date = _parse_date(row["course_end_date_raw"])
-
-        base_date = contract_signed_date or expected_close_date
-        deal_year = None
-        if course_start_date:
-            deal_year = int(course_start_date.split("-")[0])
-        elif base_date:
-            deal_year = int(base_date.split("-")[0])
-
-        year_missing_flag = deal_year is None
-        if year_missing_flag:
-            dq_metrics["year_missing_count"] += 1
-
-        organization_name = row["organization_name"] or None
-        org_missing_flag = row["organization_id"] is None or organization_name is None
-        if org_missing_flag:
-            organization_name = organization_name or ORG_UNKNOWN
-
-        counterparty_raw = _normalize_str(row["counterparty_raw"])
-        counterparty_missing_flag = row["people_id"] is None or counterparty_raw is None
-        if counterparty_missing_flag:
-            counterparty_name = COUNTERPARTY_UNKNOWN
-            dq_metrics["counterparty_unclassified_count"] += 1
-        else:
-            counterparty_name = counterparty_raw
-
-        counterparty_key = f"{row['organization_id'] or ''}||{counterparty_name}"
-
-        required_fields_ok = (
-            bool(contract_signed_date)
-            and bool(course_start_date)
-            and bool(course_end_date)
-            and _normalize_str(row["course_id_raw"]) is not None
-            and amount_value > 0
-        )
-        bucket = _classify_bucket(status, row["probability_label_raw"], required_fields_ok, amount_value)
-
-        norm_rows.append(
-            (
-                row["deal_id"],
-                row["deal_name"],
-                status,
-                row["organization_id"],
-                organization_name,
-                row["people_id"],
-                counterparty_name,
-                counterparty_key,
-                process_format_raw,
-                _bool_to_int(process_format_missing),
-                _bool_to_int(is_nononline),
-                _bool_to_int(is_online),
-                amount_raw_primary,
-                amount_raw_fallback,
-                amount_source,
-                int(amount_value),
-                int(amount_value),
-                _bool_to_int(amount_parse_ok),
-                _bool_to_int(amount_source != "NONE" and not amount_parse_ok),
-                _bool_to_int(amount_missing_flag),
-                row["contract_signed_date_raw"],
-                row["expected_close_date_raw"],
-                row["course_start_date_raw"],
-                row["course_end_date_raw"],
-                row["course_id_raw"],
-                contract_signed_date,
-                expected_close_date,
-                course_start_date,
-                course_end_date,
-                base_date,
-                deal_year,
-                _bool_to_int(year_missing_flag),
-                _bool_to_int(counterparty_missing_flag),
-                _bool_to_int(org_missing_flag),
-                row["probability_label_raw"],
-                bucket,
-            )
-        )
-        dq_metrics["total_deals_loaded"] += 1
+        norm_rows.append(_normalize_deal_row(row, dq_metrics))
 
     if norm_rows:
         conn.executemany(insert_sql, norm_rows)
@@ -723,6 +792,7 @@ def build_counterparty_target_2026(
         GROUP BY d.organization_id, COALESCE(NULLIF(TRIM(d.counterparty_name), ''), '{COUNTERPARTY_UNKNOWN}')
         """
     )
+    _create_temp_index(conn, "tmp_baseline_2025", ("organization_id", "counterparty_name"))
 
     conn.execute(
         f"""
@@ -773,6 +843,7 @@ def build_counterparty_target_2026(
          AND u.counterparty_name = b.counterparty_name
         """
     )
+    _create_temp_index(conn, output_table, ("organization_id", "counterparty_name"))
 
     null_tier_rows = conn.execute(
         f'SELECT COUNT(*) AS cnt FROM "{output_table}" WHERE tier IS NULL'
@@ -875,6 +946,7 @@ def build_counterparty_risk_rule(
         WHERE tier IN ('S0','P0','P1','P2')
         """
     )
+    _create_temp_index(conn, "tiered_orgs", ("organization_id",))
 
     # 2026 deals with bucket normalization and exclusions
     conn.execute(
@@ -920,6 +992,7 @@ def build_counterparty_risk_rule(
         GROUP BY organization_id, counterparty_name
         """
     )
+    _create_temp_index(conn, "agg_2026", ("organization_id", "counterparty_name"))
 
     # year unknown dq (all years, nononline, tiered orgs)
     conn.execute(
@@ -936,6 +1009,7 @@ def build_counterparty_risk_rule(
         GROUP BY d.organization_id, d.counterparty_name
         """
     )
+    _create_temp_index(conn, "year_unknown_dq", ("organization_id", "counterparty_name"))
 
     conn.execute(
         f"""
@@ -1108,15 +1182,93 @@ def _tier_rank(tier: str | None) -> int:
     return rank.get(tier or "", 99)
 
 
+def fetch_top_deals_2026(
+    conn: sqlite3.Connection,
+    mode_key: str = MODE_OFFLINE,
+    risk_table: str = "tmp_counterparty_risk_rule",
+    deal_norm_table: str = "deal_norm",
+    limit: int | None = None,
+) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+    """
+    리스크 테이블에 있는 (organization_id, counterparty_name)별 2026 상위 딜(금액 desc, deal_id asc)을
+    ROW_NUMBER() 윈도 한 번으로 가져온다. 카운터파티마다 deal_norm을 다시 스캔하던 N+1 쿼리를 대체한다.
+    """
+    mode = _normalize_mode_key(mode_key)
+    limit = cllm.TOP_DEALS_LIMIT if limit is None else limit
+    deals_mode_condition = "d.is_nononline = 1" if mode == MODE_OFFLINE else "d.is_online = 1"
+    rows = conn.execute(
+        f"""
+        WITH keys AS (
+            SELECT DISTINCT organization_id, counterparty_name FROM "{risk_table}"
+        ),
+        ranked AS (
+            SELECT
+                d.organization_id,
+                d.counterparty_name,
+                d.deal_id,
+                d.deal_name,
+                d.status,
+                d.probability_label_raw AS possibility,
+                d.amount_value AS amount,
+                d.is_nononline,
+                d.deal_year,
+                d.course_id_raw,
+                d.contract_signed_date,
+                d.expected_close_date,
+                d.course_start_date,
+                d.course_end_date,
+                ROW_NUMBER() OVER (
+                    PARTITION BY d.organization_id, d.counterparty_name
+                    ORDER BY CAST(d.amount_value AS INTEGER) DESC, d.deal_id ASC
+                ) AS rn
+            FROM "{deal_norm_table}" d
+            JOIN keys k
+              ON k.organization_id = d.organization_id
+             AND k.counterparty_name = d.counterparty_name
+            WHERE d.deal_year = 2026
+              AND {deals_mode_condition}
+              AND d.status NOT IN ('Convert','Lost')
+        )
+        SELECT *
+        FROM ranked
+        WHERE rn <= ?
+        ORDER BY organization_id, counterparty_name, rn
+        """,
+        (limit,),
+    ).fetchall()
+    top_deals_map: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    for d in rows:
+        top_deals_map.setdefault((d["organization_id"], d["counterparty_name"]), []).append(
+            {
+                "deal_id": d["deal_id"],
+                "deal_name": d["deal_name"],
+                "status": d["status"],
+                "possibility": d["possibility"],
+                "amount": d["amount"],
+                "is_nononline": bool(d["is_nononline"]),
+                "deal_year": d["deal_year"],
+                "course_id_exists": bool(d["course_id_raw"]),
+                "start_date": d["course_start_date"],
+                "end_date": d["course_end_date"],
+                "contract_date": d["contract_signed_date"],
+                "expected_close_date": d["expected_close_date"],
+                "last_contact_date": None,
+            }
+        )
+    return top_deals_map
+
+
 def build_counterparty_risk_report(
     as_of_date: str | None = None,
     db_path: Path = DB_PATH,
     mode_key: str = MODE_OFFLINE,
+    rule_only: bool = False,
 ) -> Dict[str, Any]:
     """
     Orchestrates D1~D4 and returns a JSON-ready counterparty risk report.
     - Builds deal_norm -> org_tier -> counterparty_target_2026 -> tmp_counterparty_risk_rule
-    - Runs agent chain (D6) via orchestrator + registry
+    - Runs agent chain (D6) via orchestrator + registry (skipped when rule_only=True:
+      blockers/evidence/actions come from the rule fallbacks and no LLM call is made)
     - Composes outputs into final counterparties list
     """
     if not db_path.exists():
@@ -1129,73 +1281,29 @@ def build_counterparty_risk_report(
     db_hash = hashlib.sha256(db_mtime.encode("utf-8")).hexdigest()[:16]
 
     with _connect(db_path) as conn:
-        dq_metrics = build_deal_norm(conn)
-        org_tier = build_org_tier(conn, as_of_date=as_of.isoformat())
-        build_counterparty_target_2026(conn, mode_key=mode)
-        risk_info = build_counterparty_risk_rule(conn, as_of_date=as_of.isoformat(), mode_key=mode)
+        try:
+            dq_metrics = build_deal_norm(conn)
+            org_tier = build_org_tier(conn, as_of_date=as_of.isoformat())
+            build_counterparty_target_2026(conn, mode_key=mode)
+            risk_info = build_counterparty_risk_rule(conn, as_of_date=as_of.isoformat(), mode_key=mode)
 
-        rows = conn.execute(
-            f"""
-            SELECT *
-            FROM "{risk_info['table']}"
-            """
-        ).fetchall()
-        # 카운터파티별 2026 상위 딜(금액 desc) 확보: deal_norm이 존재하는 동일 커넥션에서 계산
-        top_deals_map: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
-        deals_mode_condition = "is_nononline = 1" if mode == MODE_OFFLINE else "is_online = 1"
-        for r in rows:
-            key = (r["organization_id"], r["counterparty_name"])
-            deals = conn.execute(
+            rows = conn.execute(
                 f"""
-                SELECT
-                    deal_id,
-                    deal_name,
-                    status,
-                    probability_label_raw AS possibility,
-                    amount_value AS amount,
-                    is_nononline,
-                    deal_year,
-                    course_id_raw,
-                    contract_signed_date,
-                    expected_close_date,
-                    course_start_date,
-                    course_end_date
-                FROM deal_norm
-                WHERE organization_id = ?
-                  AND counterparty_name = ?
-                  AND deal_year = 2026
-                  AND {deals_mode_condition}
-                  AND status NOT IN ('Convert','Lost')
-                ORDER BY CAST(amount_value AS INTEGER) DESC, deal_id ASC
-                LIMIT ?
-                """,
-                (r["organization_id"], r["counterparty_name"], cllm.TOP_DEALS_LIMIT),
+                SELECT *
+                FROM "{risk_info['table']}"
+                """
             ).fetchall()
-            top_deals_map[key] = [
-                {
-                    "deal_id": d["deal_id"],
-                    "deal_name": d["deal_name"],
-                    "status": d["status"],
-                    "possibility": d["possibility"],
-                    "amount": d["amount"],
-                    "is_nononline": bool(d["is_nononline"]),
-                    "deal_year": d["deal_year"],
-                    "course_id_exists": bool(d["course_id_raw"]),
-                    "start_date": d["course_start_date"],
-                    "end_date": d["course_end_date"],
-                    "contract_date": d["contract_signed_date"],
-                    "expected_close_date": d["expected_close_date"],
-                    "last_contact_date": None,
-                }
-                for d in deals
-            ]
-        rows_data = []
-        for r in rows:
-            data = dict(r)
-            data["top_deals_2026"] = top_deals_map.get(
-                (r["organization_id"], r["counterparty_name"]), []
-            )
-            rows_data.append(data)
+            # 카운터파티별 2026 상위 딜(금액 desc) 확보: deal_norm이 존재하는 동일 커넥션에서 한 번에 계산
+            top_deals_map = fetch_top_deals_2026(conn, mode_key=mode, risk_table=risk_info["table"])
+            rows_data = []
+            for r in rows:
+                data = dict(r)
+                data["top_deals_2026"] = top_deals_map.get(
+                    (r["organization_id"], r["counterparty_name"]), []
+                )
+                rows_data.append(data)
+        finally:
+            drop_temp_tables(conn)
 
     severity_order = {"심각": 0, "보통": 1, "양호": 2}
 
@@ -1210,22 +1318,24 @@ def build_counterparty_risk_report(
         )
 
     # Agent orchestration (D6)
-    artifacts = ArtifactStore()
-    artifacts.set("base.counterparty_rows", rows_data)
-    ctx = AgentContext(
-        report_id=REPORT_ID_COUNTERPARTY_RISK_DAILY,
-        mode_key=mode,
-        as_of_date=as_of,
-        db_hash=db_hash,
-        snapshot_db_path=db_path,
-        cache_root=Path("report_cache/llm"),
-        llm=LLMConfig.from_env(),
-    )
-    agents = get_agent_chain(REPORT_ID_COUNTERPARTY_RISK_DAILY, mode)
-    orchestrator = Orchestrator()
-    with _connect(db_path) as conn_for_agents:
-        agent_outputs = orchestrator.run(REPORT_ID_COUNTERPARTY_RISK_DAILY, mode, ctx, artifacts, agents, conn=conn_for_agents)
-    card_outputs = artifacts.get("agent.counterparty_card.outputs") or agent_outputs.get("counterparty_card", {}) or {}
+    card_outputs: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    if not rule_only:
+        artifacts = ArtifactStore()
+        artifacts.set("base.counterparty_rows", rows_data)
+        ctx = AgentContext(
+            report_id=REPORT_ID_COUNTERPARTY_RISK_DAILY,
+            mode_key=mode,
+            as_of_date=as_of,
+            db_hash=db_hash,
+            snapshot_db_path=db_path,
+            cache_root=Path("report_cache/llm"),
+            llm=LLMConfig.from_env(),
+        )
+        agents = get_agent_chain(REPORT_ID_COUNTERPARTY_RISK_DAILY, mode)
+        orchestrator = Orchestrator()
+        with _connect(db_path) as conn_for_agents:
+            agent_outputs = orchestrator.run(REPORT_ID_COUNTERPARTY_RISK_DAILY, mode, ctx, artifacts, agents, conn=conn_for_agents)
+        card_outputs = artifacts.get("agent.counterparty_card.outputs") or agent_outputs.get("counterparty_card", {}) or {}
     merged_rows = merge_counterparty_card_outputs(sorted(rows_data, key=sort_key), card_outputs, mode, REPORT_ID_COUNTERPARTY_RISK_DAILY)
 
     counts = {"severe": 0, "normal": 0, "good": 0, "pipeline_zero": 0}
@@ -1291,6 +1401,7 @@ def build_counterparty_risk_report(
             "generated_at": generated_at,
             "mode": mode,
             "report_id": REPORT_ID_COUNTERPARTY_RISK_DAILY,
+            "rule_only": rule_only,
         },
         "summary": summary,
         "data_quality": dq_quality,
@@ -0,0 +1,211 @@
+"""
+Conditional GET + compression for the read-only /api surface.
+
+Every GET under /api is a function of (DB snapshot, resource files, query string, KST day, code),
+so a strong ETag derived from those answers `If-None-Match` with 304 before the handler runs.
+Buffered JSON/text bodies (JSONResponse/PlainTextResponse carry Content-Length) are compressed with
+brotli when the `brotli` package is installed, else gzip; streamed responses pass through untouched.
+Each encoding gets its own ETag suffix so the validator stays strong per representation.
+A Cache-Control set by the handler wins over the default; `no-store` responses (XLSX downloads) get no
+ETag at all.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from . import db_pool
+
+try:  # optional dependency
+    import brotli  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    brotli = None  # type: ignore
+
+API_PREFIX = "/api"
+# report/*는 report_cache 파일, health/debug는 프로세스 상태를 반영하므로 ETag 대상에서 제외한다.
+EXCLUDED_PREFIXES = ("/api/health", "/api/debug", "/api/report")
+RESOURCE_DIR = Path(__file__).parent / "resources"
+RESOURCE_ENV_PATHS = ("ACCOUNTING_DATA_PATH", "EXISTING_2024_FOR_2025_LIST_PATH")
+COMPRESS_MIN_BYTES = int(os.getenv("API_COMPRESS_MIN_BYTES", "1024"))
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/x-ndjson")
+CACHE_CONTROL = "private, no-cache"
+_KST = timezone(timedelta(hours=9))
+_BOOT_ID = f"{os.getpid()}-{time.time_ns()}"
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+def _file_state(path: Path) -> Tuple[str, int, int]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (str(path), 0, 0)
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def resource_signature(extra_paths: Iterable[Path] = ()) -> Tuple[Any, ...]:
+    paths: List[Path] = sorted(p for p in RESOURCE_DIR.iterdir() if p.is_file()) if RESOURCE_DIR.is_dir() else []
+    paths.extend(Path(os.environ[name]) for name in RESOURCE_ENV_PATHS if os.environ.get(name))
+    paths.extend(extra_paths)
+    return tuple(_file_state(p) for p in paths)
+
+
+def _db_signature(db_path: Path) -> Tuple[Any, ...]:
+    try:
+        return db_pool.file_signature(db_path)
+    except OSError:
+        return (str(db_path), None)
+
+
+def compute_etag(path: str, query_string: str, db_path: Path) -> str:
+    query = sorted(parse_qsl(query_string, keep_blank_values=True))
+    material = repr(
+        (
+            path,
+            query,
+            _db_signature(db_path),
+            resource_signature(),
+            datetime.now(_KST).date().isoformat(),
+            _BOOT_ID,
+        )
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+
+def _header(headers: List[Tuple[bytes, bytes]], name: bytes) -> Optional[str]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _parse_if_none_match(value: Optional[str]) -> List[str]:
+    if not value:
+        return []
+    tags = []
+    for part in value.split(","):
+        tag = part.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        tags.append(tag.strip('"'))
+    return tags
+
+
+def _pick_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    accepted = {p.split(";")[0].strip().lower() for p in (accept_encoding or "").split(",") if p.strip()}
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+
+class ApiCacheMiddleware:
+    """ASGI middleware: strong ETag / 304 for GET|HEAD /api/*, plus br/gzip for large buffered bodies."""
+
+    def __init__(self, app: ASGIApp, db_path_getter: Callable[[], Path]) -> None:
+        self.app = app
+        self.db_path_getter = db_path_getter
+
+    def _eligible(self, scope: Scope) -> bool:
+        if scope.get("type") != "http" or scope.get("method") not in {"GET", "HEAD"}:
+            return False
+        path = scope.get("path") or ""
+        if not path.startswith(API_PREFIX):
+            return False
+        return not any(path.startswith(prefix) for prefix in EXCLUDED_PREFIXES)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._eligible(scope):
+            await self.app(scope, receive, send)
+            return
+
+        req_headers = scope.get("headers") or []
+        query_string = (scope.get("query_string") or b"").decode("latin-1")
+        base = compute_etag(scope["path"], query_string, self.db_path_getter())
+        encoding = _pick_encoding(_header(req_headers, b"accept-encoding"))
+
+        client_tags = _parse_if_none_match(_header(req_headers, b"if-none-match"))
+        if client_tags and ("*" in client_tags or any(t == base or t.startswith(f"{base}-") for t in client_tags)):
+            # echo the tag that matched, not just the client's first one
+            matched = next((t for t in client_tags if t == base or t.startswith(f"{base}-")), base)
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [
+                        (b"etag", f'"{matched}"'.encode("latin-1")),
+                        (b"cache-control", CACHE_CONTROL.encode("latin-1")),
+                        (b"vary", b"Accept-Encoding"),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        state: Dict[str, Any] = {"start": None, "buffer": False, "chunks": []}
+
+        async def _send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                handler_cache_control = _header(message.get("headers", []), b"cache-control")
+                status = message.get("status", 200)
+                if status != 200 or "no-store" in (handler_cache_control or "").lower():
+                    await send(message)
+                    return
+                headers = [(k, v) for k, v in message.get("headers", []) if k.lower() not in {b"etag", b"cache-control"}]
+                content_type = (_header(headers, b"content-type") or "").lower()
+                length = _header(headers, b"content-length")
+                compressible = (
+                    scope["method"] == "GET"
+                    and encoding is not None
+                    and length is not None
+                    and int(length) >= COMPRESS_MIN_BYTES
+                    and _header(headers, b"content-encoding") is None
+                    and content_type.startswith(COMPRESSIBLE_TYPES)
+                )
+                tag = f"{base}-{encoding}" if compressible else base
+                headers.extend(
+                    [
+                        (b"etag", f'"{tag}"'.encode("latin-1")),
+                        (b"cache-control", (handler_cache_control or CACHE_CONTROL).encode("latin-1")),
+                        (b"vary", b"Accept-Encoding"),
+                    ]
+                )
+                if compressible:
+                    state["buffer"] = True
+                    state["start"] = {**message, "headers": headers}
+                    return
+                await send({**message, "headers": headers})
+                return
+
+            if not state["buffer"]:
+                await send(message)
+                return
+            state["chunks"].append(message.get("body", b""))
+            if message.get("more_body"):
+                return
+            body = _compress(b"".join(state["chunks"]), encoding)
+            start = state["start"]
+            headers = [(k, v) for k, v in start["headers"] if k.lower() != b"content-length"]
+            headers.append((b"content-encoding", encoding.encode("latin-1")))
+            headers.append((b"content-length", str(len(body)).encode("latin-1")))
+            await send({**start, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, _send)
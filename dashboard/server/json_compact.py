@@ -1,17 +1,60 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
-
-from .database import YEARS_FOR_WON, _date_only, _safe_json_load, _to_number
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cache_registry import register_cache
+from .database import (
+    DB_PATH,
+    YEARS_FOR_WON,
+    _date_only,
+    _safe_json_load,
+    _to_number,
+    get_memo_markdown_by_html,
+    get_won_groups_json,
+)
 from .html_to_markdown import html_to_markdown, should_enrich_text, strip_key_deep
+from . import won_groups_store
 
 SCHEMA_VERSION = "won-groups-json/compact-v1"
 ONLINE_COURSE_FORMATS = {"구독제(온라인)", "선택구매(온라인)", "포팅"}
 YEAR_ORDER = ["2023", "2024", "2025"]
 DEFAULT_FIELDS = {"course_format", "category", "owner", "day1_teams"}
+_COMPACT_CACHE = register_cache("won_groups_compact", max_entries=64)
 
 
-def compact_won_groups_json(raw: Dict[str, Any]) -> Dict[str, Any]:
+def get_won_groups_compact(
+    org_id: str,
+    target_uppers: Optional[List[str]] = None,
+    db_path: Path = DB_PATH,
+) -> Dict[str, Any]:
+    """
+    compact_won_groups_json(get_won_groups_json(...)) memoized per (db_path, mtime, org_id, upper filter),
+    backed by the on-disk won_groups_store (shared across workers/restarts) when WON_GROUPS_CACHE_DIR is set.
+    """
+    if not db_path.exists():
+        raise FileNotFoundError(f"Database not found at {db_path}")
+    uppers_key = None if target_uppers is None else tuple(sorted({(u or "").strip() for u in target_uppers if u}))
+    cache_key = (db_path, db_path.stat().st_mtime, str(org_id), uppers_key)
+    cached = _COMPACT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    compact = won_groups_store.get_or_build(
+        "compact",
+        str(org_id),
+        None if uppers_key is None else "|".join(uppers_key),
+        SCHEMA_VERSION,
+        db_path,
+        lambda: compact_won_groups_json(
+            get_won_groups_json(org_id=org_id, target_uppers=target_uppers, db_path=db_path),
+            memo_markdown=get_memo_markdown_by_html(str(org_id), db_path=db_path),
+        ),
+    )
+    _COMPACT_CACHE[cache_key] = compact
+    return compact
+
+
+def compact_won_groups_json(raw: Dict[str, Any], memo_markdown: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     """
     Build a compact variant of /won-groups-json for LLM input:
     - Remove nested people in deals, keep people_id reference only.
@@ -19,6 +62,7 @@ def compact_won_groups_json(raw: Dict[str, Any]) -> Dict[str, Any]:
     - Drop null/[] recursively.
     - Pull common deal fields up to group.deal_defaults (mode >=80%, n>=3).
     - Add counterparty/organization won summaries.
+    `memo_markdown` maps htmlBody → precomputed markdown (memo_clean); misses are converted here.
     """
     org_meta = raw.get("organization") or {}
     groups_raw = raw.get("groups") or []
@@ -101,7 +145,7 @@ def compact_won_groups_json(raw: Dict[str, Any]) -> Dict[str, Any]:
         "organization": {**org_meta, "summary": org_summary},
         "groups": compact_groups,
     }
-    compact = _strip_memo_html(compact)
+    compact = _strip_memo_html(compact, memo_markdown or {})
     compact = strip_key_deep(compact, "htmlBody")
     return _prune(compact, keep_keys={"schema_version", "organization"})
 
@@ -218,7 +262,7 @@ def _values_equal(left: Any, right: Any) -> bool:
     return _hashable(left) == _hashable(right)
 
 
-def _strip_memo_html(value: Any) -> Any:
+def _strip_memo_html(value: Any, memo_markdown: Dict[str, str]) -> Any:
     """
     Remove htmlBody keys from any memo-like dicts for compact payloads.
     If htmlBody exists and text is missing/blank, fill text with a plain-text
@@ -235,12 +279,14 @@ def _strip_memo_html(value: Any) -> Any:
         for k, v in value.items():
             if k == "htmlBody":
                 continue
-            result[k] = _strip_memo_html(v)
+            result[k] = _strip_memo_html(v, memo_markdown)
         if need_fill:
-            result["text"] = html_to_markdown(str(html_body))
+            html = str(html_body)
+            markdown = memo_markdown.get(html)
+            result["text"] = markdown if markdown is not None else html_to_markdown(html)
         return result
     if isinstance(value, list):
-        return [_strip_memo_html(item) for item in value]
+        return [_strip_memo_html(item, memo_markdown) for item in value]
     return value
 
 
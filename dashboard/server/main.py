@@ -1,3 +1,7 @@
+import json
+import logging
+from typing import Optional
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -9,10 +13,14 @@ try:
 except Exception:
     print("[env] python-dotenv not available or .env missing; skipping")
 
-from .database import get_initial_dashboard_data
+from .agents.core.llm_client import close_client
+from . import database
+from .cache_warmer import start_cache_warmer, stop_cache_warmer, warmup_status
+from .database import check_snapshot_indexes, get_initial_dashboard_data, iter_initial_dashboard_data
+from .http_cache import ApiCacheMiddleware
 from .org_tables_api import router as org_tables_router
 from .report_scheduler import start_scheduler
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 
 app = FastAPI(title="Org Tables Dashboard API")
 
@@ -26,6 +34,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# CORS보다 안쪽: 304/압축 응답에도 CORS 헤더가 붙는다.
+app.add_middleware(ApiCacheMiddleware, db_path_getter=lambda: database.DB_PATH)
+
 app.include_router(org_tables_router)
 
 @app.on_event("startup")
@@ -33,13 +44,52 @@ def startup_scheduler():
     # Guarded inside start_scheduler to avoid duplicate starts under reload.
     start_scheduler()
 
+
+@app.on_event("startup")
+def startup_cache_warmer():
+    # Warms default views in the background; re-runs when the DB signature changes.
+    start_cache_warmer()
+
+
+@app.on_event("startup")
+def startup_index_check():
+    try:
+        status = check_snapshot_indexes()
+    except Exception as exc:
+        logging.warning("[startup] snapshot index check skipped: %s", exc)
+        return
+    if not status["ok"]:
+        logging.warning(
+            "[startup] snapshot indexes missing or outdated (version=%s, required=%s, missing=%s); "
+            "run `python salesmap_first_page_snapshot.py --index-only --db-path <db>`",
+            status["index_version"],
+            status["required_version"],
+            status["missing"] or "run_info.indexes not recorded",
+        )
+
+
+@app.on_event("shutdown")
+def shutdown_llm_transport():
+    close_client()
+
+
+@app.on_event("shutdown")
+def shutdown_cache_warmer():
+    stop_cache_warmer()
+
+
 @app.get("/", include_in_schema=False)
 def index():
     return FileResponse("org_tables_v2.html")
 
 @app.get("/api/health")
-async def health() -> dict:
-    return {"status": "ok"}
+def health(ready: bool = False):
+    """Liveness plus warm-up progress; `?ready=true` answers 503 until the default views are cached."""
+    warmup = warmup_status()
+    body = {"status": "ok", "warmup": warmup}
+    if ready and not warmup["ready"]:
+        return JSONResponse(status_code=503, content={**body, "status": "warming"})
+    return body
 
 
 @app.get("/api/initial-data")
@@ -52,6 +102,27 @@ async def initial_data() -> dict:
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+@app.get("/api/initial-data/stream")
+def initial_data_stream(
+    after: Optional[str] = None,
+    limit: Optional[int] = None,
+    omit: Optional[str] = None,
+) -> StreamingResponse:
+    """NDJSON: one record per organization (keyset on id), then {"type":"end","next_cursor"}."""
+    try:
+        records = iter_initial_dashboard_data(
+            after=after or None,
+            limit=limit,
+            omit=(omit or "").split(","),
+        )
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    lines = (json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
 if __name__ == "__main__":
     import uvicorn
 
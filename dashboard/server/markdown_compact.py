@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Sequence
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
 
 import re
 
-from .json_compact import YEAR_ORDER
-
-PHONE_REGEX = re.compile(r"\b01[016789]-?\d{3,4}-?\d{4}\b")
+from . import won_groups_store
+from .database import DB_PATH
+from .json_compact import YEAR_ORDER, get_won_groups_compact
+from .memo_clean import PHONE_REGEX, redact_phone as _redact_phone, truncate as _truncate  # noqa: F401
 
 
 def md_escape_cell(value: Any) -> str:
@@ -25,20 +27,6 @@ def fmt_won(n: Any) -> str:
     return f"{num:,.1f}"
 
 
-def _truncate(text: str, max_chars: int) -> str:
-    if max_chars <= 0:
-        return text
-    if len(text) <= max_chars:
-        return text
-    if max_chars <= 3:
-        return text[: max_chars]
-    return text[: max_chars - 3] + "..."
-
-
-def _redact_phone(text: str) -> str:
-    return PHONE_REGEX.sub("[phone]", text)
-
-
 def render_summary_table(summary: Dict[str, Any] | None, years: Sequence[str] = ("2023", "2024", "2025")) -> str:
     if not summary:
         return ""
@@ -148,6 +136,34 @@ def summarize_memos(
     return {"count": len(memos), "lines": lines}
 
 
+MARKDOWN_SCHEMA_VERSION = "won-groups-json/compact-md-v1.1"
+
+
+def get_won_groups_markdown(
+    org_id: str,
+    upper_org: Optional[str] = None,
+    db_path: Path = DB_PATH,
+    compact: Optional[Dict[str, Any]] = None,
+    **options: Any,
+) -> str:
+    """
+    won_groups_compact_to_markdown(get_won_groups_compact(...)) for one org (optionally one upper org),
+    disk-cached per render options via won_groups_store. scope_label follows upper_org like the API;
+    callers that already hold the compact payload pass it to skip the lookup on a cache miss.
+    """
+    uppers = [upper_org] if upper_org else None
+    options.setdefault("scope_label", "UPPER_SELECTED" if upper_org else "ORG_ALL")
+    # 기본값을 채워 두어야 같은 출력이 같은 키가 된다 (bundle vs endpoint)
+    options = {**(won_groups_compact_to_markdown.__kwdefaults__ or {}), **options}
+
+    def _build() -> str:
+        data = compact if compact is not None else get_won_groups_compact(org_id=org_id, target_uppers=uppers, db_path=db_path)
+        return won_groups_compact_to_markdown(data, **options)
+
+    upper_key = (upper_org or "").strip() or None
+    return won_groups_store.get_or_build("markdown", str(org_id), upper_key, MARKDOWN_SCHEMA_VERSION, db_path, _build, options=options)
+
+
 def won_groups_compact_to_markdown(
     compact_data: Dict[str, Any],
     *,
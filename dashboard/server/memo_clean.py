@@ -0,0 +1,129 @@
+"""
+Per-memo cleaned text materialized once per snapshot (`memo_clean`).
+
+The won-groups / compact payload builders used to re-run `_clean_form_memo` (regex line merging)
+and `html_to_markdown` (HTMLParser) on every request for every memo. `build_memo_clean` runs both
+once at snapshot finalize and stores, per memo id:
+
+- kind:       'form' (structured form memo), 'skip' (low-value form memo), 'text' (free text)
+- clean_json: `_clean_form_memo` result as JSON for form memos, else NULL
+- markdown:   `html_to_markdown(htmlBody)` when the memo has an htmlBody, else NULL
+
+The markdown renderer's whitespace collapse / phone redaction / truncation stays per request: it
+depends on the request's redact_phone and memo_max_chars and is a cheap regex pass.
+
+Freshness follows deal_fact: a content signature of the memo table stored in `memo_clean_meta`;
+readers fall back to per-request cleaning when the table is missing or stale.
+"""
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .html_to_markdown import html_to_markdown
+
+MEMO_CLEAN_TABLE = "memo_clean"
+MEMO_CLEAN_META_TABLE = "memo_clean_meta"
+MEMO_CLEAN_VERSION = 2
+INSERT_CHUNK = 2000
+
+PHONE_REGEX = re.compile(r"\b01[016789]-?\d{3,4}-?\d{4}\b")
+
+
+def redact_phone(text: str) -> str:
+    return PHONE_REGEX.sub("[phone]", text)
+
+
+def truncate(text: str, max_chars: int) -> str:
+    if max_chars <= 0:
+        return text
+    if len(text) <= max_chars:
+        return text
+    if max_chars <= 3:
+        return text[: max_chars]
+    return text[: max_chars - 3] + "..."
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+    return row is not None
+
+
+def memo_source_signature(conn: sqlite3.Connection) -> str:
+    run_tag = ""
+    if _table_exists(conn, "run_info"):
+        try:
+            row = conn.execute("SELECT run_tag FROM run_info LIMIT 1").fetchone()
+            run_tag = str(row[0] or "") if row else ""
+        except sqlite3.OperationalError:
+            run_tag = ""
+    count, max_rowid = conn.execute("SELECT COUNT(*), MAX(rowid) FROM memo").fetchone()
+    return f"v{MEMO_CLEAN_VERSION}|{run_tag}|{int(count or 0)}|{int(max_rowid or 0)}"
+
+
+def memo_clean_is_fresh(conn: sqlite3.Connection) -> bool:
+    """True when memo_clean exists and was built from the current memo rows."""
+    try:
+        if not _table_exists(conn, MEMO_CLEAN_META_TABLE) or not _table_exists(conn, MEMO_CLEAN_TABLE):
+            return False
+        row = conn.execute(f"SELECT value FROM {MEMO_CLEAN_META_TABLE} WHERE key = 'signature'").fetchone()
+        return bool(row) and row[0] == memo_source_signature(conn)
+    except sqlite3.Error:
+        return False
+
+
+def clean_memo(text: Optional[str], html_body: Optional[str]) -> Dict[str, Any]:
+    """The memo_clean row for one memo, without its id."""
+    from .database import _clean_form_memo
+
+    cleaned = _clean_form_memo(text) if text else None
+    if cleaned == "":
+        # won-groups drops these memos entirely
+        return {"kind": "skip", "clean_json": None, "markdown": None}
+    markdown = html_to_markdown(str(html_body)) if html_body is not None else None
+    if isinstance(cleaned, dict):
+        return {"kind": "form", "clean_json": json.dumps(cleaned, ensure_ascii=False), "markdown": markdown}
+    return {"kind": "text", "clean_json": None, "markdown": markdown}
+
+
+def build_memo_clean(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """(Re)create memo_clean + memo_clean_meta in the given (writable) snapshot connection."""
+    started = time.time()
+    columns = {row[1] for row in conn.execute("PRAGMA table_info('memo')").fetchall()}
+    html_sql = "htmlBody" if "htmlBody" in columns else "NULL"
+    conn.execute(f"DROP TABLE IF EXISTS {MEMO_CLEAN_TABLE}")
+    conn.execute(
+        f"CREATE TABLE {MEMO_CLEAN_TABLE} ("
+        "memo_id TEXT PRIMARY KEY, kind TEXT, clean_json TEXT, markdown TEXT)"
+    )
+    insert_sql = f"INSERT OR REPLACE INTO {MEMO_CLEAN_TABLE} VALUES (?, ?, ?, ?)"
+    counts = {"form": 0, "skip": 0, "text": 0}
+    chunk: List[Tuple[Any, ...]] = []
+    for memo_id, text, html_body in conn.execute(f"SELECT id, text, {html_sql} FROM memo WHERE id IS NOT NULL"):
+        row = clean_memo(text, html_body)
+        counts[row["kind"]] += 1
+        chunk.append((memo_id, row["kind"], row["clean_json"], row["markdown"]))
+        if len(chunk) >= INSERT_CHUNK:
+            conn.executemany(insert_sql, chunk)
+            chunk = []
+    if chunk:
+        conn.executemany(insert_sql, chunk)
+
+    signature = memo_source_signature(conn)
+    conn.execute(f"DROP TABLE IF EXISTS {MEMO_CLEAN_META_TABLE}")
+    conn.execute(f"CREATE TABLE {MEMO_CLEAN_META_TABLE} (key TEXT PRIMARY KEY, value TEXT)")
+    conn.executemany(
+        f"INSERT INTO {MEMO_CLEAN_META_TABLE} (key, value) VALUES (?, ?)",
+        [("signature", signature), ("version", str(MEMO_CLEAN_VERSION))]
+        + [(f"rows_{kind}", str(count)) for kind, count in counts.items()],
+    )
+    conn.commit()
+    return {
+        "rows": sum(counts.values()),
+        "by_kind": counts,
+        "signature": signature,
+        "elapsed_sec": round(time.time() - started, 3),
+    }
@@ -1,18 +1,19 @@
 import os
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import PlainTextResponse, Response
-from io import BytesIO
-from urllib.parse import quote
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment
 from datetime import datetime
 import json
 from typing import Any
 
 from . import database as db
-from .json_compact import compact_won_groups_json
-from .markdown_compact import won_groups_compact_to_markdown
+from . import won_groups_store
+from .cache_registry import cache_stats
+from .agents.core.llm_client import transport_stats
+from .db_pool import pool_stats
+from .json_compact import get_won_groups_compact
+from .markdown_compact import MARKDOWN_SCHEMA_VERSION, get_won_groups_markdown
 from .statepath_engine import build_statepath
+from .xlsx_export import XlsxColumn, XlsxSheet, xlsx_response
 from .report_scheduler import run_daily_counterparty_risk_job, get_cached_report, _load_status
 from .llm_target_attainment import (
     TargetAttainmentRequest,
@@ -50,6 +51,21 @@ def get_organizations(
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+@router.get("/search")
+def search(
+    q: str = Query(..., min_length=1, description="검색어 (조직명/ID, 사람 이름/직급, 메모 본문)"),
+    kind: str = Query("all", description="all|org|person|memo"),
+    limit: int = Query(20, ge=1, le=100, description="최대 반환 수"),
+    offset: int = Query(0, ge=0, description="시작 offset"),
+) -> dict:
+    try:
+        return db.search_entities(query=q, kind=kind, limit=limit, offset=offset)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
+
+
 @router.get("/orgs/{org_id}/memos")
 def get_org_memos(org_id: str, limit: int = Query(100, ge=1, le=500)) -> dict:
     try:
@@ -191,27 +207,12 @@ def download_qc_monthly_revenue_report_xlsx(
         data = db.get_qc_monthly_revenue_report(team=team, year=year, month=month)
         items = data.get("reportDeals", []) or []
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "매출신고"
-
-        headers = ["코스 ID", "이름", "담당자", "상태", "계약 체결일", "금액(원)", "수강시작일", "수강종료일"]
-        ws.append(headers)
-
-        try:
-            for cell in ws[1]:
-                cell.font = Font(bold=True)
-                cell.alignment = Alignment(horizontal="center")
-            ws.freeze_panes = "A2"
-        except Exception:
-            pass
-
-        for row in items:
-            owners = row.get("owners") or ""
-            if isinstance(owners, list):
-                owners = ", ".join(owners)
-            ws.append(
-                [
+        def _rows():
+            for row in items:
+                owners = row.get("owners") or ""
+                if isinstance(owners, list):
+                    owners = ", ".join(owners)
+                yield [
                     row.get("courseId") or "",
                     row.get("dealName") or "",
                     owners or "",
@@ -221,31 +222,15 @@ def download_qc_monthly_revenue_report_xlsx(
                     row.get("startDate") or "",
                     row.get("endDate") or "",
                 ]
-            )
-
-        try:
-            for r in range(2, ws.max_row + 1):
-                c = ws.cell(row=r, column=6)
-                if isinstance(c.value, (int, float)):
-                    c.number_format = "#,##0"
-        except Exception:
-            pass
 
-        bio = BytesIO()
-        wb.save(bio)
-        bio.seek(0)
+        headers = ["코스 ID", "이름", "담당자", "상태", "계약 체결일", "금액(원)", "수강시작일", "수강종료일"]
+        columns = [XlsxColumn(h, number_format="#,##0" if h == "금액(원)" else None) for h in headers]
+        sheet = XlsxSheet("매출신고", columns, _rows(), auto_filter=False, header_alignment="center")
 
         team_label = getattr(db, "QC_TEAM_LABELS", {}).get(team, team)
         mm = f"{month:02d}"
         filename = f"{team_label}_{year}년_{mm}월_매출신고.xlsx"
-        quoted = quote(filename)
-        ascii_fallback = f"{team}_{year}_{mm}_revenue.xlsx"
-        headers = {
-            "Content-Type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            "Content-Disposition": f'attachment; filename="{ascii_fallback}"; filename*=UTF-8\'\'{quoted}',
-            "Cache-Control": "no-store",
-        }
-        return Response(content=bio.getvalue(), media_type=headers["Content-Type"], headers=headers)
+        return xlsx_response([sheet], filename, ascii_fallback=f"{team}_{year}_{mm}_revenue.xlsx")
 
     except FileNotFoundError as exc:
         raise HTTPException(status_code=500, detail=str(exc))
@@ -492,6 +477,21 @@ def get_counterparty_risk_status(
     return _load_status(mode=mode)
 
 
+@router.get("/debug/caches")
+def get_debug_caches() -> dict:
+    """
+    In-process cache registry stats (entries, approx bytes, hit/miss, evictions) per cache,
+    plus pooled SQLite connection counters, the shared LLM transport (per-model latency, in-flight)
+    and the on-disk won-groups store (hits/misses per process, entries/bytes on disk).
+    """
+    return {
+        **cache_stats(),
+        "sqlite_pool": pool_stats(),
+        "llm_transport": transport_stats(),
+        "won_groups_store": won_groups_store.store_stats(),
+    }
+
+
 def _parse_bool(val: bool | str | None, default: bool = False) -> bool:
     if isinstance(val, bool):
         return val
@@ -625,8 +625,7 @@ def get_won_groups_json(org_id: str) -> dict:
 @router.get("/orgs/{org_id}/won-groups-json-compact")
 def get_won_groups_json_compact(org_id: str) -> dict:
     try:
-        raw = db.get_won_groups_json(org_id=org_id)
-        return compact_won_groups_json(raw)
+        return get_won_groups_compact(org_id=org_id)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -644,12 +643,9 @@ def get_won_groups_markdown_compact(
     format: str = Query("text", regex="^(text|json)$"),
 ) -> Any:
     try:
-        uppers = [upper_org] if upper_org else None
-        raw = db.get_won_groups_json(org_id=org_id, target_uppers=uppers)
-        compact = compact_won_groups_json(raw)
-        md = won_groups_compact_to_markdown(
-            compact,
-            scope_label="UPPER_SELECTED" if upper_org else "ORG_ALL",
+        md = get_won_groups_markdown(
+            org_id,
+            upper_org=upper_org,
             max_people=max_people,
             max_deals=max_deals,
             deal_memo_limit=deal_memo_limit,
@@ -658,7 +654,7 @@ def get_won_groups_markdown_compact(
             max_output_chars=max_output_chars,
         )
         if format == "json":
-            return {"schema_version": "won-groups-json/compact-md-v1.1", "markdown": md}
+            return {"schema_version": MARKDOWN_SCHEMA_VERSION, "markdown": md}
         return PlainTextResponse(md, media_type="text/plain; charset=utf-8")
     except FileNotFoundError as exc:
         raise HTTPException(status_code=500, detail=str(exc))
@@ -671,14 +667,56 @@ def get_won_groups_markdown_compact(
 @router.get("/orgs/{org_id}/statepath")
 def get_statepath(org_id: str) -> dict:
     try:
-        raw = db.get_won_groups_json(org_id=org_id)
-        compact = compact_won_groups_json(raw)
+        compact = get_won_groups_compact(org_id=org_id)
         item = build_statepath(compact)
         return {"item": item}
     except FileNotFoundError as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+@router.get("/orgs/{org_id}/bundle")
+def get_org_bundle(
+    org_id: str,
+    upper_org: str | None = Query(None, description="상위 조직 필터 (filtered 뷰 포함)"),
+    memo_limit: int = Query(100, ge=1, le=500),
+) -> dict:
+    """
+    Org detail panel in one response: org, memos, people, won summary, won-groups JSON
+    (raw/compact/markdown) and statepath. All won-groups views come from one memoized base build.
+    """
+    try:
+        match = db.get_org_by_id(org_id)
+        if not match:
+            raise HTTPException(status_code=404, detail="Organization not found")
+        raw = db.get_won_groups_json(org_id=org_id)
+        compact = get_won_groups_compact(org_id=org_id)
+        bundle = {
+            "item": match,
+            "memos": db.get_org_memos(org_id=org_id, limit=memo_limit),
+            "people": db.get_people_for_org(org_id=org_id, has_deal=None),
+            "won_summary": db.get_won_summary_by_upper_org(org_id=org_id),
+            "won_groups_json": raw,
+            "won_groups_json_compact": compact,
+            "won_groups_markdown_compact": get_won_groups_markdown(org_id, compact=compact),
+            "statepath": build_statepath(compact),
+        }
+        if upper_org:
+            filtered_compact = get_won_groups_compact(org_id=org_id, target_uppers=[upper_org])
+            bundle["filtered"] = {
+                "upper_org": upper_org,
+                "won_groups_json": db.get_won_groups_json(org_id=org_id, target_uppers=[upper_org]),
+                "won_groups_json_compact": filtered_compact,
+                "won_groups_markdown_compact": get_won_groups_markdown(
+                    org_id, upper_org=upper_org, compact=filtered_compact
+                ),
+            }
+        return bundle
+    except HTTPException:
+        raise
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
+
+
 @router.get("/statepath/portfolio-2425")
 def get_statepath_portfolio(
     segment: str = Query("전체", description="대기업/중견기업/중소기업/공공기관/대학교/기타/미입력"),
@@ -0,0 +1,127 @@
+"""
+Columnar views over the cached perf payload rows (monthly amounts / inquiries / close-rate).
+
+Each loader stores a `ColumnFrame` next to its row dicts: a month index, categorical codes, segment
+bitmasks and numeric columns as NumPy arrays. Summaries aggregate with masked `np.bincount` over a
+(code × month) grid instead of re-scanning the row dicts per segment/size/course, so every
+from/to/team/scope combination is answered straight from the frame. Owner-team masks are memoized
+per member set. Row dicts remain the source for drilldowns.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+
+class ColumnFrame:
+    """Column arrays aligned with a payload's `rows` list (same order, same length)."""
+
+    def __init__(self, rows: Sequence[Mapping[str, Any]], month_field: str = "month", owners_field: str = "owner_names"):
+        self.size = len(rows)
+        self.month_keys: List[str] = sorted({r[month_field] for r in rows if r.get(month_field)})
+        index = {m: i for i, m in enumerate(self.month_keys)}
+        self.month_idx = np.fromiter((index.get(r.get(month_field), -1) for r in rows), dtype=np.int32, count=self.size)
+        self.columns: Dict[str, np.ndarray] = {}
+        self._owners = [r.get(owners_field) for r in rows]
+        self._owner_masks: Dict[FrozenSet[str], np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def add_codes(self, name: str, values: Iterable[Any], categories: Sequence[Any]) -> np.ndarray:
+        """Categorical column: index into `categories`, -1 for values outside it."""
+        index = {c: i for i, c in enumerate(categories)}
+        arr = np.fromiter((index.get(v, -1) for v in values), dtype=np.int16, count=self.size)
+        self.columns[name] = arr
+        return arr
+
+    def add_values(self, name: str, values: Iterable[Any], dtype: Any = np.float64) -> np.ndarray:
+        arr = np.fromiter(values, dtype=dtype, count=self.size)
+        self.columns[name] = arr
+        return arr
+
+    def add_bitmask(self, name: str, rows: Sequence[Any], predicates: Sequence[Callable[[Any], bool]]) -> np.ndarray:
+        """Bit i set when predicates[i](row) is true (up to 32 predicates)."""
+        if len(predicates) > 32:
+            raise ValueError("at most 32 predicates per bitmask")
+
+        def _bits(row: Any) -> int:
+            bits = 0
+            for i, pred in enumerate(predicates):
+                if pred(row):
+                    bits |= 1 << i
+            return bits
+
+        arr = np.fromiter((_bits(r) for r in rows), dtype=np.uint32, count=self.size)
+        self.columns[name] = arr
+        return arr
+
+    def add_cell(self, name: str, parts: Sequence[str], sizes: Sequence[int]) -> np.ndarray:
+        """Row-major combined code over categorical columns `parts` (-1 if any part is -1)."""
+        cell = np.zeros(self.size, dtype=np.int32)
+        valid = np.ones(self.size, dtype=bool)
+        for part, size in zip(parts, sizes):
+            codes = self.columns[part]
+            cell = cell * size + codes
+            valid &= codes >= 0
+        arr = np.where(valid, cell, -1).astype(np.int32)
+        self.columns[name] = arr
+        return arr
+
+    def ones(self) -> np.ndarray:
+        return np.ones(self.size, dtype=bool)
+
+    def month_positions(self, months: Sequence[str]) -> np.ndarray:
+        """Per-row position of its month inside `months` (-1 when outside the range)."""
+        lookup = np.full(len(self.month_keys) + 1, -1, dtype=np.int32)
+        wanted = {m: i for i, m in enumerate(months)}
+        for i, key in enumerate(self.month_keys):
+            lookup[i] = wanted.get(key, -1)
+        return lookup[self.month_idx]  # month_idx == -1 → lookup[-1] == -1
+
+    def owner_mask(self, members: Optional[Iterable[str]], match: Callable[[Any, Any], bool]) -> np.ndarray:
+        """Rows whose owners match the member set (match(owners, members)); all rows when members is None."""
+        if members is None:
+            return self.ones()
+        key = frozenset(members)
+        mask = self._owner_masks.get(key)
+        if mask is None:
+            allowed = set(key)
+            mask = np.fromiter((match(o, allowed) for o in self._owners), dtype=bool, count=self.size)
+            with self._lock:
+                self._owner_masks[key] = mask
+        return mask
+
+
+def bit(bitmask: np.ndarray, i: int) -> np.ndarray:
+    return ((bitmask >> np.uint32(i)) & np.uint32(1)).astype(bool)
+
+
+def take(mask: np.ndarray, *arrays: np.ndarray) -> List[np.ndarray]:
+    """Compress several aligned columns to the rows selected by mask (row order preserved)."""
+    idx = np.flatnonzero(mask)
+    return [arr[idx] for arr in arrays]
+
+
+def grid(
+    codes: np.ndarray,
+    positions: np.ndarray,
+    mask: np.ndarray,
+    n_codes: int,
+    n_months: int,
+    weights: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """(n_codes, n_months) counts — or weight sums — of masked rows with a valid code and month."""
+    sel = mask & (codes >= 0) & (positions >= 0)
+    flat = codes[sel].astype(np.int64) * n_months + positions[sel]
+    out = np.bincount(flat, weights=None if weights is None else weights[sel], minlength=n_codes * n_months)
+    return out.reshape(n_codes, n_months)
+
+
+def collapse(codes: np.ndarray) -> np.ndarray:
+    """Single-code view of a categorical column: 0 where the code is valid, -1 otherwise."""
+    return np.where(codes >= 0, 0, -1).astype(codes.dtype)
+
+
+def month_map(values: np.ndarray, months: Sequence[str], cast: Callable[[Any], Any] = int) -> Dict[str, Any]:
+    return {m: cast(v) for m, v in zip(months, values.tolist())}
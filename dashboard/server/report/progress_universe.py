@@ -4,17 +4,16 @@ import hashlib
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
 
 from ..agents.counterparty_card.agent import gather_deals_for_counterparty, gather_memos
 from ..agents.counterparty_progress.schema import CounterpartyKeyV1, CounterpartyProgressInputV1
 from ..database import (
     _normalize_counterparty_upper,
     get_rank_2025_top100_counterparty_dri,
-    get_won_groups_json,
 )
 from ..deal_normalizer import MODE_OFFLINE, _connect, build_counterparty_risk_report
-from ..json_compact import compact_won_groups_json
+from ..json_compact import get_won_groups_compact
 
 
 @dataclass
@@ -53,23 +52,20 @@ def _filter_compact_by_upper(viewer: Dict, upper: str) -> Dict:
 
 
 _CACHE: Dict[Tuple[str, str, Path], Dict[str, object]] = {}
-_COMPACT_CACHE: Dict[Tuple[str, Path], Dict] = {}
 
 
 def _load_compact(org_id: str, db_path: Path) -> Dict:
-    cache_key = (org_id, db_path)
-    if cache_key in _COMPACT_CACHE:
-        return _COMPACT_CACHE[cache_key]
     try:
-        raw = get_won_groups_json(org_id=org_id, db_path=db_path)
-        compact = compact_won_groups_json(raw)
+        return get_won_groups_compact(org_id=org_id, db_path=db_path)
     except Exception:
-        compact = {}
-    _COMPACT_CACHE[cache_key] = compact
-    return compact
+        return {}
 
 
-def _load_base(as_of: str, mode: str, snapshot_db_path: Path) -> Dict[str, object]:
+def _load_base(as_of: str, mode: str, snapshot_db_path: Path, risk_report: Dict[str, Any] | None = None) -> Dict[str, object]:
+    """
+    risk_report: the scheduler's cached counterparty risk report when its meta.db_signature matches
+    the snapshot; otherwise the report is rebuilt here in rule-only mode (no agents, no LLM calls).
+    """
     cache_key = (as_of, mode, snapshot_db_path)
     cached = _CACHE.get(cache_key)
     if cached:
@@ -84,7 +80,12 @@ def _load_base(as_of: str, mode: str, snapshot_db_path: Path) -> Dict[str, objec
             dri_map[k] = r
 
     # Risk report rows (rule outputs already applied)
-    report = build_counterparty_risk_report(as_of_date=as_of, db_path=snapshot_db_path, mode_key=mode)
+    if isinstance(risk_report, dict) and risk_report.get("counterparties") is not None:
+        report = risk_report
+        risk_source = "cache"
+    else:
+        report = build_counterparty_risk_report(as_of_date=as_of, db_path=snapshot_db_path, mode_key=mode, rule_only=True)
+        risk_source = "rule_only"
     risk_rows = report.get("counterparties", []) if isinstance(report, dict) else []
     risk_map: Dict[str, Dict] = {}
     for r in risk_rows:
@@ -100,14 +101,20 @@ def _load_base(as_of: str, mode: str, snapshot_db_path: Path) -> Dict[str, objec
         "dri_map": dri_map,
         "risk_rows": risk_rows,
         "risk_map": risk_map,
+        "risk_source": risk_source,
         "db_hash": db_hash,
     }
     _CACHE[cache_key] = data
     return data
 
 
-def build_progress_universe(as_of: str, mode: str, snapshot_db_path: Path) -> List[CounterpartyKey]:
-    base = _load_base(as_of, mode, snapshot_db_path)
+def build_progress_universe(
+    as_of: str,
+    mode: str,
+    snapshot_db_path: Path,
+    risk_report: Dict[str, Any] | None = None,
+) -> List[CounterpartyKey]:
+    base = _load_base(as_of, mode, snapshot_db_path, risk_report=risk_report)
     keys: Dict[str, CounterpartyKey] = {}
 
     # 1) risk report universe
@@ -4,16 +4,20 @@ import contextlib
 import hashlib
 import json
 import os
-import shutil
+import logging
 import sqlite3
+import sys
+import threading
 import time
 from datetime import datetime, timedelta, timezone, date
 from pathlib import Path
 from typing import Any, Dict, Optional
+from urllib.parse import quote
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+from . import db_pool
 from .deal_normalizer import build_counterparty_risk_report, DB_PATH, _connect
 from .agents.core.artifacts import ArtifactStore
 from .agents.core.orchestrator import Orchestrator
@@ -38,6 +42,15 @@ _SCHEDULER_INSTANCE: Optional[BackgroundScheduler] = None
 ALLOWED_MODES = {"offline", "online"}
 PROGRESS_CRON = os.getenv("PROGRESS_CRON", "0 6 * * *")
 ENABLE_PROGRESS_SCHEDULER = os.getenv("ENABLE_PROGRESS_SCHEDULER", "0") == "1"
+SNAPSHOT_HARDLINK = os.getenv("SNAPSHOT_HARDLINK", "0") == "1"
+SNAPSHOT_BACKUP_PAGES = int(os.getenv("SNAPSHOT_BACKUP_PAGES", "-1"))
+# 다른 프로세스가 아직 만들고 있을 수 있으므로 이보다 오래된 *.tmp만 정리한다.
+SNAPSHOT_TMP_STALE_SEC = int(os.getenv("SNAPSHOT_TMP_STALE_SEC", "3600"))
+SNAPSHOT_SIDECAR_SUFFIXES = ("-wal", "-shm", "-journal")
+_FICLONE = 0x40049409
+# 스냅샷 경로 → 사용 중인 작업 수. 0이 되면 최신 시그니처가 아닌 스냅샷은 즉시 정리한다.
+_snapshot_refs: Dict[Path, int] = {}
+_snapshot_lock = threading.RLock()
 
 
 def _db_signature(db_path: Path) -> str:
@@ -118,13 +131,8 @@ def _cleanup_old(retention_days: int = CACHE_RETENTION_DAYS):
                 p.unlink()
         except Exception:
             continue
-    snapshots = WORK_DIR.glob("salesmap_snapshot_*.db")
-    for p in snapshots:
-        try:
-            if datetime.fromtimestamp(p.stat().st_mtime, timezone.utc) < cutoff:
-                p.unlink()
-        except Exception:
-            continue
+    with _snapshot_lock:
+        _prune_snapshots(current=_current_snapshot_name(DB_PATH), cutoff=cutoff)
 
 
 def _db_stable(db_path: Path) -> bool:
@@ -133,14 +141,135 @@ def _db_stable(db_path: Path) -> bool:
     return age >= DB_STABLE_WINDOW_SEC
 
 
+def _snapshot_key(db_path: Path) -> str:
+    """Content identity of the DB behind db_path (symlink target, inode, mtime_ns, size)."""
+    return hashlib.sha1(repr(db_pool.file_signature(db_path)).encode("utf-8")).hexdigest()[:16]
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Copy-on-write clone (btrfs/xfs FICLONE); False when the filesystem does not support it."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        import fcntl
+
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        return True
+    except OSError:
+        with contextlib.suppress(OSError):
+            dst.unlink()
+        return False
+
+
+def _try_hardlink(src: Path, dst: Path) -> bool:
+    try:
+        os.link(os.path.realpath(src), dst)
+        return True
+    except OSError:
+        return False
+
+
+def _backup_copy(src: Path, dst: Path) -> None:
+    """SQLite online backup: a consistent page copy even if a writer touches src meanwhile."""
+    source = sqlite3.connect(f"file:{quote(os.path.abspath(src))}?mode=ro", uri=True)
+    try:
+        target = sqlite3.connect(dst)
+        try:
+            source.backup(target, pages=SNAPSHOT_BACKUP_PAGES)
+        finally:
+            target.close()
+    finally:
+        source.close()
+
+
 def _make_snapshot(db_path: Path, as_of: str) -> Path:
+    """
+    Return the shared snapshot for the current DB signature, creating it once.
+    Same signature → same file for every job and mode (as_of is not part of the name).
+    Creation order: reflink → hardlink (SNAPSHOT_HARDLINK=1, only safe when the DB is replaced
+    atomically, never written in place) → SQLite backup API.
+    """
     WORK_DIR.mkdir(parents=True, exist_ok=True)
-    ts = datetime.now().strftime("%H%M%S")
-    snap = WORK_DIR / f"salesmap_snapshot_{as_of}_{ts}.db"
-    shutil.copy2(db_path, snap)
+    snap = WORK_DIR / f"salesmap_snapshot_{_snapshot_key(db_path)}.db"
+    if snap.exists():
+        return snap
+    tmp = snap.with_name(f"{snap.stem}.{os.getpid()}.tmp")
+    with contextlib.suppress(FileNotFoundError):
+        tmp.unlink()
+    if _reflink(db_path, tmp):
+        method = "reflink"
+    elif SNAPSHOT_HARDLINK and _try_hardlink(db_path, tmp):
+        method = "hardlink"
+    else:
+        _backup_copy(db_path, tmp)
+        method = "backup"
+    os.replace(tmp, snap)
+    logging.info("[snapshot] %s created via %s (as_of=%s)", snap.name, method, as_of)
     return snap
 
 
+@contextlib.contextmanager
+def snapshot_lease(db_path: Path, as_of: str):
+    """
+    Check out the shared snapshot for db_path. Refcounted per process (a CLI run and the API process do not
+    see each other's leases): when the last lease drops and the source DB has moved on to a newer signature,
+    the snapshot is deleted right away instead of waiting for the retention sweep.
+    """
+    with _snapshot_lock:
+        snap = _make_snapshot(db_path, as_of)
+        _snapshot_refs[snap] = _snapshot_refs.get(snap, 0) + 1
+    try:
+        yield snap
+    finally:
+        with _snapshot_lock:
+            _snapshot_refs[snap] -= 1
+            if _snapshot_refs[snap] <= 0:
+                _snapshot_refs.pop(snap, None)
+                _prune_snapshots(current=_current_snapshot_name(db_path))
+
+
+def _current_snapshot_name(db_path: Path) -> Optional[str]:
+    try:
+        return f"salesmap_snapshot_{_snapshot_key(db_path)}.db"
+    except OSError:
+        return None
+
+
+def _prune_snapshots(current: Optional[str], cutoff: Optional[datetime] = None) -> int:
+    """
+    Delete unreferenced snapshots that are not the current signature (or older than cutoff), together with
+    their -wal/-shm/-journal sidecars, plus *.tmp leftovers older than SNAPSHOT_TMP_STALE_SEC.
+    Caller holds _snapshot_lock. Leases are refcounted per process only: a CLI run and the API process do
+    not see each other's leases.
+    """
+    removed = 0
+    for p in WORK_DIR.glob("salesmap_snapshot_*.db"):
+        if p in _snapshot_refs:
+            continue
+        try:
+            if p.name == current:
+                if cutoff is None or datetime.fromtimestamp(p.stat().st_mtime, timezone.utc) >= cutoff:
+                    continue
+            db_pool.release(p)
+            p.unlink()
+            removed += 1
+        except Exception:
+            continue
+        for suffix in SNAPSHOT_SIDECAR_SUFFIXES:
+            with contextlib.suppress(OSError):
+                p.with_name(p.name + suffix).unlink()
+    stale_before = time.time() - SNAPSHOT_TMP_STALE_SEC
+    for p in WORK_DIR.glob("salesmap_snapshot_*.tmp"):
+        try:
+            if p.stat().st_mtime < stale_before:
+                p.unlink()
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
+
 def _status_path(mode: str = "offline") -> Path:
     return CACHE_DIR / ("status.json" if mode == "offline" else "status_online.json")
 
@@ -184,6 +313,21 @@ def _report_cache_path(as_of: date | str, mode: str) -> Path:
     return CACHE_DIR / "counterparty-risk" / mode / f"{as_of_str}.json"
 
 
+def _load_cached_risk_report(as_of: str, mode: str, db_signature: Optional[str]) -> Optional[Dict[str, Any]]:
+    """The risk job's cached report for (as_of, mode) if it was built from the same DB signature."""
+    if not db_signature:
+        return None
+    path = _report_cache_path(as_of, mode)
+    try:
+        report = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    meta = report.get("meta") or {}
+    if meta.get("db_signature") != db_signature or meta.get("as_of") != as_of:
+        return None
+    return report
+
+
 def _progress_cache_dir(as_of: date | str, mode: str) -> Path:
     as_of_str = as_of if isinstance(as_of, str) else as_of.isoformat()
     return CACHE_DIR / "llm_progress" / as_of_str / _db_signature(DB_PATH)
@@ -236,10 +380,9 @@ def run_daily_counterparty_risk_job(as_of_date: Optional[str] = None, force: boo
             _save_status(status, mode_norm)
             raise FileNotFoundError("DB unstable or not found")
 
-        snapshot_path = _make_snapshot(DB_PATH, as_of)
-
         try:
-            report = build_counterparty_risk_report(as_of_date=as_of, db_path=snapshot_path, mode_key=mode_norm)
+            with snapshot_lease(DB_PATH, as_of) as snapshot_path:
+                report = build_counterparty_risk_report(as_of_date=as_of, db_path=snapshot_path, mode_key=mode_norm)
             report["meta"]["db_signature"] = db_signature
             report["meta"]["generator_version"] = GENERATOR_VERSION
             report["meta"]["job_run_id"] = job_run_id
@@ -330,39 +473,41 @@ def run_daily_counterparty_progress_job_all_modes(force: bool = False) -> Dict[s
             }
         db_mtime_iso = datetime.fromtimestamp(Path(DB_PATH).stat().st_mtime, timezone.utc).isoformat()
         db_hash = hashlib.sha256(db_mtime_iso.encode("utf-8")).hexdigest()[:16]
-        snap_path = _make_snapshot(DB_PATH, as_of)
         try:
-            # build universe + payloads
-            universe = build_progress_universe(as_of=as_of, mode=mode, snapshot_db_path=snap_path)
-            payloads = [build_l1_payload(k, as_of=as_of, mode=mode, snapshot_db_path=snap_path).model_dump() for k in universe]
-
-            # Agent execution (fan-out)
-            artifacts = ArtifactStore()
-            artifacts.set("base.counterparty_rows", payloads)
-            ctx = AgentContext(
-                report_id=REPORT_ID_COUNTERPARTY_PROGRESS_DAILY,
-                mode_key=mode,
-                as_of_date=date.fromisoformat(as_of),
-                db_hash=db_hash,
-                snapshot_db_path=snap_path,
-                cache_root=CACHE_DIR,
-                llm=LLMConfig.from_env(),
-            )
-            agents = get_agent_chain(REPORT_ID_COUNTERPARTY_PROGRESS_DAILY, mode)
-            orchestrator = Orchestrator()
-            with _connect(snap_path) as conn:
-                orchestrator.run(REPORT_ID_COUNTERPARTY_PROGRESS_DAILY, mode, ctx, artifacts, agents, conn=conn)
-
-            return {
-                "result": "SUCCESS",
-                "as_of": as_of,
-                "mode": mode,
-                "snapshot": str(snap_path),
-                "db_signature": db_signature,
-                "db_hash": db_hash,
-                "job_run_id": job_run_id,
-                "payload_count": len(payloads),
-            }
+            with snapshot_lease(DB_PATH, as_of) as snap_path:
+                # build universe + payloads (risk rows from the cached risk report when the signature matches)
+                risk_report = _load_cached_risk_report(as_of, mode, db_signature)
+                universe = build_progress_universe(as_of=as_of, mode=mode, snapshot_db_path=snap_path, risk_report=risk_report)
+                payloads = [build_l1_payload(k, as_of=as_of, mode=mode, snapshot_db_path=snap_path).model_dump() for k in universe]
+
+                # Agent execution (fan-out)
+                artifacts = ArtifactStore()
+                artifacts.set("base.counterparty_rows", payloads)
+                ctx = AgentContext(
+                    report_id=REPORT_ID_COUNTERPARTY_PROGRESS_DAILY,
+                    mode_key=mode,
+                    as_of_date=date.fromisoformat(as_of),
+                    db_hash=db_hash,
+                    snapshot_db_path=snap_path,
+                    cache_root=CACHE_DIR,
+                    llm=LLMConfig.from_env(),
+                )
+                agents = get_agent_chain(REPORT_ID_COUNTERPARTY_PROGRESS_DAILY, mode)
+                orchestrator = Orchestrator()
+                with _connect(snap_path) as conn:
+                    orchestrator.run(REPORT_ID_COUNTERPARTY_PROGRESS_DAILY, mode, ctx, artifacts, agents, conn=conn)
+
+                return {
+                    "result": "SUCCESS",
+                    "as_of": as_of,
+                    "mode": mode,
+                    "snapshot": str(snap_path),
+                    "db_signature": db_signature,
+                    "db_hash": db_hash,
+                    "job_run_id": job_run_id,
+                    "payload_count": len(payloads),
+                    "risk_report_source": "cache" if risk_report is not None else "rule_only",
+                }
         except Exception as exc:
             return {
                 "result": "FAILED",
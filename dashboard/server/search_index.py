@@ -0,0 +1,235 @@
+"""
+FTS5 full-text index over organizations, people and memos, materialized once per snapshot.
+
+`search_fts` is an FTS5 table with the trigram tokenizer (Korean has no word boundaries the
+unicode61 tokenizer can use), one row per searchable entity:
+
+- org:    title = 조직명, body = organization id
+- person: title = 이름, body = 직급/직책
+- memo:   title = '', body = memo text (form memos reduced by database._clean_form_memo, read from
+          memo_clean when it is fresh)
+
+`org_id` is carried on every row (memo → people/deal org when the memo itself has none) so results
+can be grouped or labelled by organization without another join. Trigram MATCH needs ≥ 3 characters
+per term: shorter terms ride along as LIKE filters on the matched rows, and a query made only of
+short terms is answered with LIKE against the same table (still one compact scan).
+
+Freshness follows deal_fact: a content signature of the source tables (run_tag, row counts,
+max rowid) stored in `search_fts_meta`.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from . import memo_clean
+
+SEARCH_TABLE = "search_fts"
+SEARCH_META_TABLE = "search_fts_meta"
+SEARCH_INDEX_VERSION = 1
+SEARCH_KINDS = ("org", "person", "memo")
+SOURCE_TABLES = ("organization", "people", "memo")
+# trigram 토크나이저는 3글자 미만 term을 MATCH로 찾지 못한다
+MIN_MATCH_CHARS = 3
+PERSON_TITLE_COLUMNS = ("직급(명함/메일서명)", "직급", "직책")
+INSERT_CHUNK = 2000
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (table,)).fetchone()
+    return row is not None
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    return [row[1] for row in conn.execute(f"PRAGMA table_info('{table}')").fetchall()]
+
+
+def trigram_available(conn: sqlite3.Connection) -> bool:
+    """True when the linked SQLite has FTS5 with the trigram tokenizer (SQLite ≥ 3.34)."""
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp._fts_probe USING fts5(x, tokenize='trigram')")
+        conn.execute("DROP TABLE temp._fts_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def search_source_signature(conn: sqlite3.Connection) -> str:
+    run_tag = ""
+    if _table_exists(conn, "run_info"):
+        try:
+            row = conn.execute("SELECT run_tag FROM run_info LIMIT 1").fetchone()
+            run_tag = str(row[0] or "") if row else ""
+        except sqlite3.OperationalError:
+            run_tag = ""
+    parts = [f"v{SEARCH_INDEX_VERSION}", run_tag]
+    for table in SOURCE_TABLES:
+        if not _table_exists(conn, table):
+            parts.append("-")
+            continue
+        count, max_rowid = conn.execute(f"SELECT COUNT(*), MAX(rowid) FROM {table}").fetchone()
+        parts.append(f"{int(count or 0)}:{int(max_rowid or 0)}")
+    return "|".join(parts)
+
+
+def search_index_is_fresh(conn: sqlite3.Connection) -> bool:
+    """True when search_fts exists and was built from the current organization/people/memo rows."""
+    try:
+        if not _table_exists(conn, SEARCH_META_TABLE) or not _table_exists(conn, SEARCH_TABLE):
+            return False
+        row = conn.execute(f"SELECT value FROM {SEARCH_META_TABLE} WHERE key = 'signature'").fetchone()
+        return bool(row) and row[0] == search_source_signature(conn)
+    except sqlite3.Error:
+        return False
+
+
+def memo_search_text(text: Optional[str], clean_kind: Optional[str] = None, clean_json: Optional[str] = None) -> Optional[str]:
+    """
+    Memo body as indexed: form memos reduced to their kept fields, low-value form memos dropped.
+    `clean_kind`/`clean_json` come from memo_clean when it was built first; otherwise the memo is cleaned here.
+    """
+    from .database import _clean_form_memo
+
+    if not text or not text.strip():
+        return None
+    if clean_kind == "skip":
+        cleaned: Any = ""
+    elif clean_kind == "form":
+        cleaned = json.loads(clean_json or "{}")
+    elif clean_kind == "text":
+        cleaned = None
+    else:
+        cleaned = _clean_form_memo(text)
+    if cleaned == "":
+        return None
+    if isinstance(cleaned, dict):
+        return "\n".join(f"{key}: {value}" for key, value in cleaned.items())
+    return " ".join(text.split())
+
+
+def _source_rows(conn: sqlite3.Connection) -> Iterator[Tuple[str, str, Optional[str], str, str]]:
+    if _table_exists(conn, "organization"):
+        cols = _columns(conn, "organization")
+        name_sql = 'COALESCE("이름", id)' if "이름" in cols else "id"
+        for org_id, name in conn.execute(f"SELECT id, {name_sql} FROM organization WHERE id IS NOT NULL"):
+            yield "org", org_id, org_id, name or "", org_id
+
+    if _table_exists(conn, "people"):
+        cols = _columns(conn, "people")
+        name_sql = '"이름"' if "이름" in cols else "NULL"
+        title_col = next((c for c in PERSON_TITLE_COLUMNS if c in cols), None)
+        title_sql = f'"{title_col}"' if title_col else "NULL"
+        org_sql = "organizationId" if "organizationId" in cols else "NULL"
+        for person_id, org_id, name, title in conn.execute(
+            f"SELECT id, {org_sql}, {name_sql}, {title_sql} FROM people WHERE id IS NOT NULL"
+        ):
+            if name or title:
+                yield "person", person_id, org_id, name or "", title or ""
+
+    if _table_exists(conn, "memo"):
+        cols = set(_columns(conn, "memo"))
+        if "text" not in cols:
+            return
+        org_parts = []
+        joins = []
+        if "organizationId" in cols:
+            org_parts.append("NULLIF(m.organizationId, '')")
+        if "peopleId" in cols and _table_exists(conn, "people") and "organizationId" in _columns(conn, "people"):
+            joins.append("LEFT JOIN people p ON p.id = m.peopleId")
+            org_parts.append("p.organizationId")
+        if "dealId" in cols and _table_exists(conn, "deal") and "organizationId" in _columns(conn, "deal"):
+            joins.append("LEFT JOIN deal d ON d.id = m.dealId")
+            org_parts.append("d.organizationId")
+        org_sql = f"COALESCE({', '.join(org_parts)})" if len(org_parts) > 1 else (org_parts[0] if org_parts else "NULL")
+        clean_sql = "NULL, NULL"
+        if memo_clean.memo_clean_is_fresh(conn):
+            joins.append(f"LEFT JOIN {memo_clean.MEMO_CLEAN_TABLE} mc ON mc.memo_id = m.id")
+            clean_sql = "mc.kind, mc.clean_json"
+        for memo_id, org_id, text, clean_kind, clean_json in conn.execute(
+            f"SELECT m.id, {org_sql}, m.text, {clean_sql} FROM memo m {' '.join(joins)} WHERE m.id IS NOT NULL"
+        ):
+            body = memo_search_text(text, clean_kind, clean_json)
+            if body:
+                yield "memo", memo_id, org_id, "", body
+
+
+def build_search_index(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """(Re)create search_fts + search_fts_meta in the given (writable) snapshot connection."""
+    if not trigram_available(conn):
+        raise sqlite3.OperationalError("FTS5 trigram tokenizer is not available in this SQLite build")
+    started = time.time()
+    conn.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+    conn.execute(
+        f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+        "kind UNINDEXED, ref_id UNINDEXED, org_id UNINDEXED, title, body, tokenize='trigram')"
+    )
+    counts = {kind: 0 for kind in SEARCH_KINDS}
+    chunk: List[Tuple[str, str, Optional[str], str, str]] = []
+    insert_sql = f"INSERT INTO {SEARCH_TABLE} (kind, ref_id, org_id, title, body) VALUES (?, ?, ?, ?, ?)"
+    for row in _source_rows(conn):
+        counts[row[0]] += 1
+        chunk.append(row)
+        if len(chunk) >= INSERT_CHUNK:
+            conn.executemany(insert_sql, chunk)
+            chunk = []
+    if chunk:
+        conn.executemany(insert_sql, chunk)
+    conn.execute(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('optimize')")
+
+    signature = search_source_signature(conn)
+    conn.execute(f"DROP TABLE IF EXISTS {SEARCH_META_TABLE}")
+    conn.execute(f"CREATE TABLE {SEARCH_META_TABLE} (key TEXT PRIMARY KEY, value TEXT)")
+    conn.executemany(
+        f"INSERT INTO {SEARCH_META_TABLE} (key, value) VALUES (?, ?)",
+        [("signature", signature), ("version", str(SEARCH_INDEX_VERSION))]
+        + [(f"rows_{kind}", str(count)) for kind, count in counts.items()],
+    )
+    conn.commit()
+    return {
+        "rows": sum(counts.values()),
+        "by_kind": counts,
+        "signature": signature,
+        "elapsed_sec": round(time.time() - started, 3),
+    }
+
+
+def query_terms(query: str) -> List[str]:
+    return [term for term in query.split() if term]
+
+
+def match_expression(terms: Sequence[str]) -> Optional[str]:
+    """FTS5 MATCH string over the terms trigram can serve (quoted, implicit AND); None when there are none."""
+    usable = [term for term in terms if len(term) >= MIN_MATCH_CHARS]
+    if not usable:
+        return None
+    return " ".join('"' + term.replace('"', '""') + '"' for term in usable)
+
+
+def short_terms(terms: Sequence[str]) -> List[str]:
+    """Terms below the trigram minimum; these are applied as LIKE filters next to MATCH."""
+    return [term for term in terms if len(term) < MIN_MATCH_CHARS]
+
+
+def like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def snippet(text: Optional[str], terms: Sequence[str], width: int = 80) -> str:
+    """Window of `text` around the first matched term (case-insensitive), with ellipses when cut."""
+    if not text:
+        return ""
+    flat = " ".join(text.split())
+    lowered = flat.lower()
+    hits = [lowered.find(term.lower()) for term in terms]
+    hits = [pos for pos in hits if pos >= 0]
+    start = max(0, min(hits) - width // 4) if hits else 0
+    end = min(len(flat), start + width)
+    out = flat[start:end]
+    if start > 0:
+        out = "…" + out
+    if end < len(flat):
+        out += "…"
+    return out
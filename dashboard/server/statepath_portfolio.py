@@ -0,0 +1,284 @@
+"""
+Indexed StatePath 24→25 portfolio.
+
+`PortfolioIndex` holds every organization's portfolio item once per DB signature (built by
+database._statepath_portfolio_index) together with inverted indexes — size group, seed, company
+bucket from/to/transition/direction, rail direction, risk/open/scale-up flags and (cell, event kind)
+pairs — plus a precomputed rank per sort. A request is answered by intersecting posting sets,
+ordering the survivors by rank and slicing; the summary counts come from the same postings and are
+memoized per query.
+"""
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, List, Optional, Set, Tuple
+
+from . import statepath_engine as sp
+
+CELLS = ["HRD_ONLINE", "HRD_OFFLINE", "BU_ONLINE", "BU_OFFLINE"]
+RAILS = ["ONLINE", "OFFLINE"]
+DIRECTIONS = ["up", "flat", "down"]
+SEEDS = ["H→B", "B→H", "SIMUL", "NONE"]
+EVENT_KINDS: Dict[str, Tuple[str, ...]] = {
+    "OPEN": ("OPEN", "OPEN_CELL"),
+    "CLOSE": ("CLOSE", "CLOSE_CELL"),
+    "UP": ("SCALE_UP", "SCALE_UP_CELL"),
+    "DOWN": ("SCALE_DOWN", "SCALE_DOWN_CELL"),
+}
+_KIND_BY_TYPE = {event_type: kind for kind, types in EVENT_KINDS.items() for event_type in types}
+ALL_SIZE_GROUPS = "전체"
+DEFAULT_SORT = "won2025_desc"
+SORT_KEYS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "won2025_desc": lambda it: -it["companyTotalEok2025"],
+    "delta_desc": lambda it: -(it["deltaEok"]),
+    "bucket_up_desc": lambda it: -sp.BUCKET_ORDER.index(it["companyBucket2025"])
+    + sp.BUCKET_ORDER.index(it["companyBucket2024"]),
+    "risk_first": lambda it: (0 if it["risk"] else 1, -it["companyTotalEok2025"]),
+    "name_asc": lambda it: (it["orgName"] or ""),
+}
+SUMMARY_MEMO_SIZE = 256
+
+_EMPTY: FrozenSet[int] = frozenset()
+
+
+class PortfolioIndex:
+    """Read-only once built; items/rows are shared across requests and must not be mutated."""
+
+    def __init__(self, items: List[Dict[str, Any]], project: Callable[[Dict[str, Any]], Dict[str, Any]]):
+        self.items = items
+        self.rows = [project(it) for it in items]
+        self.names = [it["orgName"] or "" for it in items]
+        self.by_org = {it["orgId"]: i for i, it in enumerate(items)}
+        self.all: FrozenSet[int] = frozenset(range(len(items)))
+        postings: Dict[Hashable, Set[int]] = defaultdict(set)
+        for i, it in enumerate(items):
+            for key in _item_keys(it):
+                postings[key].add(i)
+        self.postings: Dict[Hashable, FrozenSet[int]] = {k: frozenset(v) for k, v in postings.items()}
+        self.extra_seeds = sorted({it["seed"] for it in items} - set(SEEDS), key=str)
+        self.ranks: Dict[str, List[int]] = {}
+        for name, key_fn in SORT_KEYS.items():
+            order = sorted(range(len(items)), key=lambda i, fn=key_fn: fn(items[i]))
+            rank = [0] * len(items)
+            for position, i in enumerate(order):
+                rank[i] = position
+            self.ranks[name] = rank
+        self._summaries: Dict[Hashable, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def posting(self, *key: Any) -> FrozenSet[int]:
+        return self.postings.get(key, _EMPTY)
+
+    def select(self, size_group: str, search: Optional[str], filters: Dict[str, Any]) -> FrozenSet[int] | Set[int]:
+        """Positions matching the size group, search substring and facet filters."""
+        sets: List[FrozenSet[int]] = []
+        if size_group != ALL_SIZE_GROUPS:
+            sets.append(self.posting("size", size_group))
+        if filters.get("riskOnly"):
+            sets.append(self.posting("risk"))
+        if filters.get("hasOpen"):
+            sets.append(self.posting("hasOpen"))
+        if filters.get("hasScaleUp"):
+            sets.append(self.posting("hasScaleUp"))
+        for field, facet in (("companyDir", "dir"), ("seed", "seed"), ("companyFrom", "from"), ("companyTo", "to")):
+            value = filters.get(field, "all")
+            if value != "all":
+                sets.append(self.posting(facet, value))
+        rail = filters.get("rail", "all")
+        rail_dir = filters.get("railDir", "all")
+        if rail != "all" and rail_dir != "all":
+            sets.append(self.posting("rail", rail, rail_dir))
+        cell = filters.get("cell", "all")
+        cell_event = filters.get("cellEvent", "all")
+        if cell != "all" or cell_event != "all":
+            # unknown cellEvent values never excluded an event, i.e. behave like "all"
+            sets.append(self.posting("event", cell, cell_event if cell_event in EVENT_KINDS else "all"))
+
+        selected: FrozenSet[int] | Set[int]
+        if not sets:
+            selected = self.all
+        else:
+            sets.sort(key=len)
+            selected = sets[0]
+            for other in sets[1:]:
+                if not selected:
+                    break
+                selected = selected & other
+        if search:
+            selected = {i for i in selected if search in self.names[i]}
+        return selected
+
+    def ordered(self, selected: Iterable[int], sort: str) -> List[int]:
+        rank = self.ranks.get(sort) or self.ranks[DEFAULT_SORT]
+        return sorted(selected, key=rank.__getitem__)
+
+    def query(
+        self,
+        size_group: str,
+        search: Optional[str],
+        filters: Dict[str, Any],
+        sort: str,
+        limit: int,
+        offset: int,
+    ) -> Tuple[int, List[Dict[str, Any]], Dict[str, Any]]:
+        """(total count, projected rows for the page, summary)."""
+        selected = self.select(size_group, search, filters)
+        ordered = self.ordered(selected, sort)
+        memo_key = (size_group, search or "", tuple(sorted(filters.items())), sort)
+        summary = self._summaries.get(memo_key)
+        if summary is None:
+            summary = self.summarize(selected, ordered, size_group, search, filters)
+            with self._lock:
+                if len(self._summaries) >= SUMMARY_MEMO_SIZE:
+                    self._summaries.clear()
+                self._summaries[memo_key] = summary
+        rows = [dict(self.rows[i]) for i in ordered[offset : offset + limit]]
+        return len(ordered), rows, summary
+
+    def _count(self, selected: FrozenSet[int] | Set[int], *key: Any) -> int:
+        posting = self.posting(*key)
+        if selected is self.all:
+            return len(posting)
+        return len(posting & selected)
+
+    def summarize(
+        self,
+        selected: FrozenSet[int] | Set[int],
+        ordered: List[int],
+        size_group: str,
+        search: Optional[str],
+        filters: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        buckets = sp.BUCKET_ORDER
+        if not ordered:
+            return empty_summary()
+        # Float sums follow the response order so totals match a row-by-row accumulation exactly.
+        sum2024 = 0.0
+        sum2025 = 0.0
+        for i in ordered:
+            sum2024 += self.items[i]["companyTotalEok2024"]
+            sum2025 += self.items[i]["companyTotalEok2025"]
+        count = lambda *key: self._count(selected, *key)  # noqa: E731
+        seed_counts = {s: count("seed", s) for s in SEEDS}
+        for seed in self.extra_seeds:
+            n = count("seed", seed)
+            if n:
+                seed_counts[seed] = n
+        cell_matrix = {cell: {kind: count("event", cell, kind) for kind in EVENT_KINDS} for cell in CELLS}
+        change_counts = {d: count("dir", d) for d in DIRECTIONS}
+        top_patterns = {
+            "topOpenCell": top_cell_event(cell_matrix, "OPEN"),
+            "topCloseCell": top_cell_event(cell_matrix, "CLOSE"),
+            "topUpCell": top_cell_event(cell_matrix, "UP"),
+            "topDownCell": top_cell_event(cell_matrix, "DOWN"),
+            "topSeed": top_seed(seed_counts),
+        }
+        segment_comparison: List[Dict[str, Any]] = []
+        if size_group == ALL_SIZE_GROUPS and not search and all(v in (False, "all", None) for v in filters.values()):
+            segment_comparison = self._segment_comparison(selected, ordered)
+        return {
+            "accountCount": len(ordered),
+            "sum2024Eok": sum2024,
+            "sum2025Eok": sum2025,
+            "companyBucketChangeCounts": change_counts,
+            "openAccountCount": change_counts["up"],
+            "closeAccountCount": change_counts["down"],
+            "riskAccountCount": count("risk"),
+            "seedCounts": seed_counts,
+            "companyTransitionMatrix": {
+                "buckets": buckets,
+                "counts": [[count("trans", b24, b25) for b25 in buckets] for b24 in buckets],
+            },
+            "cellEventMatrix": cell_matrix,
+            "railChangeSummary": {rail: {d: count("rail", rail, d) for d in DIRECTIONS} for rail in RAILS},
+            "topPatterns": top_patterns,
+            "segmentComparison": segment_comparison,
+        }
+
+    def _segment_comparison(self, selected: FrozenSet[int] | Set[int], ordered: List[int]) -> List[Dict[str, Any]]:
+        sums: Dict[str, float] = {}
+        for i in ordered:  # first-appearance order of size groups, as the UI lists them
+            sg = self.items[i]["sizeGroup"]
+            sums[sg] = sums.get(sg, 0.0) + self.items[i]["companyTotalEok2025"]
+        out: List[Dict[str, Any]] = []
+        for sg, sum2025 in sums.items():
+            members = self.posting("size", sg) & selected
+            total = len(members)
+            out.append(
+                {
+                    "sizeGroup": sg,
+                    "accountCount": total,
+                    "sum2025Eok": sum2025,
+                    "companyUpRate": len(members & self.posting("dir", "up")) / total if total else 0,
+                    "openRate": len(members & self.posting("hasOpen")) / total if total else 0,
+                    "riskRate": len(members & self.posting("risk")) / total if total else 0,
+                    "seedH2BRate": len(members & self.posting("seed", "H→B")) / total if total else 0,
+                }
+            )
+        return out
+
+
+def _item_keys(it: Dict[str, Any]) -> Iterable[Hashable]:
+    b24 = it["companyBucket2024"]
+    b25 = it["companyBucket2025"]
+    yield ("size", it["sizeGroup"])
+    yield ("seed", it["seed"])
+    yield ("dir", it["_bucket_dir"])
+    yield ("from", b24)
+    yield ("to", b25)
+    yield ("trans", b24, b25)
+    if it["risk"]:
+        yield ("risk",)
+    if it["_has_open"]:
+        yield ("hasOpen",)
+    if it["_has_scale_up"]:
+        yield ("hasScaleUp",)
+    for rail, direction in it["railChange"].items():
+        yield ("rail", rail, direction)
+    for ev in it["_events"]:
+        cells = ("all",) if ev.get("cell") is None else (ev.get("cell"), "all")
+        kind = _KIND_BY_TYPE.get(ev["type"])
+        kinds = ("all",) if kind is None else (kind, "all")
+        for cell in cells:
+            for k in kinds:
+                yield ("event", cell, k)
+
+
+def empty_summary() -> Dict[str, Any]:
+    buckets = sp.BUCKET_ORDER
+    return {
+        "accountCount": 0,
+        "sum2024Eok": 0.0,
+        "sum2025Eok": 0.0,
+        "companyBucketChangeCounts": {"up": 0, "flat": 0, "down": 0},
+        "openAccountCount": 0,
+        "closeAccountCount": 0,
+        "riskAccountCount": 0,
+        "seedCounts": {s: 0 for s in SEEDS},
+        "companyTransitionMatrix": {"buckets": buckets, "counts": [[0 for _ in buckets] for _ in buckets]},
+        "cellEventMatrix": {cell: {"OPEN": 0, "CLOSE": 0, "UP": 0, "DOWN": 0} for cell in CELLS},
+        "railChangeSummary": {"ONLINE": {"up": 0, "flat": 0, "down": 0}, "OFFLINE": {"up": 0, "flat": 0, "down": 0}},
+        "topPatterns": {},
+        "segmentComparison": [],
+    }
+
+
+def top_cell_event(cell_matrix: Dict[str, Dict[str, int]], key: str) -> Dict[str, Any]:
+    best_cell = None
+    best_val = -1
+    for cell, counts in cell_matrix.items():
+        if counts[key] > best_val:
+            best_cell = cell
+            best_val = counts[key]
+    return {"cell": best_cell, "count": best_val}
+
+
+def top_seed(seed_counts: Dict[str, int]) -> Dict[str, Any]:
+    best_seed = None
+    best_val = -1
+    for seed, cnt in seed_counts.items():
+        if cnt > best_val:
+            best_seed = seed
+            best_val = cnt
+    return {"seed": best_seed, "count": best_val}
@@ -0,0 +1,282 @@
+"""
+Persistent, content-addressed cache for compact won-groups JSON and markdown.
+
+The compact payloads are rebuilt per process (the in-process `won_groups_compact` cache is lost on
+restart and not shared between uvicorn workers or the scheduler). When WON_GROUPS_CACHE_DIR is set,
+`get_or_build` stores each payload as gzip JSON under
+
+    <root>/<db_signature[:16]>/<key[:2]>/<key>.json.gz
+
+where key = sha256(kind, org_id, upper_org, db_signature, schema_version, render options, code
+signature). `db_signature` hashes the snapshot's run_info row and file size, so re-downloading the
+same snapshot (start.sh) keeps hits while any ingest (full or incremental) misses; `code signature`
+hashes the builder modules so a deploy that changes rendering never serves old output.
+`<root>/index.sqlite` records every entry (org, upper, kind, bytes, signature) for stats and
+pruning: the first write under a new db_signature deletes every other signature's files.
+
+Writes are atomic (tmp file + os.replace); any OSError/sqlite3.Error is logged and the payload is
+simply built, so the cache can never fail a request.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from . import db_pool
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "WON_GROUPS_CACHE_DIR"
+STORE_VERSION = 1
+INDEX_FILENAME = "index.sqlite"
+GZIP_LEVEL = 6
+# 출력에 영향을 주는 모듈: 배포로 내용이 바뀌면 키가 바뀐다
+_CODE_MODULES = ("database.py", "json_compact.py", "markdown_compact.py", "memo_clean.py", "html_to_markdown.py")
+
+_lock = threading.Lock()
+_db_signatures: Dict[Tuple[Any, ...], str] = {}
+_pruned_for: Dict[str, str] = {}
+_code_signature: Optional[str] = None
+_stats = {"hits": 0, "misses": 0, "writes": 0, "errors": 0, "pruned": 0}
+
+
+def _bump(counter: str, amount: int = 1) -> None:
+    # 요청 스레드 여러 개가 동시에 갱신하므로 _lock 아래에서만 증가시킨다
+    with _lock:
+        _stats[counter] += amount
+
+
+def cache_root() -> Optional[Path]:
+    raw = os.getenv(CACHE_DIR_ENV, "").strip()
+    return Path(raw) if raw else None
+
+
+def code_signature() -> str:
+    global _code_signature
+    if _code_signature is None:
+        digest = hashlib.sha256(f"v{STORE_VERSION}".encode("utf-8"))
+        here = Path(__file__).parent
+        for name in _CODE_MODULES:
+            try:
+                digest.update((here / name).read_bytes())
+            except OSError:
+                digest.update(name.encode("utf-8"))
+        _code_signature = digest.hexdigest()
+    return _code_signature
+
+
+def db_signature(db_path: Path) -> str:
+    """Content signature of the snapshot: run_info row + file size (mtime only when run_info is missing)."""
+    file_sig = db_pool.file_signature(db_path)
+    cached = _db_signatures.get(file_sig)
+    if cached is not None:
+        return cached
+    real, _, mtime_ns, size = file_sig
+    basis = f"size={size}|mtime_ns={mtime_ns}"
+    try:
+        conn = sqlite3.connect(f"file:{real}?mode=ro", uri=True)
+        try:
+            cur = conn.execute("SELECT * FROM run_info LIMIT 1")
+            row = cur.fetchone()
+            if row is not None:
+                cols = [c[0] for c in cur.description]
+                basis = f"size={size}|run_info={json.dumps(dict(zip(cols, row)), sort_keys=True, default=str)}"
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        pass
+    signature = hashlib.sha256(basis.encode("utf-8")).hexdigest()
+    with _lock:
+        if len(_db_signatures) > 16:
+            _db_signatures.clear()
+        _db_signatures[file_sig] = signature
+    return signature
+
+
+def cache_key(
+    kind: str,
+    org_id: str,
+    upper_org: Optional[str],
+    db_sig: str,
+    schema_version: str,
+    options: Optional[Dict[str, Any]] = None,
+) -> str:
+    parts = {
+        "kind": kind,
+        "org_id": str(org_id),
+        "upper_org": upper_org,
+        "db": db_sig,
+        "schema": schema_version,
+        "options": options or {},
+        "code": code_signature(),
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _entry_path(root: Path, db_sig: str, key: str) -> Path:
+    return root / db_sig[:16] / key[:2] / f"{key}.json.gz"
+
+
+def _index(root: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(root / INDEX_FILENAME, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS entries ("
+        "key TEXT PRIMARY KEY, db_signature TEXT, kind TEXT, org_id TEXT, upper_org TEXT, "
+        "schema_version TEXT, options TEXT, path TEXT, bytes INTEGER, created_at REAL)"
+    )
+    return conn
+
+
+def load(root: Path, db_sig: str, key: str) -> Any:
+    path = _entry_path(root, db_sig, key)
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        _bump("errors")
+        logger.warning("won-groups disk cache read failed (%s): %s", path, exc)
+        return None
+
+
+def store(
+    root: Path,
+    db_sig: str,
+    key: str,
+    value: Any,
+    *,
+    kind: str,
+    org_id: str,
+    upper_org: Optional[str],
+    schema_version: str,
+    options: Optional[Dict[str, Any]] = None,
+) -> None:
+    path = _entry_path(root, db_sig, key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = gzip.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"), compresslevel=GZIP_LEVEL)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        conn = _index(root)
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        db_sig,
+                        kind,
+                        str(org_id),
+                        upper_org,
+                        schema_version,
+                        json.dumps(options or {}, sort_keys=True, ensure_ascii=False),
+                        str(path.relative_to(root)),
+                        len(data),
+                        time.time(),
+                    ),
+                )
+        finally:
+            conn.close()
+        _bump("writes")
+    except (OSError, sqlite3.Error) as exc:
+        _bump("errors")
+        logger.warning("won-groups disk cache write failed (%s): %s", path, exc)
+    _prune_once(root, db_sig)
+
+
+def prune(root: Path, keep_signature: str) -> int:
+    """Delete every entry (files + index rows) that belongs to another DB signature."""
+    removed = 0
+    conn = _index(root)
+    try:
+        stale = [row[0] for row in conn.execute("SELECT DISTINCT db_signature FROM entries WHERE db_signature <> ?", (keep_signature,))]
+        for sig in stale:
+            shutil.rmtree(root / sig[:16], ignore_errors=True)
+            with conn:
+                removed += conn.execute("DELETE FROM entries WHERE db_signature = ?", (sig,)).rowcount
+    finally:
+        conn.close()
+    return removed
+
+
+def _prune_once(root: Path, db_sig: str) -> None:
+    root_key = str(root.resolve())
+    with _lock:
+        if _pruned_for.get(root_key) == db_sig:
+            return
+        _pruned_for[root_key] = db_sig
+    try:
+        removed = prune(root, db_sig)
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("won-groups disk cache prune failed (%s): %s", root, exc)
+        return
+    if removed:
+        _bump("pruned", removed)
+        logger.info("won-groups disk cache pruned %d stale entries under %s", removed, root)
+
+
+def get_or_build(
+    kind: str,
+    org_id: str,
+    upper_org: Optional[str],
+    schema_version: str,
+    db_path: Path,
+    build: Callable[[], Any],
+    options: Optional[Dict[str, Any]] = None,
+    root: Optional[Path] = None,
+) -> Any:
+    """Disk-cached build(); without a cache root (env unset) this is just build()."""
+    root = root or cache_root()
+    if root is None:
+        return build()
+    db_sig = db_signature(db_path)
+    key = cache_key(kind, org_id, upper_org, db_sig, schema_version, options)
+    cached = load(root, db_sig, key)
+    if cached is not None:
+        _bump("hits")
+        return cached
+    _bump("misses")
+    value = build()
+    store(
+        root,
+        db_sig,
+        key,
+        value,
+        kind=kind,
+        org_id=org_id,
+        upper_org=upper_org,
+        schema_version=schema_version,
+        options=options,
+    )
+    return value
+
+
+def store_stats() -> Dict[str, Any]:
+    """Counters for /api/debug/caches (per process) plus the on-disk index totals."""
+    root = cache_root()
+    with _lock:
+        counters = dict(_stats)
+    out: Dict[str, Any] = {"enabled": root is not None, "root": str(root) if root else None, **counters}
+    if root is not None and (root / INDEX_FILENAME).exists():
+        try:
+            conn = _index(root)
+            try:
+                entries, total_bytes = conn.execute("SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM entries").fetchone()
+            finally:
+                conn.close()
+            out.update({"entries": entries, "bytes": total_bytes})
+        except sqlite3.Error:
+            pass
+    return out
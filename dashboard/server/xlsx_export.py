@@ -0,0 +1,160 @@
+"""
+Streaming XLSX writer shared by the API downloads and the export scripts.
+
+Workbooks are created in openpyxl `write_only` mode: every row is serialized to the sheet's temp
+file as it is appended, so memory stays flat no matter how many rows a cursor yields. Because
+write-only sheets cannot be revisited, everything that used to be a post-pass over `ws.max_row`
+is declared up front on `XlsxColumn` (header, width, number format) and `XlsxSheet` (freeze,
+autofilter, header alignment). A number format applies to non-empty cells only, like the old
+post-passes that skipped None/"" values. Per-cell extras (hyperlink, fill, named style) go through
+`XlsxCell`.
+
+`stream_xlsx` saves into a temporary file and yields it in chunks; `xlsx_response` wraps that in a
+StreamingResponse so the build runs in Starlette's threadpool iterator instead of holding a
+worker on an in-memory BytesIO.
+"""
+from __future__ import annotations
+
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+from urllib.parse import quote
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.utils import get_column_letter
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class XlsxColumn:
+    header: str
+    width: Optional[float] = None
+    number_format: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class XlsxCell:
+    """A value with per-cell formatting (only needed when it differs from the column's)."""
+
+    value: Any
+    hyperlink: Optional[str] = None
+    style: Optional[str] = None
+    fill_color: Optional[str] = None
+
+
+@dataclass
+class XlsxSheet:
+    title: str
+    columns: Sequence[XlsxColumn]
+    rows: Iterable[Sequence[Any]] = ()
+    freeze_header: bool = True
+    auto_filter: bool = True
+    header_alignment: Optional[str] = None
+    row_count: int = field(default=0, init=False)
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == ""
+
+
+def _write_sheet(wb: Workbook, sheet: XlsxSheet) -> None:
+    ws = wb.create_sheet(sheet.title)
+    # write-only: 열 너비/고정 영역은 행을 쓰기 전에 정해야 한다
+    for idx, col in enumerate(sheet.columns, start=1):
+        if col.width is not None:
+            ws.column_dimensions[get_column_letter(idx)].width = col.width
+    if sheet.freeze_header:
+        ws.freeze_panes = "A2"
+
+    bold = Font(bold=True)
+    align = Alignment(horizontal=sheet.header_alignment) if sheet.header_alignment else None
+    header: List[WriteOnlyCell] = []
+    for col in sheet.columns:
+        cell = WriteOnlyCell(ws, col.header)
+        cell.font = bold
+        if align is not None:
+            cell.alignment = align
+        header.append(cell)
+    ws.append(header)
+
+    formats = [col.number_format for col in sheet.columns]
+    fills: Dict[str, PatternFill] = {}
+    count = 0
+    for row in sheet.rows:
+        out: List[Any] = []
+        for idx, value in enumerate(row):
+            number_format = formats[idx] if idx < len(formats) else None
+            if isinstance(value, XlsxCell):
+                cell = WriteOnlyCell(ws, value.value)
+                if value.style:
+                    cell.style = value.style
+                if value.hyperlink:
+                    cell.hyperlink = value.hyperlink
+                if value.fill_color:
+                    fill = fills.get(value.fill_color)
+                    if fill is None:
+                        fill = fills[value.fill_color] = PatternFill(
+                            start_color=value.fill_color, end_color=value.fill_color, fill_type="solid"
+                        )
+                    cell.fill = fill
+                if number_format and not _is_empty(value.value):
+                    cell.number_format = number_format
+                out.append(cell)
+            elif number_format and not _is_empty(value):
+                cell = WriteOnlyCell(ws, value)
+                cell.number_format = number_format
+                out.append(cell)
+            else:
+                out.append(value)
+        ws.append(out)
+        count += 1
+    sheet.row_count = count
+    if sheet.auto_filter and sheet.columns:
+        ws.auto_filter.ref = f"A1:{get_column_letter(len(sheet.columns))}{count + 1}"
+
+
+def write_xlsx(target: Union[str, Path, IO[bytes]], sheets: Iterable[XlsxSheet]) -> Dict[str, int]:
+    """Write the sheets (in order) to a path or binary file object; returns data rows per sheet."""
+    wb = Workbook(write_only=True)
+    counts: Dict[str, int] = {}
+    for sheet in sheets:
+        _write_sheet(wb, sheet)
+        counts[sheet.title] = sheet.row_count
+    if isinstance(target, (str, Path)):
+        Path(target).parent.mkdir(parents=True, exist_ok=True)
+        wb.save(str(target))
+    else:
+        wb.save(target)
+    return counts
+
+
+def stream_xlsx(sheets: Iterable[XlsxSheet], chunk_size: int = STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+    """Build the workbook into a temp file, then yield it chunk by chunk (the file is removed after)."""
+    with tempfile.TemporaryFile(suffix=".xlsx") as tmp:
+        write_xlsx(tmp, sheets)
+        tmp.seek(0)
+        while True:
+            chunk = tmp.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+def content_disposition(filename: str, ascii_fallback: str) -> str:
+    return f'attachment; filename="{ascii_fallback}"; filename*=UTF-8\'\'{quote(filename)}'
+
+
+def xlsx_response(sheets: Sequence[XlsxSheet], filename: str, ascii_fallback: str):
+    """StreamingResponse for an XLSX download; rows are pulled while the response body is sent."""
+    from fastapi.responses import StreamingResponse
+
+    headers = {
+        "Content-Disposition": content_disposition(filename, ascii_fallback),
+        "Cache-Control": "no-store",
+    }
+    return StreamingResponse(stream_xlsx(sheets), media_type=XLSX_MEDIA_TYPE, headers=headers)
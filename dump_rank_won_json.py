@@ -6,20 +6,36 @@ with the rank (e.g., `1_조직명.txt`) under `org_dataset/ranking`, and into
 industry-prefixed files (e.g., `IT서비스_조직명.txt`) under `org_dataset/industry`
 by looking up 업종 구분(대) from the local `organization` table. Intended to be
 run against the local FastAPI backend (`uvicorn dashboard.server.main:app --reload`).
+
+`--direct` skips the API: ranking and payloads come from `dashboard.server.database`
+against the read-only `--db-path`, built in a spawn process pool (`--workers`) with at
+most a few tasks in flight per worker. Workers write their own files (tmp + replace), so
+the parent only holds paths and hashes. `<output-dir>/.manifest.json` records the DB
+signature and each org's payload sha256/paths: an unchanged DB skips orgs outright, a
+new DB rebuilds but only rewrites files whose content hash changed. `--limit all`
+exports every ranked org.
 """
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import multiprocessing
+import os
 import re
 import sqlite3
 import sys
 import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
 
+MANIFEST_NAME = ".manifest.json"
+IN_FLIGHT_PER_WORKER = 4
+_WORKER_DB_PATH: Optional[Path] = None
+
 
 def sanitize_filename(name: str) -> str:
     cleaned = re.sub(r'[\\/:*?"<>|]', "_", name.strip())
@@ -100,20 +116,168 @@ def load_industry_map(db_path: Path, org_ids: Iterable[str]) -> Dict[str, str]:
     return result
 
 
-def iter_top_orgs(items: Iterable[dict], limit: int) -> Iterable[dict]:
+def parse_limit(value: str) -> Optional[int]:
+    """`--limit` value: a non-negative int, or "all" (None) for every ranked org."""
+    if str(value).strip().lower() == "all":
+        return None
+    try:
+        limit = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid limit: {value!r} (int or 'all')")
+    if limit < 0:
+        raise argparse.ArgumentTypeError("limit must be >= 0")
+    return limit
+
+
+def iter_top_orgs(items: Iterable[dict], limit: Optional[int]) -> Iterable[dict]:
     count = 0
     for item in items:
-        if count >= limit:
+        if limit is not None and count >= limit:
             break
         yield item
         count += 1
 
 
+def render_payload(payload: Any) -> str:
+    return json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def load_manifest(path: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _init_worker(db_path: str) -> None:
+    global _WORKER_DB_PATH
+    _WORKER_DB_PATH = Path(db_path)
+
+
+def build_and_write(task: Dict[str, Any]) -> Tuple[str, str, List[str], Optional[str]]:
+    """
+    Worker: build one org's won-groups JSON from the DB and write it to task["paths"].
+    Paths whose previous content hash matches (task["prev_sha256"]) and still exist are left alone.
+    Returns (org_id, sha256, written paths, error).
+    """
+    from dashboard.server import database as db
+
+    org_id = task["org_id"]
+    try:
+        text = render_payload(db.get_won_groups_json(org_id, db_path=_WORKER_DB_PATH or db.DB_PATH))
+    except Exception as exc:  # noqa: BLE001 - reported per org by the parent
+        return org_id, "", [], f"build failed: {exc}"
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    written: List[str] = []
+    for raw_path in task["paths"]:
+        path = Path(raw_path)
+        if not task["overwrite"] and digest == task.get("prev_sha256") and path.exists():
+            continue
+        try:
+            write_text_atomic(path, text)
+        except OSError as exc:
+            return org_id, digest, written, f"write failed ({path.name}): {exc}"
+        written.append(raw_path)
+    return org_id, digest, written, None
+
+
+def run_direct(
+    top_items: List[dict],
+    *,
+    db_path: Path,
+    out_dir: Path,
+    industry_dir: Path,
+    industry_map: Dict[str, str],
+    overwrite: bool,
+    workers: int,
+) -> Tuple[Dict[str, int], List[Tuple[str, str, str]]]:
+    """Build and write payloads in a process pool; returns (counters, failures)."""
+    from dashboard.server.won_groups_store import db_signature
+
+    manifest_path = out_dir / MANIFEST_NAME
+    manifest = load_manifest(manifest_path)
+    signature = db_signature(db_path)
+    same_db = manifest.get("db_signature") == signature
+    previous: Dict[str, Any] = manifest.get("orgs") or {}
+    entries: Dict[str, Any] = {}
+    counts = {"saved": 0, "unchanged": 0, "skipped": 0}
+    failures: List[Tuple[str, str, str]] = []
+    names: Dict[str, str] = {}
+
+    ranking_used_names: Dict[str, str] = {}
+    industry_used_names: Dict[str, str] = {}
+    tasks: List[Dict[str, Any]] = []
+    for rank, item in enumerate(top_items, start=1):
+        org_id = item.get("orgId") or item.get("org_id") or ""
+        org_name = item.get("orgName") or item.get("org_name") or org_id or "unknown"
+        if not org_id:
+            failures.append(("missing_id", org_name, "rank item missing orgId"))
+            continue
+        names[org_id] = org_name
+        industry = (industry_map.get(org_id) or "").strip() or "미분류"
+        paths = [
+            str(resolve_ranking_output_path(org_name, org_id, rank, out_dir, ranking_used_names)),
+            str(resolve_industry_output_path(org_name, org_id, industry, industry_dir, industry_used_names)),
+        ]
+        prev = previous.get(org_id) or {}
+        if not overwrite and same_db and prev.get("paths") == paths and all(Path(p).exists() for p in paths):
+            entries[org_id] = prev
+            counts["skipped"] += 1
+            continue
+        tasks.append({"org_id": org_id, "paths": paths, "prev_sha256": prev.get("sha256"), "overwrite": overwrite})
+
+    def _collect(result: Tuple[str, str, List[str], Optional[str]], paths: List[str]) -> None:
+        org_id, digest, written, error = result
+        if error:
+            failures.append((org_id, names.get(org_id, org_id), error))
+            return
+        entries[org_id] = {"sha256": digest, "paths": paths}
+        counts["saved" if written else "unchanged"] += 1
+
+    print(f"[info] direct: {len(tasks)} orgs to build, {counts['skipped']} unchanged since last run (workers={workers}).")
+    if workers <= 1 or len(tasks) <= 1:
+        _init_worker(str(db_path))
+        for task in tasks:
+            _collect(build_and_write(task), task["paths"])
+    else:
+        # spawn: 부모의 스레드별 SQLite 커넥션을 자식이 물려받지 않도록
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_worker, initargs=(str(db_path),)) as pool:
+            pending: Dict[Any, List[str]] = {}
+            queue = iter(tasks)
+            max_in_flight = workers * IN_FLIGHT_PER_WORKER
+            while True:
+                for task in queue:
+                    pending[pool.submit(build_and_write, task)] = task["paths"]
+                    if len(pending) >= max_in_flight:
+                        break
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    _collect(fut.result(), pending.pop(fut))
+
+    write_text_atomic(
+        manifest_path,
+        json.dumps({"db_signature": signature, "db_path": str(db_path), "orgs": entries}, ensure_ascii=False, indent=2) + "\n",
+    )
+    return counts, failures
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Dump won-groups JSON for top 2025 Won-ranked orgs.")
     parser.add_argument("--api-base-url", default="http://localhost:8000/api", help="FastAPI base URL (default: %(default)s)")
     parser.add_argument("--size", default="대기업", help='Organization size filter for ranking (default: "대기업")')
-    parser.add_argument("--limit", type=int, default=100, help="How many ranked orgs to export (default: 100)")
+    parser.add_argument(
+        "--limit", type=parse_limit, default=100, help='How many ranked orgs to export, or "all" (default: 100)'
+    )
     parser.add_argument(
         "--output-dir",
         default="org_dataset/ranking",
@@ -131,6 +295,17 @@ def main(argv: list[str] | None = None) -> int:
     )
     parser.add_argument("--overwrite", action="store_true", help="Overwrite existing files instead of skipping")
     parser.add_argument("--delay", type=float, default=0.0, help="Sleep seconds between org fetches (default: 0)")
+    parser.add_argument(
+        "--direct",
+        action="store_true",
+        help="Build payloads from --db-path in-process (no API server); incremental via <output-dir>/.manifest.json",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Process pool size for --direct (default: CPU count)",
+    )
     args = parser.parse_args(argv)
 
     base = args.api_base_url.rstrip("/")
@@ -141,17 +316,43 @@ def main(argv: list[str] | None = None) -> int:
 
     session = requests.Session()
     try:
-        rank_resp = fetch_json(session, f"{base}/rank/2025-deals", params={"size": args.size})
+        if args.direct:
+            from dashboard.server import database as db
+
+            rank_items = db.get_rank_2025_deals(size=args.size, db_path=Path(args.db_path))
+        else:
+            rank_items = fetch_json(session, f"{base}/rank/2025-deals", params={"size": args.size}).get("items") or []
     except Exception as exc:
         print(f"[error] Failed to fetch rank data: {exc}", file=sys.stderr)
         return 1
 
-    rank_items = rank_resp.get("items") or []
     top_items = list(iter_top_orgs(rank_items, args.limit))
     print(f"[info] Retrieved {len(rank_items)} ranked orgs (size={args.size}). Exporting top {len(top_items)}.")
 
     industry_map = load_industry_map(Path(args.db_path), [item.get("orgId") or item.get("org_id") or "" for item in top_items])
 
+    if args.direct:
+        started = time.time()
+        counts, failures = run_direct(
+            top_items,
+            db_path=Path(args.db_path),
+            out_dir=out_dir,
+            industry_dir=industry_dir,
+            industry_map=industry_map,
+            overwrite=args.overwrite,
+            workers=max(1, args.workers),
+        )
+        print(
+            f"[done] direct: wrote {counts['saved']} orgs, unchanged {counts['unchanged']}, "
+            f"skipped {counts['skipped']} into {out_dir} / {industry_dir} in {time.time() - started:.1f}s."
+        )
+        if failures:
+            print("[warn] Failures:")
+            for org_id, org_name, reason in failures:
+                print(f"  - {org_id} ({org_name}): {reason}")
+            return 2
+        return 0
+
     ranking_used_names: Dict[str, str] = {}
     industry_used_names: Dict[str, str] = {}
     failures: list[tuple[str, str, str]] = []
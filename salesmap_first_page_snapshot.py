@@ -6,11 +6,14 @@ import logging
 import os
 import shutil
 import re
+import queue
 import sqlite3
+import threading
 import time
 import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 import pandas as pd
 import requests
@@ -23,10 +26,51 @@ DEFAULT_CHECKPOINT_DIR = "logs/checkpoints"
 DEFAULT_CHECKPOINT_INTERVAL = 50
 DEFAULT_KEEP_BACKUPS = 30
 MIN_INTERVAL = 0.12
+# Crawl threads share one token bucket (≈ the old 1/MIN_INTERVAL serial ceiling) and one SQLite writer thread.
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE = 1.0 / MIN_INTERVAL
+RATE_BURST = 2
+WRITER_QUEUE_SIZE = 64
 MAX_RETRIES = 3
 BACKOFF_429 = 10.0
 MAX_BACKOFF = 60.0
 LOG_NAME = "salesmap"
+PAGINATED_ENDPOINTS: List[Tuple[str, str, str]] = [
+    ("/organization", "organizationList", "organization"),
+    ("/people", "peopleList", "people"),
+    ("/deal", "dealList", "deal"),
+    ("/lead", "leadList", "lead"),
+    ("/memo", "memoList", "memo"),
+]
+SINGLE_ENDPOINTS: List[Tuple[str, str, str]] = [
+    ("/user", "userList", "user"),
+    ("/team", "teamList", "team"),
+]
+# --incremental: record update timestamp fields (first parseable one wins) and high-water mark handling.
+UPDATED_AT_FIELDS: Tuple[str, ...] = ("updatedAt", "수정 날짜")
+# Optional server-side "updated since" query param; when unset every page is walked and only changed rows are written.
+DEFAULT_SINCE_PARAM = os.environ.get("SALESMAP_UPDATED_SINCE_PARAM", "")
+INCREMENTAL_OVERLAP_SEC = 300
+DEFAULT_ID_SWEEP_HOURS = 24.0
+UPSERT_CHUNK = 500
+SNAPSHOT_INDEX_VERSION = 2
+# (index name, table, columns). Missing tables/columns are skipped at build time.
+SNAPSHOT_INDEXES: List[Tuple[str, str, Tuple[str, ...]]] = [
+    ("idx_organization_id", "organization", ("id",)),
+    ("idx_people_id", "people", ("id",)),
+    ("idx_people_organizationId", "people", ("organizationId",)),
+    ("idx_deal_id", "deal", ("id",)),
+    ("idx_deal_organizationId_status", "deal", ("organizationId", "상태")),
+    ("idx_deal_peopleId", "deal", ("peopleId",)),
+    ("idx_deal_status_contract_date", "deal", ("상태", "계약 체결일")),
+    ("idx_memo_organizationId_createdAt", "memo", ("organizationId", "createdAt")),
+    ("idx_memo_peopleId_createdAt", "memo", ("peopleId", "createdAt")),
+    ("idx_memo_dealId_createdAt", "memo", ("dealId", "createdAt")),
+    ("idx_memo_createdAt", "memo", ("createdAt",)),
+    ("idx_webform_history_peopleId", "webform_history", ("peopleId", "webFormId")),
+    ("idx_deal_fact_org_counterparty", "deal_fact", ("organization_id", "counterparty_name")),
+    ("idx_deal_fact_perf_month", "deal_fact", ("perf_month",)),
+]
 
 logger = logging.getLogger(LOG_NAME)
 
@@ -46,6 +90,46 @@ def _load_token(explicit: Optional[str]) -> Optional[str]:
     return token
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every crawl thread. `pause()` (a 429 / Retry-After) stalls all
+    callers, not just the thread that was throttled. rate <= 0 disables limiting.
+    """
+
+    def __init__(self, rate: float, burst: float = 1) -> None:
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                else:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            until = time.monotonic() + max(0.0, seconds)
+            if until > self._blocked_until:
+                self._blocked_until = until
+                self._updated = until
+                self._tokens = 0.0
+
+
 class SalesmapClient:
     def __init__(
         self,
@@ -54,20 +138,28 @@ class SalesmapClient:
         min_interval: float = MIN_INTERVAL,
         max_retries: int = MAX_RETRIES,
         backoff_429: float = BACKOFF_429,
+        limiter: Optional[TokenBucket] = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.headers.update({"Authorization": f"Bearer {token}"})
+        self.token = token
         self.min_interval = min_interval
         self.max_retries = max_retries
         self.backoff_429 = backoff_429
-        self._last_request_at = 0.0
+        self.limiter = limiter or TokenBucket(1.0 / min_interval if min_interval > 0 else 0)
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        # requests.Session is not thread-safe; keep one per crawl thread.
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({"Authorization": f"Bearer {self.token}"})
+            self._local.session = session
+        return session
 
     def _respect_rate_limit(self) -> None:
-        elapsed = time.time() - self._last_request_at
-        wait_for = self.min_interval - elapsed
-        if wait_for > 0:
-            time.sleep(wait_for)
+        self.limiter.acquire()
 
     def get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         url = f"{self.base_url}/{path.lstrip('/')}"
@@ -81,7 +173,6 @@ class SalesmapClient:
                 wait = min(self.backoff_429 * attempts, MAX_BACKOFF)
                 time.sleep(wait)
                 continue
-            self._last_request_at = time.time()
             if resp.status_code == 429:
                 attempts += 1
                 retry_after = resp.headers.get("Retry-After")
@@ -89,7 +180,7 @@ class SalesmapClient:
                     delay = float(retry_after)
                 except Exception:
                     delay = self.backoff_429 * attempts
-                time.sleep(min(delay, MAX_BACKOFF))
+                self.limiter.pause(min(delay, MAX_BACKOFF))
                 continue
             if 500 <= resp.status_code < 600:
                 attempts += 1
@@ -122,15 +213,75 @@ def _serialize_value(val: Any) -> Any:
     return val
 
 
+class WriterQueue:
+    """
+    Single SQLite writer: callables submitted from crawl threads run one at a time, in submission order,
+    on a dedicated thread. The connection it writes through must be opened with check_same_thread=False.
+    """
+
+    def __init__(self, maxsize: int = WRITER_QUEUE_SIZE, name: str = "sqlite-writer") -> None:
+        self._queue: "queue.Queue[Optional[Tuple[Future, Callable[..., Any], Tuple[Any, ...]]]]" = queue.Queue(maxsize)
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def owns_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        future: Future = Future()
+        self._queue.put((future, fn, args))
+        return future
+
+    def call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self.owns_thread():
+            return fn(*args)
+        return self.submit(fn, *args).result()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def __enter__(self) -> "WriterQueue":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
 class TableWriter:
-    def __init__(self, conn: sqlite3.Connection, table: str) -> None:
+    def __init__(self, conn: sqlite3.Connection, table: str, writer_queue: Optional[WriterQueue] = None) -> None:
         self.conn = conn
         self.table = table
         self.columns: List[str] = []
         self.row_count = 0
         self.created = False
+        self.writer_queue = writer_queue
+
+    def call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a DB operation for this table on the writer thread (directly when there is no queue)."""
+        if self.writer_queue is None:
+            return fn(*args)
+        return self.writer_queue.call(fn, *args)
+
+    def _queued(self) -> bool:
+        return self.writer_queue is not None and not self.writer_queue.owns_thread()
 
     def load_existing(self) -> None:
+        if self._queued():
+            return self.call(self.load_existing)
         cur = self.conn.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (self.table,)
         )
@@ -145,6 +296,8 @@ class TableWriter:
     def _ensure_table_created(self) -> None:
         if self.created:
             return
+        if self._queued():
+            return self.call(self._ensure_table_created)
         if not self.columns:
             return
         cols_sql = ", ".join(f'"{col}" TEXT' for col in self.columns)
@@ -165,6 +318,8 @@ class TableWriter:
     def write_batch(self, records: List[Dict[str, Any]]) -> int:
         if not records:
             return 0
+        if self._queued():
+            return self.call(self.write_batch, records)
         batch_columns = collect_columns(records)
         if not self.columns:
             self.columns = batch_columns
@@ -172,12 +327,73 @@ class TableWriter:
             new_cols = [c for c in batch_columns if c not in self.columns]
             self._add_columns(new_cols)
         self._ensure_table_created()
-        normalized = normalize_records(records, self.columns)
-        df = pd.DataFrame(normalized, columns=self.columns)
-        df.to_sql(self.table, self.conn, if_exists="append", index=False)
+        columns = list(self.columns)
+        self.conn.executemany(_insert_sql(self.table, columns), (_row_values(record, columns) for record in records))
         self.row_count += len(records)
         return len(records)
 
+    def commit(self) -> None:
+        """Pages accumulate in one open transaction; commit at checkpoints and when the table is done."""
+        self.call(self.conn.commit)
+
+
+def _cell(val: Any) -> Any:
+    if isinstance(val, (dict, list)):
+        return json.dumps(val, ensure_ascii=False)
+    return val
+
+
+def _row_values(record: Dict[str, Any], columns: Sequence[str]) -> Tuple[Any, ...]:
+    return tuple(_cell(record.get(col)) for col in columns)
+
+
+def _insert_sql(table: str, columns: Sequence[str]) -> str:
+    cols_sql = ", ".join(f'"{col}"' for col in columns)
+    placeholders = ", ".join("?" for _ in columns)
+    return f'INSERT INTO "{table}" ({cols_sql}) VALUES ({placeholders})'
+
+
+def _sqlite_type(value: Any) -> str:
+    # Same affinities pandas.to_sql picked for these small bookkeeping tables.
+    if isinstance(value, (bool, int)):
+        return "INTEGER"
+    if isinstance(value, float):
+        return "REAL"
+    return "TEXT"
+
+
+def replace_table(
+    conn: sqlite3.Connection,
+    table: str,
+    records: Sequence[Dict[str, Any]],
+    columns: Optional[Sequence[str]] = None,
+) -> None:
+    """DROP + CREATE + executemany (replaces the pandas `to_sql(if_exists="replace")` round-trip)."""
+    columns = list(columns or collect_columns(list(records)) or ["__no_data"])
+    types = {
+        col: _sqlite_type(next((r.get(col) for r in records if r.get(col) is not None), None)) for col in columns
+    }
+    cols_sql = ", ".join(f'"{col}" {types[col]}' for col in columns)
+    conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+    conn.execute(f'CREATE TABLE "{table}" ({cols_sql})')
+    conn.executemany(_insert_sql(table, columns), (_row_values(r, columns) for r in records))
+
+
+def configure_ingest_connection(conn: sqlite3.Connection, resumable: bool = True) -> None:
+    """
+    The crawl writes a temp DB that is atomically renamed over the snapshot at the end. A checkpointed run
+    may be resumed on that same file after a crash, so it keeps a journal: WAL with synchronous=NORMAL only
+    fsyncs at checkpoints and a killed process rolls back to the last commit. One-shot writers that are
+    never resumed (resumable=False) turn the journal and fsyncs off entirely.
+    """
+    if resumable:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    else:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA temp_store=MEMORY")
+
 
 def collect_columns(records: List[Dict[str, Any]]) -> List[str]:
     columns: List[str] = []
@@ -263,7 +479,16 @@ def fetch_webform_submissions(client: SalesmapClient, webform_id: str, log: logg
     return submissions
 
 
-def update_webform_history(db_path: Path, client: SalesmapClient, log: logging.Logger) -> None:
+def update_webform_history(
+    db_path: Path,
+    client: SalesmapClient,
+    log: logging.Logger,
+    concurrency: int = 1,
+) -> None:
+    """
+    Fetch every webform's submission cursor on `concurrency` threads (throttled by the client's shared
+    limiter); this thread is the only writer and consumes results in webform id order.
+    """
     if not db_path.exists():
         log.warning("DB not found for webform history update: %s", db_path)
         return
@@ -277,22 +502,23 @@ def update_webform_history(db_path: Path, client: SalesmapClient, log: logging.L
         total = 0
         dropped_missing_total = 0
         dropped_not_allowed_total = 0
-        for wf_id in webform_ids:
-            submissions = fetch_webform_submissions(client, wf_id, log)
-            filtered, dropped_missing, dropped_not_allowed = filter_submissions_by_people(
-                submissions, allowed_people_set, log
-            )
-            if dropped_missing or dropped_not_allowed:
-                log.info(
-                    "webform %s submissions filtered: kept=%d dropped_missing_person=%d dropped_not_allowed=%d",
-                    wf_id,
-                    len(filtered),
-                    dropped_missing,
-                    dropped_not_allowed,
+        with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="webform") as pool:
+            futures = [(wf_id, pool.submit(fetch_webform_submissions, client, wf_id, log)) for wf_id in webform_ids]
+            for wf_id, future in futures:
+                filtered, dropped_missing, dropped_not_allowed = filter_submissions_by_people(
+                    future.result(), allowed_people_set, log
                 )
-            dropped_missing_total += dropped_missing
-            dropped_not_allowed_total += dropped_not_allowed
-            total += writer.write_batch(filtered)
+                if dropped_missing or dropped_not_allowed:
+                    log.info(
+                        "webform %s submissions filtered: kept=%d dropped_missing_person=%d dropped_not_allowed=%d",
+                        wf_id,
+                        len(filtered),
+                        dropped_missing,
+                        dropped_not_allowed,
+                    )
+                dropped_missing_total += dropped_missing
+                dropped_not_allowed_total += dropped_not_allowed
+                total += writer.write_batch(filtered)
         conn.commit()
     log.info(
         "webform_history updated with %d rows (db=%s, dropped_missing_person=%d, dropped_not_allowed=%d)",
@@ -306,14 +532,7 @@ def update_webform_history(db_path: Path, client: SalesmapClient, log: logging.L
 def normalize_records(records: List[Dict[str, Any]], columns: Sequence[str]) -> List[Dict[str, Any]]:
     normalized: List[Dict[str, Any]] = []
     for record in records:
-        row: Dict[str, Any] = {}
-        for col in columns:
-            val = record.get(col)
-            if isinstance(val, (dict, list)):
-                row[col] = json.dumps(val, ensure_ascii=False)
-            else:
-                row[col] = val
-        normalized.append(row)
+        normalized.append({col: _cell(record.get(col)) for col in columns})
     return normalized
 
 
@@ -403,12 +622,17 @@ class CheckpointManager:
             except Exception:
                 pass
         self.state = default_state
+        self._lock = threading.Lock()
 
     def get_table(self, table: str) -> Optional[Dict[str, Any]]:
         tables = self.state.get("tables") or {}
         return tables.get(table)
 
     def save_table(self, table: str, payload: Dict[str, Any]) -> None:
+        with self._lock:
+            self._save_table_locked(table, payload)
+
+    def _save_table_locked(self, table: str, payload: Dict[str, Any]) -> None:
         tables = self.state.setdefault("tables", {})
         tables[table] = payload
         self.state["updated_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z")
@@ -455,6 +679,16 @@ def load_checkpoint_file(checkpoint_dir: Path, run_tag: Optional[str]) -> Option
     return None
 
 
+def _page_items(payload: Optional[Dict[str, Any]], list_key: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """(records, nextCursor) from one list page payload."""
+    if not payload:
+        return [], None
+    data = payload.get("data", {})
+    lst = data.get(list_key, [])
+    batch = [item for item in lst if isinstance(item, dict)] if isinstance(lst, list) else []
+    return batch, data.get("nextCursor")
+
+
 def capture_paginated(
     client: SalesmapClient,
     table_state: Dict[str, Dict[str, Any]],
@@ -484,14 +718,7 @@ def capture_paginated(
         params = {"cursor": cursor} if cursor else None
         payload, error = client.get_json(path, params=params)
         page += 1
-        batch: List[Dict[str, Any]] = []
-        next_cursor: Optional[str] = None
-        if payload:
-            data = payload.get("data", {})
-            lst = data.get(list_key, [])
-            if isinstance(lst, list):
-                batch = [item for item in lst if isinstance(item, dict)]
-            next_cursor = data.get("nextCursor")
+        batch, next_cursor = _page_items(payload, list_key)
         if batch:
             writer.write_batch(batch)
         log.info(
@@ -509,6 +736,7 @@ def capture_paginated(
             break
         cursor = next_cursor
         if checkpoint and (page % checkpoint_interval == 0):
+            writer.commit()
             checkpoint.save_table(
                 table,
                 {
@@ -520,6 +748,7 @@ def capture_paginated(
                     "errors": entry["errors"],
                 },
             )
+    writer.commit()
     col_count = len(writer.columns)
     completed = not error
     if checkpoint:
@@ -569,6 +798,7 @@ def capture_single_list(
         writer._ensure_table_created()
     if batch:
         writer.write_batch(batch)
+    writer.commit()
     if error:
         entry["errors"].append(f"fetch:{error}")
     col_count = len(writer.columns)
@@ -589,6 +819,209 @@ def capture_single_list(
     return {"table": table, "rows": writer.row_count, "columns": writer.columns, "errors": entry["errors"]}
 
 
+def parse_timestamp(value: Any) -> Optional[datetime.datetime]:
+    """ISO-8601 text (trailing Z allowed, naive = UTC) -> aware UTC datetime; None when unparseable."""
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    try:
+        ts = datetime.datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=datetime.timezone.utc)
+    return ts.astimezone(datetime.timezone.utc)
+
+
+def format_timestamp(ts: datetime.datetime) -> str:
+    return ts.astimezone(datetime.timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def record_updated_at(record: Dict[str, Any]) -> Optional[datetime.datetime]:
+    for field in UPDATED_AT_FIELDS:
+        ts = parse_timestamp(record.get(field))
+        if ts is not None:
+            return ts
+    return None
+
+
+def upsert_by_id(writer: TableWriter, records: List[Dict[str, Any]]) -> int:
+    """Replace rows sharing an `id` with the given records (last one wins within the batch), then append."""
+    if not records:
+        return 0
+    latest: Dict[str, Dict[str, Any]] = {}
+    without_id: List[Dict[str, Any]] = []
+    for record in records:
+        rid = record.get("id")
+        if rid is None:
+            without_id.append(record)
+        else:
+            latest[str(rid)] = record
+    if latest and writer.created and "id" in writer.columns:
+        ids = list(latest)
+        for start in range(0, len(ids), UPSERT_CHUNK):
+            chunk = ids[start : start + UPSERT_CHUNK]
+            placeholders = ",".join("?" for _ in chunk)
+            cur = writer.conn.execute(f'DELETE FROM "{writer.table}" WHERE id IN ({placeholders})', chunk)
+            writer.row_count -= max(cur.rowcount, 0)
+    return writer.write_batch(list(latest.values()) + without_id)
+
+
+def sweep_deleted_ids(conn: sqlite3.Connection, table: str, seen_ids: Set[str]) -> int:
+    """Delete rows whose id was not listed by a complete walk. Empty id sets never delete anything."""
+    if not seen_ids or "id" not in _table_columns(conn, table):
+        return 0
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS sweep_ids (id TEXT PRIMARY KEY)")
+    conn.execute("DELETE FROM sweep_ids")
+    conn.executemany("INSERT OR IGNORE INTO sweep_ids (id) VALUES (?)", ((rid,) for rid in seen_ids))
+    cur = conn.execute(f'DELETE FROM "{table}" WHERE id NOT IN (SELECT id FROM sweep_ids)')
+    conn.execute("DELETE FROM sweep_ids")
+    return max(cur.rowcount, 0)
+
+
+def capture_incremental(
+    client: SalesmapClient,
+    table_state: Dict[str, Dict[str, Any]],
+    path: str,
+    list_key: str,
+    writer: TableWriter,
+    table_name: str,
+    since: Optional[datetime.datetime],
+    since_param: str = "",
+    sweep: bool = False,
+    log: Optional[logging.Logger] = None,
+    checkpoint: Optional[CheckpointManager] = None,
+) -> Dict[str, Any]:
+    """
+    Delta-sync one paginated endpoint into an existing table.
+
+    Records updated at/after `since` (minus INCREMENTAL_OVERLAP_SEC) — or without any update timestamp —
+    are upserted by `id`. With `since_param` the API is asked for changed records only; otherwise (or when
+    `sweep` is set) every page is walked, the listed ids are collected and, if the walk completed without
+    errors, rows missing from the listing are deleted. The high-water mark only advances on a clean walk.
+    """
+    log = log or logger
+    entry = table_state.setdefault(table_name, {"endpoint": path, "errors": []})
+    cutoff = since - datetime.timedelta(seconds=INCREMENTAL_OVERLAP_SEC) if since else None
+    filtered = bool(since_param and cutoff and not sweep)
+    seen_ids: Optional[Set[str]] = None if filtered else set()
+    high = since
+    cursor: Optional[str] = None
+    page = 0
+    fetched = upserted = 0
+    seen_cursors = set()
+    error: Optional[str] = None
+    while True:
+        if cursor in seen_cursors:
+            error = "cursor_loop"
+            entry["errors"].append(f"page{page}:cursor_loop")
+            log.error("%s cursor repeated (%s). Stopping to avoid loop.", path, cursor)
+            break
+        seen_cursors.add(cursor)
+        params: Dict[str, Any] = {}
+        if cursor:
+            params["cursor"] = cursor
+        if filtered:
+            params[since_param] = format_timestamp(cutoff)
+        payload, error = client.get_json(path, params=params or None)
+        page += 1
+        batch, next_cursor = _page_items(payload, list_key)
+        fetched += len(batch)
+        changed: List[Dict[str, Any]] = []
+        for item in batch:
+            if seen_ids is not None and item.get("id") is not None:
+                seen_ids.add(str(item["id"]))
+            ts = record_updated_at(item)
+            if ts is None or cutoff is None or ts >= cutoff:
+                changed.append(item)
+            if ts is not None and (high is None or ts > high):
+                high = ts
+        upserted += writer.call(upsert_by_id, writer, changed)
+        if error:
+            entry["errors"].append(f"page{page}:{error}")
+            break
+        if not next_cursor:
+            break
+        cursor = next_cursor
+    clean = not entry["errors"]
+    deleted = 0
+    if seen_ids is not None and clean:
+        deleted = writer.call(sweep_deleted_ids, writer.conn, writer.table, seen_ids)
+        writer.row_count -= deleted
+    writer.commit()
+    mark = high if clean else since
+    result = {
+        "table": table_name,
+        "rows": writer.row_count,
+        "columns": writer.columns,
+        "pages": page,
+        "fetched": fetched,
+        "upserted": upserted,
+        "deleted": deleted,
+        "swept": seen_ids is not None and clean,
+        "high_water_mark": format_timestamp(mark) if mark else None,
+        "errors": entry["errors"],
+    }
+    if checkpoint:
+        checkpoint.save_table(
+            table_name,
+            {
+                "next_cursor": None,
+                "page": page,
+                "rows": writer.row_count,
+                "columns": writer.columns,
+                "completed": clean,
+                "errors": entry["errors"],
+                "high_water_mark": result["high_water_mark"],
+            },
+        )
+    log.info(
+        "%s incremental -> pages=%s fetched=%s upserted=%s deleted=%s rows=%s hwm=%s",
+        path,
+        page,
+        fetched,
+        upserted,
+        deleted,
+        writer.row_count,
+        result["high_water_mark"],
+    )
+    return result
+
+
+def refresh_single_list(
+    client: SalesmapClient,
+    table_state: Dict[str, Dict[str, Any]],
+    path: str,
+    list_key: str,
+    writer: TableWriter,
+    table_name: str,
+    log: Optional[logging.Logger] = None,
+) -> Dict[str, Any]:
+    """Small non-paginated lists are replaced wholesale, but only after a successful fetch."""
+    log = log or logger
+    entry = table_state.setdefault(table_name, {"endpoint": path, "errors": []})
+    payload, error = client.get_json(path)
+    if error:
+        entry["errors"].append(f"fetch:{error}")
+        log.warning("%s refresh failed (%s); keeping existing rows", path, error)
+    else:
+        batch, _ = _page_items(payload, list_key)
+
+        def _replace() -> None:
+            if writer.created:
+                writer.conn.execute(f'DELETE FROM "{writer.table}"')
+                writer.row_count = 0
+            writer.write_batch(batch)
+
+        writer.call(_replace)
+        log.info("%s -> rows=%s (replaced)", path, writer.row_count)
+    return {"table": table_name, "rows": writer.row_count, "columns": writer.columns, "errors": entry["errors"]}
+
+
 def write_outputs(
     tables: Dict[str, Dict[str, Any]],
     manifest: List[Dict[str, Any]],
@@ -597,10 +1030,9 @@ def write_outputs(
 ) -> None:
     with sqlite3.connect(db_path) as conn:
         for table_name, payload in tables.items():
-            df = pd.DataFrame(payload["records"], columns=payload["columns"])
-            df.to_sql(table_name, conn, if_exists="replace", index=False)
-        pd.DataFrame(manifest).to_sql("manifest", conn, if_exists="replace", index=False)
-        pd.DataFrame([run_info]).to_sql("run_info", conn, if_exists="replace", index=False)
+            replace_table(conn, table_name, payload["records"], payload["columns"])
+        replace_table(conn, "manifest", manifest)
+        replace_table(conn, "run_info", [run_info])
 
 
 def _list_tables(con: sqlite3.Connection) -> List[str]:
@@ -670,7 +1102,11 @@ def finalize_sqlite_connection(
     log: Optional[logging.Logger] = None,
     sleep_after: float = 0.5,
 ) -> None:
-    """Flush, checkpoint, and close a SQLite connection before file moves."""
+    """
+    Flush, checkpoint, and close a SQLite connection before file moves. The WAL flag of a resumable temp DB
+    lives in the file header, so it is switched back to a rollback journal here; otherwise the renamed snapshot
+    ships as a WAL DB and every mode=ro reader creates -wal/-shm files next to it.
+    """
     log = log or logger
     try:
         conn.commit()
@@ -680,6 +1116,10 @@ def finalize_sqlite_connection(
         conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
     except Exception as exc:
         log.info("wal_checkpoint skipped: %s", exc)
+    try:
+        conn.execute("PRAGMA journal_mode=DELETE")
+    except Exception as exc:
+        log.warning("journal_mode=DELETE during finalize failed: %s", exc)
     try:
         conn.execute("PRAGMA optimize")
     except Exception as exc:
@@ -701,6 +1141,123 @@ def finalize_sqlite_connection(
             pass
 
 
+def _table_columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    return [row[1] for row in conn.execute(f'PRAGMA table_info("{table}")').fetchall()]
+
+
+def stamp_run_info(conn: sqlite3.Connection, values: Dict[str, Any], log: Optional[logging.Logger] = None) -> bool:
+    """Add/overwrite columns on the single run_info row (creates missing columns as TEXT)."""
+    log = log or logger
+    existing = _table_columns(conn, "run_info")
+    if not existing:
+        log.info("run_info table missing; skip stamping %s", sorted(values))
+        return False
+    for col in values:
+        if col not in existing:
+            conn.execute(f'ALTER TABLE run_info ADD COLUMN "{col}" TEXT')
+    assignments = ", ".join(f'"{col}" = ?' for col in values)
+    conn.execute(f"UPDATE run_info SET {assignments}", tuple(values.values()))
+    return True
+
+
+def build_snapshot_indexes(conn: sqlite3.Connection, log: Optional[logging.Logger] = None) -> List[str]:
+    """
+    Post-ingest finalize stage: create SNAPSHOT_INDEXES, run ANALYZE and stamp run_info.
+    Returns the index names that exist after the build.
+    """
+    log = log or logger
+    built: List[str] = []
+    columns_by_table: Dict[str, List[str]] = {}
+    for name, table, columns in SNAPSHOT_INDEXES:
+        if table not in columns_by_table:
+            columns_by_table[table] = _table_columns(conn, table)
+        available = columns_by_table[table]
+        if not available:
+            log.info("index %s skipped: table %s not found", name, table)
+            continue
+        missing = [col for col in columns if col not in available]
+        if missing:
+            log.info("index %s skipped: %s missing columns %s", name, table, missing)
+            continue
+        cols_sql = ", ".join(f'"{col}"' for col in columns)
+        started = time.time()
+        conn.execute(f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" ({cols_sql})')
+        log.info("index %s on %s(%s) ready in %.2fs", name, table, ", ".join(columns), time.time() - started)
+        built.append(name)
+    conn.execute("ANALYZE")
+    stamp_run_info(
+        conn,
+        {
+            "index_version": str(SNAPSHOT_INDEX_VERSION),
+            "indexes": json.dumps(built, ensure_ascii=False),
+            "indexed_at_utc": datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z"),
+        },
+        log=log,
+    )
+    conn.commit()
+    return built
+
+
+def build_derived_tables(conn: sqlite3.Connection, log: Optional[logging.Logger] = None) -> List[str]:
+    """Materialize API-side derived tables (deal_fact, memo_clean, search_fts) from the raw snapshot tables."""
+    log = log or logger
+    try:
+        from dashboard.server.deal_fact import DEAL_FACT_TABLE, build_deal_fact
+        from dashboard.server.memo_clean import MEMO_CLEAN_TABLE, build_memo_clean
+        from dashboard.server.search_index import SEARCH_TABLE, build_search_index
+    except Exception as exc:
+        log.warning("derived tables skipped (dashboard package unavailable): %s", exc)
+        return []
+    built: List[str] = []
+    if not _table_columns(conn, "deal"):
+        log.info("%s skipped: deal table not found", DEAL_FACT_TABLE)
+    else:
+        try:
+            stats = build_deal_fact(conn)
+        except sqlite3.Error as exc:
+            # API falls back to parsing raw deal rows when deal_fact is missing/stale.
+            log.warning("%s build failed: %s", DEAL_FACT_TABLE, exc)
+        else:
+            log.info("%s built: rows=%s in %.2fs (signature=%s)", DEAL_FACT_TABLE, stats["rows"], stats["elapsed_sec"], stats["signature"])
+            built.append(DEAL_FACT_TABLE)
+    if not _table_columns(conn, "memo"):
+        log.info("%s skipped: memo table not found", MEMO_CLEAN_TABLE)
+    else:
+        try:
+            stats = build_memo_clean(conn)
+        except sqlite3.Error as exc:
+            # won-groups/compact clean memos per request when memo_clean is missing/stale.
+            log.warning("%s build failed: %s", MEMO_CLEAN_TABLE, exc)
+        else:
+            log.info("%s built: rows=%s %s in %.2fs", MEMO_CLEAN_TABLE, stats["rows"], stats["by_kind"], stats["elapsed_sec"])
+            built.append(MEMO_CLEAN_TABLE)
+    if not _table_columns(conn, "organization"):
+        log.info("%s skipped: organization table not found", SEARCH_TABLE)
+        return built
+    try:
+        stats = build_search_index(conn)
+    except sqlite3.Error as exc:
+        # /api/search falls back to LIKE over the raw tables when search_fts is missing/stale.
+        log.warning("%s build failed: %s", SEARCH_TABLE, exc)
+        return built
+    log.info("%s built: rows=%s %s in %.2fs", SEARCH_TABLE, stats["rows"], stats["by_kind"], stats["elapsed_sec"])
+    built.append(SEARCH_TABLE)
+    return built
+
+
+def finalize_snapshot(db_path: Path, log: Optional[logging.Logger] = None) -> List[str]:
+    """Post-ingest finalize: derived tables first (so they get indexed), then indexes + ANALYZE."""
+    log = log or logger
+    if not db_path.exists():
+        log.warning("DB not found for snapshot finalize: %s", db_path)
+        return []
+    with sqlite3.connect(db_path) as conn:
+        build_derived_tables(conn, log=log)
+        built = build_snapshot_indexes(conn, log=log)
+    log.info("Snapshot indexes v%s built: %d (db=%s)", SNAPSHOT_INDEX_VERSION, len(built), db_path)
+    return built
+
+
 def _describe_blocking_processes(path: Path, log: logging.Logger) -> None:
     """Log processes that currently hold a handle to path (best effort)."""
     try:
@@ -842,6 +1399,201 @@ def finalize_tables(registry: Dict[str, Dict[str, Any]]) -> Tuple[Dict[str, Dict
     return tables, manifest
 
 
+def run_crawl_jobs(jobs: List[Tuple[Callable[..., None], Tuple[Any, ...]]], concurrency: int) -> None:
+    """Run independent endpoint crawls on a thread pool; the first failure is re-raised once all have stopped."""
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="crawl") as pool:
+        futures = [pool.submit(fn, *job_args) for fn, job_args in jobs]
+    for future in futures:
+        future.result()
+
+
+def read_run_info(conn: sqlite3.Connection) -> Dict[str, Any]:
+    columns = _table_columns(conn, "run_info")
+    if not columns:
+        return {}
+    row = conn.execute("SELECT * FROM run_info LIMIT 1").fetchone()
+    return dict(zip(columns, row)) if row else {}
+
+
+def incremental_state(run_info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Sync bookkeeping carried in run_info: per-table high-water marks (`sync_hwm`, JSON), the capture time of
+    the last full crawl (`full_captured_at_utc`) and of the last id sweep (`id_sweep_at_utc`). A DB produced
+    by a full run has none of these yet; its `captured_at_utc` (crawl start) then serves as mark and sweep time.
+    """
+    if (run_info.get("sync_mode") or "full") == "full":
+        full_captured = run_info.get("captured_at_utc")
+    else:
+        full_captured = run_info.get("full_captured_at_utc") or run_info.get("captured_at_utc")
+    try:
+        raw_marks = json.loads(run_info.get("sync_hwm") or "{}")
+    except (TypeError, ValueError):
+        raw_marks = {}
+    if not isinstance(raw_marks, dict):
+        raw_marks = {}
+    fallback = parse_timestamp(full_captured)
+    marks = {
+        table: parse_timestamp(raw_marks.get(table)) or fallback for _, _, table in PAGINATED_ENDPOINTS
+    }
+    return {
+        "full_captured_at_utc": full_captured,
+        "marks": marks,
+        "last_sweep": parse_timestamp(run_info.get("id_sweep_at_utc")) or fallback,
+    }
+
+
+def copy_sqlite_db(src: Path, dest: Path) -> None:
+    """Consistent copy through the SQLite backup API (safe while readers hold the source open)."""
+    if dest.exists():
+        dest.unlink()
+    source = sqlite3.connect(src)
+    try:
+        target = sqlite3.connect(dest)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+    finally:
+        source.close()
+
+
+def run_incremental(
+    args: argparse.Namespace,
+    client: SalesmapClient,
+    db_path: Path,
+) -> bool:
+    """
+    --incremental: apply a delta sync to a copy of the existing snapshot and swap it in.
+    Returns False (caller falls back to a full crawl) when there is no usable snapshot to start from.
+    """
+    run_ts = datetime.datetime.now(datetime.timezone.utc)
+    run_tag = run_ts.strftime("%Y%m%d_%H%M%S")
+    log_dir = Path(args.log_dir)
+    log_path = setup_logging(log_dir, run_tag)
+    if not db_path.exists():
+        logger.info("Incremental requested but %s does not exist. Running a full snapshot.", db_path)
+        return False
+    with sqlite3.connect(db_path) as conn:
+        previous = read_run_info(conn)
+    if not previous:
+        logger.info("Incremental requested but %s has no run_info. Running a full snapshot.", db_path)
+        return False
+    state = incremental_state(previous)
+    sweep_age = run_ts - state["last_sweep"] if state["last_sweep"] else None
+    sweep = bool(
+        args.id_sweep or sweep_age is None or sweep_age >= datetime.timedelta(hours=max(0.0, args.id_sweep_hours))
+    )
+    logger.info(
+        "Starting Salesmap incremental run %s on %s (since_param=%s, id_sweep=%s)",
+        run_tag,
+        db_path,
+        args.since_param or "-",
+        sweep,
+    )
+
+    backup_created = maybe_backup_existing_db(
+        db_path, Path(args.backup_dir), args.keep_backups, enabled=not args.no_backup
+    )
+    if backup_created:
+        logger.info("Backup created: %s", backup_created)
+
+    tmp_path = db_path.with_suffix(db_path.suffix + ".tmp")
+    copy_sqlite_db(db_path, tmp_path)
+    checkpoint_mgr = CheckpointManager(Path(args.checkpoint_dir), run_tag, tmp_path)
+
+    table_state: Dict[str, Dict[str, Any]] = {}
+    writers: Dict[str, TableWriter] = {}
+    results: Dict[str, Dict[str, Any]] = {}
+    manifest: List[Dict[str, Any]] = []
+    conn = sqlite3.connect(tmp_path, check_same_thread=False)
+    configure_ingest_connection(conn)
+    try:
+        with WriterQueue() as writer_queue:
+
+            def _delta(path: str, list_key: str, table: str) -> None:
+                writer = TableWriter(conn, table, writer_queue)
+                writer.load_existing()
+                writers[table] = writer
+                results[table] = capture_incremental(
+                    client,
+                    table_state,
+                    path,
+                    list_key=list_key,
+                    writer=writer,
+                    table_name=table,
+                    since=state["marks"].get(table),
+                    since_param=args.since_param,
+                    sweep=sweep,
+                    log=logger,
+                    checkpoint=checkpoint_mgr,
+                )
+
+            def _single(path: str, list_key: str, table: str) -> None:
+                writer = TableWriter(conn, table, writer_queue)
+                writer.load_existing()
+                writers[table] = writer
+                refresh_single_list(client, table_state, path, list_key, writer, table, log=logger)
+
+            run_crawl_jobs(
+                [(_delta, endpoint) for endpoint in PAGINATED_ENDPOINTS]
+                + [(_single, endpoint) for endpoint in SINGLE_ENDPOINTS],
+                args.concurrency,
+            )
+        conn.commit()
+
+        for _, _, table in PAGINATED_ENDPOINTS + SINGLE_ENDPOINTS:
+            writer = writers[table]
+            entry = table_state[table]
+            manifest.append(
+                {
+                    "table": table,
+                    "endpoint": entry["endpoint"],
+                    "row_count": writer.row_count,
+                    "column_count": len(writer.columns),
+                    "errors": ";".join(entry["errors"]),
+                }
+            )
+        replace_table(conn, "manifest", manifest)
+
+        swept_all = all(r["swept"] for r in results.values())
+        run_info_values = {
+            "run_tag": run_tag,
+            "captured_at_utc": format_timestamp(run_ts),
+            "sync_mode": "incremental",
+            "full_captured_at_utc": state["full_captured_at_utc"],
+            "sync_hwm": json.dumps({t: r["high_water_mark"] for t, r in results.items()}, ensure_ascii=False),
+            "id_sweep_at_utc": format_timestamp(run_ts) if swept_all else previous.get("id_sweep_at_utc"),
+            "incremental_stats": json.dumps(
+                {t: {k: r[k] for k in ("pages", "fetched", "upserted", "deleted", "swept")} for t, r in results.items()},
+                ensure_ascii=False,
+            ),
+            "checkpoint_path": str(checkpoint_mgr.path),
+        }
+        stamp_run_info(conn, run_info_values, log=logger)
+    finally:
+        finalize_sqlite_connection(conn, log=logger)
+
+    final_db_path = replace_file_with_retry(tmp_path, db_path, log=logger, run_tag=run_tag)
+    if final_db_path != db_path:
+        logger.warning("Target DB locked; new snapshot stored at %s (original left untouched)", final_db_path)
+    with sqlite3.connect(final_db_path) as conn:
+        stamp_run_info(conn, {"final_db_path": str(final_db_path)}, log=logger)
+        run_info = read_run_info(conn)
+    try:
+        update_webform_history(Path(final_db_path), client, logger, concurrency=args.concurrency)
+    except Exception as exc:  # pragma: no cover - best-effort post step
+        logger.warning("webform history update failed: %s", exc)
+    try:
+        finalize_snapshot(Path(final_db_path), logger)
+    except Exception as exc:  # pragma: no cover - API warns at startup when indexes are missing
+        logger.warning("snapshot finalize (deal_fact/indexes) failed: %s", exc)
+
+    history_path = record_run_history(log_dir, run_info, manifest, log_path, backup_created)
+    logger.info("Run history appended to %s", history_path)
+    logger.info("Done incremental. SQLite -> %s", final_db_path)
+    return True
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Salesmap API full snapshot (cursor to end) to SQLite.")
     parser.add_argument("--db-path", default=DEFAULT_DB_PATH, help="Output SQLite path.")
@@ -864,24 +1616,73 @@ def main() -> None:
         action="store_true",
         help="Skip snapshot crawl and only update webform_history on the existing DB.",
     )
+    parser.add_argument(
+        "--index-only",
+        action="store_true",
+        help="Skip snapshot crawl and only (re)build derived tables (deal_fact), indexes + ANALYZE on the existing DB.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Delta-sync the existing DB: upsert records changed since the stored high-water marks (falls back to a full run when no snapshot exists).",
+    )
+    parser.add_argument(
+        "--since-param",
+        default=DEFAULT_SINCE_PARAM,
+        help="API query param for 'updated since' filtering in --incremental (env SALESMAP_UPDATED_SINCE_PARAM). Empty = walk all pages, write only changed rows.",
+    )
+    parser.add_argument(
+        "--id-sweep", action="store_true", help="Force a deletion sweep (full id walk) in --incremental."
+    )
+    parser.add_argument(
+        "--id-sweep-hours",
+        type=float,
+        default=DEFAULT_ID_SWEEP_HOURS,
+        help="Run the --incremental deletion sweep when the last one is older than this.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Endpoints / webform cursors crawled in parallel (writes still go through one SQLite writer).",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_RATE,
+        help="Global API request budget (requests/sec) shared by all crawl threads; 429 Retry-After pauses all of them.",
+    )
     args = parser.parse_args()
 
+    if args.index_only:
+        db_path = Path(args.db_path)
+        run_ts = datetime.datetime.now(datetime.timezone.utc)
+        setup_logging(Path(args.log_dir), run_ts.strftime("%Y%m%d_%H%M%S"))
+        logger.info("Starting index-only finalize on %s", db_path)
+        finalize_snapshot(db_path, logger)
+        logger.info("Done index-only build.")
+        return
+
     token = _load_token(args.token)
     if not token:
         raise SystemExit("SALESMAP_TOKEN is required (env or streamlit secrets).")
 
     db_path = Path(args.db_path)
-    client = SalesmapClient(base_url=args.base_url, token=token)
+    client = SalesmapClient(base_url=args.base_url, token=token, limiter=TokenBucket(args.rate, RATE_BURST))
 
     if args.webform_only:
         run_ts = datetime.datetime.now(datetime.timezone.utc)
         log_dir = Path(args.log_dir)
         setup_logging(log_dir, run_ts.strftime("%Y%m%d_%H%M%S"))
         logger.info("Starting webform-only update on %s", db_path)
-        update_webform_history(db_path, client, logger)
+        update_webform_history(db_path, client, logger, concurrency=args.concurrency)
+        finalize_snapshot(db_path, logger)
         logger.info("Done webform-only update.")
         return
 
+    if args.incremental and run_incremental(args, client, db_path):
+        return
+
     run_ts = datetime.datetime.now(datetime.timezone.utc)
     checkpoint_dir = Path(args.checkpoint_dir)
     resume_state = load_checkpoint_file(checkpoint_dir, args.resume_run_tag if args.resume else None) if args.resume else None
@@ -909,20 +1710,10 @@ def main() -> None:
             tmp_path = db_path.with_name(f"{db_path.stem}_{run_tag}{db_path.suffix}.tmp")
     checkpoint_mgr = CheckpointManager(checkpoint_dir, run_tag, tmp_path, initial_state=resume_state)
 
-    client = SalesmapClient(base_url=args.base_url, token=token)
     table_state: Dict[str, Dict[str, Any]] = {}
     writers: Dict[str, TableWriter] = {}
-    paginated_endpoints = [
-        ("/organization", "organizationList", "organization"),
-        ("/people", "peopleList", "people"),
-        ("/deal", "dealList", "deal"),
-        ("/lead", "leadList", "lead"),
-        ("/memo", "memoList", "memo"),
-    ]
-    single_endpoints = [
-        ("/user", "userList", "user"),
-        ("/team", "teamList", "team"),
-    ]
+    paginated_endpoints = PAGINATED_ENDPOINTS
+    single_endpoints = SINGLE_ENDPOINTS
     all_endpoints = [p for p, _, _ in paginated_endpoints + single_endpoints]
 
     run_info: Dict[str, Any] = {
@@ -932,75 +1723,68 @@ def main() -> None:
         "endpoints": json.dumps(all_endpoints, ensure_ascii=False),
         "note": "",
         "checkpoint_path": str(checkpoint_mgr.path),
+        "sync_mode": "full",
     }
 
     manifest: List[Dict[str, Any]] = []
-    conn = sqlite3.connect(tmp_path)
+    conn = sqlite3.connect(tmp_path, check_same_thread=False)
+    configure_ingest_connection(conn)
     try:
-        for path, list_key, table in paginated_endpoints:
-            writer = TableWriter(conn, table)
-            writer.load_existing()
-            if resume_state:
-                cp_entry = resume_state.get("tables", {}).get(table)
-                if cp_entry and not writer.columns and cp_entry.get("columns"):
-                    writer.columns = cp_entry.get("columns", [])
-                    writer._ensure_table_created()
-                    writer.row_count = int(cp_entry.get("rows", 0) or 0)
-                    writer.created = bool(writer.columns)
-                elif cp_entry and writer.row_count != int(cp_entry.get("rows", 0) or 0):
-                    logger.warning(
-                        "Checkpoint row count (%s) for %s differs from existing table rows (%s)",
-                        cp_entry.get("rows"),
-                        table,
-                        writer.row_count,
+        with WriterQueue() as writer_queue:
+
+            def _crawl(path: str, list_key: str, table: str, single: bool) -> None:
+                writer = TableWriter(conn, table, writer_queue)
+                writer.load_existing()
+                if resume_state:
+                    cp_entry = resume_state.get("tables", {}).get(table)
+                    if cp_entry and not writer.columns and cp_entry.get("columns"):
+                        writer.columns = cp_entry.get("columns", [])
+                        writer._ensure_table_created()
+                        writer.row_count = int(cp_entry.get("rows", 0) or 0)
+                        writer.created = bool(writer.columns)
+                    elif cp_entry and writer.row_count != int(cp_entry.get("rows", 0) or 0):
+                        logger.warning(
+                            "Checkpoint row count (%s) for %s differs from existing table rows (%s)",
+                            cp_entry.get("rows"),
+                            table,
+                            writer.row_count,
+                        )
+                writers[table] = writer
+                resume_info = checkpoint_mgr.get_table(table) if resume_state else None
+                if single:
+                    capture_single_list(
+                        client,
+                        table_state,
+                        path,
+                        list_key=list_key,
+                        writer=writer,
+                        table_name=table,
+                        log=logger,
+                        checkpoint=checkpoint_mgr,
+                        resume_info=resume_info,
                     )
-            writers[table] = writer
-            resume_info = checkpoint_mgr.get_table(table) if resume_state else None
-            capture_paginated(
-                client,
-                table_state,
-                path,
-                list_key=list_key,
-                writer=writer,
-                table_name=table,
-                log=logger,
-                checkpoint=checkpoint_mgr,
-                checkpoint_interval=max(1, args.checkpoint_interval),
-                resume_info=resume_info,
-            )
+                    return
+                capture_paginated(
+                    client,
+                    table_state,
+                    path,
+                    list_key=list_key,
+                    writer=writer,
+                    table_name=table,
+                    log=logger,
+                    checkpoint=checkpoint_mgr,
+                    checkpoint_interval=max(1, args.checkpoint_interval),
+                    resume_info=resume_info,
+                )
 
-        for path, list_key, table in single_endpoints:
-            writer = TableWriter(conn, table)
-            writer.load_existing()
-            if resume_state:
-                cp_entry = resume_state.get("tables", {}).get(table)
-                if cp_entry and not writer.columns and cp_entry.get("columns"):
-                    writer.columns = cp_entry.get("columns", [])
-                    writer._ensure_table_created()
-                    writer.row_count = int(cp_entry.get("rows", 0) or 0)
-                    writer.created = bool(writer.columns)
-                elif cp_entry and writer.row_count != int(cp_entry.get("rows", 0) or 0):
-                    logger.warning(
-                        "Checkpoint row count (%s) for %s differs from existing table rows (%s)",
-                        cp_entry.get("rows"),
-                        table,
-                        writer.row_count,
-                    )
-            writers[table] = writer
-            resume_info = checkpoint_mgr.get_table(table) if resume_state else None
-            capture_single_list(
-                client,
-                table_state,
-                path,
-                list_key=list_key,
-                writer=writer,
-                table_name=table,
-                log=logger,
-                checkpoint=checkpoint_mgr,
-                resume_info=resume_info,
+            run_crawl_jobs(
+                [(_crawl, (*endpoint, False)) for endpoint in paginated_endpoints]
+                + [(_crawl, (*endpoint, True)) for endpoint in single_endpoints],
+                args.concurrency,
             )
 
-        for table, entry in table_state.items():
+        for _, _, table in paginated_endpoints + single_endpoints:
+            entry = table_state[table]
             writer = writers.get(table)
             columns_len = len(writer.columns) if writer else 0
             manifest.append(
@@ -1012,10 +1796,8 @@ def main() -> None:
                     "errors": ";".join(entry["errors"]),
                 }
             )
-        manifest_df = pd.DataFrame(manifest)
-        manifest_df.to_sql("manifest", conn, if_exists="replace", index=False)
-
-        pd.DataFrame([run_info]).to_sql("run_info", conn, if_exists="replace", index=False)
+        replace_table(conn, "manifest", manifest)
+        replace_table(conn, "run_info", [run_info])
     finally:
         finalize_sqlite_connection(conn, log=logger)
 
@@ -1024,11 +1806,15 @@ def main() -> None:
         logger.warning("Target DB locked; new snapshot stored at %s (original left untouched)", final_db_path)
     run_info["final_db_path"] = str(final_db_path)
     with sqlite3.connect(final_db_path) as conn:
-        pd.DataFrame([run_info]).to_sql("run_info", conn, if_exists="replace", index=False)
+        replace_table(conn, "run_info", [run_info])
     try:
-        update_webform_history(Path(final_db_path), client, logger)
+        update_webform_history(Path(final_db_path), client, logger, concurrency=args.concurrency)
     except Exception as exc:  # pragma: no cover - best-effort post step
         logger.warning("webform history update failed: %s", exc)
+    try:
+        finalize_snapshot(Path(final_db_path), logger)
+    except Exception as exc:  # pragma: no cover - API warns at startup when indexes are missing
+        logger.warning("snapshot finalize (deal_fact/indexes) failed: %s", exc)
 
     history_path = record_run_history(log_dir, run_info, manifest, log_path, backup_created)
     logger.info("Run history appended to %s", history_path)
@@ -9,15 +9,19 @@ denominator/numerator datasets.
 
 import argparse
 import datetime
+import itertools
 import json
 import os
 import sqlite3
 import sys
 import urllib.parse
 
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
 try:
-    from openpyxl import Workbook
-    from openpyxl.styles import Font
+    from dashboard.server.xlsx_export import XlsxColumn, XlsxSheet, write_xlsx
 except ImportError as exc:  # pragma: no cover - helpful runtime guard
     sys.stderr.write(
         "Missing dependency: openpyxl. Install with `pip install -r requirements.txt` "
@@ -786,13 +790,10 @@ def connect_readonly(db_path: str) -> sqlite3.Connection:
     return sqlite3.connect(uri, uri=True)
 
 
-def run_query(conn: sqlite3.Connection, sql: str, params=None):
+def execute_query(conn: sqlite3.Connection, sql: str, params=None) -> sqlite3.Cursor:
     sql = sql.strip().rstrip(";")
     try:
-        cur = conn.execute(sql, params or [])
-        cols = [d[0] for d in cur.description] if cur.description else []
-        rows = cur.fetchall()
-        return cols, rows
+        return conn.execute(sql, params or [])
     except Exception as e:  # pragma: no cover - defensive logging
         print("SQLite error:", e)
         print("----- SQL BEGIN -----")
@@ -801,6 +802,12 @@ def run_query(conn: sqlite3.Connection, sql: str, params=None):
         raise
 
 
+def run_query(conn: sqlite3.Connection, sql: str, params=None):
+    cur = execute_query(conn, sql, params)
+    cols = [d[0] for d in cur.description] if cur.description else []
+    return cols, cur.fetchall()
+
+
 def rows_to_dicts(columns, rows):
     return [dict(zip(columns, row)) for row in rows]
 
@@ -832,15 +839,6 @@ def get_org_name_map(conn: sqlite3.Connection):
     return mapping
 
 
-def append_org_names(dict_rows, org_map):
-    if not org_map:
-        return dict_rows
-    for row in dict_rows:
-        org_id = row.get("org_id")
-        row["org_name"] = org_map.get(org_id, "") if org_id else ""
-    return dict_rows
-
-
 def ensure_required_columns(conn: sqlite3.Connection):
     cols = {row[1] for row in conn.execute("PRAGMA table_info(deal)")}
     missing = REQUIRED_DEAL_COLS - cols
@@ -850,7 +848,17 @@ def ensure_required_columns(conn: sqlite3.Connection):
         )
 
 
-def write_sheet(ws, dict_rows, header_order=None):
+def column_number_format(header):
+    if header in PERCENT_COLUMNS:
+        return "0.00%"
+    if header in AMOUNT_COLUMNS:
+        return "#,##0.00"
+    if header.lower().endswith("_count"):
+        return "#,##0"
+    return None
+
+
+def dict_sheet(title, dict_rows, header_order=None):
     rows = dict_rows or []
     all_keys = set()
     for r in rows:
@@ -863,33 +871,35 @@ def write_sheet(ws, dict_rows, header_order=None):
     else:
         headers = sorted(all_keys)
 
-    # Ensure at least headers
-    if not headers:
-        headers = []
-        if rows:
-            headers = sorted(rows[0].keys())
-
-    ws.append(headers)
-    header_font = Font(bold=True)
-    for cell in ws[1]:
-        cell.font = header_font
-
-    for row in rows:
-        ws.append([row.get(h, None) for h in headers])
-
-    ws.freeze_panes = "A2"
-    if ws.max_row >= 1 and ws.max_column >= 1:
-        ws.auto_filter.ref = ws.dimensions
-
-    # Number formats
-    for row in ws.iter_rows(min_row=2, max_row=ws.max_row):
-        for cell, header in zip(row, headers):
-            if header in PERCENT_COLUMNS and cell.value is not None:
-                cell.number_format = "0.00%"
-            elif header in AMOUNT_COLUMNS and cell.value is not None:
-                cell.number_format = "#,##0.00"
-            elif header.lower().endswith("_count") and cell.value is not None:
-                cell.number_format = "#,##0"
+    columns = [XlsxColumn(h, number_format=column_number_format(h)) for h in headers]
+    return XlsxSheet(title, columns, ([row.get(h, None) for h in headers] for row in rows))
+
+
+def query_sheet(conn: sqlite3.Connection, title, sql, org_map):
+    """Dataset sheet streamed straight from the cursor; org_name is (re)filled from org_map per row."""
+    cur = execute_query(conn, sql)
+    headers = [d[0] for d in cur.description] if cur.description else []
+    org_idx = headers.index("org_id") if "org_id" in headers else None
+    if org_map and "org_name" not in headers:
+        headers.append("org_name")
+    name_idx = headers.index("org_name") if org_map else None
+
+    def _rows():
+        for row in cur:
+            if name_idx is None:
+                yield row
+                continue
+            values = list(row)
+            org_id = row[org_idx] if org_idx is not None else None
+            org_name = org_map.get(org_id, "") if org_id else ""
+            if name_idx < len(values):
+                values[name_idx] = org_name
+            else:
+                values.append(org_name)
+            yield values
+
+    columns = [XlsxColumn(h, number_format=column_number_format(h)) for h in headers]
+    return XlsxSheet(title, columns, _rows())
 
 
 def build_readme_sheet_data(db_path: str, generated_at: str):
@@ -1131,20 +1141,9 @@ def main():
             "71_KPI6_DROPPED_DEALS_INVALID_DATES": QUERY_KPI6_DURATION_DROPPED_DEALS_2025_GENAI_EXCLFMT,
         }
 
-        wb = Workbook()
-        # Remove default sheet
-        default_ws = wb.active
-        wb.remove(default_ws)
-
-        # README sheet
-        ws_readme = wb.create_sheet("00_README")
         readme_rows = build_readme_sheet_data(
             args.db_path, summary["generated_at_utc"]
         )
-        write_sheet(ws_readme, readme_rows, header_order=["item", "value"])
-
-        # KPI summary sheet
-        ws_summary = wb.create_sheet("01_KPI_SUMMARY")
         summary_rows = [
             {
                 "kpi": "kpi1",
@@ -1292,24 +1291,20 @@ def main():
                 "value_pct": None,
             },
         ]
-        write_sheet(
-            ws_summary,
-            summary_rows,
-            header_order=["kpi", "metric", "value", "value_pct"],
+        sheets = [
+            dict_sheet("00_README", readme_rows, header_order=["item", "value"]),
+            dict_sheet(
+                "01_KPI_SUMMARY",
+                summary_rows,
+                header_order=["kpi", "metric", "value", "value_pct"],
+            ),
+        ]
+        # Dataset sheets: generated lazily so each query streams while its sheet is written
+        sheets_iter = itertools.chain(
+            sheets,
+            (query_sheet(conn, name, sql, org_map) for name, sql in datasets.items()),
         )
-
-        # Dataset sheets
-        for sheet_name, sql in datasets.items():
-            cols, rows = run_query(conn, sql)
-            dict_rows = rows_to_dicts(cols, rows)
-            dict_rows = append_org_names(dict_rows, org_map)
-            ws = wb.create_sheet(sheet_name)
-            header_order = list(cols)
-            if org_map and "org_name" not in header_order and "org_id" in header_order:
-                header_order.append("org_name")
-            write_sheet(ws, dict_rows, header_order=header_order)
-
-        wb.save(args.out_xlsx)
+        write_xlsx(args.out_xlsx, sheets_iter)
     finally:
         conn.close()
 
@@ -0,0 +1,479 @@
+import argparse
+import json
+import math
+import os
+import platform
+import resource
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# README-style header:
+# - Generates (or reuses) a synthetic Salesmap DB via scripts/synthetic_salesmap_db.py and benchmarks the whole
+#   /api surface in-process with FastAPI's TestClient: every APIRoute under /api (router + main.py) is discovered
+#   automatically, path params come from the busiest org/person/deal in the DB and required query params/bodies
+#   from ENDPOINT_PARAMS/ENDPOINT_BODIES below (a new endpoint with an unknown required param shows up under
+#   "skipped" instead of silently dropping out).
+# - Nightly jobs (report_scheduler risk + progress, all modes) run after the endpoints.
+# - The LLM is an httpx.MockTransport client injected with llm_client.set_client (--llm-latency-ms simulates
+#   provider latency), so agents exercise their real request/parse/fallback path without network access. The
+#   dispatcher token bucket is off by default (--llm-rate 0) so job timings measure our code, not the provider quota.
+# - cold = in-process cache_registry caches cleared, pooled SQLite connections closed and the report/LLM file
+#   caches under the bench work dir removed before the request; warm = the same request repeated afterwards.
+#   Module-level caches outside cache_registry (counterparty target file, progress universe) are not reset.
+# - Reports p50/p95 per endpoint/job, peak RSS while it ran (sampled from /proc/self/statm, ru_maxrss fallback)
+#   and writes everything to JSON (default bench_results/api_<commit>.json) for --compare / --diff between commits.
+# Usage example:
+#   python scripts/bench_api_endpoints.py --deals 100000 --db-path /tmp/salesmap_100k.db
+#   python scripts/bench_api_endpoints.py --deals 100000 --db-path /tmp/salesmap_100k.db --compare bench_results/api_abc1234.json
+#   python scripts/bench_api_endpoints.py --diff bench_results/api_abc1234.json bench_results/api_def5678.json
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+RESULT_SCHEMA = "bench-api/v1"
+RSS_SAMPLE_SEC = 0.005
+# required query params per path (optional params keep their defaults)
+ENDPOINT_PARAMS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "/api/search": lambda s: {"q": s["q"]},
+    "/api/deal-check": lambda s: {"team": "edu1"},
+    "/api/qc/deal-errors/person": lambda s: {"owner": s["owner"], "team": "all"},
+    "/api/qc/monthly-revenue-report": lambda s: {"team": "edu1", "year": 2025, "month": 3},
+    "/api/qc/monthly-revenue-report/xlsx": lambda s: {"team": "edu1", "year": 2025, "month": 3},
+    "/api/performance/monthly-amounts/deals": lambda s: {"segment": "ALL", "row": "TOTAL", "month": "2503"},
+    "/api/performance/monthly-inquiries/deals": lambda s: {"segment": "대기업", "row": "출강||생성형AI", "month": "2503"},
+    "/api/performance/monthly-close-rate/deals": lambda s: {"segment": "대기업", "row": "오프라인||total", "month": "2503"},
+    "/api/performance/pl-progress-2026/deals": lambda s: {"month": "2603", "rail": "TOTAL"},
+    "/api/rank/2025-counterparty-dri/detail": lambda s: {"orgId": s["org_id"], "upperOrg": s["upper_org"]},
+    "/api/report/counterparty-risk/recompute": lambda s: {"mode": "offline"},
+    "/api/llm/daily-report-v2/pipeline": lambda s: {"pipeline_id": "row.target_attainment"},
+}
+ENDPOINT_BODIES: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "/api/llm/target-attainment": lambda s: s["target_attainment"],
+    "/api/llm/daily-report-v2/pipeline": lambda s: s["target_attainment"],
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark every /api endpoint and the nightly jobs on a synthetic DB.")
+    parser.add_argument("--deals", type=int, default=10_000, help="Synthetic deals when the DB is generated (default: 10000)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--db-path", default=None, help="Reuse/write the synthetic DB here (default: temp file)")
+    parser.add_argument("--cold-runs", type=int, default=1, help="Cold requests per endpoint (default: 1)")
+    parser.add_argument("--warm-runs", type=int, default=5, help="Warm requests per endpoint (default: 5)")
+    parser.add_argument("--job-runs", type=int, default=1, help="Warm runs per nightly job (default: 1)")
+    parser.add_argument("--only", default=None, help="Only endpoints/jobs whose name contains this substring")
+    parser.add_argument("--skip-jobs", action="store_true", help="Do not run the nightly jobs")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="Simulated latency of the stubbed LLM")
+    parser.add_argument(
+        "--llm-rate", type=float, default=0.0, help="LLM_RATE_PER_SEC for the dispatcher token bucket (default: 0 = unlimited)"
+    )
+    parser.add_argument("--out", default=None, help="Result JSON path (default: bench_results/api_<commit>.json)")
+    parser.add_argument("--compare", default=None, help="Baseline result JSON to compare this run against")
+    parser.add_argument("--diff", nargs=2, metavar=("OLD", "NEW"), default=None, help="Only compare two result files")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative slowdown reported as regression (default: 0.2)")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0, help="Ignore slowdowns smaller than this (noise floor)")
+    return parser.parse_args()
+
+
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    idx = max(0, math.ceil(pct / 100.0 * len(ordered)) - 1)
+    return round(ordered[idx], 2)
+
+
+def _summary(samples_ms: List[float]) -> Dict[str, Any]:
+    return {
+        "runs": len(samples_ms),
+        "p50_ms": _percentile(samples_ms, 50),
+        "p95_ms": _percentile(samples_ms, 95),
+        "min_ms": round(min(samples_ms), 2) if samples_ms else None,
+        "max_ms": round(max(samples_ms), 2) if samples_ms else None,
+    }
+
+
+def _rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as fh:
+            pages = int(fh.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1_048_576
+    except (OSError, ValueError, IndexError):
+        return _max_rss_mb()
+
+
+def _max_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1_048_576 if sys.platform == "darwin" else peak / 1024
+
+
+class RssSampler:
+    """Background thread tracking the peak resident set size while the block runs."""
+
+    def __init__(self, interval: float = RSS_SAMPLE_SEC) -> None:
+        self.interval = interval
+        self.start_mb = self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak_mb = max(self.peak_mb, _rss_mb())
+
+    def __enter__(self) -> "RssSampler":
+        self.start_mb = self.peak_mb = _rss_mb()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak_mb = max(self.peak_mb, _rss_mb())
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(["git", *args], cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _stub_llm(latency_ms: float) -> Dict[str, int]:
+    import httpx
+
+    from dashboard.server.agents.core import llm_client
+
+    calls = {"count": 0}
+    content = json.dumps({"summary": "bench stub", "items": []}, ensure_ascii=False)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if latency_ms:
+            time.sleep(latency_ms / 1000.0)
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+    llm_client.set_client(httpx.Client(transport=httpx.MockTransport(handler)))
+    return calls
+
+
+def _sample_values(db_path: Path) -> Dict[str, Any]:
+    """Busiest org (most Won deals) and its busiest person/deal; the defaults every path param is filled from."""
+    from dashboard.server.markdown_compact import get_won_groups_markdown
+
+    conn = sqlite3.connect(db_path)
+    try:
+        org_id, org_name = conn.execute(
+            'SELECT d.organizationId, o."이름" FROM deal d JOIN organization o ON o.id = d.organizationId '
+            "WHERE d.\"상태\" = 'Won' GROUP BY d.organizationId ORDER BY COUNT(*) DESC, d.organizationId LIMIT 1"
+        ).fetchone()
+        person_id, upper_org = conn.execute(
+            'SELECT d.peopleId, p."소속 상위 조직" FROM deal d JOIN people p ON p.id = d.peopleId '
+            "WHERE d.organizationId = ? GROUP BY d.peopleId ORDER BY COUNT(*) DESC, d.peopleId LIMIT 1",
+            (org_id,),
+        ).fetchone()
+        deal_id, owner_json = conn.execute(
+            'SELECT id, "담당자" FROM deal WHERE peopleId = ? ORDER BY "상태" = \'Won\' DESC, id LIMIT 1', (person_id,)
+        ).fetchone()
+    finally:
+        conn.close()
+    markdown = get_won_groups_markdown(org_id, upper_org, db_path=db_path)
+    return {
+        "org_id": org_id,
+        "org_name": org_name,
+        "person_id": person_id,
+        "deal_id": deal_id,
+        "upper_org": upper_org,
+        "owner": json.loads(owner_json)["name"],
+        "q": org_name[:2],
+        "target_attainment": {
+            "orgId": org_id,
+            "orgName": org_name,
+            "upperOrg": upper_org,
+            "mode": "offline",
+            "target_2026": 300_000_000,
+            "actual_2026": 120_000_000,
+            "won_group_markdown": markdown,
+        },
+    }
+
+
+def _iter_api_routes(routes: List[Any]) -> Iterator[Any]:
+    from fastapi.routing import APIRoute
+
+    for route in routes:
+        if isinstance(route, APIRoute):
+            yield route
+        elif hasattr(route, "original_router"):
+            # newer FastAPI keeps included routers as one lazy entry instead of copying their routes
+            yield from _iter_api_routes(route.original_router.routes)
+
+
+def _discover_endpoints(app: Any, samples: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    endpoints: List[Dict[str, Any]] = []
+    skipped: List[Dict[str, Any]] = []
+    for route in _iter_api_routes(app.routes):
+        if not route.path.startswith("/api"):
+            continue
+        for method in sorted(route.methods or ()):
+            name = f"{method} {route.path}"
+            params = ENDPOINT_PARAMS.get(route.path, lambda s: {})(samples)
+            missing = [
+                p.name for p in route.dependant.query_params if p.field_info.is_required() and p.name not in params
+            ]
+            body = ENDPOINT_BODIES.get(route.path)
+            if route.dependant.body_params and body is None:
+                missing.append("<body>")
+            try:
+                url = route.path.format(**samples)
+            except KeyError as exc:
+                missing.append(f"{{{exc.args[0]}}}")
+                url = route.path
+            if missing:
+                skipped.append({"name": name, "reason": f"no sample for {', '.join(missing)}"})
+                continue
+            endpoints.append(
+                {"name": name, "method": method, "url": url, "params": params, "json": body(samples) if body else None}
+            )
+    return endpoints, skipped
+
+
+def _reset_cold(work_dir: Path, db_path: Path) -> None:
+    from dashboard.server import cache_registry, db_pool
+
+    cache_registry.clear_all()
+    db_pool.release(db_path)
+    shutil.rmtree(work_dir / "report_cache", ignore_errors=True)
+
+
+def _measure(
+    run: Callable[[], Tuple[Any, int]], reset: Callable[[], None], cold_runs: int, warm_runs: int
+) -> Dict[str, Any]:
+    cold: List[float] = []
+    warm: List[float] = []
+    outcomes: List[Any] = []
+    size = 0
+    with RssSampler() as rss:
+        for _ in range(cold_runs):
+            reset()
+            started = time.perf_counter()
+            outcome, size = run()
+            cold.append((time.perf_counter() - started) * 1000.0)
+            outcomes.append(outcome)
+        for _ in range(warm_runs):
+            started = time.perf_counter()
+            outcome, size = run()
+            warm.append((time.perf_counter() - started) * 1000.0)
+            outcomes.append(outcome)
+    return {
+        "outcome": sorted(set(outcomes), key=str),
+        "bytes": size,
+        "cold": _summary(cold),
+        "warm": _summary(warm),
+        "peak_rss_mb": round(rss.peak_mb, 1),
+        "rss_growth_mb": round(rss.peak_mb - rss.start_mb, 1),
+    }
+
+
+def _job_outcome(result: Dict[str, Any]) -> str:
+    codes = sorted({str(v.get("result")) for v in result.values() if isinstance(v, dict)})
+    return ",".join(codes) or "UNKNOWN"
+
+
+def _configure_env(args: argparse.Namespace, db_path: Path, work_dir: Path) -> None:
+    # database/deal_normalizer/report_scheduler read these at import time (DB_PATH is also a default argument),
+    # so this runs before anything under dashboard.server is imported -- including the generator
+    os.environ.update(
+        {
+            "DB_PATH": str(db_path),
+            "CACHE_DIR": str(work_dir / "report_cache"),
+            "WORK_DIR": str(work_dir / "report_work"),
+            "DB_STABLE_WINDOW_SEC": "0",
+            "DB_RETRY": "1",
+            "ENABLE_SCHEDULER": "0",
+            "ENABLE_CACHE_WARMUP": "0",
+            "LLM_PROVIDER": "openai",
+            "OPENAI_API_KEY": "bench-stub",
+            "LLM_BASE_URL": "http://llm-stub.invalid/v1",
+            "LLM_RATE_PER_SEC": str(args.llm_rate),
+        }
+    )
+    os.environ.pop("WON_GROUPS_CACHE_DIR", None)
+
+
+def run_bench(args: argparse.Namespace, db_path: Path, work_dir: Path) -> Dict[str, Any]:
+    from fastapi.testclient import TestClient
+
+    from dashboard.server import report_scheduler
+    from dashboard.server.main import app
+
+    llm_calls = _stub_llm(args.llm_latency_ms)
+    samples = _sample_values(db_path)
+    endpoints, skipped = _discover_endpoints(app, samples)
+    client = TestClient(app)  # no `with`: startup hooks (scheduler, warmer) stay off
+    reset = lambda: _reset_cold(work_dir, db_path)  # noqa: E731
+
+    endpoint_results: List[Dict[str, Any]] = []
+    for ep in endpoints:
+        if args.only and args.only not in ep["name"]:
+            continue
+
+        def call(ep: Dict[str, Any] = ep) -> Tuple[int, int]:
+            resp = client.request(ep["method"], ep["url"], params=ep["params"], json=ep["json"])
+            return resp.status_code, len(resp.content)
+
+        result = _measure(call, reset, args.cold_runs, args.warm_runs)
+        endpoint_results.append({"name": ep["name"], "url": ep["url"], "params": ep["params"], **result})
+        print(
+            f"[bench] {ep['name']:<62} status={','.join(map(str, result['outcome']))} "
+            f"cold p50={result['cold']['p50_ms']}ms warm p50={result['warm']['p50_ms']} p95={result['warm']['p95_ms']}ms "
+            f"rss={result['peak_rss_mb']}MB"
+        )
+    for item in skipped:
+        print(f"[bench] skipped {item['name']}: {item['reason']}")
+
+    job_results: List[Dict[str, Any]] = []
+    jobs = [
+        ("job counterparty_risk_all_modes", lambda: report_scheduler.run_daily_counterparty_risk_job_all_modes(force=True)),
+        ("job counterparty_progress_all_modes", lambda: report_scheduler.run_daily_counterparty_progress_job_all_modes(force=True)),
+    ]
+    for name, job in [] if args.skip_jobs else jobs:
+        if args.only and args.only not in name:
+            continue
+        result = _measure(lambda job=job: (_job_outcome(job()), 0), reset, 1, args.job_runs)
+        job_results.append({"name": name, **result})
+        print(
+            f"[bench] {name:<62} result={','.join(result['outcome'])} cold={result['cold']['p50_ms']}ms "
+            f"warm p50={result['warm']['p50_ms']}ms rss={result['peak_rss_mb']}MB"
+        )
+
+    return {
+        "endpoints": endpoint_results,
+        "jobs": job_results,
+        "skipped": skipped,
+        "llm_stub": {"latency_ms": args.llm_latency_ms, "calls": llm_calls["count"]},
+        "samples": {k: v for k, v in samples.items() if k != "target_attainment"},
+    }
+
+
+def _db_meta(db_path: Path) -> Dict[str, Any]:
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = {
+            table: conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+            for table in ("organization", "people", "deal", "memo", "webform_history")
+        }
+        run_tag = conn.execute("SELECT run_tag FROM run_info LIMIT 1").fetchone()[0]
+    finally:
+        conn.close()
+    return {"path": str(db_path), "size_bytes": db_path.stat().st_size, "run_tag": run_tag, "rows": rows}
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if data.get("schema") != RESULT_SCHEMA:
+        raise ValueError(f"{path}: unexpected schema {data.get('schema')!r}")
+    return data
+
+
+def compare_results(old: Dict[str, Any], new: Dict[str, Any], threshold: float, min_delta_ms: float) -> List[str]:
+    """Print a per-name comparison (warm/cold p50, peak RSS); returns the names that regressed."""
+    old_rows = {r["name"]: r for r in old["endpoints"] + old["jobs"]}
+    regressions: List[str] = []
+    print(f"[compare] {old['meta']['git_commit'] or '?'} -> {new['meta']['git_commit'] or '?'}")
+    if old["meta"]["db"]["rows"] != new["meta"]["db"]["rows"]:
+        print("[compare] warning: DB row counts differ, latencies are not directly comparable")
+    for row in new["endpoints"] + new["jobs"]:
+        before = old_rows.get(row["name"])
+        if before is None:
+            print(f"[compare] {row['name']:<62} new")
+            continue
+        flags: List[str] = []
+        parts: List[str] = []
+        for phase in ("warm", "cold"):
+            a, b = before[phase]["p50_ms"], row[phase]["p50_ms"]
+            if a is None or b is None:
+                continue
+            parts.append(f"{phase} {a}->{b}ms ({(b - a) / a * 100 if a else 0:+.0f}%)")
+            if b - a > min_delta_ms and b > a * (1 + threshold):
+                flags.append(phase)
+        parts.append(f"rss {before['peak_rss_mb']}->{row['peak_rss_mb']}MB")
+        if row["outcome"] != before["outcome"]:
+            parts.append(f"outcome {before['outcome']}->{row['outcome']}")
+        if flags:
+            regressions.append(row["name"])
+        marker = "REGRESSION " if flags else ""
+        print(f"[compare] {marker}{row['name']:<62} " + "  ".join(parts))
+    for name in sorted(set(old_rows) - {r["name"] for r in new["endpoints"] + new["jobs"]}):
+        print(f"[compare] {name:<62} removed")
+    print(f"[compare] {len(regressions)} regression(s) over {threshold:.0%} / {min_delta_ms}ms")
+    return regressions
+
+
+def main() -> None:
+    args = parse_args()
+    if args.diff:
+        compare_results(load_results(Path(args.diff[0])), load_results(Path(args.diff[1])), args.threshold, args.min_delta_ms)
+        return
+
+    commit = _git("rev-parse", "--short", "HEAD")
+    dirty = bool(_git("status", "--porcelain", "--untracked-files=no"))
+    out_path = Path(args.out) if args.out else REPO_ROOT / "bench_results" / f"api_{commit or 'nogit'}{'-dirty' if dirty else ''}.json"
+    baseline = load_results(Path(args.compare)) if args.compare else None
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        work_dir = Path(tmpdir)
+        db_path = Path(args.db_path).resolve() if args.db_path else work_dir / "synthetic.db"
+        _configure_env(args, db_path, work_dir)
+        sys.path.insert(0, str(Path(__file__).resolve().parent))
+        from synthetic_salesmap_db import build_synthetic_db
+
+        generated_sec = None
+        if not db_path.exists():
+            started = time.perf_counter()
+            build_synthetic_db(db_path, args.deals, seed=args.seed)
+            generated_sec = round(time.perf_counter() - started, 2)
+            print(f"[bench] synthetic db: deals={args.deals} ({generated_sec}s) -> {db_path}")
+        db_meta = {**_db_meta(db_path), "generated_sec": generated_sec}
+
+        cwd = os.getcwd()
+        os.chdir(work_dir)  # agents write report_cache/llm relative to the cwd
+        try:
+            bench = run_bench(args, db_path, work_dir)
+        finally:
+            os.chdir(cwd)
+
+    result = {
+        "schema": RESULT_SCHEMA,
+        "meta": {
+            "git_commit": commit,
+            "git_dirty": dirty,
+            "created_at_utc": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "args": {k: v for k, v in vars(args).items() if k not in {"compare", "diff"}},
+            "db": db_meta,
+            "llm_stub": bench.pop("llm_stub"),
+            "peak_rss_mb": round(_max_rss_mb(), 1),
+        },
+        **bench,
+    }
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(result, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    print(f"[bench] {len(result['endpoints'])} endpoints, {len(result['jobs'])} jobs, peak RSS {result['meta']['peak_rss_mb']}MB -> {out_path}")
+    if baseline is not None:
+        compare_results(baseline, result, args.threshold, args.min_delta_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import argparse
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# README-style header:
+# - Builds a synthetic Salesmap-shaped SQLite DB (organization/people/deal) with --deals rows.
+# - Runs build_deal_norm → build_org_tier → build_counterparty_target_2026 → build_counterparty_risk_rule.
+# - Times the legacy per-counterparty top-deal query (N+1, unindexed deal_norm) against
+#   deal_normalizer.fetch_top_deals_2026 (single ROW_NUMBER window, indexed) and checks both agree.
+# Usage example:
+#   python scripts/bench_counterparty_risk_top_deals.py --deals 100000 --mode offline
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from dashboard.server import counterparty_llm as cllm  # noqa: E402
+from dashboard.server import deal_normalizer as dn  # noqa: E402
+
+FORMATS = ["집합교육", "출강", "구독제(온라인)", "선택구매(온라인)", "복합(출강+온라인)"]
+STATUSES = ["Won", "Won", "Open", "Open", "Lost", "Convert"]
+PROBABILITIES = [None, "높음", "확정", "낮음"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark top-deal lookup in build_counterparty_risk_report.")
+    parser.add_argument("--deals", type=int, default=100_000, help="Number of synthetic deals (default: 100000)")
+    parser.add_argument("--orgs", type=int, default=2_000, help="Number of synthetic organizations")
+    parser.add_argument("--counterparties-per-org", type=int, default=4, help="Upper-org names per organization")
+    parser.add_argument("--mode", choices=["offline", "online"], default="offline")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--db-path", default=None, help="Reuse/write the synthetic DB here (default: temp file)")
+    return parser.parse_args()
+
+
+def build_synthetic_db(path: Path, deals: int, orgs: int, cps_per_org: int, seed: int) -> None:
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        DROP TABLE IF EXISTS organization;
+        DROP TABLE IF EXISTS people;
+        DROP TABLE IF EXISTS deal;
+        CREATE TABLE organization (id TEXT, "이름" TEXT);
+        CREATE TABLE people (id TEXT, organizationId TEXT, "이름" TEXT, "소속 상위 조직" TEXT);
+        CREATE TABLE deal (
+            id TEXT, peopleId TEXT, organizationId TEXT, "이름" TEXT, "상태" TEXT, "과정포맷" TEXT,
+            "금액" TEXT, "예상 체결액" TEXT, "계약 체결일" TEXT, "수주 예정일" TEXT,
+            "수강시작일" TEXT, "수강종료일" TEXT, "코스 ID" TEXT, "성사 가능성" TEXT
+        );
+        """
+    )
+    conn.executemany(
+        'INSERT INTO organization VALUES (?, ?)',
+        [(f"org{i}", f"기업{i}") for i in range(orgs)],
+    )
+    people = []
+    for i in range(orgs):
+        for j in range(cps_per_org):
+            people.append((f"p{i}_{j}", f"org{i}", f"사람{i}_{j}", f"본부{j}"))
+    conn.executemany('INSERT INTO people VALUES (?, ?, ?, ?)', people)
+
+    deal_rows = []
+    for n in range(deals):
+        org = rng.randrange(orgs)
+        cp = rng.randrange(cps_per_org)
+        year = rng.choice([2025, 2025, 2026, 2026, 2024])
+        month = rng.randint(1, 12)
+        date_str = f"{year}-{month:02d}-{rng.randint(1, 28):02d}"
+        status = rng.choice(STATUSES)
+        amount = str(rng.randrange(1, 500) * 1_000_000)
+        deal_rows.append(
+            (
+                f"d{n}",
+                f"p{org}_{cp}",
+                f"org{org}",
+                f"딜{n}",
+                status,
+                rng.choice(FORMATS),
+                amount,
+                None,
+                date_str if status == "Won" else None,
+                date_str,
+                date_str,
+                date_str,
+                f"C{n}" if status == "Won" else None,
+                rng.choice(PROBABILITIES),
+            )
+        )
+    conn.executemany('INSERT INTO deal VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)', deal_rows)
+    conn.commit()
+    conn.close()
+
+
+def legacy_top_deals(conn: sqlite3.Connection, mode: str, risk_table: str) -> Dict[Tuple[str, str], List[str]]:
+    """Pre-change behaviour: one deal_norm query per counterparty row."""
+    deals_mode_condition = "is_nononline = 1" if mode == dn.MODE_OFFLINE else "is_online = 1"
+    result: Dict[Tuple[str, str], List[str]] = {}
+    for r in conn.execute(f'SELECT organization_id, counterparty_name FROM "{risk_table}"').fetchall():
+        deals = conn.execute(
+            f"""
+            SELECT deal_id
+            FROM deal_norm
+            WHERE organization_id = ?
+              AND counterparty_name = ?
+              AND deal_year = 2026
+              AND {deals_mode_condition}
+              AND status NOT IN ('Convert','Lost')
+            ORDER BY CAST(amount_value AS INTEGER) DESC, deal_id ASC
+            LIMIT ?
+            """,
+            (r["organization_id"], r["counterparty_name"], cllm.TOP_DEALS_LIMIT),
+        ).fetchall()
+        if deals:
+            result[(r["organization_id"], r["counterparty_name"])] = [d["deal_id"] for d in deals]
+    return result
+
+
+def _timed(fn: Any, *args: Any, **kwargs: Any) -> Tuple[Any, float]:
+    started = time.perf_counter()
+    value = fn(*args, **kwargs)
+    return value, time.perf_counter() - started
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(args.db_path) if args.db_path else Path(tmpdir) / "synthetic.db"
+        if not db_path.exists():
+            _, gen_sec = _timed(build_synthetic_db, db_path, args.deals, args.orgs, args.counterparties_per_org, args.seed)
+            print(f"[bench] synthetic db: deals={args.deals} orgs={args.orgs} ({gen_sec:.2f}s) -> {db_path}")
+
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        _, norm_sec = _timed(dn.build_deal_norm, conn)
+        dn.build_org_tier(conn, as_of_date="2026-04-15")
+        dn.build_counterparty_target_2026(conn, mode_key=args.mode)
+        risk_info, rule_sec = _timed(dn.build_counterparty_risk_rule, conn, as_of_date="2026-04-15", mode_key=args.mode)
+        counterparties = conn.execute(f'SELECT COUNT(*) FROM "{risk_info["table"]}"').fetchone()[0]
+        print(f"[bench] deal_norm {norm_sec:.2f}s, risk rule {rule_sec:.2f}s, counterparties={counterparties}")
+
+        windowed, window_sec = _timed(dn.fetch_top_deals_2026, conn, mode_key=args.mode, risk_table=risk_info["table"])
+
+        # legacy path ran against an unindexed TEMP deal_norm
+        for (name,) in conn.execute("SELECT name FROM sqlite_temp_master WHERE type = 'index' AND tbl_name = 'deal_norm'").fetchall():
+            conn.execute(f'DROP INDEX "{name}"')
+        legacy, legacy_sec = _timed(legacy_top_deals, conn, args.mode, risk_info["table"])
+        conn.close()
+
+        same = {k: [d["deal_id"] for d in v] for k, v in windowed.items()} == legacy
+        speedup = legacy_sec / window_sec if window_sec else float("inf")
+        print(f"[bench] legacy N+1: {legacy_sec:.3f}s  windowed: {window_sec:.3f}s  speedup x{speedup:.1f}  identical={same}")
+        if not same:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
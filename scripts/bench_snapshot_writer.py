@@ -0,0 +1,135 @@
+import argparse
+import json
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+# README-style header:
+# - Generates Salesmap-shaped API pages (deal-like records: ~30 scalar fields, nested owner/tag objects,
+#   a few sparse columns that appear mid-stream) without holding the whole table in memory.
+# - Writes them page by page through the legacy pandas path (DataFrame + to_sql append, default journal,
+#   one commit per page) and through TableWriter (executemany, journal_mode/synchronous OFF, one transaction).
+# - Prints rows/sec for both and checks row counts and ids agree.
+# Usage example:
+#   python scripts/bench_snapshot_writer.py --rows 200000 --page-size 100
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+import pandas as pd  # noqa: E402
+
+import salesmap_first_page_snapshot as snap  # noqa: E402
+
+STATUSES = ["Won", "Open", "Lost", "Convert"]
+FORMATS = ["집합교육", "출강", "구독제(온라인)", "선택구매(온라인)"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark snapshot ingest: pandas to_sql vs executemany TableWriter.")
+    parser.add_argument("--rows", type=int, default=100_000, help="Synthetic records to write (default: 100000)")
+    parser.add_argument("--page-size", type=int, default=100, help="Records per API page (default: 100)")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def iter_pages(rows: int, page_size: int, seed: int) -> Iterator[List[Dict[str, Any]]]:
+    rng = random.Random(seed)
+    page: List[Dict[str, Any]] = []
+    for n in range(rows):
+        record: Dict[str, Any] = {
+            "id": f"d{n}",
+            "organizationId": f"org{rng.randrange(5000)}",
+            "peopleId": f"p{rng.randrange(20000)}",
+            "이름": f"딜{n}",
+            "상태": rng.choice(STATUSES),
+            "과정포맷": rng.choice(FORMATS),
+            "금액": rng.randrange(1, 500) * 1_000_000,
+            "예상 체결액": None if rng.random() < 0.5 else rng.randrange(1, 500) * 1_000_000,
+            "계약 체결일": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "담당자": {"id": f"u{rng.randrange(50)}", "name": f"담당{rng.randrange(50)}"},
+            "태그": [f"t{rng.randrange(9)}" for _ in range(rng.randrange(3))],
+            "updatedAt": f"2025-{rng.randint(1, 12):02d}-01T00:00:00.000Z",
+        }
+        for i in range(18):
+            record[f"필드{i}"] = f"값{rng.randrange(1000)}"
+        if n > rows // 2 and rng.random() < 0.1:
+            record["후반 추가 필드"] = "late"
+        page.append(record)
+        if len(page) == page_size:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+def legacy_write(db_path: Path, pages: Iterator[List[Dict[str, Any]]]) -> int:
+    """Pre-change TableWriter.write_batch: normalize → DataFrame → to_sql append (commit per page)."""
+    conn = sqlite3.connect(db_path)
+    columns: List[str] = []
+    total = 0
+    for records in pages:
+        if not columns:
+            columns = snap.collect_columns(records)
+            conn.execute("CREATE TABLE deal (" + ", ".join(f'"{c}" TEXT' for c in columns) + ")")
+        for col in snap.collect_columns(records):
+            if col not in columns:
+                conn.execute(f'ALTER TABLE deal ADD COLUMN "{col}"')
+                columns.append(col)
+        df = pd.DataFrame(snap.normalize_records(records, columns), columns=columns)
+        df.to_sql("deal", conn, if_exists="append", index=False)
+        total += len(records)
+    conn.close()
+    return total
+
+
+def fast_write(db_path: Path, pages: Iterator[List[Dict[str, Any]]]) -> int:
+    conn = sqlite3.connect(db_path)
+    snap.configure_ingest_connection(conn, resumable=False)
+    writer = snap.TableWriter(conn, "deal")
+    for records in pages:
+        writer.write_batch(records)
+    writer.commit()
+    conn.close()
+    return writer.row_count
+
+
+def _timed(fn: Any, *args: Any) -> Tuple[Any, float]:
+    started = time.perf_counter()
+    value = fn(*args)
+    return value, time.perf_counter() - started
+
+
+def _ids(db_path: Path) -> Tuple[int, str]:
+    with sqlite3.connect(db_path) as conn:
+        count = conn.execute("SELECT COUNT(*) FROM deal").fetchone()[0]
+        digest = json.dumps(conn.execute("SELECT id FROM deal ORDER BY rowid LIMIT 5").fetchall())
+    return count, digest
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        legacy_db = Path(tmpdir) / "legacy.db"
+        fast_db = Path(tmpdir) / "fast.db"
+        _, gen_sec = _timed(lambda pages: sum(len(p) for p in pages), iter_pages(args.rows, args.page_size, args.seed))
+        legacy_rows, legacy_sec = _timed(legacy_write, legacy_db, iter_pages(args.rows, args.page_size, args.seed))
+        fast_rows, fast_sec = _timed(fast_write, fast_db, iter_pages(args.rows, args.page_size, args.seed))
+        same = _ids(legacy_db) == _ids(fast_db) and legacy_rows == fast_rows
+        # page generation is timed on its own and subtracted so rows/s reflects the write path only
+        legacy_sec = max(legacy_sec - gen_sec, 1e-9)
+        fast_sec = max(fast_sec - gen_sec, 1e-9)
+        print(f"[bench] rows={args.rows} page_size={args.page_size} (page generation {gen_sec:.2f}s excluded)")
+        print(f"[bench] pandas to_sql: {legacy_sec:.2f}s ({legacy_rows / legacy_sec:,.0f} rows/s)")
+        print(f"[bench] executemany:   {fast_sec:.2f}s ({fast_rows / fast_sec:,.0f} rows/s)")
+        print(f"[bench] speedup x{legacy_sec / fast_sec:.1f}  identical_ids={same}")
+        if not same:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,7 @@ import sys
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
-
-from openpyxl import Workbook
-from openpyxl.styles import Font
-from openpyxl.utils import get_column_letter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 # README-style header:
 # - Filters organizations by inferred sizeGroup (default: 중견기업) using dashboard.server.database.infer_size_group when available.
@@ -17,7 +13,7 @@ from openpyxl.utils import get_column_letter
 # - Merges people info from lead (priority), memo (raw text key:value parse), people table (fallback).
 # - Detects consent/phone/email/job/title/sequence from lead columns (auto keyword match) or memo text keys.
 # - Supports stub people from deals if missing in people table.
-# - Writes Excel with midmarket_people sheet; won amounts kept in 원 단위 with numeric formatting.
+# - Writes Excel with midmarket_people sheet (streaming write-only, dashboard.server.xlsx_export); won amounts kept in 원 단위 with numeric formatting.
 # Usage example:
 #   python scripts/export_midmarket_people.py --db-path salesmap_latest.db --size-group 중견기업 --years 2023,2024,2025 --out exports/midmarket_people.xlsx
 
@@ -25,6 +21,8 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.append(str(REPO_ROOT))
 
+from dashboard.server.xlsx_export import XlsxColumn, XlsxSheet, write_xlsx
+
 try:
     from dashboard.server.database import infer_size_group as _infer_size_group
 except Exception:
@@ -439,8 +437,7 @@ def merge_contact(base: Dict[str, Any], lead: Optional[Dict[str, Any]], memo: Op
     return result
 
 
-def build_rows(orgs: Dict[str, Dict[str, Any]], people: Dict[str, Dict[str, Any]], won_people: Dict[str, set], totals: Dict[str, Dict[str, float]], lead_by_pid: Dict[str, Dict[str, Any]], lead_by_org: Dict[str, Dict[str, Any]], memo_by_pid: Dict[str, Dict[str, Any]], memo_by_org: Dict[str, Dict[str, Any]], years: Sequence[str]) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
+def build_rows(orgs: Dict[str, Dict[str, Any]], people: Dict[str, Dict[str, Any]], won_people: Dict[str, set], totals: Dict[str, Dict[str, float]], lead_by_pid: Dict[str, Dict[str, Any]], lead_by_org: Dict[str, Dict[str, Any]], memo_by_pid: Dict[str, Dict[str, Any]], memo_by_org: Dict[str, Dict[str, Any]], years: Sequence[str]) -> Iterator[Dict[str, Any]]:
     for org_id, org_meta in orgs.items():
         people_ids = set(pid for pid, pdata in people.items() if pdata.get("orgId") == org_id)
         people_ids.update(won_people.get(org_id, set()))
@@ -461,59 +458,42 @@ def build_rows(orgs: Dict[str, Dict[str, Any]], people: Dict[str, Dict[str, Any]
                 "wonAmountTotal2325": int(sum(won.values())),
                 **merged,
             }
-            rows.append(row)
-    return rows
-
-
-def write_excel(rows: List[Dict[str, Any]], out_path: Path) -> None:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "midmarket_people"
-    headers = [
-        "orgId",
-        "orgName",
-        "sizeRaw",
-        "sizeGroup",
-        "industryMajor",
-        "industryMid",
-        "orgPhone",
-        "wonAmount2023",
-        "wonAmount2024",
-        "wonAmount2025",
-        "wonAmountTotal2325",
-        "personId",
-        "personName",
-        "personTitle",
-        "personJob",
-        "personEmail",
-        "personPhone",
-        "inSequence",
-        "marketingConsent",
-        "lastContactSource",
-        "lastContactAt",
+            yield row
+
+
+HEADERS = [
+    "orgId",
+    "orgName",
+    "sizeRaw",
+    "sizeGroup",
+    "industryMajor",
+    "industryMid",
+    "orgPhone",
+    "wonAmount2023",
+    "wonAmount2024",
+    "wonAmount2025",
+    "wonAmountTotal2325",
+    "personId",
+    "personName",
+    "personTitle",
+    "personJob",
+    "personEmail",
+    "personPhone",
+    "inSequence",
+    "marketingConsent",
+    "lastContactSource",
+    "lastContactAt",
+]
+WON_COLUMNS = {"wonAmount2023", "wonAmount2024", "wonAmount2025", "wonAmountTotal2325"}
+
+
+def write_excel(rows: Iterable[Dict[str, Any]], out_path: Path) -> None:
+    columns = [
+        XlsxColumn(h, width=max(len(h), 12), number_format="#,##0" if h in WON_COLUMNS else None) for h in HEADERS
     ]
-    ws.append(headers)
-    bold = Font(bold=True)
-    for cell in ws[1]:
-        cell.font = bold
-    for row in rows:
-        ws.append([row.get(h, "") for h in headers])
-    ws.freeze_panes = "A2"
-    ws.auto_filter.ref = ws.dimensions
-
-    won_cols = [headers.index("wonAmount2023") + 1, headers.index("wonAmount2024") + 1, headers.index("wonAmount2025") + 1, headers.index("wonAmountTotal2325") + 1]
-    for col_idx in won_cols:
-        for cell in ws.iter_cols(min_col=col_idx, max_col=col_idx, min_row=2):
-            for c in cell:
-                c.number_format = "#,##0"
-
-    for i, header in enumerate(headers, start=1):
-        width = max(len(header), 12)
-        ws.column_dimensions[get_column_letter(i)].width = width
-
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(out_path)
-    print(f"[export] Wrote {out_path}")
+    sheet = XlsxSheet("midmarket_people", columns, ([row.get(h, "") for h in HEADERS] for row in rows))
+    write_xlsx(out_path, [sheet])
+    print(f"[export] Wrote {out_path} ({sheet.row_count} rows)")
 
 
 def main():
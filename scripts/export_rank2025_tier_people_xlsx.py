@@ -4,8 +4,6 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Sequence, Tuple
 
-import pandas as pd
-
 # Ensure repository root is importable
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
@@ -13,6 +11,7 @@ if str(REPO_ROOT) not in sys.path:
 
 # Reuse existing DB logic (grade calculation, constants, helpers)
 from dashboard.server import database as db
+from dashboard.server.xlsx_export import XlsxCell, XlsxColumn, XlsxSheet, write_xlsx
 
 TIERS = ["S0", "P0", "P1", "P2"]
 HEADERS = [
@@ -33,6 +32,12 @@ HEADERS = [
     "2024 딜 카드 예시",
     "2025 딜카드 예시",
 ]
+HIGHLIGHT_IF_BLANK = [
+    "people의 소속 상위 조직",
+    "people의 팀(명함/메일서명)",
+    "people의 직급(명함/메일서명)",
+    "people의 '담당 교육 영역'",
+]
 
 BASE_URL = (os.getenv("SALESMAP_WEB_BASE") or "https://salesmap.kr/64cb5beda5a78ae225d7815b").rstrip(
     "/"
@@ -195,7 +200,7 @@ def export_rank2025_tier_people(db_path: Path, out_path: Path, size: str) -> Non
             f"{_q(created_col)} AS created_raw "
             "FROM deal "
             "WHERE peopleId IS NOT NULL"
-        ).fetchall()
+        )
 
         eligible_people: set[str] = set()
         stats_by_people: Dict[str, Dict[str, Any]] = {}
@@ -287,60 +292,32 @@ def export_rank2025_tier_people(db_path: Path, out_path: Path, size: str) -> Non
     rows = [r for r, _ in entries_sorted]
     link_meta = [meta for _, meta in entries_sorted]
 
-    df = pd.DataFrame(rows, columns=HEADERS)
-    df.to_excel(out_path, index=False, engine="openpyxl")
-
-    # Post-processing: freeze header, autofilter, column width, hyperlinks, highlighting
-    from openpyxl import load_workbook
-    from openpyxl.styles import PatternFill
-
-    wb = load_workbook(out_path)
-    ws = wb.active
-    ws.freeze_panes = "A2"
-    ws.auto_filter.ref = ws.dimensions
-    header_map = {cell.value: cell.column_letter for cell in ws[1]}
-    people_col = header_map.get("people의 이름")
-    deal24_col = header_map.get("2024 딜 카드 예시")
-    deal25_col = header_map.get("2025 딜카드 예시")
-    highlight_cols = [
-        header_map.get("people의 소속 상위 조직"),
-        header_map.get("people의 팀(명함/메일서명)"),
-        header_map.get("people의 직급(명함/메일서명)"),
-        header_map.get("people의 '담당 교육 영역'"),
-    ]
-    yellow = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-
-    for idx, meta in enumerate(link_meta, start=2):  # Excel rows start at 2 (after header)
-        if people_col:
-            cell = ws[f"{people_col}{idx}"]
+    # Column widths fit the longest value (header included), clamped to [12, 40]
+    widths = []
+    for header in HEADERS:
+        max_len = max([len(header)] + [len(str(row[header])) for row in rows if row[header] is not None])
+        widths.append(min(max(max_len + 2, 12), 40))
+    columns = [XlsxColumn(header, width=width) for header, width in zip(HEADERS, widths)]
+
+    def _sheet_rows():
+        for row, meta in zip(rows, link_meta):
+            values: List[Any] = [row[h] for h in HEADERS]
             url = _build_people_link(meta.get("people_id", ""))
             if url:
-                cell.hyperlink = url
-                cell.style = "Hyperlink"
-        if deal24_col and meta.get("deal24_id"):
-            cell = ws[f"{deal24_col}{idx}"]
-            url = _build_deal_link(meta["deal24_id"])
-            if url and cell.value != "딜 부재":
-                cell.hyperlink = url
-                cell.style = "Hyperlink"
-        if deal25_col and meta.get("deal25_id"):
-            cell = ws[f"{deal25_col}{idx}"]
-            url = _build_deal_link(meta["deal25_id"])
-            if url and cell.value != "딜 부재":
-                cell.hyperlink = url
-                cell.style = "Hyperlink"
-        for col_letter in highlight_cols:
-            if not col_letter:
-                continue
-            c = ws[f"{col_letter}{idx}"]
-            if c.value is None or str(c.value).strip() == "":
-                c.fill = yellow
-
-    for col_cells in ws.columns:
-        max_len = max(len(str(cell.value)) if cell.value is not None else 0 for cell in col_cells)
-        col_letter = col_cells[0].column_letter
-        ws.column_dimensions[col_letter].width = min(max(max_len + 2, 12), 40)
-    wb.save(out_path)
+                idx = HEADERS.index("people의 이름")
+                values[idx] = XlsxCell(values[idx], hyperlink=url, style="Hyperlink")
+            for header, key in (("2024 딜 카드 예시", "deal24_id"), ("2025 딜카드 예시", "deal25_id")):
+                url = _build_deal_link(meta[key]) if meta.get(key) else None
+                idx = HEADERS.index(header)
+                if url and values[idx] != "딜 부재":
+                    values[idx] = XlsxCell(values[idx], hyperlink=url, style="Hyperlink")
+            for header in HIGHLIGHT_IF_BLANK:
+                idx = HEADERS.index(header)
+                if values[idx] is None or str(values[idx]).strip() == "":
+                    values[idx] = XlsxCell(values[idx], fill_color="FFFF00")
+            yield values
+
+    write_xlsx(out_path, [XlsxSheet("Sheet1", columns, _sheet_rows())])
     print(
         f"[export] tier orgs: {len(filtered)}, people (eligible rows): {len(rows)}, written: {out_path}"
     )
@@ -0,0 +1,526 @@
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import time
+from bisect import bisect_right
+from datetime import date, datetime, timezone
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# README-style header:
+# - Writes a Salesmap-shaped SQLite snapshot (organization/people/deal/memo/webform_history + run_info) with the
+#   real Korean column names at production scale (10k–1M deals), deterministic for a given --seed.
+# - Distributions follow the live data: deal volume is long-tailed per organization (a few 대기업 own most deals),
+#   owners come from database.PART_STRUCTURE so deal-check/QC/performance team filters match, statuses carry
+#   the date/amount/probability fields the QC rules expect, and webform submissions appear both in
+#   people."제출된 웹폼 목록", webform_history and as webform memos.
+# - Rows stream through executemany in chunks (memory stays flat), then finalize_snapshot builds the derived
+#   tables + indexes exactly like a real crawl (skip with --raw).
+# - Used by scripts/bench_api_endpoints.py; also handy for profiling database.py/deal_normalizer.py by hand.
+# Usage example:
+#   python scripts/synthetic_salesmap_db.py --deals 200000 --out /tmp/salesmap_200k.db
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+import salesmap_first_page_snapshot as snap  # noqa: E402
+from dashboard.server.database import PART_STRUCTURE  # noqa: E402
+
+CHUNK_ROWS = 20_000
+EPOCH = date(2023, 1, 1).toordinal()
+SPAN_DAYS = date(2026, 12, 31).toordinal() - EPOCH
+
+ORGANIZATION_COLUMNS: List[Tuple[str, str]] = [
+    ("id", "TEXT"),
+    ("이름", "TEXT"),
+    ("기업 규모", "TEXT"),
+    ("업종", "TEXT"),
+    ("업종 구분(대)", "TEXT"),
+    ("업종 구분(중)", "TEXT"),
+    ("팀", "TEXT"),
+    ("담당자", "TEXT"),
+    ("전화", "TEXT"),
+    ("생성 날짜", "TEXT"),
+]
+PEOPLE_COLUMNS: List[Tuple[str, str]] = [
+    ("id", "TEXT"),
+    ("organizationId", "TEXT"),
+    ("이름", "TEXT"),
+    ("소속 상위 조직", "TEXT"),
+    ("팀(명함/메일서명)", "TEXT"),
+    ("직급(명함/메일서명)", "TEXT"),
+    ("담당 교육 영역", "TEXT"),
+    ("제출된 웹폼 목록", "TEXT"),
+    ("담당자", "TEXT"),
+    ("이메일", "TEXT"),
+    ("전화", "TEXT"),
+]
+DEAL_COLUMNS: List[Tuple[str, str]] = [
+    ("id", "TEXT"),
+    ("peopleId", "TEXT"),
+    ("organizationId", "TEXT"),
+    ("이름", "TEXT"),
+    ("팀", "TEXT"),
+    ("담당자", "TEXT"),
+    ("상태", "TEXT"),
+    ("성사 가능성", "TEXT"),
+    ("수주 예정일", "TEXT"),
+    ("예상 체결액", "INTEGER"),
+    ("LOST 확정일", "TEXT"),
+    ("이탈 사유", "TEXT"),
+    ("과정포맷", "TEXT"),
+    ("카테고리", "TEXT"),
+    ("계약 체결일", "TEXT"),
+    ("금액", "INTEGER"),
+    ("수강시작일", "TEXT"),
+    ("수강종료일", "TEXT"),
+    ("Net(%)", "REAL"),
+    ("생성 날짜", "TEXT"),
+    ("코스 ID", "TEXT"),
+    ("기획시트 링크", "TEXT"),
+    ("온라인 입과 주기", "TEXT"),
+    ("온라인 최초 입과 여부", "TEXT"),
+    ("강사 이름1", "TEXT"),
+    ("강사비1", "INTEGER"),
+]
+MEMO_COLUMNS: List[Tuple[str, str]] = [
+    ("id", "TEXT"),
+    ("organizationId", "TEXT"),
+    ("peopleId", "TEXT"),
+    ("dealId", "TEXT"),
+    ("text", "TEXT"),
+    ("htmlBody", "TEXT"),
+    ("ownerId", "TEXT"),
+    ("createdAt", "TEXT"),
+    ("updatedAt", "TEXT"),
+]
+WEBFORM_HISTORY_COLUMNS: List[Tuple[str, str]] = [("peopleId", "TEXT"), ("webFormId", "TEXT"), ("createdAt", "TEXT")]
+
+SIZES = ["대기업", "중견기업", "중소기업", "공공기관", "대학교"]
+INDUSTRIES = {
+    "금융": ["은행", "보험", "증권", "카드"],
+    "제조": ["전자", "자동차", "화학", "철강"],
+    "IT/통신": ["소프트웨어", "통신", "플랫폼"],
+    "유통/서비스": ["유통", "호텔/레저", "물류"],
+    "공공": ["중앙부처", "지자체", "공기업"],
+    "교육": ["대학", "교육기관"],
+    "바이오/헬스케어": ["제약", "의료기기"],
+}
+ORG_STEMS = ["한빛", "다온", "누리", "미래", "세움", "가람", "온새미로", "푸른", "대한", "동방", "새솔", "하람"]
+ORG_SUFFIXES = ["전자", "생명", "화학", "금융", "에너지", "건설", "물산", "테크", "제약", "통신", "공사", "대학교"]
+UPPER_ORGS = ["인재개발실", "HRD센터", "경영지원본부", "DX추진단", "연구소", "영업본부", "생산본부", "인사팀"]
+SIGNATURE_TEAMS = ["교육팀", "인재육성팀", "조직문화팀", "HR팀", "DT전략팀", "기술교육팀"]
+TITLES = ["사원", "대리", "과장", "차장", "부장", "팀장", "책임", "선임", "수석"]
+EDU_AREAS = ["직무교육", "리더십", "DX/AI", "신입사원", "법정의무", "온라인 교육"]
+FAMILY_NAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오"]
+GIVEN_NAMES = ["민준", "서연", "도윤", "지우", "하준", "서윤", "지호", "수아", "예준", "지민", "현우", "유진"]
+
+STATUSES = ["Won", "Open", "Lost", "Convert"]
+STATUS_WEIGHTS = [35, 25, 30, 10]
+OPEN_PROBABILITIES = ["높음", "확정", "낮음", None]
+FORMATS = ["집합교육", "출강", "구독제(온라인)", "선택구매(온라인)", "포팅", "복합(출강+온라인)"]
+FORMAT_WEIGHTS = [15, 35, 20, 15, 5, 10]
+ONLINE_FORMATS = {"구독제(온라인)", "선택구매(온라인)", "포팅"}
+CATEGORIES = [
+    "생성형AI",
+    "데이터분석/CDS",
+    "DX Essential",
+    "빅데이터/AI",
+    "재무회계",
+    "PM/PO",
+    "마케팅",
+    "개발/CD",
+    "OA/업무자동화",
+    "HR",
+    "Skill-based HRD",
+    "법정의무교육",
+    "자유입과(온라인)",
+]
+LOST_REASONS = ["예산 미확보", "경쟁사 선정", "일정 연기", "내부 진행", "연락 두절"]
+ONLINE_CYCLES = ["월 1회", "분기 1회", "상시"]
+WEBFORMS = [
+    ("wf-inquiry", "교육 문의"),
+    ("wf-genai-seminar", "생성형AI 세미나 신청"),
+    ("wf-catalog", "교육 카탈로그 다운로드"),
+    ("wf-online-trial", "온라인 체험 신청"),
+    ("wf-hrd-report", "HRD 리포트 구독"),
+    ("wf-webinar", "웨비나 사전 등록"),
+]
+MEMO_LINES = [
+    "담당자 미팅 진행, 하반기 교육 계획 공유받음",
+    "견적서 발송 완료, 예산 확정 후 회신 예정",
+    "커리큘럼 수정 요청: 실습 비중 확대",
+    "강사 일정 조율 중 (2차 후보일 전달)",
+    "전년도 과정 만족도 높음, 재계약 긍정적",
+    "구매팀 검토 단계, 계약서 초안 전달",
+    "경쟁사 제안 동시 검토 중이라고 함",
+    "온라인 라이선스 추가 구매 문의",
+]
+
+
+def _owners() -> List[Tuple[str, str, str]]:
+    """(owner name, team name, team id) for every member of PART_STRUCTURE."""
+    owners: List[Tuple[str, str, str]] = []
+    for t_idx, (team_name, parts) in enumerate(PART_STRUCTURE.items()):
+        for names in parts.values():
+            for name in names or []:
+                owners.append((name, team_name, f"team-{t_idx + 1}"))
+    return owners
+
+
+def _day(offset: int) -> str:
+    return date.fromordinal(EPOCH + min(max(offset, 0), SPAN_DAYS + 365)).isoformat()
+
+
+def _timestamp(rng: random.Random, offset: int) -> str:
+    return f"{_day(offset)}T{rng.randrange(24):02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}.000Z"
+
+
+def _person_name(rng: random.Random) -> str:
+    return rng.choice(FAMILY_NAMES) + rng.choice(GIVEN_NAMES)
+
+
+def _phone(rng: random.Random) -> str:
+    return f"010-{rng.randrange(10000):04d}-{rng.randrange(10000):04d}"
+
+
+def _amount(rng: random.Random) -> int:
+    # 중앙값 ~1천만원, 10만원 단위 (long tail up to 수억)
+    return max(1, int(rng.lognormvariate(16.1, 1.0) // 100_000)) * 100_000
+
+
+def _owner_json(owner: Tuple[str, str, str], owner_idx: int) -> str:
+    return json.dumps({"id": f"user-{owner_idx}", "name": owner[0]}, ensure_ascii=False)
+
+
+def _team_json(owner: Tuple[str, str, str]) -> str:
+    return json.dumps([{"id": owner[2], "name": owner[1]}], ensure_ascii=False)
+
+
+def _memo_html(text: str) -> str:
+    return "".join(f"<p>{line}</p>" for line in text.split("\n"))
+
+
+def _webform_memo(rng: random.Random, person_name: str, org_name: str, form_name: str) -> str:
+    return (
+        f"- 고객 이름 : {person_name}\n"
+        f"- 고객 이메일 : user{rng.randrange(10**6)}@example.com\n"
+        f"- 고객 전화 : {_phone(rng).replace('-', '')}\n"
+        f"- 회사 이름 : {org_name}\n"
+        f"- 문의 유형 : {form_name}\n"
+        f"- 고객 utm_source : {rng.choice(['email', 'google', 'naver', 'direct'])}\n"
+    )
+
+
+def _create_table(conn: sqlite3.Connection, table: str, columns: Sequence[Tuple[str, str]]) -> None:
+    cols_sql = ", ".join(f'"{name}" {sql_type}' for name, sql_type in columns)
+    conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+    conn.execute(f'CREATE TABLE "{table}" ({cols_sql})')
+
+
+def _insert_chunked(conn: sqlite3.Connection, table: str, columns: Sequence[Tuple[str, str]], rows: Iterator[Tuple[Any, ...]]) -> int:
+    sql = snap._insert_sql(table, [name for name, _ in columns])
+    count = 0
+    chunk: List[Tuple[Any, ...]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= CHUNK_ROWS:
+            conn.executemany(sql, chunk)
+            count += len(chunk)
+            chunk = []
+    if chunk:
+        conn.executemany(sql, chunk)
+        count += len(chunk)
+    return count
+
+
+class _Universe:
+    """Organizations/people layout shared by every table generator (ids are positional)."""
+
+    def __init__(self, rng: random.Random, orgs: int, people: int) -> None:
+        self.owners = _owners()
+        # Zipf-like deal share: org0 is the biggest account (삼성전자, so the SAMSUNG performance segments fill)
+        weights = [1.0 / (rank + 1) ** 0.9 for rank in range(orgs)]
+        self.cum_weights = list(accumulate(weights))
+        total = self.cum_weights[-1]
+        self.org_names: List[str] = []
+        self.org_sizes: List[str] = []
+        self.org_owner: List[int] = []
+        self.org_upper: List[List[str]] = []
+        self.people_offsets: List[int] = [0]
+        extra = max(0, people - orgs)
+        for i in range(orgs):
+            if i == 0:
+                name = "삼성전자"
+            else:
+                name = f"{rng.choice(ORG_STEMS)}{rng.choice(ORG_SUFFIXES)} {i}"
+            pct = i / max(orgs, 1)
+            if pct < 0.05:
+                size = "대기업" if rng.random() < 0.8 else "중견기업"
+            elif pct < 0.3:
+                size = rng.choice(["대기업", "중견기업", "공공기관"])
+            else:
+                size = rng.choices(SIZES, weights=[5, 20, 50, 15, 10])[0]
+            self.org_names.append(name)
+            self.org_sizes.append(size)
+            self.org_owner.append(rng.randrange(len(self.owners)))
+            self.org_upper.append(rng.sample(UPPER_ORGS, k=1 + min(i % 5, len(UPPER_ORGS) - 1)))
+            share = int(extra * weights[i] / total)
+            self.people_offsets.append(self.people_offsets[-1] + 1 + share)
+        self.people = self.people_offsets[-1]
+
+    def pick_orgs(self, rng: random.Random, k: int) -> List[int]:
+        top = self.cum_weights[-1]
+        return [bisect_right(self.cum_weights, rng.random() * top) for _ in range(k)]
+
+    def person_of(self, rng: random.Random, org: int) -> int:
+        start, end = self.people_offsets[org], self.people_offsets[org + 1]
+        return start + rng.randrange(end - start)
+
+
+def _organization_rows(rng: random.Random, uni: _Universe) -> Iterator[Tuple[Any, ...]]:
+    industries = list(INDUSTRIES)
+    for i, name in enumerate(uni.org_names):
+        major = "공공" if uni.org_sizes[i] == "공공기관" else ("교육" if uni.org_sizes[i] == "대학교" else rng.choice(industries))
+        owner = uni.owners[uni.org_owner[i]]
+        yield (
+            f"org{i}",
+            name,
+            uni.org_sizes[i] if rng.random() > 0.03 else None,
+            rng.choice(INDUSTRIES[major]),
+            major,
+            rng.choice(INDUSTRIES[major]),
+            _team_json(owner),
+            _owner_json(owner, uni.org_owner[i]),
+            f"02-{rng.randrange(1000, 10000)}-{rng.randrange(10000):04d}",
+            _timestamp(rng, rng.randrange(SPAN_DAYS // 2)),
+        )
+
+
+def _people_rows(rng: random.Random, uni: _Universe, webform_rows: List[Tuple[Any, ...]], webform_memos: List[Tuple[Any, ...]]) -> Iterator[Tuple[Any, ...]]:
+    org = 0
+    for pid in range(uni.people):
+        while pid >= uni.people_offsets[org + 1]:
+            org += 1
+        name = _person_name(rng)
+        missing_meta = rng.random() < 0.15
+        forms: List[Dict[str, str]] = []
+        if rng.random() < 0.25:
+            for wf_id, wf_name in rng.sample(WEBFORMS, k=rng.randint(1, 3)):
+                forms.append({"id": wf_id, "name": wf_name})
+                offset = rng.randrange(SPAN_DAYS)
+                submitted = _timestamp(rng, offset)
+                webform_rows.append((f"p{pid}", wf_id, submitted))
+                text = _webform_memo(rng, name, uni.org_names[org], wf_name)
+                webform_memos.append(
+                    (f"mw{len(webform_memos)}", f"org{org}", f"p{pid}", None, text, _memo_html(text), None, submitted, submitted)
+                )
+        owner_idx = uni.org_owner[org] if rng.random() < 0.9 else rng.randrange(len(uni.owners))
+        yield (
+            f"p{pid}",
+            f"org{org}",
+            name,
+            rng.choice(uni.org_upper[org]),
+            None if missing_meta else rng.choice(SIGNATURE_TEAMS),
+            None if missing_meta else rng.choice(TITLES),
+            None if missing_meta else rng.choice(EDU_AREAS),
+            json.dumps(forms, ensure_ascii=False),
+            _owner_json(uni.owners[owner_idx], owner_idx),
+            f"p{pid}@example.com",
+            _phone(rng),
+        )
+
+
+def _deal_and_memo_rows(
+    rng: random.Random, uni: _Universe, deals: int, memos_per_deal: float, memo_rows: List[Tuple[Any, ...]]
+) -> Iterator[Tuple[Any, ...]]:
+    """Yields deal rows; deal memos for the same chunk are appended to memo_rows (drained by the caller)."""
+    memo_whole, memo_frac = int(memos_per_deal), memos_per_deal - int(memos_per_deal)
+    memo_seq = 0
+    n = 0
+    while n < deals:
+        batch = min(CHUNK_ROWS, deals - n)
+        for org in uni.pick_orgs(rng, batch):
+            person = uni.person_of(rng, org)
+            owner_idx = uni.org_owner[org] if rng.random() < 0.8 else rng.randrange(len(uni.owners))
+            owner = uni.owners[owner_idx]
+            created = rng.randrange(SPAN_DAYS)
+            status = rng.choices(STATUSES, weights=STATUS_WEIGHTS)[0]
+            if created > SPAN_DAYS - 300 and status == "Lost" and rng.random() < 0.5:
+                status = "Open"  # 최근 딜은 진행 중 비중이 높다
+            fmt = rng.choices(FORMATS, weights=FORMAT_WEIGHTS)[0]
+            category = rng.choice(CATEGORIES) if rng.random() > 0.05 else None
+            online = fmt in ONLINE_FORMATS
+            probability = expected_close = expected_amount = lost_at = lost_reason = None
+            contract = amount = start = end = course_id = instructor = instructor_fee = None
+            if status == "Won":
+                signed = created + rng.randrange(60)
+                begin = signed + rng.randrange(-10, 45)
+                probability = "확정" if rng.random() < 0.95 else "높음"
+                contract, amount = _day(signed), _amount(rng)
+                start, end = _day(begin), _day(begin + (rng.randrange(90, 365) if online else rng.randrange(1, 30)))
+                course_id = f"C{n:07d}" if rng.random() < 0.97 else None
+                if not online:
+                    instructor, instructor_fee = _person_name(rng), rng.randrange(5, 60) * 100_000
+            elif status == "Open":
+                probability = rng.choice(OPEN_PROBABILITIES)
+                expected_close = _day(created + rng.randrange(14, 150)) if rng.random() < 0.85 else None
+                expected_amount = _amount(rng) if rng.random() < 0.8 else None
+            elif status == "Lost":
+                probability = "LOST" if rng.random() < 0.9 else "낮음"
+                lost_at, lost_reason = _day(created + rng.randrange(7, 120)), rng.choice(LOST_REASONS)
+            org_name = uni.org_names[org]
+            yield (
+                f"d{n}",
+                f"p{person}",
+                f"org{org}",
+                f"{org_name}_{category or '미정'}_{fmt} {n}",
+                _team_json(owner),
+                _owner_json(owner, owner_idx),
+                status,
+                probability,
+                expected_close,
+                expected_amount,
+                lost_at,
+                lost_reason,
+                fmt,
+                category,
+                contract,
+                amount,
+                start,
+                end,
+                round(rng.uniform(15, 60), 1) if status == "Won" else None,
+                _timestamp(rng, created),
+                course_id,
+                f"https://example.com/plan/{n}" if status == "Won" and rng.random() < 0.4 else None,
+                rng.choice(ONLINE_CYCLES) if online and status == "Won" else None,
+                rng.choice(["TRUE", "FALSE"]) if online and status == "Won" else None,
+                instructor,
+                instructor_fee,
+            )
+            for _ in range(memo_whole + (1 if rng.random() < memo_frac else 0)):
+                text = "\n".join(rng.sample(MEMO_LINES, k=rng.randint(1, 4)))
+                stamp = _timestamp(rng, created + rng.randrange(120))
+                memo_rows.append(
+                    (f"m{memo_seq}", f"org{org}", f"p{person}", f"d{n}", text, _memo_html(text), f"user-{owner_idx}", stamp, stamp)
+                )
+                memo_seq += 1
+            n += 1
+
+
+def build_synthetic_db(
+    path: Path,
+    deals: int,
+    *,
+    orgs: Optional[int] = None,
+    people: Optional[int] = None,
+    memos_per_deal: float = 1.0,
+    seed: int = 7,
+    finalize: bool = True,
+) -> Dict[str, int]:
+    """Write the synthetic snapshot to `path` (tmp file + os.replace); returns row counts per table."""
+    rng = random.Random(seed)
+    orgs = orgs or max(10, deals // 20)
+    people = people or max(orgs, deals // 2)
+    uni = _Universe(rng, orgs, people)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+    counts: Dict[str, int] = {}
+    conn = sqlite3.connect(tmp_path)
+    try:
+        snap.configure_ingest_connection(conn, resumable=False)
+        for table, columns in (
+            ("organization", ORGANIZATION_COLUMNS),
+            ("people", PEOPLE_COLUMNS),
+            ("deal", DEAL_COLUMNS),
+            ("memo", MEMO_COLUMNS),
+            ("webform_history", WEBFORM_HISTORY_COLUMNS),
+        ):
+            _create_table(conn, table, columns)
+        counts["organization"] = _insert_chunked(conn, "organization", ORGANIZATION_COLUMNS, _organization_rows(rng, uni))
+
+        # webform history/memos are bounded by people * 3 rows; deal memos are flushed per deal chunk
+        webform_rows: List[Tuple[Any, ...]] = []
+        memo_rows: List[Tuple[Any, ...]] = []
+        counts["people"] = _insert_chunked(conn, "people", PEOPLE_COLUMNS, _people_rows(rng, uni, webform_rows, memo_rows))
+        counts["webform_history"] = _insert_chunked(conn, "webform_history", WEBFORM_HISTORY_COLUMNS, iter(webform_rows))
+        counts["memo"] = _insert_chunked(conn, "memo", MEMO_COLUMNS, iter(memo_rows))
+        memo_rows.clear()
+
+        memo_sql = snap._insert_sql("memo", [name for name, _ in MEMO_COLUMNS])
+        deal_sql = snap._insert_sql("deal", [name for name, _ in DEAL_COLUMNS])
+        chunk: List[Tuple[Any, ...]] = []
+        counts["deal"] = 0
+        for row in _deal_and_memo_rows(rng, uni, deals, memos_per_deal, memo_rows):
+            chunk.append(row)
+            if len(chunk) >= CHUNK_ROWS:
+                conn.executemany(deal_sql, chunk)
+                conn.executemany(memo_sql, memo_rows)
+                counts["deal"] += len(chunk)
+                counts["memo"] += len(memo_rows)
+                chunk, memo_rows[:] = [], []
+        conn.executemany(deal_sql, chunk)
+        conn.executemany(memo_sql, memo_rows)
+        counts["deal"] += len(chunk)
+        counts["memo"] += len(memo_rows)
+
+        snap.replace_table(
+            conn,
+            "run_info",
+            [
+                {
+                    "run_tag": f"synthetic-d{deals}-s{seed}",
+                    "captured_at_utc": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+                    "sync_mode": "synthetic",
+                }
+            ],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+    if finalize:
+        snap.finalize_snapshot(path)
+    return counts
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate a synthetic Salesmap snapshot DB with the real Korean columns.")
+    parser.add_argument("--deals", type=int, default=10_000, help="Number of deals (default: 10000; tested up to 1000000)")
+    parser.add_argument("--orgs", type=int, default=None, help="Organizations (default: deals/20)")
+    parser.add_argument("--people", type=int, default=None, help="People (default: deals/2)")
+    parser.add_argument("--memos-per-deal", type=float, default=1.0, help="Average deal memos per deal (default: 1.0)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--raw", action="store_true", help="Skip finalize_snapshot (derived tables + indexes)")
+    parser.add_argument("--out", default="synthetic_salesmap.db", help="Output SQLite path")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    started = time.perf_counter()
+    counts = build_synthetic_db(
+        Path(args.out),
+        args.deals,
+        orgs=args.orgs,
+        people=args.people,
+        memos_per_deal=args.memos_per_deal,
+        seed=args.seed,
+        finalize=not args.raw,
+    )
+    size_mb = Path(args.out).stat().st_size / 1_048_576
+    rows = " ".join(f"{table}={count}" for table, count in counts.items())
+    print(f"[synthetic] {rows} -> {args.out} ({size_mb:.1f} MB, {time.perf_counter() - started:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
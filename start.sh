@@ -64,5 +64,7 @@ ln -sf "$VOL_DB" "$APP_DB"
 echo "[start.sh] DB ready: $APP_DB -> $VOL_DB"
 
 export DB_PATH="$APP_DB"
+# compact won-groups JSON/markdown disk cache (keyed by snapshot content, survives restarts)
+export WON_GROUPS_CACHE_DIR="${WON_GROUPS_CACHE_DIR:-$(dirname "$VOL_DB")/won_groups_cache}"
 
 exec python -m uvicorn dashboard.server.main:app --host 0.0.0.0 --port "${PORT:-8000}"
@@ -82,6 +82,36 @@ class StatepathPortfolioTest(unittest.TestCase):
       res_search_none = db.get_statepath_portfolio(size_group="전체", search="없는회사", db_path=db_path)
       self.assertEqual(len(res_search_none["items"]), 0)
 
+  def test_facet_filters_use_cached_index(self) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+      db_path = Path(tmpdir) / "db.sqlite"
+      _build_db(db_path)
+
+      res = db.get_statepath_portfolio(filters={"cell": "BU_OFFLINE", "cellEvent": "OPEN"}, db_path=db_path)
+      self.assertEqual([r["orgId"] for r in res["items"]], ["org-2"])
+      self.assertEqual(res["summary"]["cellEventMatrix"]["BU_OFFLINE"]["OPEN"], 1)
+      self.assertEqual(res["summary"]["segmentComparison"], [])
+
+      res = db.get_statepath_portfolio(filters={"companyFrom": "Ø", "companyDir": "up"}, db_path=db_path)
+      self.assertEqual([r["orgId"] for r in res["items"]], ["org-2"])
+      res = db.get_statepath_portfolio(filters={"seed": "H→B", "riskOnly": True}, db_path=db_path)
+      self.assertEqual(res["meta"]["totalCount"], 0)
+      self.assertEqual(res["summary"]["accountCount"], 0)
+
+      index = db._statepath_portfolio_index(db_path)
+      self.assertIs(db._statepath_portfolio_index(db_path), index)
+      full = db.get_statepath_portfolio(sort="name_asc", db_path=db_path)
+      self.assertEqual([r["orgName"] for r in full["items"]], ["베타", "알파"])
+      self.assertEqual(full["summary"]["accountCount"], 2)
+      self.assertEqual(sum(seg["accountCount"] for seg in full["summary"]["segmentComparison"]), 2)
+      page = db.get_statepath_portfolio(sort="name_asc", limit=1, offset=1, db_path=db_path)
+      self.assertEqual([r["orgName"] for r in page["items"]], ["알파"])
+      self.assertEqual(page["meta"]["totalCount"], 2)
+
+      detail = db.get_statepath_detail("org-1", db_path=db_path)
+      self.assertEqual(detail["year_states"]["2025"]["bucket"], "P0")
+      self.assertIsNone(db.get_statepath_detail("missing", db_path=db_path))
+
   def test_api_endpoint_returns_items(self) -> None:
     if TestClient is None:
       self.skipTest("fastapi.testclient not available")
@@ -0,0 +1,106 @@
+import unittest
+from pathlib import Path
+
+from dashboard.server import cache_registry as cr
+from dashboard.server import database as db
+
+
+def _unregister_test_caches() -> None:
+    with cr._REGISTRY_LOCK:
+        for name in [n for n in cr._REGISTRY if n.startswith("t-")]:
+            del cr._REGISTRY[name]
+
+
+class BoundedCacheTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        _unregister_test_caches()
+
+    def test_lru_entry_limit_and_hit_miss_counters(self) -> None:
+        cache = cr.BoundedCache("t-lru", max_entries=2, max_bytes=None)
+        path = Path("/tmp/a.db")
+        cache[(path, 1.0, "a")] = {"v": 1}
+        cache[(path, 1.0, "b")] = {"v": 2}
+        self.assertEqual(cache.get((path, 1.0, "a")), {"v": 1})  # a becomes most recent
+        cache[(path, 1.0, "c")] = {"v": 3}
+
+        self.assertIn((path, 1.0, "a"), cache)
+        self.assertNotIn((path, 1.0, "b"), cache)
+        self.assertIsNone(cache.get((path, 1.0, "b")))
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (1, 1, 1))
+
+    def test_new_db_signature_evicts_older_entries_for_same_path(self) -> None:
+        cache = cr.BoundedCache("t-sig", max_entries=10, max_bytes=None)
+        old_db, other_db = Path("/tmp/old.db"), Path("/tmp/other.db")
+        cache[(old_db, 1.0, "x")] = [1]
+        cache[(old_db, 1.0, "y")] = [2]
+        cache[(other_db, 1.0)] = [3]
+        cache[(old_db, 2.0, "x")] = [4]
+
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn((old_db, 1.0, "y"), cache)
+        self.assertIn((other_db, 1.0), cache)
+        self.assertEqual(cache.stats()["stale_evictions"], 2)
+
+    def test_new_signature_evicts_old_entries_from_other_registered_caches(self) -> None:
+        self.addCleanup(cr.clear_all)
+        stale = cr.register_cache("t-reg-stale", max_entries=10, max_bytes=None)
+        fresh = cr.register_cache("t-reg-fresh", max_entries=10, max_bytes=None)
+        path, other = Path("/tmp/reg.db"), Path("/tmp/reg-other.db")
+        stale[(path, 1.0, "view")] = [1]
+        stale[(other, 1.0, "view")] = [2]
+
+        self.assertIsNone(fresh.get((path, 2.0, "view")))  # first lookup under the new mtime
+
+        self.assertNotIn((path, 1.0, "view"), stale)
+        self.assertIn((other, 1.0, "view"), stale)
+        # a late request still holding the old mtime does not evict the current snapshot
+        fresh[(path, 2.0, "view")] = [3]
+        stale.get((path, 1.0, "view"))
+        self.assertIn((path, 2.0, "view"), fresh)
+
+    def test_evict_db_keeps_only_given_signature(self) -> None:
+        self.addCleanup(cr.clear_all)
+        cache = cr.register_cache("t-reg-evict", max_entries=10, max_bytes=None)
+        path = Path("/tmp/evict.db")
+        cache[(path, 1.0, "a")] = [1]
+        cache[(path, 1.0, "b")] = [2]
+
+        self.assertEqual(cr.evict_db(path, keep_signature=2.0), 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_byte_budget_keeps_latest_entry(self) -> None:
+        cache = cr.BoundedCache("t-bytes", max_entries=10, max_bytes=1, db_keyed=False)
+        cache["a"] = "x" * 100
+        cache["b"] = "y" * 100
+        self.assertEqual(list(cache), ["b"])
+        self.assertGreater(cache.stats()["approx_bytes"], 100)
+
+    def test_approx_size_counts_arrays_and_object_attributes(self) -> None:
+        import numpy as np
+
+        from dashboard.server.perf_columns import ColumnFrame
+
+        arr = np.zeros(100_000, dtype=np.float64)
+        self.assertGreaterEqual(cr.approx_size(arr[10:]), arr[10:].nbytes)  # views count their data too
+        frame = ColumnFrame([{"month": "2501", "owner_names": ["a"]}] * 1000)
+        frame.add_values("amount", (1.0 for _ in range(1000)))
+        self.assertGreater(cr.approx_size(frame), 8 * 1000 + 4 * 1000)
+
+        class Slotted:
+            __slots__ = ("payload",)
+
+            def __init__(self) -> None:
+                self.payload = "x" * 10_000
+
+        self.assertGreater(cr.approx_size(Slotted()), 10_000)
+
+    def test_database_caches_are_registered(self) -> None:
+        names = {c["name"] for c in cr.cache_stats()["caches"]}
+        self.assertIn("perf_monthly_data", names)
+        self.assertIn("counterparty_dri", names)
+        self.assertIs(cr.register_cache("perf_monthly_data"), db._PERF_MONTHLY_DATA_CACHE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from dashboard.server import cache_registry, cache_warmer
+
+
+class CacheWarmerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmpdir.name) / "db.sqlite"
+        sqlite3.connect(self.db_path).close()
+        self.seen = []
+        self.threads = set()
+
+        def record(name):
+            def _fn(path):
+                self.seen.append((name, path))
+                self.threads.add(threading.current_thread().name)
+
+            return _fn
+
+        def boom(path):
+            raise RuntimeError("no table")
+
+        tasks = [("a", record("a")), ("b", record("b")), ("broken", boom)]
+        self.patches = [
+            patch.object(cache_warmer, "WARMUP_TASKS", tasks),
+            patch.dict(cache_warmer._state, {"status": "idle", "signature": None, "tasks": {}}),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self) -> None:
+        for p in reversed(self.patches):
+            p.stop()
+        self.tmpdir.cleanup()
+
+    def test_warm_runs_tasks_in_pool_and_reports_progress(self) -> None:
+        status = cache_warmer.warm(self.db_path)
+        self.assertEqual(sorted(name for name, _ in self.seen), ["a", "b"])
+        self.assertTrue(all(path == self.db_path for _, path in self.seen))
+        self.assertTrue(all(name.startswith("warmup") for name in self.threads))
+        self.assertEqual((status["status"], status["total"], status["done"], status["failed"]), ("ready", 3, 3, 1))
+        self.assertEqual(status["tasks"]["broken"]["status"], "error")
+        self.assertTrue(cache_warmer.warmup_status(self.db_path)["ready"])
+
+    def test_ready_drops_when_db_signature_changes(self) -> None:
+        cache_warmer.warm(self.db_path)
+        st = os.stat(self.db_path)
+        os.utime(self.db_path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        self.assertFalse(cache_warmer.warmup_status(self.db_path)["ready"])
+
+    def test_warm_evicts_previous_snapshot_entries(self) -> None:
+        self.addCleanup(cache_registry.clear_all)
+        cache = cache_registry.register_cache("t-warm-stale", max_entries=10, max_bytes=None)
+        self.addCleanup(cache_registry._REGISTRY.pop, "t-warm-stale", None)
+        mtime = self.db_path.stat().st_mtime
+        cache[(self.db_path, mtime - 5, "view")] = [1]
+        cache_warmer.warm(self.db_path)
+        self.assertNotIn((self.db_path, mtime - 5, "view"), cache)
+
+    def test_missing_db_is_not_ready(self) -> None:
+        status = cache_warmer.warm(Path(self.tmpdir.name) / "missing.db")
+        self.assertEqual(status["status"], "no_db")
+        self.assertFalse(status["ready"])
+        self.assertEqual(self.seen, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
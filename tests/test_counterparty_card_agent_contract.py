@@ -4,7 +4,14 @@ from datetime import date
 from pathlib import Path
 
 from dashboard.server.agents.core.types import AgentContext, LLMConfig
-from dashboard.server.agents.counterparty_card.agent import CounterpartyCardAgent, PAYLOAD_DEALS_LIMIT
+from dashboard.server.agents.counterparty_card.agent import (
+    CounterpartyCardAgent,
+    PAYLOAD_DEALS_LIMIT,
+    gather_deals_for_counterparty,
+    gather_memos,
+    prefetch_deals_for_counterparties,
+    prefetch_memos,
+)
 
 
 def _setup_db() -> sqlite3.Connection:
@@ -81,3 +88,45 @@ def test_counterparty_card_agent_fallback_outputs_lengths():
     assert 2 <= len(output["recommended_actions"]) <= 3
     assert len(output.get("deals_top", risk_rows[0]["top_deals_2026"][:PAYLOAD_DEALS_LIMIT])) >= 1
 
+
+def test_prefetch_matches_per_candidate_queries_with_fixed_round_trips():
+    conn = _setup_db()
+    conn.row_factory = sqlite3.Row
+    conn.executemany(
+        'INSERT INTO people VALUES (?, ?, ?)',
+        [("p1", "org1", "CP-A"), ("p2", "org1", "CP-B"), ("p3", "org2", None)],
+    )
+    conn.executemany(
+        'INSERT INTO deal VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)',
+        [
+            ("d1", "p1", "org1", "A1", "Open", "출강", "100", None, None, "2026-03-01", None, None, None, "높음"),
+            ("d2", "p2", "org1", "B1", "Won", "출강", "300", None, "2026-02-01", None, "2026-02-10", None, "C1", None),
+            ("d3", "p3", "org2", "N1", "Open", "구독제(온라인)", "50", None, None, "2026-05-01", None, None, None, None),
+        ],
+    )
+    conn.executemany(
+        'INSERT INTO memo VALUES (?, ?, ?, ?, ?, ?)',
+        [
+            ("m1", "org memo", "2025-12-01T01:00:00", None, None, "org1"),
+            ("m2", "deal memo", "2025-12-15T01:00:00", "d2", None, None),
+            ("m3", "people A memo", "2025-11-20T01:00:00", None, "p1", None),
+            ("m4", "people B memo", "2025-11-21T01:00:00", None, "p2", None),
+            ("m5", "too old", "2025-01-01T01:00:00", None, None, "org1"),
+            ("m6", "no upper org", "2025-12-20T01:00:00", None, "p3", None),
+        ],
+    )
+    keys = [("org1", "CP-A"), ("org1", "CP-B"), ("org2", ""), ("org3", "CP-X")]
+    as_of = date(2026, 1, 1)
+
+    statements = []
+    conn.set_trace_callback(statements.append)
+    memos = prefetch_memos(conn, keys, as_of)
+    deals = prefetch_deals_for_counterparties(conn, keys, mode_key="offline")
+    conn.set_trace_callback(None)
+
+    assert len(statements) == 4  # 3 memo queries + 1 deal query regardless of len(keys)
+    for org_id, cp in keys:
+        assert memos[(org_id, cp)] == gather_memos(conn, org_id, cp, as_of)
+        assert deals[(org_id, cp)] == gather_deals_for_counterparty(conn, org_id, cp, mode_key="offline")
+    assert [m["id"] for m in memos[("org1", "CP-A")]] == ["m2", "m1", "m3"]
+    assert [d["deal_id"] for d in deals[("org1", "CP-B")]] == ["d2"]
@@ -2,6 +2,7 @@ import sqlite3
 import tempfile
 from pathlib import Path
 from unittest import TestCase
+from unittest.mock import patch
 
 from dashboard.server import deal_normalizer as dn
 
@@ -23,6 +24,7 @@ class CounterpartyRiskRuleTest(TestCase):
     def setUp(self) -> None:
         self.tmpdir = tempfile.TemporaryDirectory()
         db_path = Path(self.tmpdir.name) / "db.sqlite"
+        self.db_path = db_path
         self.conn = sqlite3.connect(db_path)
         _prepare_schema(self.conn)
 
@@ -111,3 +113,45 @@ class CounterpartyRiskRuleTest(TestCase):
         self.assertNotIn(("org_p1", "CP-Gamma"), rows)
 
         self.assertEqual(result["null_tier_rows"], 0)
+
+    def test_top_deals_2026_single_window_query(self) -> None:
+        self._build_fixture()
+        self.conn.executemany(
+            'INSERT INTO deal VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)',
+            [
+                ("d_2026_beta2", "p2", "org_p0", "C5", "Open", "집합교육", "80000000", None, "2026-07-01", None, None, None, None, "높음"),
+                ("d_2026_beta3", "p2", "org_p0", "C6", "Open", "집합교육", "80000000", None, "2026-08-01", None, None, None, None, "높음"),
+                ("d_2026_beta_lost", "p2", "org_p0", "C7", "Lost", "집합교육", "900000000", None, "2026-08-01", None, None, None, None, None),
+            ],
+        )
+        self.conn.commit()
+        dn.build_deal_norm(self.conn)
+        dn.build_org_tier(self.conn)
+        dn.build_counterparty_target_2026(self.conn)
+        dn.build_counterparty_risk_rule(self.conn, as_of_date="2026-04-15")
+
+        top = dn.fetch_top_deals_2026(self.conn, limit=2)
+
+        # amount desc, deal_id asc on ties; Lost excluded; limit applied per counterparty
+        self.assertEqual([d["deal_id"] for d in top[("org_p0", "CP-Beta")]], ["d_2026_beta2", "d_2026_beta3"])
+        self.assertNotIn(("org_p0", "CP-Alpha"), top)
+        self.assertEqual([d["deal_id"] for d in top[("org_p0", dn.COUNTERPARTY_UNKNOWN)]], ["d_2026_unknown"])
+        indexes = {row[0] for row in self.conn.execute("SELECT name FROM sqlite_temp_master WHERE type = 'index'")}
+        self.assertIn("idx_deal_norm_organization_id_counterparty_name_deal_year", indexes)
+
+    def test_report_rule_only_skips_agent_chain(self) -> None:
+        self._build_fixture()
+        self.conn.close()
+        with patch.object(dn, "Orchestrator", side_effect=AssertionError("agents must not run")):
+            report = dn.build_counterparty_risk_report(as_of_date="2026-04-15", db_path=self.db_path, rule_only=True)
+
+        self.assertTrue(report["meta"]["rule_only"])
+        # the pooled connection outlives the build, so its TEMP tables must not stay resident
+        pooled = dn._connect(self.db_path)
+        self.assertEqual(pooled.execute("SELECT name FROM temp.sqlite_master").fetchall(), [])
+        rows = {(r["organizationId"], r["counterpartyName"]): r for r in report["counterparties"]}
+        alpha = rows[("org_p0", "CP-Alpha")]
+        self.assertEqual(alpha["risk_level_rule"], "심각")
+        self.assertEqual(alpha["risk_level_llm"], "심각")
+        self.assertTrue(alpha["llm_meta"]["fallback_used"])
+        self.assertEqual(len(alpha["evidence_bullets"]), 3)
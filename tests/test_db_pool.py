@@ -0,0 +1,97 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from dashboard.server import db_pool
+
+
+def _make_db(path: Path, value: str) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE t (v TEXT)")
+    conn.execute("INSERT INTO t VALUES (?)", (value,))
+    conn.commit()
+    conn.close()
+
+
+class DbPoolTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.db_path = self.root / "a.db"
+        _make_db(self.db_path, "a")
+
+    def tearDown(self) -> None:
+        db_pool.release(self.db_path)
+        self.tmpdir.cleanup()
+
+    def test_reuses_connection_per_thread_with_udfs_and_read_only(self) -> None:
+        conn = db_pool.get_connection(self.db_path)
+        conn.close()  # no-op for pooled connections
+        self.assertIs(db_pool.get_connection(self.db_path), conn)
+        self.assertEqual(conn.execute("SELECT kst_year('2025-03-01')").fetchone()[0], "2025")
+        self.assertEqual(conn.execute("PRAGMA temp_store").fetchone()[0], 2)
+        with self.assertRaises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO t VALUES ('x')")
+
+        other: list = []
+        worker = threading.Thread(target=lambda: other.append(db_pool.get_connection(self.db_path)))
+        worker.start()
+        worker.join()
+        self.assertIsNot(other[0], conn)
+
+    def test_temp_tables_allowed_without_query_only(self) -> None:
+        conn = db_pool.get_connection(self.db_path, query_only=False)
+        conn.execute("CREATE TEMP TABLE scratch AS SELECT v FROM t")
+        self.assertEqual(conn.execute("SELECT v FROM scratch").fetchone()[0], "a")
+        with self.assertRaises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO main.t VALUES ('x')")
+
+    def test_release_marks_other_threads_stale_and_closes_own(self) -> None:
+        own = db_pool.get_connection(self.db_path)
+        started, finish = threading.Event(), threading.Event()
+        other: list = []
+
+        def worker() -> None:
+            other.append(db_pool.get_connection(self.db_path))
+            started.set()
+            finish.wait(5)
+            other.append(db_pool.get_connection(self.db_path))
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        started.wait(5)
+        self.assertEqual(db_pool.release(self.db_path), 1)
+        self.assertTrue(own.released)
+        self.assertFalse(other[0].released)  # may be mid-query in its own thread
+        self.assertEqual(other[0].execute("SELECT v FROM t").fetchone()[0], "a")
+        finish.set()
+        thread.join()
+        self.assertIsNot(other[1], other[0])
+        self.assertTrue(other[0].released)
+
+    def test_recycles_after_symlink_swap(self) -> None:
+        b_path = self.root / "b.db"
+        _make_db(b_path, "b")
+        link = self.root / "latest.db"
+        os.symlink(self.db_path, link)
+        try:
+            first = db_pool.get_connection(link)
+            self.assertEqual(first.execute("SELECT v FROM t").fetchone()[0], "a")
+
+            tmp_link = self.root / "latest.tmp"
+            os.symlink(b_path, tmp_link)
+            os.replace(tmp_link, link)
+
+            second = db_pool.get_connection(link)
+            self.assertIsNot(second, first)
+            self.assertTrue(first.released)
+            self.assertEqual(second.execute("SELECT v FROM t").fetchone()[0], "b")
+        finally:
+            db_pool.release(link)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from dashboard.server import database as db
+from dashboard.server import deal_fact
+from dashboard.server import deal_normalizer as dn
+from tests.test_perf_monthly_contracts import _init_db
+
+
+class DealFactTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmpdir.name) / "fact.db"
+        _init_db(self.db_path)
+        db._PERF_MONTHLY_DATA_CACHE.clear()
+
+    def tearDown(self) -> None:
+        db._PERF_MONTHLY_DATA_CACHE.clear()
+        self.tmpdir.cleanup()
+
+    def _build_fact(self) -> dict:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return deal_fact.build_deal_fact(conn)
+        finally:
+            conn.close()
+
+    def test_build_and_freshness_signature(self) -> None:
+        stats = self._build_fact()
+        self.assertEqual(stats["rows"], 4)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.assertTrue(deal_fact.deal_fact_is_fresh(conn))
+            amount, bucket = conn.execute(
+                "SELECT amount_num, perf_bucket FROM deal_fact WHERE deal_id = 'd-1'"
+            ).fetchone()
+            self.assertEqual(amount, 100.0)
+            self.assertEqual(bucket, "CONTRACT")
+            conn.execute('INSERT INTO deal (id, "상태") VALUES (?, ?)', ("d-new", "Open"))
+            conn.commit()
+            self.assertFalse(deal_fact.deal_fact_is_fresh(conn))
+        finally:
+            conn.close()
+
+    def test_perf_monthly_rows_match_raw_parse(self) -> None:
+        raw = db._load_perf_monthly_data(self.db_path)
+        self.assertNotIn("source", raw)
+
+        self._build_fact()
+        db._PERF_MONTHLY_DATA_CACHE.clear()
+        fast = db._load_perf_monthly_data(self.db_path)
+
+        self.assertEqual(fast["source"], deal_fact.DEAL_FACT_TABLE)
+        self.assertEqual(fast["course_id_available"], raw["course_id_available"])
+        self.assertEqual(fast["rows"], raw["rows"])
+
+    def test_deal_norm_matches_raw_parse(self) -> None:
+        def _norm_rows(conn: sqlite3.Connection) -> tuple:
+            dq = dn.build_deal_norm(conn)
+            rows = conn.execute("SELECT * FROM deal_norm ORDER BY deal_id").fetchall()
+            conn.execute("DROP TABLE deal_norm")
+            return dq, rows
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            raw_dq, raw_rows = _norm_rows(conn)
+            deal_fact.build_deal_fact(conn)
+            fact_dq, fact_rows = _norm_rows(conn)
+        finally:
+            conn.close()
+        self.assertEqual(fact_rows, raw_rows)
+        self.assertEqual(fact_dq, raw_dq)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import json
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+import dump_rank_won_json as dump
+from dashboard.server import database as db
+from tests.test_won_groups_json import build_sample_db
+
+
+class DumpRankWonJsonDirectTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.db_path = self.root / "db.sqlite"
+        build_sample_db(self.db_path)
+        self.out_dir = self.root / "ranking"
+        self.industry_dir = self.root / "industry"
+        self.out_dir.mkdir()
+        self.industry_dir.mkdir()
+
+    def tearDown(self) -> None:
+        db._WON_GROUPS_CACHE.clear()
+        self.tmpdir.cleanup()
+
+    def _run(self, items, workers=1, overwrite=False):
+        return dump.run_direct(
+            items,
+            db_path=self.db_path,
+            out_dir=self.out_dir,
+            industry_dir=self.industry_dir,
+            industry_map={"org1": "금융"},
+            overwrite=overwrite,
+            workers=workers,
+        )
+
+    def test_parse_limit(self) -> None:
+        self.assertIsNone(dump.parse_limit("all"))
+        self.assertEqual(dump.parse_limit("5"), 5)
+        self.assertEqual(list(dump.iter_top_orgs([{}] * 3, None)), [{}] * 3)
+
+    def test_pool_output_matches_api_format_and_manifest_skips(self) -> None:
+        items = [{"orgId": "org1", "orgName": "조직1"}, {"orgId": "org-x", "orgName": "조직/없음"}, {"orgName": "id없음"}]
+        counts, failures = self._run(items, workers=2)
+        self.assertEqual(counts, {"saved": 2, "unchanged": 0, "skipped": 0})
+        self.assertEqual([f[0] for f in failures], ["missing_id"])
+        ranking = self.out_dir / "1_조직1.txt"
+        expected = json.dumps(db.get_won_groups_json("org1", db_path=self.db_path), ensure_ascii=False, indent=2) + "\n"
+        self.assertEqual(ranking.read_text(encoding="utf-8"), expected)
+        self.assertEqual((self.industry_dir / "금융_조직1.txt").read_text(encoding="utf-8"), expected)
+        self.assertTrue((self.out_dir / "2_조직_없음.txt").exists())
+        manifest = json.loads((self.out_dir / dump.MANIFEST_NAME).read_text(encoding="utf-8"))
+        self.assertEqual(sorted(manifest["orgs"]), ["org-x", "org1"])
+
+        counts, _ = self._run(items[:2])
+        self.assertEqual(counts, {"saved": 0, "unchanged": 0, "skipped": 2})
+
+        # 새 스냅샷: 다시 빌드하지만 내용이 같으면 파일은 건드리지 않는다
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE run_info (run_tag TEXT)")
+        conn.execute("INSERT INTO run_info VALUES ('run-2')")
+        conn.commit()
+        conn.close()
+        (self.industry_dir / "금융_조직1.txt").unlink()
+        counts, _ = self._run(items[:2])
+        self.assertEqual(counts, {"saved": 1, "unchanged": 1, "skipped": 0})
+        self.assertEqual((self.industry_dir / "금융_조직1.txt").read_text(encoding="utf-8"), expected)
+
+        counts, _ = self._run(items[:2], overwrite=True)
+        self.assertEqual(counts["saved"], 2)
+        self.assertEqual(ranking.read_text(encoding="utf-8"), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    from fastapi import FastAPI
+    from fastapi.responses import JSONResponse, StreamingResponse
+    from fastapi.testclient import TestClient
+except ImportError:  # pragma: no cover - optional for test envs without fastapi extras
+    TestClient = None
+
+from dashboard.server.http_cache import ApiCacheMiddleware
+
+
+class ApiCacheMiddlewareTest(unittest.TestCase):
+    def setUp(self) -> None:
+        if TestClient is None:
+            self.skipTest("fastapi.testclient not available")
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmpdir.name) / "db.sqlite"
+        sqlite3.connect(self.db_path).close()
+        self.calls = 0
+
+        app = FastAPI()
+        app.add_middleware(ApiCacheMiddleware, db_path_getter=lambda: self.db_path)
+
+        @app.get("/api/rows")
+        def rows(size: str = "all") -> dict:
+            self.calls += 1
+            return {"size": size, "rows": [{"i": i, "name": "row"} for i in range(200)]}
+
+        @app.get("/api/stream")
+        def stream():
+            return StreamingResponse(iter([b"a\n", b"b\n"]), media_type="application/x-ndjson")
+
+        @app.get("/api/download")
+        def download():
+            return StreamingResponse(iter([b"xlsx"]), media_type="application/octet-stream", headers={"Cache-Control": "no-store"})
+
+        @app.get("/api/short")
+        def short():
+            return JSONResponse({"ok": True}, headers={"Cache-Control": "private, max-age=60"})
+
+        @app.get("/api/health")
+        def health() -> dict:
+            return {"status": "ok"}
+
+        self.client = TestClient(app)
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_if_none_match_skips_handler_until_db_changes(self) -> None:
+        first = self.client.get("/api/rows", params={"size": "대기업"}, headers={"Accept-Encoding": "identity"})
+        etag = first.headers["etag"]
+        self.assertEqual(self.calls, 1)
+
+        again = self.client.get("/api/rows", params={"size": "대기업"}, headers={"If-None-Match": etag})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(self.calls, 1)
+
+        other = self.client.get("/api/rows", params={"size": "전체"}, headers={"If-None-Match": etag})
+        self.assertEqual(other.status_code, 200)
+
+        st = os.stat(self.db_path)
+        os.utime(self.db_path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        changed = self.client.get("/api/rows", params={"size": "대기업"}, headers={"If-None-Match": etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers["etag"], etag)
+
+    def test_gzip_for_large_json_with_distinct_etag(self) -> None:
+        plain = self.client.get("/api/rows", headers={"Accept-Encoding": "identity"})
+        zipped = self.client.get("/api/rows", headers={"Accept-Encoding": "gzip"})
+        self.assertNotIn("content-encoding", plain.headers)
+        self.assertEqual(zipped.headers["content-encoding"], "gzip")
+        self.assertEqual(zipped.json(), plain.json())
+        self.assertEqual(zipped.headers["etag"], plain.headers["etag"][:-1] + '-gzip"')
+        self.assertEqual(zipped.headers["vary"], "Accept-Encoding")
+        # 압축된 표현의 ETag로도 304
+        revalidated = self.client.get("/api/rows", headers={"If-None-Match": zipped.headers["etag"], "Accept-Encoding": "gzip"})
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_304_echoes_the_tag_that_matched(self) -> None:
+        zipped = self.client.get("/api/rows", headers={"Accept-Encoding": "gzip"})
+        tag = zipped.headers["etag"]
+        revalidated = self.client.get("/api/rows", headers={"If-None-Match": f'"old", {tag}', "Accept-Encoding": "gzip"})
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated.headers["etag"], tag)
+
+    def test_handler_cache_control_is_kept(self) -> None:
+        download = self.client.get("/api/download")
+        self.assertEqual(download.headers["cache-control"], "no-store")
+        self.assertNotIn("etag", download.headers)
+        short = self.client.get("/api/short")
+        self.assertEqual(short.headers["cache-control"], "private, max-age=60")
+        self.assertIn("etag", short.headers)
+
+    def test_streaming_and_excluded_paths_pass_through(self) -> None:
+        streamed = self.client.get("/api/stream", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(streamed.text, "a\nb\n")
+        self.assertNotIn("content-encoding", streamed.headers)
+        self.assertIn("etag", streamed.headers)
+        self.assertNotIn("etag", self.client.get("/api/health").headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from dashboard.server import database as db
+
+
+def build_sample_db(db_path: Path) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        'CREATE TABLE organization (id TEXT, "이름" TEXT, "업종" TEXT, "팀" TEXT, "담당자" TEXT, "전화" TEXT, "기업 규모" TEXT)'
+    )
+    conn.execute(
+        'CREATE TABLE people (id TEXT, organizationId TEXT, "이름" TEXT, "직급/직책" TEXT, "이메일" TEXT, '
+        '"전화" TEXT, "고객 상태" TEXT)'
+    )
+    conn.execute(
+        'CREATE TABLE deal (id TEXT, peopleId TEXT, organizationId TEXT, "이름" TEXT, "상태" TEXT, "금액" TEXT, '
+        '"예상 체결액" TEXT, "마감일" TEXT, "수주 예정일" TEXT)'
+    )
+    conn.execute(
+        "CREATE TABLE memo (id TEXT, dealId TEXT, peopleId TEXT, organizationId TEXT, text TEXT, "
+        "createdAt TEXT, updatedAt TEXT, ownerId TEXT, htmlBody TEXT)"
+    )
+    for i in range(1, 6):
+        conn.execute("INSERT INTO organization (id, \"이름\") VALUES (?, ?)", (f"org{i}", f"기업{i}"))
+    conn.execute("INSERT INTO organization (id, \"이름\") VALUES ('org9', '사람없음')")
+    for i in range(1, 6):
+        conn.execute("INSERT INTO people (id, organizationId, \"이름\") VALUES (?, ?, ?)", (f"p{i}a", f"org{i}", "가"))
+        conn.execute("INSERT INTO people (id, organizationId, \"이름\") VALUES (?, ?, ?)", (f"p{i}b", f"org{i}", "나"))
+        conn.execute(
+            "INSERT INTO deal (id, peopleId, organizationId, \"이름\", \"상태\") VALUES (?, ?, ?, '딜', 'Won')",
+            (f"d{i}", f"p{i}a", f"org{i}"),
+        )
+        conn.execute(
+            "INSERT INTO memo (id, dealId, peopleId, organizationId, text, htmlBody) VALUES (?, ?, ?, ?, 'deal', '<p>x</p>')",
+            (f"md{i}", f"d{i}", f"p{i}a", f"org{i}"),
+        )
+        conn.execute(
+            "INSERT INTO memo (id, peopleId, organizationId, text) VALUES (?, ?, ?, 'person')",
+            (f"mp{i}", f"p{i}b", f"org{i}"),
+        )
+        conn.execute("INSERT INTO memo (id, organizationId, text) VALUES (?, ?, 'company')", (f"mc{i}", f"org{i}"))
+    conn.commit()
+    conn.close()
+
+
+class InitialDataStreamTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmpdir.name) / "db.sqlite"
+        build_sample_db(self.db_path)
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _walk(self, **kwargs):
+        return list(db.iter_initial_dashboard_data(db_path=self.db_path, **kwargs))
+
+    def test_stream_matches_bulk_payload(self) -> None:
+        bulk = db.get_initial_dashboard_data(self.db_path)
+        records = self._walk(batch_size=2)
+        self.assertEqual(records[-1], {"type": "end", "count": 5, "next_cursor": None})
+        orgs = [r for r in records if r["type"] == "organization"]
+
+        self.assertEqual(
+            sorted(r["organization"]["id"] for r in orgs), sorted(o["id"] for o in bulk["organizations"])
+        )
+        people = [p for r in orgs for p in r["people"]]
+        self.assertEqual(
+            sorted(p["id"] for p in people if p["dealCount"]), sorted(p["id"] for p in bulk["peopleWithDeals"])
+        )
+        self.assertEqual(
+            {d["id"] for r in orgs for d in r["deals"]},
+            {d["id"] for deals in bulk["dealsByPersonId"].values() for d in deals},
+        )
+        self.assertEqual(
+            {m["id"] for r in orgs for m in r["dealMemos"]},
+            {m["id"] for memos in bulk["dealMemosById"].values() for m in memos},
+        )
+        self.assertEqual(
+            {m["id"] for r in orgs for m in r["peopleMemos"]},
+            {m["id"] for memos in bulk["peopleMemosById"].values() for m in memos},
+        )
+        self.assertEqual(
+            {m["id"] for r in orgs for m in r["companyMemos"]},
+            {m["id"] for memos in bulk["companyMemos"].values() for m in memos},
+        )
+
+    def test_keyset_pages_resume_from_cursor(self) -> None:
+        first = self._walk(limit=2)
+        self.assertEqual([r["organization"]["id"] for r in first[:-1]], ["org1", "org2"])
+        self.assertEqual(first[-1]["next_cursor"], "org2")
+        second = self._walk(after="org2", limit=10)
+        self.assertEqual([r["organization"]["id"] for r in second[:-1]], ["org3", "org4", "org5"])
+        self.assertIsNone(second[-1]["next_cursor"])
+
+    def test_omit_drops_columns_and_validates(self) -> None:
+        record = self._walk(limit=1, omit=["htmlBody", "text"])[0]
+        self.assertEqual(set(record["dealMemos"][0]), {"id", "dealId", "peopleId", "organizationId", "createdAt", "updatedAt", "ownerId"})
+        with self.assertRaises(ValueError):
+            db.iter_initial_dashboard_data(db_path=self.db_path, omit=["id"])
+        with self.assertRaises(ValueError):
+            db.iter_initial_dashboard_data(db_path=self.db_path, limit=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from dashboard.server.agents.core import llm_client
+from dashboard.server.agents.core.types import LLMConfig
+
+
+def _ok(content: str) -> httpx.Response:
+    return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+
+class LLMClientTest(unittest.TestCase):
+    def setUp(self) -> None:
+        llm_client.reset_stats()
+        self.requests: list = []
+
+    def tearDown(self) -> None:
+        llm_client.close_client()
+        llm_client.reset_stats()
+
+    def _install(self, handler) -> None:
+        def _record(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return handler(request)
+
+        llm_client.set_client(httpx.Client(transport=httpx.MockTransport(_record)))
+
+    def test_shared_client_across_threads_and_stats(self) -> None:
+        self._install(lambda request: _ok("hi"))
+        seen = []
+
+        def call() -> None:
+            seen.append(llm_client.get_client())
+            llm_client.chat_completion(
+                [{"role": "user", "content": "x"}],
+                model="m1",
+                base_url="http://llm.local/v1/",
+                api_key="k",
+                timeout_total=5,
+                temperature=0,
+                max_tokens=8,
+            )
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len({id(c) for c in seen}), 1)
+        self.assertEqual(str(self.requests[0].url), "http://llm.local/v1/chat/completions")
+        stats = llm_client.transport_stats()["models"]["m1"]
+        self.assertEqual(stats["calls"], 4)
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertEqual(stats["errors"], 0)
+
+    def test_retries_429_then_succeeds_and_does_not_retry_400(self) -> None:
+        responses = [httpx.Response(429), _ok("done")]
+        self._install(lambda request: responses.pop(0))
+        with patch.object(llm_client, "_backoff", return_value=0):
+            out = llm_client.chat_completion(
+                [], model="m2", base_url=None, api_key="k", timeout_total=4, temperature=0, max_tokens=8, retry=1
+            )
+        self.assertEqual(out, "done")
+        self.assertEqual(llm_client.transport_stats()["models"]["m2"]["errors"], 1)
+
+        self.requests.clear()
+        self._install(lambda request: httpx.Response(400))
+        with self.assertRaises(httpx.HTTPStatusError):
+            llm_client.chat_completion(
+                [], model="m2", base_url=None, api_key="k", timeout_total=4, temperature=0, max_tokens=8, retry=2
+            )
+        self.assertEqual(len(self.requests), 1)
+
+    def test_llm_config_chat_uses_shared_transport(self) -> None:
+        self._install(lambda request: _ok("card"))
+        cfg = LLMConfig(provider="openai", model="m3", base_url="", timeout=5, max_tokens=64, temperature=0.2, api_key="k", retry=0)
+        self.assertEqual(cfg.chat([{"role": "user", "content": "x"}]), "card")
+        self.assertEqual(self.requests[0].headers["authorization"], "Bearer k")
+
+
+if __name__ == "__main__":
+    unittest.main()
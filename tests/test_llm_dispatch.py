@@ -0,0 +1,63 @@
+import threading
+import time
+import unittest
+
+from dashboard.server.agents.core.llm_dispatch import LLMDispatcher, TokenBucket
+
+
+class LLMDispatcherTest(unittest.TestCase):
+    def test_results_follow_input_order_with_bounded_concurrency(self) -> None:
+        lock = threading.Lock()
+        state = {"in_flight": 0, "peak": 0}
+
+        def call(item: int) -> int:
+            with lock:
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            time.sleep(0.02 * (5 - item % 5))  # later items finish first
+            with lock:
+                state["in_flight"] -= 1
+            return item * 10
+
+        dispatcher = LLMDispatcher(max_workers=3, rate_per_sec=0, call_deadline_sec=5)
+        results = dispatcher.map(call, list(range(10)), on_fail=lambda item, reason: None)
+
+        self.assertEqual(results, [i * 10 for i in range(10)])
+        self.assertLessEqual(state["peak"], 3)
+        self.assertGreater(state["peak"], 1)
+        self.assertEqual(dispatcher.stats.completed, 10)
+
+    def test_deadline_and_errors_use_on_fail(self) -> None:
+        def call(item: str) -> str:
+            if item == "slow":
+                time.sleep(0.5)
+            if item == "boom":
+                raise RuntimeError("llm down")
+            return item.upper()
+
+        dispatcher = LLMDispatcher(max_workers=3, rate_per_sec=0, call_deadline_sec=0.1)
+        results = dispatcher.map(call, ["ok", "slow", "boom"], on_fail=lambda item, reason: f"fallback:{reason.split(':')[0]}")
+
+        self.assertEqual(results, ["OK", "fallback:deadline_exceeded", "fallback:error"])
+        self.assertEqual(dispatcher.stats.timed_out, 1)
+
+    def test_token_bucket_limits_rate(self) -> None:
+        bucket = TokenBucket(rate=20, burst=1)
+        started = time.monotonic()
+        for _ in range(5):
+            self.assertTrue(bucket.acquire())
+        self.assertGreaterEqual(time.monotonic() - started, 0.15)
+
+        slow = TokenBucket(rate=0.1, burst=1)
+        self.assertTrue(slow.acquire())
+        self.assertFalse(slow.acquire(deadline=time.monotonic() + 0.05))
+
+    def test_serial_dispatcher_runs_inline(self) -> None:
+        seen_threads = set()
+        dispatcher = LLMDispatcher.serial()
+        dispatcher.map(lambda item: seen_threads.add(threading.get_ident()), [1, 2, 3], on_fail=lambda i, r: None)
+        self.assertEqual(seen_threads, {threading.get_ident()})
+
+
+if __name__ == "__main__":
+    unittest.main()
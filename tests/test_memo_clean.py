@@ -0,0 +1,79 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from dashboard.server import database as db
+from dashboard.server import json_compact
+from dashboard.server import memo_clean
+from dashboard.server.markdown_compact import won_groups_compact_to_markdown
+from tests.test_won_groups_json import build_compact_htmlbody_db, build_sample_db_with_html_body
+
+
+def _clear_caches() -> None:
+    db._WON_GROUPS_CACHE.clear()
+    db._DERIVED_TABLE_STATE_CACHE.clear()
+    json_compact._COMPACT_CACHE.clear()
+
+
+class MemoCleanTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        _clear_caches()
+
+    def tearDown(self) -> None:
+        _clear_caches()
+        self.tmpdir.cleanup()
+
+    def _build(self, db_path: Path) -> dict:
+        conn = sqlite3.connect(db_path)
+        try:
+            stats = memo_clean.build_memo_clean(conn)
+        finally:
+            conn.close()
+        # build는 mtime 해상도 안에서 끝날 수 있으므로 캐시 키가 바뀌도록 mtime을 민다
+        st = os.stat(db_path)
+        os.utime(db_path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        return stats
+
+    def _views(self, db_path: Path, org_id: str) -> tuple:
+        raw = db.get_won_groups_json(org_id, db_path=db_path)
+        compact = json_compact.get_won_groups_compact(org_id, db_path=db_path)
+        return raw, compact, won_groups_compact_to_markdown(compact)
+
+    def test_rows_and_freshness(self) -> None:
+        db_path = Path(self.tmpdir.name) / "form.db"
+        build_sample_db_with_html_body(db_path)
+        stats = self._build(db_path)
+        self.assertEqual(stats["by_kind"], {"form": 1, "skip": 1, "text": 0})
+        conn = sqlite3.connect(db_path)
+        try:
+            self.assertTrue(memo_clean.memo_clean_is_fresh(conn))
+            kind, markdown = conn.execute("SELECT kind, markdown FROM memo_clean WHERE memo_id = 'm1'").fetchone()
+            self.assertEqual((kind, markdown.strip()), ("form", "본문1"))
+            columns = [row[1] for row in conn.execute("PRAGMA table_info('memo_clean')")]
+            self.assertEqual(columns, ["memo_id", "kind", "clean_json", "markdown"])
+            conn.execute("INSERT INTO memo (id, text) VALUES ('m-new', 'x')")
+            conn.commit()
+            self.assertFalse(memo_clean.memo_clean_is_fresh(conn))
+        finally:
+            conn.close()
+
+    def test_payloads_match_per_request_cleaning(self) -> None:
+        for build, org_id in ((build_sample_db_with_html_body, "org1"), (build_compact_htmlbody_db, "org-html")):
+            db_path = Path(self.tmpdir.name) / f"{org_id}.db"
+            build(db_path)
+            before = self._views(db_path, org_id)
+            self._build(db_path)
+            _clear_caches()
+            with patch.object(db, "_clean_form_memo", side_effect=AssertionError("re-cleaned")), patch.object(
+                json_compact, "html_to_markdown", side_effect=AssertionError("re-parsed")
+            ):
+                after = self._views(db_path, org_id)
+            self.assertEqual(after, before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from dashboard.server import database as db
+from dashboard.server import perf_columns
+
+
+def _amount_row(month, bucket, amount, owners, online=False, major=True, samsung=False):
+    return {
+        "month": month,
+        "bucket": bucket,
+        "amount_used": amount,
+        "day1_owner_names": owners,
+        "is_online": online,
+        "is_major_size": major,
+        "org_is_samsung": samsung,
+    }
+
+
+class ColumnFrameTest(unittest.TestCase):
+    def test_month_positions_codes_and_owner_mask_memo(self) -> None:
+        rows = [
+            {"month": "2501", "kind": "a", "owner_names": ["x"]},
+            {"month": "2612", "kind": "b", "owner_names": []},
+            {"month": None, "kind": "zz", "owner_names": ["y"]},
+        ]
+        frame = perf_columns.ColumnFrame(rows)
+        self.assertEqual(frame.month_positions(["2612", "2501"]).tolist(), [1, 0, -1])
+        self.assertEqual(frame.add_codes("kind", (r["kind"] for r in rows), ["a", "b"]).tolist(), [0, 1, -1])
+
+        calls = []
+
+        def match(owners, allowed):
+            calls.append(owners)
+            return bool(set(owners or []) & allowed)
+
+        self.assertEqual(frame.owner_mask({"x"}, match).tolist(), [True, False, False])
+        frame.owner_mask({"x"}, match)
+        self.assertEqual(len(calls), 3)  # second call served from the memo
+        self.assertTrue(frame.owner_mask(None, match).all())
+
+
+class PerfAmountsColumnarSummaryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmpdir.name) / "db.sqlite"
+        self.db_path.write_bytes(b"")
+        member = sorted(db._dealcheck_members("edu1"))[0]
+        rows = [
+            _amount_row("2501", "CONTRACT", 100.0, [member]),
+            _amount_row("2501", "HIGH", 50.0, ["외부인"], online=True),
+            _amount_row("2502", "CONFIRMED", 30.0, [member], samsung=True),
+            _amount_row("2412", "CONTRACT", 999.0, [member]),
+        ]
+        self.payload = {"rows": rows, "snapshot_version": "v", "columns": db._perf_amount_columns(rows)}
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _summary(self, **kwargs):
+        with patch.object(db, "_load_perf_monthly_data", return_value=self.payload):
+            res = db.get_perf_monthly_amounts_summary(from_month="2025-01", to_month="2025-02", db_path=self.db_path, **kwargs)
+        return {seg["key"]: {r["key"]: r for r in seg["rows"]} for seg in res["segments"]}
+
+    def test_segments_rows_and_team_filter(self) -> None:
+        all_rows = self._summary()
+        self.assertEqual(all_rows["ALL"]["TOTAL"]["byMonth"], {"2501": 150.0, "2502": 30.0})
+        self.assertEqual(all_rows["ALL"]["TOTAL"]["dealCountByMonth"], {"2501": 2, "2502": 1})
+        self.assertEqual(all_rows["ALL"]["HIGH"]["byMonth"], {"2501": 50.0, "2502": 0.0})
+        self.assertEqual(all_rows["SAMSUNG"]["CONFIRMED"]["byMonth"], {"2501": 0.0, "2502": 30.0})
+        self.assertEqual(all_rows["NON_SAMSUNG_ONLINE"]["TOTAL"]["byMonth"], {"2501": 50.0, "2502": 0.0})
+
+        edu1 = self._summary(team="edu1")
+        self.assertEqual(edu1["ALL"]["TOTAL"]["byMonth"], {"2501": 100.0, "2502": 30.0})
+        self.assertEqual(edu1["ALL"]["HIGH"]["dealCountByMonth"], {"2501": 0, "2502": 0})
+
+    def test_payload_without_columns_is_still_supported(self) -> None:
+        self.payload.pop("columns")
+        self.assertEqual(self._summary()["ALL"]["CONTRACT"]["byMonth"], {"2501": 100.0, "2502": 0.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from dashboard.server import report_scheduler as rs
+from dashboard.server.report import progress_universe as pu
+
+RISK_REPORT = {
+    "meta": {"as_of": "2026-04-15", "db_signature": "100-2048", "mode": "offline"},
+    "counterparties": [
+        {"organizationId": "org1", "organizationName": "기업1", "counterpartyName": "본부A", "tier": "P0"},
+    ],
+}
+
+
+class ProgressRiskReportReuseTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.snapshot = Path(self.tmpdir.name) / "snap.db"
+        self.snapshot.write_bytes(b"")
+        pu._CACHE.clear()
+        self.dri = patch.object(pu, "get_rank_2025_top100_counterparty_dri", return_value={"rows": []})
+        self.dri.start()
+
+    def tearDown(self) -> None:
+        self.dri.stop()
+        pu._CACHE.clear()
+        self.tmpdir.cleanup()
+
+    def test_cached_report_skips_rebuild(self) -> None:
+        with patch.object(pu, "build_counterparty_risk_report") as build:
+            keys = pu.build_progress_universe("2026-04-15", "offline", self.snapshot, risk_report=RISK_REPORT)
+        build.assert_not_called()
+        self.assertEqual([(k.org_id, k.upper_org) for k in keys], [("org1", "본부A")])
+        self.assertEqual(pu._load_base("2026-04-15", "offline", self.snapshot)["risk_source"], "cache")
+
+    def test_missing_report_rebuilds_rule_only(self) -> None:
+        with patch.object(pu, "build_counterparty_risk_report", return_value=RISK_REPORT) as build:
+            pu.build_progress_universe("2026-04-15", "offline", self.snapshot)
+        self.assertTrue(build.call_args.kwargs["rule_only"])
+
+    def test_scheduler_loads_report_only_for_matching_signature(self) -> None:
+        with patch.object(rs, "CACHE_DIR", Path(self.tmpdir.name)):
+            path = rs._report_cache_path("2026-04-15", "offline")
+            path.write_text(json.dumps(RISK_REPORT), encoding="utf-8")
+            self.assertEqual(rs._load_cached_risk_report("2026-04-15", "offline", "100-2048"), RISK_REPORT)
+            self.assertIsNone(rs._load_cached_risk_report("2026-04-15", "offline", "101-2048"))
+            self.assertIsNone(rs._load_cached_risk_report("2026-04-15", "online", "100-2048"))
+
+
+if __name__ == "__main__":
+    unittest.main()
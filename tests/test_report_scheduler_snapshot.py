@@ -0,0 +1,87 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from dashboard.server import report_scheduler as rs
+
+
+def _write_db(path: Path, value: str) -> None:
+    tmp = path.with_suffix(".tmp")
+    conn = sqlite3.connect(tmp)
+    conn.execute("CREATE TABLE t (v TEXT)")
+    conn.execute("INSERT INTO t VALUES (?)", (value,))
+    conn.commit()
+    conn.close()
+    os.replace(tmp, path)
+
+
+def _read(path: Path) -> str:
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT v FROM t").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class SnapshotLeaseTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        root = Path(self.tmpdir.name)
+        self.db_path = root / "salesmap_latest.db"
+        self.work_dir = root / "work"
+        _write_db(self.db_path, "v1")
+        self.patch = patch.object(rs, "WORK_DIR", self.work_dir)
+        self.patch.start()
+
+    def tearDown(self) -> None:
+        self.patch.stop()
+        self.tmpdir.cleanup()
+
+    def test_same_signature_shares_one_snapshot_across_modes(self) -> None:
+        with rs.snapshot_lease(self.db_path, "2026-01-02") as offline_snap:
+            with rs.snapshot_lease(self.db_path, "2026-01-03") as online_snap:
+                self.assertEqual(offline_snap, online_snap)
+                self.assertEqual(rs._snapshot_refs[offline_snap], 2)
+        self.assertEqual(_read(offline_snap), "v1")
+        self.assertEqual(list(self.work_dir.glob("salesmap_snapshot_*")), [offline_snap])
+        self.assertNotIn(offline_snap, rs._snapshot_refs)
+
+    def test_stale_snapshot_removed_when_last_lease_drops(self) -> None:
+        with rs.snapshot_lease(self.db_path, "2026-01-02") as old_snap:
+            _write_db(self.db_path, "v2")
+            with rs.snapshot_lease(self.db_path, "2026-01-02") as new_snap:
+                self.assertNotEqual(old_snap, new_snap)
+                self.assertEqual(_read(new_snap), "v2")
+            self.assertTrue(old_snap.exists())  # still leased
+            self.assertEqual(_read(old_snap), "v1")
+        self.assertFalse(old_snap.exists())
+        self.assertTrue(new_snap.exists())
+
+    def test_prune_keeps_current_sidecars_and_drops_stale_ones(self) -> None:
+        with rs.snapshot_lease(self.db_path, "2026-01-02") as old_snap:
+            _write_db(self.db_path, "v2")
+            with rs.snapshot_lease(self.db_path, "2026-01-02") as new_snap:
+                for snap in (old_snap, new_snap):
+                    for suffix in ("-wal", "-shm"):
+                        snap.with_name(snap.name + suffix).touch()
+                old_tmp = self.work_dir / "salesmap_snapshot_x.1.tmp"
+                fresh_tmp = self.work_dir / "salesmap_snapshot_y.2.tmp"
+                old_tmp.touch()
+                fresh_tmp.touch()
+                os.utime(old_tmp, (0, 0))
+        names = sorted(p.name for p in self.work_dir.iterdir())
+        self.assertEqual(names, sorted([new_snap.name, new_snap.name + "-shm", new_snap.name + "-wal", fresh_tmp.name]))
+
+    def test_backup_copy_used_when_reflink_unavailable(self) -> None:
+        with patch.object(rs, "_reflink", return_value=False), patch.object(rs, "_backup_copy", wraps=rs._backup_copy) as backup:
+            with rs.snapshot_lease(self.db_path, "2026-01-02") as snap:
+                self.assertEqual(_read(snap), "v1")
+        backup.assert_called_once()
+        self.assertEqual(list(self.work_dir.glob("*.tmp")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
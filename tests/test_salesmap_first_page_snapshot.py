@@ -141,9 +141,26 @@ class FinalizeConnectionTest(TestCase):
 
         self.assertEqual(
             calls,
-            ["commit", "PRAGMA wal_checkpoint(TRUNCATE)", "PRAGMA optimize", "close"],
+            ["commit", "PRAGMA wal_checkpoint(TRUNCATE)", "PRAGMA journal_mode=DELETE", "PRAGMA optimize", "close"],
         )
 
+    def test_resumable_temp_db_is_swapped_in_without_wal(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path, db_path = Path(tmpdir) / "latest.db.tmp", Path(tmpdir) / "latest.db"
+            conn = snap.sqlite3.connect(tmp_path)
+            snap.configure_ingest_connection(conn)
+            snap.replace_table(conn, "deal", [{"id": "d1"}])
+            snap.finalize_sqlite_connection(conn, log=quiet_logger(), sleep_after=0)
+            snap.replace_file_with_retry(tmp_path, db_path, attempts=1, delay=0, log=quiet_logger())
+
+            ro = snap.sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+            try:
+                self.assertEqual(ro.execute("PRAGMA journal_mode").fetchone()[0], "delete")
+                self.assertEqual(ro.execute("SELECT id FROM deal").fetchall(), [("d1",)])
+            finally:
+                ro.close()
+            self.assertEqual(sorted(p.name for p in Path(tmpdir).iterdir()), ["latest.db"])
+
 
 class RunHistoryTest(TestCase):
     def test_record_run_history_appends_json_line(self) -> None:
@@ -219,6 +236,43 @@ class TableWriterTest(TestCase):
                 self.assertIn("c", writer.columns)
 
 
+class BulkWriteTest(TestCase):
+    def test_one_shot_connection_turns_journal_off(self) -> None:
+        conn = snap.sqlite3.connect(":memory:")
+        snap.configure_ingest_connection(conn, resumable=False)
+        self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 0)
+        conn.close()
+
+    def test_write_batch_uses_one_transaction_and_keeps_values_as_delivered(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "bulk.db"
+            conn = snap.sqlite3.connect(db_path)
+            snap.configure_ingest_connection(conn)
+            # resumable temp DBs keep a journal so a crash mid-transaction cannot corrupt them
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            writer = snap.TableWriter(conn, "deal")
+            writer.write_batch([{"id": "d1", "금액": 1000, "owner": {"id": "u1"}}, {"id": "d2", "금액": None}])
+            writer.write_batch([{"id": "d3", "tags": ["a", "b"]}])
+            self.assertTrue(conn.in_transaction)
+            writer.commit()
+            self.assertFalse(conn.in_transaction)
+            conn.close()
+            with snap.sqlite3.connect(db_path) as conn:
+                rows = conn.execute('SELECT id, "금액", owner, tags FROM deal ORDER BY rowid').fetchall()
+        self.assertEqual(
+            rows,
+            [("d1", "1000", '{"id": "u1"}', None), ("d2", None, None, None), ("d3", None, None, '["a", "b"]')],
+        )
+
+    def test_replace_table_infers_bookkeeping_types(self) -> None:
+        with snap.sqlite3.connect(":memory:") as conn:
+            conn.execute("CREATE TABLE manifest (old TEXT)")
+            snap.replace_table(conn, "manifest", [{"table": "deal", "row_count": 3, "errors": ""}])
+            info = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(manifest)")}
+            self.assertEqual(info, {"table": "TEXT", "row_count": "INTEGER", "errors": "TEXT"})
+            self.assertEqual(conn.execute("SELECT * FROM manifest").fetchall(), [("deal", 3, "")])
+
+
 class CheckpointManagerTest(TestCase):
     def test_checkpoint_manager_save_and_load(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -275,3 +329,293 @@ class WebformFilterTest(TestCase):
 
             self.assertEqual(len(filtered_calls), 1)
             self.assertEqual(filtered_calls[0], [{"peopleId": "p-1", "payload": 1}])
+
+
+class SnapshotIndexTest(TestCase):
+    def test_build_snapshot_indexes_skips_missing_and_stamps_run_info(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "idx.db"
+            with snap.sqlite3.connect(db_path) as conn:
+                conn.execute('CREATE TABLE deal (id TEXT, organizationId TEXT, peopleId TEXT, "상태" TEXT, "계약 체결일" TEXT)')
+                conn.execute("CREATE TABLE memo (id TEXT, organizationId TEXT, createdAt TEXT)")
+                conn.execute("CREATE TABLE run_info (run_tag TEXT)")
+                conn.execute("INSERT INTO run_info (run_tag) VALUES ('t1')")
+
+            built = snap.finalize_snapshot(db_path, quiet_logger())
+
+            self.assertIn("idx_deal_organizationId_status", built)
+            self.assertIn("idx_memo_organizationId_createdAt", built)
+            self.assertNotIn("idx_memo_peopleId_createdAt", built)  # memo.peopleId missing
+            self.assertNotIn("idx_webform_history_peopleId", built)  # table missing
+            with snap.sqlite3.connect(db_path) as conn:
+                names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+                self.assertTrue(set(built) <= names)
+                self.assertTrue(conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] >= 1)
+                version, indexes = conn.execute("SELECT index_version, indexes FROM run_info").fetchone()
+            self.assertEqual(version, str(snap.SNAPSHOT_INDEX_VERSION))
+            self.assertEqual(json.loads(indexes), built)
+
+    def test_build_derived_tables_builds_search_index_without_deal(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "derived.db"
+            with snap.sqlite3.connect(db_path) as conn:
+                conn.execute('CREATE TABLE organization (id TEXT, "이름" TEXT)')
+                conn.execute("INSERT INTO organization VALUES ('org-1', '데이터랩스')")
+                built = snap.build_derived_tables(conn, quiet_logger())
+                hits = conn.execute("SELECT ref_id FROM search_fts WHERE search_fts MATCH '\"데이터\"'").fetchall()
+            self.assertEqual(built, ["search_fts"])
+            self.assertEqual(hits, [("org-1",)])
+
+
+class _ListClient:
+    """Serves fixed list pages per path; records the params of each call."""
+
+    def __init__(self, pages) -> None:
+        self.base_url = "http://example.test"
+        self.pages = pages
+        self.calls = []
+
+    def get_json(self, path: str, params=None):
+        self.calls.append((path, dict(params or {})))
+        pages = self.pages.get(path, [[]])
+        cursor = (params or {}).get("cursor")
+        idx = int(cursor) if cursor else 0
+        key = path.strip("/") + "List"
+        data = {key: pages[idx]}
+        if idx + 1 < len(pages):
+            data["nextCursor"] = str(idx + 1)
+        return {"data": data}, None
+
+
+class IncrementalSyncTest(TestCase):
+    def _seed(self, conn) -> None:
+        conn.execute('CREATE TABLE organization (id TEXT, "이름" TEXT, updatedAt TEXT)')
+        conn.executemany(
+            "INSERT INTO organization VALUES (?, ?, ?)",
+            [
+                ("o1", "old1", "2025-01-01T00:00:00.000Z"),
+                ("o2", "old2", "2025-01-01T00:00:00.000Z"),
+                ("o3", "gone", "2025-01-01T00:00:00.000Z"),
+            ],
+        )
+
+    def test_capture_incremental_upserts_changed_and_sweeps_deleted(self) -> None:
+        since = snap.parse_timestamp("2025-02-01T00:00:00Z")
+        client = _ListClient(
+            {
+                "/organization": [
+                    [{"id": "o1", "이름": "new1", "updatedAt": "2025-02-03T00:00:00.000Z", "extra": "x"}],
+                    [
+                        {"id": "o2", "이름": "stale", "updatedAt": "2025-01-01T00:00:00.000Z"},
+                        {"id": "o4", "이름": "new4", "updatedAt": "2025-02-02T00:00:00.000Z"},
+                    ],
+                ]
+            }
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with snap.sqlite3.connect(Path(tmpdir) / "inc.db") as conn:
+                self._seed(conn)
+                writer = snap.TableWriter(conn, "organization")
+                writer.load_existing()
+                result = snap.capture_incremental(
+                    client, {}, "/organization", "organizationList", writer, "organization", since, log=quiet_logger()
+                )
+                rows = dict(conn.execute('SELECT id, "이름" FROM organization').fetchall())
+
+        self.assertEqual(rows, {"o1": "new1", "o2": "old2", "o4": "new4"})
+        self.assertEqual((result["upserted"], result["deleted"], result["rows"]), (2, 1, 3))
+        self.assertTrue(result["swept"])
+        self.assertEqual(result["high_water_mark"], "2025-02-03T00:00:00Z")
+        self.assertIn("extra", writer.columns)
+
+    def test_since_param_filters_server_side_and_skips_sweep(self) -> None:
+        since = snap.parse_timestamp("2025-02-01T00:00:00Z")
+        client = _ListClient({"/organization": [[{"id": "o2", "이름": "new2", "updatedAt": "2025-02-05T00:00:00Z"}]]})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with snap.sqlite3.connect(Path(tmpdir) / "inc.db") as conn:
+                self._seed(conn)
+                writer = snap.TableWriter(conn, "organization")
+                writer.load_existing()
+                result = snap.capture_incremental(
+                    client,
+                    {},
+                    "/organization",
+                    "organizationList",
+                    writer,
+                    "organization",
+                    since,
+                    since_param="updatedAfter",
+                    log=quiet_logger(),
+                )
+                count = conn.execute("SELECT COUNT(*) FROM organization").fetchone()[0]
+
+        self.assertEqual(client.calls[0][1], {"updatedAfter": "2025-01-31T23:55:00Z"})  # overlap window
+        self.assertEqual((count, result["deleted"], result["swept"]), (3, 0, False))
+
+    def test_errors_keep_previous_mark_and_skip_sweep(self) -> None:
+        class FailingClient(_ListClient):
+            def get_json(self, path, params=None):
+                payload, _ = super().get_json(path, params)
+                return payload, "http_500"
+
+        since = snap.parse_timestamp("2025-02-01T00:00:00Z")
+        client = FailingClient({"/organization": [[{"id": "o9", "updatedAt": "2025-03-01T00:00:00Z"}]]})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with snap.sqlite3.connect(Path(tmpdir) / "inc.db") as conn:
+                self._seed(conn)
+                writer = snap.TableWriter(conn, "organization")
+                writer.load_existing()
+                result = snap.capture_incremental(
+                    client, {}, "/organization", "organizationList", writer, "organization", since, log=quiet_logger()
+                )
+        self.assertEqual(result["high_water_mark"], "2025-02-01T00:00:00Z")
+        self.assertEqual(result["deleted"], 0)
+        self.assertEqual(result["errors"], ["page1:http_500"])
+
+    def test_incremental_state_uses_full_capture_time_as_fallback(self) -> None:
+        state = snap.incremental_state({"captured_at_utc": "2025-02-01T00:00:00Z"})
+        self.assertEqual(state["marks"]["deal"], snap.parse_timestamp("2025-02-01T00:00:00Z"))
+        state = snap.incremental_state(
+            {
+                "sync_mode": "incremental",
+                "captured_at_utc": "2025-02-09T00:00:00Z",
+                "full_captured_at_utc": "2025-02-01T00:00:00Z",
+                "sync_hwm": json.dumps({"deal": "2025-02-08T00:00:00Z"}),
+                "id_sweep_at_utc": "2025-02-05T00:00:00Z",
+            }
+        )
+        self.assertEqual(state["marks"]["deal"], snap.parse_timestamp("2025-02-08T00:00:00Z"))
+        self.assertEqual(state["marks"]["memo"], snap.parse_timestamp("2025-02-01T00:00:00Z"))
+        self.assertEqual(state["last_sweep"], snap.parse_timestamp("2025-02-05T00:00:00Z"))
+
+    def test_run_incremental_swaps_in_updated_db_and_stamps_marks(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            db_path = root / "salesmap.db"
+            with snap.sqlite3.connect(db_path) as conn:
+                self._seed(conn)
+                conn.execute("CREATE TABLE user (id TEXT, name TEXT)")
+                conn.execute("INSERT INTO user VALUES ('u0', 'old')")
+                conn.execute("CREATE TABLE run_info (run_tag TEXT, captured_at_utc TEXT, sync_mode TEXT)")
+                conn.execute("INSERT INTO run_info VALUES ('full1', '2025-02-01T00:00:00Z', 'full')")
+            client = _ListClient(
+                {
+                    "/organization": [[{"id": "o1", "이름": "new1", "updatedAt": "2025-02-02T00:00:00Z"}, {"id": "o2"}]],
+                    "/user": [[{"id": "u1", "name": "kim"}]],
+                }
+            )
+            args = snap.argparse.Namespace(
+                log_dir=str(root / "logs"),
+                backup_dir=str(root / "backups"),
+                keep_backups=1,
+                no_backup=True,
+                checkpoint_dir=str(root / "cp"),
+                since_param="",
+                id_sweep=False,
+                id_sweep_hours=24.0,
+                concurrency=3,
+            )
+            with patch("salesmap_first_page_snapshot.update_webform_history"), patch(
+                "salesmap_first_page_snapshot.finalize_sqlite_connection",
+                side_effect=lambda conn, log=None: (conn.commit(), conn.close()),
+            ):
+                self.assertTrue(snap.run_incremental(args, client, db_path))
+            snap.logger.handlers.clear()
+
+            with snap.sqlite3.connect(db_path) as conn:
+                orgs = dict(conn.execute('SELECT id, "이름" FROM organization').fetchall())
+                users = conn.execute("SELECT id FROM user").fetchall()
+                info = snap.read_run_info(conn)
+            self.assertEqual(orgs, {"o1": "new1", "o2": None})
+            self.assertEqual(users, [("u1",)])
+            self.assertEqual(info["sync_mode"], "incremental")
+            self.assertEqual(info["full_captured_at_utc"], "2025-02-01T00:00:00Z")
+            self.assertEqual(json.loads(info["sync_hwm"])["organization"], "2025-02-02T00:00:00Z")
+            self.assertEqual(info["final_db_path"], str(db_path))
+            self.assertFalse(snap.run_incremental(args, client, root / "missing.db"))
+            snap.logger.handlers.clear()
+
+
+class ConcurrentCrawlTest(TestCase):
+    def test_token_bucket_pause_blocks_every_caller(self) -> None:
+        bucket = snap.TokenBucket(rate=1000, burst=1)
+        bucket.acquire()
+        sleeps = []
+        clock = {"now": 100.0}
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock["now"] += seconds
+
+        with patch("salesmap_first_page_snapshot.time.monotonic", side_effect=lambda: clock["now"]), patch(
+            "salesmap_first_page_snapshot.time.sleep", side_effect=fake_sleep
+        ):
+            bucket._updated = clock["now"]
+            bucket.pause(5.0)
+            bucket.acquire()
+        self.assertAlmostEqual(sum(sleeps), 5.0 + 1 / 1000)
+
+    def test_client_429_pauses_shared_limiter(self) -> None:
+        class Resp:
+            def __init__(self, status, headers=None):
+                self.status_code = status
+                self.headers = headers or {}
+                self.ok = status == 200
+
+            def json(self):
+                return {"data": {}}
+
+        limiter = snap.TokenBucket(rate=0)
+        client = snap.SalesmapClient("http://example.test", "t", limiter=limiter)
+        responses = [Resp(429, {"Retry-After": "7"}), Resp(200)]
+        with patch.object(limiter, "pause") as pause_mock, patch("requests.Session.get", side_effect=lambda *a, **k: responses.pop(0)):
+            payload, err = client.get_json("/deal")
+        self.assertIsNone(err)
+        pause_mock.assert_called_once_with(7.0)
+
+    def test_writer_queue_serializes_writes_from_many_threads(self) -> None:
+        import threading
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            conn = snap.sqlite3.connect(Path(tmpdir) / "q.db", check_same_thread=False)
+            writer_threads = set()
+            with snap.WriterQueue() as writer_queue:
+                writers = [snap.TableWriter(conn, f"t{i % 2}", writer_queue) for i in range(2)]
+                original = snap.TableWriter.write_batch
+
+                def tracking(self, records):
+                    if not self._queued():
+                        writer_threads.add(threading.current_thread().name)
+                    return original(self, records)
+
+                with patch.object(snap.TableWriter, "write_batch", tracking):
+                    jobs = [
+                        (lambda w, n: [w.write_batch([{"id": f"{n}-{k}", "n": k}]) for k in range(20)], (writers[i % 2], i))
+                        for i in range(6)
+                    ]
+                    snap.run_crawl_jobs(jobs, concurrency=6)
+            counts = [conn.execute(f"SELECT COUNT(*) FROM t{i}").fetchone()[0] for i in range(2)]
+            conn.close()
+        self.assertEqual(counts, [60, 60])
+        self.assertEqual([w.row_count for w in writers], [60, 60])
+        self.assertEqual(writer_threads, {"sqlite-writer"})
+
+    def test_update_webform_history_fetches_concurrently_in_id_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "db.sqlite"
+            with snap.sqlite3.connect(db_path) as conn:
+                conn.execute("CREATE TABLE deal (peopleId TEXT)")
+                conn.execute("INSERT INTO deal (peopleId) VALUES ('p-1')")
+                conn.execute('CREATE TABLE people (id TEXT, "제출된 웹폼 목록" TEXT)')
+                forms = json.dumps([{"id": f"wf-{i}"} for i in range(5)])
+                conn.execute('INSERT INTO people (id, "제출된 웹폼 목록") VALUES (?, ?)', ("p-1", forms))
+
+            def fake_fetch(client, wf_id, log):
+                return [{"peopleId": "p-1", "webFormId": wf_id}]
+
+            with patch("salesmap_first_page_snapshot.fetch_webform_submissions", side_effect=fake_fetch):
+                snap.update_webform_history(db_path, object(), quiet_logger(), concurrency=4)
+
+            with snap.sqlite3.connect(db_path) as conn:
+                rows = [r[0] for r in conn.execute("SELECT webFormId FROM webform_history ORDER BY rowid")]
+        self.assertEqual(rows, [f"wf-{i}" for i in range(5)])
@@ -0,0 +1,163 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+try:
+    from fastapi.testclient import TestClient
+except ImportError:  # pragma: no cover - optional for test envs without fastapi extras
+    TestClient = None
+
+from dashboard.server import database as db
+from dashboard.server import search_index
+
+FORM_MEMO = (
+    "고객이름: 홍길동\n고객전화: 010-0000-0000\n회사이름: 데이터랩스\n"
+    "궁금한 점: 생성형AI 리더십 과정 문의\nutm_source: google"
+)
+
+
+def _init_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE organization (id TEXT PRIMARY KEY, "이름" TEXT, "기업 규모" TEXT, "팀" TEXT, "담당자" TEXT);
+        CREATE TABLE people (id TEXT PRIMARY KEY, organizationId TEXT, "이름" TEXT, "직급(명함/메일서명)" TEXT);
+        CREATE TABLE deal (id TEXT PRIMARY KEY, peopleId TEXT, organizationId TEXT, "상태" TEXT, "금액" REAL, "계약 체결일" TEXT);
+        CREATE TABLE memo (id TEXT PRIMARY KEY, organizationId TEXT, peopleId TEXT, dealId TEXT, text TEXT, createdAt TEXT);
+        """
+    )
+    conn.executemany(
+        'INSERT INTO organization (id, "이름", "기업 규모") VALUES (?, ?, ?)',
+        [
+            ("org-1", "삼성전자", "대기업"),
+            ("org-2", "삼성바이오로직스", "대기업"),
+            ("org-3", "데이터랩스", "중소기업"),
+            ("org-4", "유령회사", "중소기업"),  # 사람/딜 없음 → /orgs 제외
+        ],
+    )
+    conn.executemany(
+        'INSERT INTO people (id, organizationId, "이름", "직급(명함/메일서명)") VALUES (?, ?, ?, ?)',
+        [("p-1", "org-1", "김데이터", "인재개발팀장"), ("p-2", "org-3", "홍길동", "HRD 매니저")],
+    )
+    conn.executemany(
+        'INSERT INTO deal (id, peopleId, organizationId, "상태", "금액", "계약 체결일") VALUES (?, ?, ?, ?, ?, ?)',
+        [("d-1", "p-1", "org-1", "Won", 100.0, "2025-03-01"), ("d-2", None, "org-2", "Open", None, None)],
+    )
+    conn.executemany(
+        "INSERT INTO memo (id, organizationId, peopleId, dealId, text, createdAt) VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            ("m-1", "org-1", None, None, "리더십 과정 제안서 재송부 요청, 삼성전자 교육팀 검토 중", "2025-01-02"),
+            ("m-2", None, "p-2", None, FORM_MEMO, "2025-01-03"),
+            ("m-3", None, "p-1", None, "   ", "2025-01-04"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+class SearchIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmpdir.name) / "search.db"
+        _init_db(self.db_path)
+
+    def tearDown(self) -> None:
+        db._DERIVED_TABLE_STATE_CACHE.clear()
+        self.tmpdir.cleanup()
+
+    def _build(self) -> dict:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return search_index.build_search_index(conn)
+        finally:
+            conn.close()
+
+    def _bump_mtime(self) -> None:
+        st = os.stat(self.db_path)
+        os.utime(self.db_path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+    def test_build_rows_memo_cleaning_and_freshness(self) -> None:
+        stats = self._build()
+        self.assertEqual(stats["by_kind"], {"org": 4, "person": 2, "memo": 2})
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.assertTrue(search_index.search_index_is_fresh(conn))
+            org_id, body = conn.execute(
+                "SELECT org_id, body FROM search_fts WHERE kind = 'memo' AND ref_id = 'm-2'"
+            ).fetchone()
+            self.assertEqual(org_id, "org-3")  # memo → people org
+            self.assertIn("question: 생성형AI 리더십 과정 문의", body)
+            self.assertNotIn("010-0000-0000", body)
+            conn.execute("INSERT INTO memo (id, text) VALUES ('m-new', '새 메모')")
+            conn.commit()
+            self.assertFalse(search_index.search_index_is_fresh(conn))
+        finally:
+            conn.close()
+
+    def test_search_ranks_and_paginates_across_kinds(self) -> None:
+        self._build()
+        res = db.search_entities("리더십 과정", db_path=self.db_path)
+        self.assertEqual(res["meta"]["mode"], "fts")
+        self.assertEqual(res["counts"], {"org": 0, "person": 0, "memo": 2})
+        self.assertEqual({item["id"] for item in res["items"]}, {"m-1", "m-2"})
+        self.assertEqual({item["orgName"] for item in res["items"]}, {"삼성전자", "데이터랩스"})
+        self.assertTrue(all("리더십" in item["snippet"] for item in res["items"]))
+
+        res = db.search_entities("삼성전자", db_path=self.db_path)
+        self.assertEqual([(i["kind"], i["id"]) for i in res["items"]], [("org", "org-1"), ("memo", "m-1")])
+
+        page = db.search_entities("삼성전자", kind="memo", limit=1, offset=0, db_path=self.db_path)
+        self.assertEqual((page["total"], [i["id"] for i in page["items"]]), (1, ["m-1"]))
+
+    def test_short_query_and_raw_fallback_agree(self) -> None:
+        raw = db.search_entities("삼성", db_path=self.db_path)
+        self.assertEqual(raw["meta"]["mode"], "raw")
+        self._build()
+        self._bump_mtime()
+        like = db.search_entities("삼성", db_path=self.db_path)
+        self.assertEqual(like["meta"]["mode"], "like")
+        self.assertEqual(like["counts"], raw["counts"])
+        self.assertEqual([i["id"] for i in like["items"]][:2], ["org-1", "org-2"])
+        with self.assertRaises(ValueError):
+            db.search_entities("  ", db_path=self.db_path)
+        with self.assertRaises(ValueError):
+            db.search_entities("삼성", kind="deal", db_path=self.db_path)
+
+    def test_list_organizations_matches_with_and_without_index(self) -> None:
+        def _ids(search):
+            return [o["id"] for o in db.list_organizations(search=search, db_path=self.db_path)]
+
+        before = {q: _ids(q) for q in ("삼성", "삼성바이오", "org-3", "랩스")}
+        self._build()
+        self._bump_mtime()
+        after = {q: _ids(q) for q in before}
+        self.assertEqual(after, before)
+        self.assertEqual(before["삼성"], ["org-1", "org-2"])
+        self.assertEqual(_ids(None), ["org-1", "org-3", "org-2"])
+
+    def test_api_search_endpoint(self) -> None:
+        if TestClient is None:
+            self.skipTest("fastapi.testclient not available")
+        from dashboard.server.main import app
+
+        self._build()
+        original_fn = db.search_entities
+
+        def _wrapped(**kwargs):
+            return original_fn(db_path=self.db_path, **kwargs)
+
+        with patch.object(db, "search_entities", _wrapped):
+            client = TestClient(app)
+            resp = client.get("/api/search", params={"q": "홍길동", "kind": "person"})
+            self.assertEqual(resp.status_code, 200)
+            data = resp.json()
+            self.assertEqual([(i["id"], i["orgName"]) for i in data["items"]], [("p-2", "데이터랩스")])
+            self.assertEqual(data["counts"], {"org": 0, "person": 1, "memo": 1})
+            self.assertEqual(client.get("/api/search", params={"q": "홍길동", "kind": "deal"}).status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import json
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from dashboard.server import database as db
+
+
+def _build_db(path: Path, indexes: list, version: str | None = "1") -> None:
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE deal (id TEXT, organizationId TEXT)")
+    conn.execute("CREATE INDEX idx_deal_id ON deal (id)")
+    if version is not None:
+        conn.execute("CREATE TABLE run_info (run_tag TEXT, index_version TEXT, indexes TEXT)")
+        conn.execute("INSERT INTO run_info VALUES (?,?,?)", ("t", version, json.dumps(indexes)))
+    else:
+        conn.execute("CREATE TABLE run_info (run_tag TEXT)")
+        conn.execute("INSERT INTO run_info VALUES ('t')")
+    conn.commit()
+    conn.close()
+
+
+class SnapshotIndexCheckTest(unittest.TestCase):
+    def test_ok_when_all_recorded_indexes_exist(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "ok.db"
+            _build_db(path, ["idx_deal_id"])
+            status = db.check_snapshot_indexes(path)
+        self.assertTrue(status["ok"])
+        self.assertEqual(status["missing"], [])
+
+    def test_reports_missing_indexes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "missing.db"
+            _build_db(path, ["idx_deal_id", "idx_deal_organizationId_status"])
+            status = db.check_snapshot_indexes(path)
+        self.assertFalse(status["ok"])
+        self.assertEqual(status["missing"], ["idx_deal_organizationId_status"])
+
+    def test_legacy_snapshot_without_index_stage_is_not_ok(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "legacy.db"
+            _build_db(path, [], version=None)
+            status = db.check_snapshot_indexes(path)
+        self.assertFalse(status["ok"])
+        self.assertIsNone(status["index_version"])
+
+
+if __name__ == "__main__":
+    unittest.main()
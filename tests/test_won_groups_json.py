@@ -4,10 +4,12 @@ import tempfile
 from pathlib import Path
 from typing import Any
 from unittest import TestCase
+from unittest.mock import patch
 
 from dashboard.server import database as db
 from dashboard.server.html_to_markdown import html_to_markdown, strip_key_deep
 from dashboard.server.database import _clean_form_memo
+from dashboard.server import json_compact
 from dashboard.server.json_compact import compact_won_groups_json
 
 
@@ -523,6 +525,52 @@ class CreatedAtTsRegressionTest(TestCase):
             self.assertIn("2025-01-01T11:00:00", ts_values)
 
 
+class WonGroupsMemoTest(TestCase):
+    def test_views_share_one_base_build(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "db.sqlite"
+            build_sample_db(db_path)
+            with patch.object(db, "_build_won_groups_json", wraps=db._build_won_groups_json) as build:
+                raw = db.get_won_groups_json("org1", db_path=db_path)
+                self.assertIs(db.get_won_groups_json("org1", db_path=db_path), raw)
+                filtered = db.get_won_groups_json("org1", target_uppers=["상위A"], db_path=db_path)
+                empty = db.get_won_groups_json("org1", target_uppers=["없는조직"], db_path=db_path)
+                compact = json_compact.get_won_groups_compact("org1", db_path=db_path)
+                self.assertIs(json_compact.get_won_groups_compact("org1", db_path=db_path), compact)
+                json_compact.get_won_groups_compact("org1", target_uppers=["상위A"], db_path=db_path)
+            self.assertEqual(build.call_count, 1)
+            self.assertEqual(filtered["groups"], raw["groups"])
+            self.assertEqual(empty, {"organization": raw["organization"], "groups": []})
+            self.assertEqual(compact, compact_won_groups_json(raw))
+
+    def test_org_bundle_endpoint(self) -> None:
+        from dashboard.server import org_tables_api as api
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "db.sqlite"
+            build_sample_db(db_path)
+            raw_fn = db.get_won_groups_json
+            compact_fn = json_compact.get_won_groups_compact
+            with patch.object(api.db, "get_org_by_id", return_value={"id": "org1"}), patch.object(
+                api.db, "get_org_memos", return_value=[]
+            ), patch.object(api.db, "get_people_for_org", return_value=[{"id": "p1"}]), patch.object(
+                api.db, "get_won_summary_by_upper_org", return_value=[]
+            ), patch.object(
+                api.db, "get_won_groups_json", side_effect=lambda **kw: raw_fn(db_path=db_path, **kw)
+            ), patch.object(
+                api, "get_won_groups_compact", side_effect=lambda **kw: compact_fn(db_path=db_path, **kw)
+            ), patch.object(db, "_build_won_groups_json", wraps=db._build_won_groups_json) as build:
+                bundle = api.get_org_bundle("org1", upper_org="상위A", memo_limit=100)
+
+            self.assertEqual(build.call_count, 1)
+            self.assertEqual(bundle["people"], [{"id": "p1"}])
+            self.assertEqual(bundle["won_groups_json"]["organization"]["id"], "org1")
+            self.assertEqual(bundle["won_groups_json_compact"]["schema_version"], "won-groups-json/compact-v1")
+            self.assertIn("compact-info-md", bundle["won_groups_markdown_compact"])
+            self.assertIn("statepath", bundle)
+            self.assertEqual(bundle["filtered"]["upper_org"], "상위A")
+
+
 class HtmlToMarkdownTableTest(TestCase):
     def test_table_preserves_columns(self) -> None:
         html = """
@@ -0,0 +1,102 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from dashboard.server import database as db
+from dashboard.server import json_compact
+from dashboard.server import markdown_compact
+from dashboard.server import won_groups_store
+from tests.test_won_groups_json import build_sample_db
+
+
+def _clear_caches() -> None:
+    db._WON_GROUPS_CACHE.clear()
+    db._DERIVED_TABLE_STATE_CACHE.clear()
+    json_compact._COMPACT_CACHE.clear()
+    won_groups_store._db_signatures.clear()
+    won_groups_store._pruned_for.clear()
+
+
+class WonGroupsStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name) / "cache"
+        self.db_path = Path(self.tmpdir.name) / "db.sqlite"
+        build_sample_db(self.db_path)
+        self._set_run_tag("run-1")
+        _clear_caches()
+        env = patch.dict(os.environ, {won_groups_store.CACHE_DIR_ENV: str(self.root)})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def tearDown(self) -> None:
+        _clear_caches()
+        self.tmpdir.cleanup()
+
+    def _set_run_tag(self, run_tag: str) -> None:
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE IF NOT EXISTS run_info (run_tag TEXT)")
+        conn.execute("DELETE FROM run_info")
+        conn.execute("INSERT INTO run_info (run_tag) VALUES (?)", (run_tag,))
+        conn.commit()
+        conn.close()
+
+    def _entries(self) -> list:
+        conn = sqlite3.connect(self.root / won_groups_store.INDEX_FILENAME)
+        try:
+            return conn.execute("SELECT kind, org_id, upper_org, path FROM entries ORDER BY kind, upper_org").fetchall()
+        finally:
+            conn.close()
+
+    def test_compact_and_markdown_survive_process_cache_loss(self) -> None:
+        compact = json_compact.get_won_groups_compact("org1", db_path=self.db_path)
+        filtered = json_compact.get_won_groups_compact("org1", target_uppers=["상위A"], db_path=self.db_path)
+        md = markdown_compact.get_won_groups_markdown("org1", db_path=self.db_path, max_deals=50)
+        self.assertEqual([e[:3] for e in self._entries()], [("compact", "org1", None), ("compact", "org1", "상위A"), ("markdown", "org1", None)])
+        self.assertTrue(all((self.root / e[3]).exists() for e in self._entries()))
+
+        # 새 프로세스(다른 worker/재시작) 흉내: 메모리 캐시를 비우고 DB를 다시 받은 것처럼 mtime을 민다
+        _clear_caches()
+        st = os.stat(self.db_path)
+        os.utime(self.db_path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        with patch.object(db, "_build_won_groups_json", side_effect=AssertionError("rebuilt")):
+            self.assertEqual(json_compact.get_won_groups_compact("org1", db_path=self.db_path), compact)
+            self.assertEqual(
+                json_compact.get_won_groups_compact("org1", target_uppers=["상위A"], db_path=self.db_path), filtered
+            )
+            self.assertEqual(markdown_compact.get_won_groups_markdown("org1", db_path=self.db_path, max_deals=50), md)
+        self.assertEqual(md, markdown_compact.won_groups_compact_to_markdown(compact, max_deals=50))
+
+    def test_render_options_and_snapshot_change_miss_and_prune(self) -> None:
+        default_md = markdown_compact.get_won_groups_markdown("org1", db_path=self.db_path)
+        markdown_compact.get_won_groups_markdown("org1", db_path=self.db_path, scope_label="ORG_ALL", max_people=60)
+        self.assertEqual(len(self._entries()), 2)  # compact + markdown; explicit defaults share the key
+        markdown_compact.get_won_groups_markdown("org1", db_path=self.db_path, redact_phone=False)
+        self.assertEqual(len(self._entries()), 3)
+        old_sig = won_groups_store.db_signature(self.db_path)
+
+        self._set_run_tag("run-2")
+        _clear_caches()
+        with patch.object(db, "_build_won_groups_json", wraps=db._build_won_groups_json) as build:
+            self.assertEqual(markdown_compact.get_won_groups_markdown("org1", db_path=self.db_path), default_md)
+        self.assertEqual(build.call_count, 1)
+        self.assertNotEqual(won_groups_store.db_signature(self.db_path), old_sig)
+        self.assertEqual(len(self._entries()), 2)
+        self.assertFalse((self.root / old_sig[:16]).exists())
+
+    def test_disabled_or_broken_store_falls_back_to_build(self) -> None:
+        with patch.dict(os.environ, {won_groups_store.CACHE_DIR_ENV: ""}):
+            compact = json_compact.get_won_groups_compact("org1", db_path=self.db_path)
+        self.assertFalse(self.root.exists())
+        _clear_caches()
+        self.root.parent.mkdir(exist_ok=True)
+        self.root.write_text("not a directory")
+        self.assertEqual(json_compact.get_won_groups_compact("org1", db_path=self.db_path), compact)
+        self.assertGreater(won_groups_store.store_stats()["errors"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from openpyxl import load_workbook
+
+try:
+    from fastapi.testclient import TestClient
+except ImportError:  # pragma: no cover - optional for test envs without fastapi extras
+    TestClient = None
+
+from dashboard.server import xlsx_export
+from dashboard.server.xlsx_export import XlsxCell, XlsxColumn, XlsxSheet
+
+
+class XlsxExportTest(unittest.TestCase):
+    def test_streamed_workbook_applies_declared_styles(self) -> None:
+        columns = [XlsxColumn("이름", width=20), XlsxColumn("금액", number_format="#,##0")]
+        rows = iter(
+            [
+                ["a", 1200],
+                [XlsxCell("b", hyperlink="https://example.com/b", style="Hyperlink"), None],
+                [XlsxCell("", fill_color="FFFF00"), ""],
+            ]
+        )
+        sheets = [XlsxSheet("data", columns, rows, header_alignment="center"), XlsxSheet("empty", [XlsxColumn("x")])]
+        data = b"".join(xlsx_export.stream_xlsx(sheets, chunk_size=1024))
+
+        wb = load_workbook(io.BytesIO(data))
+        self.assertEqual(wb.sheetnames, ["data", "empty"])
+        ws = wb["data"]
+        self.assertEqual([c.value for c in ws[1]], ["이름", "금액"])
+        self.assertTrue(ws["A1"].font.b)
+        self.assertEqual(ws["A1"].alignment.horizontal, "center")
+        self.assertEqual((ws.freeze_panes, ws.auto_filter.ref), ("A2", "A1:B4"))
+        self.assertEqual(ws.column_dimensions["A"].width, 20)
+        self.assertEqual((ws["B2"].value, ws["B2"].number_format), (1200, "#,##0"))
+        self.assertEqual(ws["B3"].number_format, "General")  # empty cells keep the default format
+        self.assertEqual(ws["A3"].hyperlink.target, "https://example.com/b")
+        self.assertEqual(ws["A4"].fill.fgColor.rgb, "00FFFF00")
+        self.assertEqual(sheets[0].row_count, 3)
+        self.assertEqual(wb["empty"].max_row, 1)
+
+    def test_write_xlsx_to_path_creates_parent(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out = Path(tmpdir) / "nested" / "out.xlsx"
+            counts = xlsx_export.write_xlsx(out, [XlsxSheet("s", [XlsxColumn("v")], ([i] for i in range(5)))])
+            self.assertEqual(counts, {"s": 5})
+            self.assertEqual(load_workbook(out)["s"]["A6"].value, 4)
+
+    def test_qc_monthly_revenue_xlsx_endpoint_streams(self) -> None:
+        if TestClient is None:
+            self.skipTest("fastapi.testclient not available")
+        from dashboard.server import database as db
+        from dashboard.server.main import app
+
+        report = {
+            "reportDeals": [
+                {"courseId": "C-1", "dealName": "과정", "owners": ["김", "이"], "status": "Won", "amount": 1500000},
+                {"courseId": "C-2", "dealName": "과정2", "owners": "박", "status": "Won", "amount": None},
+            ]
+        }
+        with patch.object(db, "get_qc_monthly_revenue_report", return_value=report):
+            resp = TestClient(app).get("/api/qc/monthly-revenue-report/xlsx", params={"team": "edu1", "year": 2025, "month": 3})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.headers["content-type"], xlsx_export.XLSX_MEDIA_TYPE)
+        self.assertIn('filename="edu1_2025_03_revenue.xlsx"', resp.headers["content-disposition"])
+        ws = load_workbook(io.BytesIO(resp.content))["매출신고"]
+        self.assertEqual([c.value for c in ws[2]][:6], ["C-1", "과정", "김, 이", "Won", None, 1500000])
+        self.assertEqual(ws["F2"].number_format, "#,##0")
+        self.assertEqual(ws.freeze_panes, "A2")
+        self.assertIsNone(ws.auto_filter.ref)
+
+
+if __name__ == "__main__":
+    unittest.main()